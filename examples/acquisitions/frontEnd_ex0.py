@@ -0,0 +1,86 @@
+"""
+This script is an example of how to use the fused front-end. |br|
+
+In this example 1 random multitone signal is generated. The signal contains 3 random tones,
+the highest possible frequency in the signal is 10 kHz. |br|
+
+After the signal generation, the signal is pushed through the front-end:
+a nonlinear amplifier, a saturation block and a 4-bit quantizer. |br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Version 1.0 released. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import rxcs
+import numpy as np
+import matplotlib.pyplot as plt
+
+def _frontEnd_ex0():
+
+    # Put the stuff on board
+    gen = rxcs.sig.randMult()      # Signal generator
+    front = rxcs.acq.frontEnd()    # Front-end
+
+    # General settings
+    TIME = 1e-3  # Time of the signal is 1 ms
+    FSMP = 1e6   # The signal representation sampling frequency is 1 MHz
+
+    # Settings for the generator
+    gen.tS = TIME      # Time of the signal is 1 ms
+    gen.fR = FSMP      # The signal representation sampling frequency is 1 MHz
+    gen.fMax = 10e3    # The highest possible frequency in the signal is 10 kHz
+    gen.fRes = 1e3     # The signal spectrum resolution is 1 kHz
+    gen.nTones = 3     # The number of random tones
+    gen.iMinAmp = 0.1   # The minimum amplitude of a tone
+    gen.iMaxAmp = 1.0   # The maximum amplitude of a tone
+    gen.nSigPack = 1    # The number of signals to be generated
+
+    # Settings for the front-end
+    front.vCoef = np.array([1.0, 0.1, -0.2])   # Coefficients of the amplifier
+    front.iMinAmp = -0.8   # Minimum amplitude
+    front.iMaxAmp = 0.8    # Maximum amplitude
+    front.nBits = 4        # The number of bits of the quantizer
+
+    # -----------------------------------------------------------------
+    # Run the multitone signal generator and the front-end
+    gen.run()               # Run the generator
+    front.mSig = gen.mSig   # Connect the generator output with the front-end input
+    front.run()             # Run the front-end
+
+    # -----------------------------------------------------------------
+    # Plot the results
+    vSig = gen.mSig[0, :]   # Get the original signal
+    vT = gen.vTSig          # ... and its time vector
+    vObSig = front.mObSig[0, :]           # Get the observed signal
+    vSaturMark = front.mSaturMark[0, :]   # Get the first set ot saturation markers
+
+    hFig1 = plt.figure(1)
+    # Plot the original signal and the observed signal
+    hSubPlot1 = hFig1.add_subplot(211)
+    hSubPlot1.grid(True)
+    hSubPlot1.set_title('Signals in the time domain')
+    hSubPlot1.plot(vT, vSig, 'b-', label='original signal')
+    hSubPlot1.plot(vT, vObSig, 'r-', label='signal after the front-end')
+    hSubPlot1.legend()
+
+    hSubPlot2 = hFig1.add_subplot(212)
+    hSubPlot2.set_title('Saturation markers in the time domain')
+    hSubPlot2.plot(vT, vSaturMark, 'g-')
+    hSubPlot2.set_xlabel('Time')
+    hSubPlot2.set_ylim(-1.2, 1.2)
+
+    # -----------------------------------------------------------------
+    plt.show(block=True)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _frontEnd_ex0()
@@ -30,6 +30,7 @@ the time domain and the frequency domain for two randomly chosen signals. |br|
 
 *Version*:
     1.0  | 25-AUG-2015 : * Version 1.0 released. |br|
+    1.1  | 19-OCT-2026 : * The dictionary is a band-restricted sub-dictionary (view on the IDFT dictionary) |br|
 
 *License*:
     BSD 2-Clause
@@ -128,31 +129,17 @@ def _L1_recon_ex2():
     # Generate the dictionary and the Theta matrices
     # -----------------------------------------------------------------
 
-    # Generate the IDFT dictionaries:
-
-    # dictionary #1
-    IDFT.tS = TIME         # time of the dictionaries
+    # Generate the IDFT dictionary which covers both parts of the spectrum
+    IDFT.tS = TIME         # time of the dictionary
     IDFT.fR = FSMP         # representation sampling frequency
     IDFT.fDelta = FDELTA   # the frequency separation between tones
     IDFT.fFirst = FMIN1    # minimum frequency in the dictionary
-    IDFT.nTones = int((FMAX1 - FMIN1) / FDELTA)  # the number of tones
-    IDFT.run()
-    mDict1 = IDFT.mDict.copy()   # Take the dictionary matrix for the 1st part 
-                                 # of the spectrum
-
-    # dictionary #2
-    IDFT.fFirst = FMIN2    # minimum frequency in the dictionary
-    IDFT.nTones = int((FMAX2 - FMIN2) / FDELTA)  # the number of tones
+    IDFT.nTones = int((FMAX2 - FMIN1) / FDELTA)  # the number of tones
     IDFT.run()
-    mDict2 = IDFT.mDict.copy()   # Take the dictionary matrix for the 2nd part 
-                                 # of the spectrum
 
-    # Concatenate the dictionary matrices
-    (nRows, _) = mDict1.shape                     # Cut down the dictionary matrix #1
-    mDict1 = mDict1[np.arange(int(nRows/2)), :]   # ^   
-    (nRows, _) = mDict2.shape                     # Cut down the dictionary matrix #2
-    mDict2 = mDict2[np.arange(int(nRows/2)), :]   # ^
-    mDict = np.vstack((mDict1, mDict2))      
+    # Take positive tones from the 1st and the 2nd part of the spectrum
+    # (the sub-dictionary is a view on the dictionary, rows are not copied)
+    mDict = IDFT.freqBands([(FMIN1, FMAX1 - FDELTA), (FMIN2, FMAX2 - FDELTA)], bPosOnly=1)
 
     # Compute the Theta matrix    
     makeTheta.lPhi = samp.lPhi    # Add the observation matrix
@@ -176,7 +163,7 @@ def _L1_recon_ex2():
     mReconstructed = np.zeros((NSIGS, NSMP))
     for inxSig in np.arange(NSIGS):
         vCoeff = L1recon.lCoeff[inxSig]
-        vSigRecon = np.dot(mDict.T, vCoeff)
+        vSigRecon = mDict.T.dot(vCoeff)
         mReconstructed[inxSig, :] = vSigRecon.real
   
     # -----------------------------------------------------------------
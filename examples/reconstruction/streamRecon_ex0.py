@@ -0,0 +1,117 @@
+"""
+This script is an example of how to use the sliding-window streaming
+reconstruction module. |br|
+
+In this example a long random multitone signal is generated and nonuniformly
+sampled. Then the signal is reconstructed window by window with the streaming
+reconstruction module. |br|
+
+After the reconstruction, the original signal, the observed samples, and the
+reconstructed signal are plot in the time domain. |br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Version 1.0 released. |br|
+
+
+*License*:
+    BSD 2-Clause
+"""
+
+from __future__ import division
+import numpy as np
+import rxcs
+import matplotlib.pyplot as plt
+
+
+def _streamRecon_ex0():
+
+    # ---------------------------------------------------------------------
+    # Settings for the example
+    # ---------------------------------------------------------------------
+    TIME = 4e-3       # Time of the signal is 4 ms
+    FSMP = 1e6        # Signal representation sampling frequency 1MHz
+
+    TWIN = 400e-6     # Time of a reconstruction window is 400 us
+    DELTA = 5e3       # Tone separation is 5KHz
+    FMAX = 100e3      # The highest possible frequency in the spectrum is 100 kHz
+
+    # Things on the board:
+    gen = rxcs.sig.randMult()         # Signal generator
+    samp = rxcs.acq.nonuniANGIE()     # Sampler
+    recon = rxcs.cs.streamRecon()     # Streaming reconstruction
+
+    analysisSNR = rxcs.ana.SNR()      # SNR analysis
+
+    # ---------------------------------------------------------------------
+    # Generate the signal and sample it
+    # ---------------------------------------------------------------------
+
+    # Settings for the generator
+    gen.tS = TIME      # Time of the signal
+    gen.fR = FSMP      # The signal representation sampling frequency
+    gen.fMax = FMAX    # Max frequency
+    gen.fRes = DELTA   # The tone separation in the signals
+
+    gen.nTones = 3     # The number of random tones in the signals
+
+    # Settings for the sampler
+    samp.tS = TIME       # Time of the signal
+    samp.fR = FSMP       # The signal representation sampling freuqnecy
+    samp.Tg = 1e-6       # The sampling grid period
+    samp.fSamp = 100e3   # The average sampling frequency
+
+    # -----------------------------------------------------------------
+    gen.run()               # Run the generator
+    samp.mSig = gen.mSig    # Connect the signal from the generator to the sampler
+    samp.run()              # Run the sampler
+
+    # -----------------------------------------------------------------
+    # Reconstruct the signal, window by window
+    # -----------------------------------------------------------------
+    recon.vObSig = samp.lObSig[0]                  # The observed signal
+    recon.vPattRep = samp.lPattsRep[0].astype(int) # Indices of the observed samples
+    recon.fR = FSMP                                # The signal representation sampling frequency
+    recon.tS = TIME                                # Time of the signal
+    recon.tW = TWIN                                # Time of a window
+    recon.tOverlap = TWIN / 4                      # Time of overlap of windows
+    recon.fDelta = DELTA                           # The frequency separation between tones
+    recon.nTones = int(FMAX / DELTA)               # The number of tones in the dictionary
+
+    # Blocks of the reconstructed signal may be processed one by one:
+    #
+    #   for vBlock in recon.blocks():
+    #       ...
+    #
+    # here all the blocks are collected into one signal
+    recon.run()
+    vSigRecon = recon.vSig
+
+    # -----------------------------------------------------------------
+    # Measure the SNR of the reconstruction
+    # -----------------------------------------------------------------
+    analysisSNR.mSigRef = gen.mSigNN    # Nonnoisy signal from the generator is a a reference signal
+    analysisSNR.mSig = vSigRecon        # Reconstructed signal is a signal under test
+    analysisSNR.run()                   # Run the reconstruction
+
+    # ---------------------------------------------------------------------
+    # Plot the original signal, reconstructed signal and signal samples
+    # ---------------------------------------------------------------------
+    hFig1 = plt.figure(1)
+    hSubPlot1 = hFig1.add_subplot(111)
+    hSubPlot1.plot(gen.vT, gen.mSig[0, :], 'g-', label="original sig")
+    hSubPlot1.plot(gen.vT, vSigRecon, 'b--', label="reconstructed sig")
+    hSubPlot1.plot(samp.lPattsT[0], samp.lObSig[0],
+                   '*r', label="observed samps", markersize=10)
+    hSubPlot1.set_xlabel('time')
+    hSubPlot1.grid(True)
+    hSubPlot1.legend(loc="best")
+    plt.show(block=True)
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _streamRecon_ex0()
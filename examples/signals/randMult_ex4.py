@@ -0,0 +1,80 @@
+"""
+This script is an example of how to use the Random Multitone Signal
+Generator module with the generator of packs of signals. |br|
+
+In this example 100 000 random multitone signals are generated in packs.
+Only one pack of signals is kept in the memory at a time, the memory budget
+for a pack is 16 MB. |br|
+
+Time of the signals is 1 ms, the signal representation sampling frequency
+is 1 MHz. The highest possible frequency of a tone in the signal is 400 kHz,
+the signal spectrum resolution is 1 kHz. |br|
+
+The signals contain 5 random tones. |br|
+
+The power of the signals is adjusted to 1 W. |br|
+
+The noise is added to the signals, the SNR of the signals is 20 dB. |br|
+
+The power spectrum of the signals is averaged over all the packs and
+plotted.
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import rxcs
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def _randMult_ex4():
+
+    # Put the generator on board
+    gen = rxcs.sig.randMult()
+
+    # Settings for the generator
+    gen.tS = 1e-3       # Time of the signal is 1 ms
+    gen.fR = 1e6        # The signal representation sampling frequency is 1 MHz
+    gen.fMax = 400e3    # The highest possible frequency in the signal is 400 kHz
+    gen.fRes = 1e3      # The signal spectrum resolution is 1 kHz
+
+    gen.nTones = 5      # The number of random tones
+
+    gen.iP = 1          # Power of the signals
+    gen.iSNR = 20       # Level of noise in the signals
+
+    # The number of signals to be generated
+    gen.nSigs = 100000
+
+    # Run the generator of packs of signals (memory budget for a pack is 16 MB)
+    # and average the power spectrum of the signals
+    vPSD = 0
+    for dPack in gen.packs(iMemPack=2**24):
+        mSpect = np.fft.rfft(dPack['mSig'], axis=1)
+        vPSD = vPSD + np.sum(np.abs(mSpect)**2, axis=0)
+    vPSD = vPSD / (gen.nSigs * gen.nSmp**2)
+    vF = np.fft.rfftfreq(gen.nSmp, 1/gen.fR)
+
+    # -----------------------------------------------------------------
+    # Plot the averaged power spectrum
+    hFig1 = plt.figure(1)
+    hSubPlot1 = hFig1.add_subplot(111)
+    hSubPlot1.grid(True)
+    hSubPlot1.set_title('Averaged power spectrum of %d random multitone signals' % gen.nSigs)
+    hSubPlot1.set_xlabel('Frequency [Hz]')
+    hSubPlot1.plot(vF, vPSD, '-')
+
+    plt.show(block=True)
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _randMult_ex4()
@@ -0,0 +1,80 @@
+"""
+This script is an example of how to use the Random Multitone Signal
+Generator module with the generator of time blocks of signals. |br|
+
+In this example 2 long random multitone signals are generated in time blocks
+and written into a memory-mapped file. |br|
+
+Time of the signals is 10 s, the signal representation sampling frequency
+is 5 MHz (50 million samples in a signal). The highest possible frequency
+of a tone in the signal is 2 MHz, the signal spectrum resolution is 1 kHz. |br|
+
+The signals contain 10 random tones. |br|
+
+The power of the signals is adjusted to 1 W. |br|
+
+After the generation, the first millisecond of the signals is plotted.
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import os
+import tempfile
+import rxcs
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def _randMult_ex5():
+
+    # Put the generator on board
+    gen = rxcs.sig.randMult()
+
+    # Settings for the generator
+    gen.tS = 10         # Time of the signal is 10 s
+    gen.fR = 5e6        # The signal representation sampling frequency is 5 MHz
+    gen.fMax = 2e6      # The highest possible frequency in the signal is 2 MHz
+    gen.fRes = 1e3      # The signal spectrum resolution is 1 kHz
+
+    gen.nTones = 10     # The number of random tones
+
+    gen.iP = 1          # Power of the signals
+
+    gen.nSigs = 2       # The number of signals to be generated
+
+    gen.strDType = 'float32'   # Samples of the signals are stored as float32
+
+    # Generate the signals in time blocks and write them into a file
+    strFile = os.path.join(tempfile.gettempdir(), 'randMult_ex5.npy')
+    mSig = gen.toFile(strFile)
+
+    # -----------------------------------------------------------------
+    # Plot the first millisecond of the signals
+    nSmpPlot = int(1e-3 * gen.fR)
+    hFig1 = plt.figure(1)
+    hSubPlot1 = hFig1.add_subplot(111)
+    hSubPlot1.grid(True)
+    hSubPlot1.set_title('The first millisecond of the signals')
+    hSubPlot1.set_xlabel('Time [s]')
+    hSubPlot1.plot(gen.vT[:nSmpPlot], mSig[0, :nSmpPlot], '-')
+    hSubPlot1.plot(gen.vT[:nSmpPlot], mSig[1, :nSmpPlot], '-')
+
+    plt.show(block=True)
+
+    # Remove the file with the signals
+    del mSig
+    gen.mSig = None
+    os.remove(strFile)
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _randMult_ex5()
@@ -17,3 +17,6 @@ from nonuniExtern import nonuniExtern
 # Import saturation block
 from satur import satur
 
+
+# Import fused front-end (amplifier, saturation, quantization)
+from frontEnd import frontEnd
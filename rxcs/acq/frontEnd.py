@@ -0,0 +1,262 @@
+"""
+This is a model of a receiver front-end: a nonlinear low-noise amplifier,
+a saturation block and a uniform quantizer (ADC), fused into one stage. |br|
+
+The stages of the front-end are:
+
+   1. nonlinear amplifier:  y(t) = a_1 * x(t) + a_2 * x(t)^2 + ... + a_n * x(t)^n
+      (the polynomial is evaluated with the Horner's scheme, as in rxcs.sig.LNA)
+
+   2. saturation:  y(t) is clipped to [iMinAmp, iMaxAmp]
+
+   3. uniform quantization:  2^nBits levels in [iMinAmp, iMaxAmp]
+      (a mid-rise quantizer, levels are in the middles of the quantization steps)
+
+Every stage is optional. The signals are processed in one pass, block after
+block (a block has at most 2^16 samples), so all the stages are applied to a
+block while the block is in the processor cache. The signals may be processed
+in place. The numbers of saturated samples are counted on the fly, the
+saturation markers are stored as a compact int8 matrix
+(0: not saturated, 1: saturated by higher limit, -1: saturated by lower limit).
+
+*Examples*:
+    Please go to the *examples/acquisitions* directory for examples on how to
+    use the front-end. |br|
+
+*Settings*:
+    Parameters of the front-end are described below.
+
+    Take a look on '__parametersDefine' function for more info on the
+    parameters.
+
+    Parameters of the front-end are attributes of the class which
+    must/can be set before the front-end is run.
+
+    Required parameters:
+
+    - a. **mSig** (*Numpy array 2D*): Input signals
+
+
+    Optional parameters:
+
+    - b. **vCoef** (*Numpy array 1D*):  Amplifier coefficients, a_k = vCoef[k-1]
+                                        [default = not given: no amplifier]
+
+    - c. **iMinAmp** (*float*): minimum allowed amplitude of a signal
+                                [default = not given: no lower limit]
+
+    - d. **iMaxAmp** (*float*): maximum allowed amplitude of a signal
+                                [default = not given: no higher limit]
+
+    - e. **nBits** (*int*): the number of bits of the quantizer (both amplitude
+                            limits must be given) [default = not given: no quantization]
+
+    - f. **bInPlace** (*int*):  process the input signals in place (the input
+                                signals must be a float matrix, otherwise
+                                ValueError is raised) [default = 0]
+
+    - g. **bMute** (*int*):    mute the console output from the front-end [default = 0]
+
+
+*Output*:
+    Description of the front-end output is below.
+    This is the list of attributes of the front-end class which are
+    available after calling the 'run' method:
+
+    - a. **mObSig** (*Numpy array 2D*): observed signals (output of the front-end)
+
+    - b. **mSaturMark** (*Numpy array 2D*): saturation markers (int8)
+
+    - c. **nSatMin** (*int*):  the number of samples saturated by the lower limit
+
+    - d. **nSatMax** (*int*):  the number of samples saturated by the higher limit
+
+    - e. **nSat** (*int*):  the total number of saturated samples
+
+    - f. **nSatPerc** (*float*):  the percentage of saturated samples
+
+    - g. **iQStep** (*float*):  the quantization step (NaN if there is no quantization)
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+    1.0r1  | 19-OCT-2026 : * Signals which are not float are refused to be processed in place |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import rxcs
+import numpy as np
+from rxcs.sig.LNA import horner
+
+
+class frontEnd(rxcs._RxCSobject):
+
+    def __init__(self, *args):
+        rxcs._RxCSobject.__init__(self)    # Make it a RxCS object
+
+        self.strRxCSgroup = 'Acquisition'       # Name of group of RxCS modules
+        self.strModuleName = 'front-end'        # Module name
+
+        self.__inputSignals()          # Define input signals
+        self.__parametersDefine()      # Define the parameters
+
+    # Input signals
+    def __inputSignals(self):
+
+        # 1d/2d array with input signals, one signal p. row
+        self.paramAddMan('mSig', 'Input signals', noprint=1)
+        self.paramType('mSig', np.ndarray)
+        self.paramTypeEl('mSig', (int, float))
+        self.paramNDimLE('mSig', 2)
+
+    # Define parameters
+    def __parametersDefine(self):
+
+        # Amplifier coefficients
+        self.paramAddOpt('vCoef', 'Amplifier coefficients', noprint=1)
+        self.paramType('vCoef', np.ndarray)        # Must be of a numpy array...
+        self.paramTypeEl('vCoef', (int, float))    # ...with float/int elements
+        self.paramSizH('vCoef', 0)                 # Size must be higher than 0
+        self.paramNDimEq('vCoef', 1)               # vCoef must be 1-dimensional
+
+        # The minimum allowed amplitude of a signal
+        self.paramAddOpt('iMinAmp', 'The minimum allowed amplitude of a signal')
+        self.paramType('iMinAmp', (int, float))   # Must be of int or float type
+
+        # The maximum allowed amplitude of a signal
+        self.paramAddOpt('iMaxAmp', 'The maximum allowed amplitude of a signal')
+        self.paramType('iMaxAmp', (int, float))   # Must be of int or float type
+        self.paramH('iMaxAmp', 'iMinAmp')         # The maximum allowed amplitude must be higher than the minimum amplitude
+
+        # The number of bits of the quantizer
+        self.paramAddOpt('nBits', 'The number of bits of the quantizer')
+        self.paramType('nBits', int)              # Must be of int type
+        self.paramH('nBits', 0)                   # The number of bits must be higher than zero
+        self.paramLE('nBits', 32)                 # ...and lower or equal to 32
+
+        # Process the signals in place
+        self.paramAddOpt('bInPlace', 'Process the signals in place', noprint=1, default=0)
+        self.paramType('bInPlace', int)
+        self.paramAllowed('bInPlace', [0, 1])
+
+        # 'Mute the output' flag
+        self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
+        self.paramType('bMute', int)           # Must be of int type
+        self.paramAllowed('bMute',[0, 1])      # It can be either 1 or 0
+
+    # Run
+    def run(self):
+        self.parametersCheck()         # Check if all the needed partameters are in place and are correct
+        self.parametersPrint()         # Print the values of parameters
+
+        self.engineStartsInfo()  # Info that the engine starts
+        self.__engine()          # Run the engine
+        self.engineStopsInfo()   # Info that the engine ends
+        return self.__dict__     # Return dictionary with the parameters
+
+    # Engine
+    def __engine(self):
+
+        mSig = self.mSig
+        if mSig.ndim == 1:
+            mSig = mSig.reshape(1, mSig.size)
+        (self.nSigs, self.nSamps) = mSig.shape
+
+        # Amplitude limits
+        iMinAmp = self.iMinAmp if self.wasParamGiven('iMinAmp') else -np.inf
+        iMaxAmp = self.iMaxAmp if self.wasParamGiven('iMaxAmp') else np.inf
+        bSatur = self.wasParamGiven('iMinAmp') or self.wasParamGiven('iMaxAmp')
+
+        # Quantization step
+        if self.wasParamGiven('nBits'):
+            if not (self.wasParamGiven('iMinAmp') and self.wasParamGiven('iMaxAmp')):
+                raise ValueError('Quantization requires both amplitude limits (iMinAmp and iMaxAmp)!')
+            self.iQStep = (iMaxAmp - iMinAmp) / 2**self.nBits
+        else:
+            self.iQStep = np.nan
+
+        # Output signals and saturation markers
+        if self.bInPlace:
+            if not np.issubdtype(mSig.dtype, np.floating):
+                raise ValueError('Only a float matrix with signals can be processed in place (bInPlace)!')
+            self.mObSig = mSig
+        else:
+            self.mObSig = np.empty(mSig.shape, dtype=np.result_type(mSig, float))
+        self.mSaturMark = np.zeros(mSig.shape, dtype=np.int8)
+
+        # Process the signals, block after block
+        self.nSatMin = 0
+        self.nSatMax = 0
+        nSmpBlock = 2**16
+        nSigsPack = max(1, int(nSmpBlock / self.nSamps))
+        for inxSig in range(0, self.nSigs, nSigsPack):
+            vRows = slice(inxSig, min(inxSig + nSigsPack, self.nSigs))
+            for inxSmp in range(0, self.nSamps, nSmpBlock):
+                vCols = slice(inxSmp, min(inxSmp + nSmpBlock, self.nSamps))
+                self._processBlock(mSig[vRows, vCols], self.mObSig[vRows, vCols], self.mSaturMark[vRows, vCols],
+                                   iMinAmp, iMaxAmp, bSatur)
+
+        # Print results of saturation
+        self._printResults()
+
+        # Store the total number of saturated samples and the average percentage of saturated samples in the signals
+        self.nSat = self.nSatMin + self.nSatMax
+        self.nSatPerc = self.nSat/(self.nSamps*self.nSigs)*100
+        return
+
+    def _processBlock(self, mX, mY, mMark, iMinAmp, iMaxAmp, bSatur):
+        """
+        This function processes one block of signals: the amplifier, the
+        saturation and the quantization. Results are written into the blocks
+        of the output signals (mY) and of the saturation markers (mMark).
+        """
+
+        # Nonlinear amplifier
+        if self.wasParamGiven('vCoef'):
+            horner(mX, self.vCoef, mY)
+        elif mY is not mX:
+            mY[...] = mX
+
+        # Saturation (markers and counts are computed on the fly)
+        if bSatur:
+            mSatMax = (mY > iMaxAmp)
+            mSatMin = (mY < iMinAmp)
+            mMark[...] = mSatMax.view(np.int8) - mSatMin.view(np.int8)
+            self.nSatMax += np.count_nonzero(mSatMax)
+            self.nSatMin += np.count_nonzero(mSatMin)
+            np.clip(mY, iMinAmp, iMaxAmp, out=mY)
+
+        # Uniform quantization (mid-rise)
+        if not np.isnan(self.iQStep):
+            mY -= iMinAmp
+            mY /= self.iQStep
+            np.floor(mY, out=mY)
+            np.clip(mY, 0, 2**self.nBits - 1, out=mY)
+            mY += 0.5
+            mY *= self.iQStep
+            mY += iMinAmp
+        return
+
+    # =================================================================
+    # Print some statistical info about the results
+    # =================================================================
+    def _printResults(self):
+        """
+        This function prints the numbers of saturated samples.
+        """
+        if self.bMute == 0:
+            nSamps = self.nSamps * self.nSigs
+            print('')
+            rxcs.console.bullet_param('The total number of signals is', self.nSigs, '-', '')
+            rxcs.console.param('The number of samples in one signal is', self.nSamps, '-', 'samples')
+
+            rxcs.console.bullet_param('The total number of saturated samples', self.nSatMin + self.nSatMax, '-', 'samples')
+            rxcs.console.param('which is', (self.nSatMin + self.nSatMax)/nSamps*100, ' ', '%')
+
+            rxcs.console.param('The total number of saturated samples because of too low value', self.nSatMin, '-', 'samples')
+            rxcs.console.param('The total number of saturated samples because of too high value', self.nSatMax, '-', 'samples')
+        return
@@ -0,0 +1 @@
+../../test/acquisitions/frontEnd_test.py
\ No newline at end of file
@@ -45,7 +45,11 @@ available in arXiv: http://arxiv.org/abs/1409.1002
     - h. **tMax** (*float*):    maximum allowed time between the sampling moments
                                 [default = maximum time not set]
 
-    - i. **bMute** (*int*):    mute the console output from the sampler [default = 0]
+    - i. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the sampler
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+    - j. **bMute** (*int*):    mute the console output from the sampler [default = 0]
 
 
 *Output*:
@@ -116,6 +120,7 @@ available in arXiv: http://arxiv.org/abs/1409.1002
     2.2    | 24-AUG-2015 :  *  **lObSig**, **lPatts**, **lPattsRep**, **lPattsT** added to the output |br|
     2.2r1  | 20-JAN-2016 :  *  Grid / representation sampling frequency compatibility check is secured against 
                                floating-point inaccuracy issues |br|
+    2.3    | 19-OCT-2026 :  *  Seed of the stream of random numbers (iSeed) |br|
 
 *License*:
     BSD 2-Clause 
@@ -192,6 +197,10 @@ class nonuniANGIE(rxcs._RxCSobject):
         self.paramType('tMax', (int, float))     # Must be of int or float type
         self.paramH('tMax', 0)                   # Maximum time must be higher than zero
 
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -216,6 +225,7 @@ class nonuniANGIE(rxcs._RxCSobject):
         self._computeParam()    # Compute parameters of sampling
         self._checkConf()       # Check configuration of sampling
 
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)   # Stream of random numbers
         self._generatePatterns()     # Generate the sampling patterns   
         self._sampleSignals()        # Sample the signals
         self._generObser()           # Generate the observation matrices
@@ -572,13 +582,13 @@ class nonuniANGIE(rxcs._RxCSobject):
             if k == 0:
     
                 # Draw the sampling moment (uniformly)
-                nk = math.ceil(np.random.rand()*nddag_k)
+                nk = math.ceil(self.randState.rand()*nddag_k)
             # -------------------------------------------------------------
             # -------------------------------------------------------------
     
             else:
                 # Draw Gaussian
-                xk = np.random.randn()
+                xk = self.randState.randn()
     
                 # Draw the sampling point
                 nk = Enk + math.sqrt(sigma)*xk*nd_k
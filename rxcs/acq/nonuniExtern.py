@@ -61,7 +61,11 @@ is applied on every signal.  |br|
                                            the mumber of input signals.
                                            [default = not given]
 
-    - g. **bMute** (*int*):    mute the console output from the sampler 
+    - g. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the sampler
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+    - h. **bMute** (*int*):    mute the console output from the sampler 
                                [default = 0]
 
 
@@ -88,7 +92,9 @@ is applied on every signal.  |br|
 
     Observation matrices:                         
     - f. **lPhi** (list)   List with observation matrices.
-                           One matrix p. signal.
+                           One matrix p. signal. Signals sampled with the same
+                           sampling pattern share the same observation matrix
+                           (the same object, it should not be modified in place).
 
 
 *Author*:
@@ -98,6 +104,8 @@ is applied on every signal.  |br|
     0.1  | 1-SEP-2014 : * Initial version. |br|
     1.0  | 12-SEP-2014 : * Version 1.0 is ready. |br|
     2.0  | 19-AUG-2015 : * Version 2.0 is ready. |br|
+    2.1  | 19-OCT-2026 : * Observation matrix is generated once for every used sampling pattern |br|
+    2.2  | 19-OCT-2026 : * Seed of the stream of random numbers (iSeed) |br|
 
 *License*:
     BSD 2-Clause
@@ -165,6 +173,10 @@ class nonuniExtern(rxcs._RxCSobject):
         self.paramDimEq('vPattInx', 'mSig', 0, 'rows')   # The number of indices must equal the number of signals in mSig
         self.paramHE('vPattInx', 0)                      # All the indices must be higher or equal to 0
 
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)            # Must be of int type
@@ -183,6 +195,9 @@ class nonuniExtern(rxcs._RxCSobject):
 
     def __engine(self):
 
+        # Stream of random numbers
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)
+
         # Make the array with signals a 2 dimensional array, if it was given
         if self.wasParamGivenVal(self.mSig):
             self.mSig = self.makeArray2Dim(self.mSig)
@@ -284,7 +299,7 @@ class nonuniExtern(rxcs._RxCSobject):
         # Construct a vector with indices for sampling patterns,
         # if such a vector was not yet given
         if not self.wasParamGivenVal(vPattInx):
-            vPattInx = np.random.randint(0, nPatts, nSigs)
+            vPattInx = self.randState.randint(0, nPatts, nSigs)
 
         mObSig = np.nan * np.zeros((nSigs, iMaxPat))  # Allocate an array for the observed signals
 
@@ -331,11 +346,16 @@ class nonuniExtern(rxcs._RxCSobject):
         lPhi = []    
 
         # Generate the observation matrices for every signal, if the signals were given
+        # (an observation matrix is generated once for every used pattern, 
+        #  signals sampled with the same pattern share the matrix)
         if nSigs > 0:
+            dPhi = {}                        # Observation matrices of the used patterns
             for inxSig in np.arange(nSigs):  # <- loop over all signals
-                vPatt = mPattsRep[vPattInx[inxSig], :]     # Take the current pattern   
-                mPhi = self._gener1Obser(vPatt, nSmp)      # Create an observation matrix for the current pattern
-                lPhi.append(mPhi.copy())                   # Add the matrix to the list
+                inxPatt = vPattInx[inxSig]                     # Index of the current pattern
+                if inxPatt not in dPhi:
+                    vPatt = mPattsRep[inxPatt, :]              # Take the current pattern   
+                    dPhi[inxPatt] = self._gener1Obser(vPatt, nSmp)  # Create an observation matrix for the current pattern
+                lPhi.append(dPhi[inxPatt])                     # Add the matrix to the list
 
         # Generate the observation matrices for every pattern (dummy sampler), if the signals were not given
         if nSigs == 0:
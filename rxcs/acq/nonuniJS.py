@@ -38,7 +38,11 @@ available in arXiv: http://arxiv.org/abs/1409.1002
 
     - f. **iSigma** (*float*):  variance of Gaussian random process [default = 1]
 
-    - g. **bMute** (*int*):    mute the console output from the sampler [default = 0]
+    - g. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the sampler
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+    - h. **bMute** (*int*):    mute the console output from the sampler [default = 0]
 
 
 *Output*:
@@ -83,6 +87,7 @@ available in arXiv: http://arxiv.org/abs/1409.1002
     1.1    | 9-MAR-2015  :  * Observation matrices are grouped in a list, not in a 3D Numpy array |br|
     2.0    | 14-AUG-2015 :  * Objectified version (2.0) |br|
     2.0r1  | 18-AUG-2015 :  * Adjusted to RxCSObject v1.0 |br|
+    2.1    | 19-OCT-2026 :  * Seed of the stream of random numbers (iSeed) |br|
 
 
 *License*:
@@ -150,6 +155,10 @@ class nonuniJS(rxcs._RxCSobject):
         self.paramH('iSigma', 0)                 # Variance must be higher than zero
         self.paramL('iSigma', np.inf)            # ...and lower than infinity
 
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -174,6 +183,7 @@ class nonuniJS(rxcs._RxCSobject):
         self._computeParam()    # Compute parameters of sampling
         self._checkConf()       # Check configuration of sampling
 
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)   # Stream of random numbers
         self._generatePatterns()     # Generate the sampling patterns   
         self._sampleSignals()        # Sample the signals
         self._generObser()           # Generate the observation matrices
@@ -461,7 +471,7 @@ class nonuniJS(rxcs._RxCSobject):
         for inxSmp in range(1, nK_s+1):
     
             # Draw the current time point
-            x_k = np.random.randn()
+            x_k = self.randState.randn()
             nstar_hatk = round(inxSmp*nT + np.sqrt(sigma) * x_k * nT)
     
             # Store the time point in the vector,
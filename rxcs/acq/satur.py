@@ -69,7 +69,7 @@ the saturated sampling points are removed.
     Observed signals:
     - a. **mObSig** (*Numpy array 2D*): observed saturated signals
 
-    - b. **mSaturMark** (*Numpy array 2D*): saturation markers   
+    - b. **mSaturMark** (*Numpy array 2D*): saturation markers (int8)
 
     - c. **lObSigClean** (list):  observed signals with saturated samples 
                                   removed
@@ -106,6 +106,7 @@ the saturated sampling points are removed.
     2.0    | 17-AUG-2015 : * Objectified version (2.0) |br|
     2.0r1  | 18-AUG-2015 : * Restricitons added onto input parameters |br|
     2.0r2  | 18-AUG-2015 : * Adjusted to RxCSObject v1.0 |br|
+    2.1    | 19-OCT-2026 : * Saturation markers are int8, signals are clipped with 'np.clip' |br|
 
 
 *License*:
@@ -243,18 +244,16 @@ class satur(rxcs._RxCSobject):
     
         # -----------------------------------------------------------------
         # Saturation markers
-        mSaturMark = np.zeros(mSig.shape)      # Create an array with saturation markers
-        mSaturMark[mSig < iMinAmp] = -1     # Samples saturated because of too low value
-        mSaturMark[mSig > iMaxAmp] = 1      # Samples saturated because of too high value
-    
-        nSatMin = mSaturMark[mSaturMark == -1].size   # The total number of saturated samples because of too low value
-        nSatMax = mSaturMark[mSaturMark == 1].size    # The total number of saturated samples because of too high value
+        mSatMax = (mSig > iMaxAmp)          # Samples saturated because of too high value
+        mSatMin = (mSig < iMinAmp)          # Samples saturated because of too low value
+        mSaturMark = mSatMax.view(np.int8) - mSatMin.view(np.int8)   # Saturation markers (int8)
+
+        nSatMin = np.count_nonzero(mSatMin)   # The total number of saturated samples because of too low value
+        nSatMax = np.count_nonzero(mSatMax)   # The total number of saturated samples because of too high value
 
         # -----------------------------------------------------------------
         # Generate the observed saturated signals
-        mObSig = mSig.copy()
-        mObSig[mSaturMark == -1] = self.iMinAmp
-        mObSig[mSaturMark == 1] = self.iMaxAmp
+        mObSig = np.clip(mSig, iMinAmp, iMaxAmp)
         
         return (mSaturMark, nSatMin, nSatMax, mObSig)
         
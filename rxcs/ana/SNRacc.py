@@ -0,0 +1,346 @@
+"""|
+This module contains SNR accumulator of the reconstructed signals. |br|
+
+The accumulator is fed with packs of signals (f.e. packs of signals
+processed in the multi CPU wrapper, rxcs.auxiliary.parExp), pack after pack.
+Every call of the 'run' method adds a pack of signals to the accumulated
+statistics. The statistics of all the signals fed so far are available
+after every call of the 'run' method.
+
+The signals in a pack are processed in chunks of rows, so that the memory
+needed by the accumulator is bounded by the size of a chunk and does not
+depend on the size of the whole experiment.
+
+The accumulated statistics may be cleared with the 'reset' method.
+Two accumulators (f.e. used in different processes) may be merged with
+the 'merge' method. Only accumulators with the same success threshold and
+the same edges of bins of the SNR histogram may be merged.
+
+*Examples*:
+    Please go to the *examples/analysis* directory for examples
+    on how to use the SNR analysis modules. |br|
+
+*Settings*:
+    Parameters of the SNR accumulator are described below.
+
+    Take a look on '__inputSignals' function for more info on the
+    parameters.
+
+    Parameters of the SNR accumulator are attributes of the class which
+    must/can be set before the accumulator is run.
+
+    Required parameters:
+
+    - a. **mSig** (*2D Numpy array*): pack with signals to be tested
+
+    - b. **mSigRef** (*2D Numpy array*): pack with reference signals
+
+    Optional parameters:
+
+    - c. **strComment** (*string*):   an optional comment to the name of
+                                      the SNR accumulator module
+
+    - d. **iSNRSuccess** (*float*):   success threshold. SNR over this
+                                      threshold is treated as a successful
+                                      reconstruction [default = not given]
+
+    - e. **vSNREdges** (*1D Numpy array*):  edges of bins of the SNR histogram
+                                            [default = not given]
+
+    - f. **iNSigsChunk** (*int*):  the max number of signals processed in one
+                                   chunk [default = 128]
+
+    - g. **bMute** (*int*):    mute the console output from the module [default = 0]
+
+
+*Output*:
+    Description of the SNR accumulator output is below.
+    This is the list of attributes of the class which are available after
+    calling the 'run' method:
+
+    - a. **nSigs** (*int*):  the number of signals accumulated so far
+
+    - b. **iSNR** (*float*):  the average SNR
+
+    - c. **iSNRStd** (*float*):  standard deviation of SNR
+
+    - d. **iSNRMin** (*float*):  the lowest SNR
+
+    - e. **iSNRMax** (*float*):  the highest SNR
+
+    - f. **iSR** (*float*):  average success ratio
+
+    - g. **vSNRHist** (*1D Numpy array*):  histogram of SNR (only if the edges of
+                                           bins of the histogram are given)
+
+    - h. **vSNR** (*1D Numpy array*):  SNR for every signal in the last pack
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+    1.0r1  | 19-OCT-2026 : * Accumulators with different settings are not merged |br|
+
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+class SNRacc(rxcs._RxCSobject):
+
+    def __init__(self, *args):
+        rxcs._RxCSobject.__init__(self)    # Make it a RxCS object
+
+        self.strRxCSgroup = 'Analysis'          # Name of group of RxCS modules
+        self.strModuleName = 'SNR accumulator'  # Module name
+
+        self.__inputSignals()      # Define the input signals
+        self.__parametersDefine()  # Define the parameters
+
+        self.reset()               # Clear the accumulated statistics
+
+    # Define parameters
+    def __inputSignals(self):
+
+        # Signal under test
+        self.paramAddMan('mSig', 'Signal under test', noprint=1)
+        self.paramType('mSig', np.ndarray)         # Must be a Numpy array
+        self.paramTypeEl('mSig', (int, float))     # Elements must be of float or int type
+        self.paramNDimLE('mSig', 2)                # Must be a 1, or 2 dimensional matrix
+
+        # Reference signal
+        self.paramAddMan('mSigRef', 'Reference signal', noprint=1)
+        self.paramType('mSigRef', np.ndarray)         # Must be a Numpy array
+        self.paramTypeEl('mSigRef', (int, float))     # Elements must be of float or int type
+        self.paramNDimLE('mSigRef', 2)                # Must be a 1, or 2 dimensional matrix
+        self.paramDimEq('mSigRef', 'mSig', 'rows', 'rows')         # Must have shape equal to mSig
+        self.paramDimEq('mSigRef', 'mSig', 'columns', 'columns')   # ^
+
+    # Define parameters
+    def __parametersDefine(self):
+
+        # Success threshold
+        self.paramAddOpt('iSNRSuccess', 'Success threshold')
+        self.paramType('iSNRSuccess', (int, float))   # Must be a number
+        self.paramH('iSNRSuccess', -np.inf)
+        self.paramL('iSNRSuccess', np.inf)
+
+        # Edges of bins of the SNR histogram
+        self.paramAddOpt('vSNREdges', 'Edges of bins of the SNR histogram', noprint=1)
+        self.paramType('vSNREdges', np.ndarray)       # Must be a Numpy array
+        self.paramTypeEl('vSNREdges', (int, float))   # Elements must be of float or int type
+        self.paramNDimEq('vSNREdges', 1)              # Must be a 1 dimensional matrix
+        self.paramSizH('vSNREdges', 1)                # At least two edges are needed
+
+        # The max number of signals processed in one chunk
+        self.paramAddOpt('iNSigsChunk', 'The max number of signals processed in one chunk', default=128)
+        self.paramType('iNSigsChunk', int)        # Must be of int type
+        self.paramH('iNSigsChunk', 0)             # It must be higher than 0
+
+        # Additional comment in printing
+        self.paramAddOpt('strComment', 'Additional comment in printing', noprint=1, default='')
+        self.paramType('strComment', (str))   # Must be a string
+
+        # 'Mute the output' flag
+        self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
+        self.paramType('bMute', int)           # Must be of int type
+        self.paramAllowed('bMute',[0, 1])      # It can be either 1 or 0
+
+    # Run
+    def run(self):
+
+        self.parametersCheck()    # Check if all the needed partameters are in place and are correct
+        self.addComment2Name()    # Add a comment to the name of the SNR accumulator, if needed
+
+        self.parametersPrint()    # Print the values of parameters
+
+        self.engineStartsInfo()  # Info that the engine starts
+        self.__engine()          # Run the engine
+        self.engineStopsInfo()   # Info that the engine ends
+        return self.__dict__     # Return dictionary with the parameters
+
+    # Add a comment to the name of the module, if needed
+    def addComment2Name(self):
+        if not (self.strComment == ''):
+            if not 'strModuleName_' in self.__dict__:
+                self.strModuleName_ = self.strModuleName
+            self.strModuleName = self.strModuleName_ + ' [' + self.strComment + ']'
+            self.strComment = ''
+        return
+
+    # Clear the accumulated statistics
+    def reset(self):
+        """
+        Clear the statistics accumulated so far.
+        """
+        self.nSigs = 0            # The number of signals accumulated so far
+        self.nSuccess = 0         # The number of successful reconstructions
+        self.iSNR = np.nan        # The average SNR
+        self.iSNRM2 = 0.0         # Sum of squared differences from the average SNR
+        self.iSNRStd = np.nan     # Standard deviation of SNR
+        self.iSNRMin = np.inf     # The lowest SNR
+        self.iSNRMax = -np.inf    # The highest SNR
+        self.iSR = np.nan         # Success ratio
+        if 'vSNRHist' in self.__dict__:
+            del self.vSNRHist
+        return
+
+    # Merge statistics accumulated by another accumulator
+    def merge(self, other):
+        """
+        Add statistics accumulated by another SNR accumulator to the
+        statistics of this accumulator. Both the accumulators must have the
+        same success threshold (or both must have no threshold) and the same
+        edges of bins of the SNR histogram (or both must have no histogram).
+
+        Args:
+            other (SNRacc):  another SNR accumulator
+
+        Returns:
+            nothing
+        """
+        if self._getSetting('iSNRSuccess') != other._getSetting('iSNRSuccess'):
+            raise ValueError('SNR accumulators with different success thresholds can not be merged!')
+        vSNREdges = self._getSetting('vSNREdges')
+        vSNREdgesOther = other._getSetting('vSNREdges')
+        if (vSNREdges is None) != (vSNREdgesOther is None) or \
+           (vSNREdges is not None and not np.array_equal(vSNREdges, vSNREdgesOther)):
+            raise ValueError('SNR accumulators with different edges of bins of the histogram can not be merged!')
+        if other.nSigs == 0:
+            return
+        self._accumulate(other.nSigs, other.iSNR, other.iSNRM2, other.iSNRMin, other.iSNRMax, other.nSuccess)
+        if 'vSNRHist' in other.__dict__:
+            if 'vSNRHist' in self.__dict__:
+                self.vSNRHist = self.vSNRHist + other.vSNRHist
+            else:
+                self.vSNRHist = other.vSNRHist.copy()
+        return
+
+    # Get a setting of the accumulator
+    def _getSetting(self, strName):
+        """
+        This function returns the value of a setting of the accumulator,
+        or None if the setting was not given.
+        """
+        if self.wasParamGiven(strName):
+            return self.__dict__[strName]
+        return None
+
+    # Engine - compute SNR of the current pack and accumulate statistics
+    def __engine(self):
+
+        # Make the 2D matrices with signals under test and reference signals
+        self.mSig = self.makeArray2Dim(self.mSig)
+        self.mSigRef = self.makeArray2Dim(self.mSigRef)
+
+        # Compute SNR of signals in the current pack, chunk by chunk
+        self.vSNR = self._computeSNR(self.mSig, self.mSigRef, self.iNSigsChunk)
+
+        # Accumulate statistics of the current pack
+        nSigs = self.vSNR.size
+        iSNR = self.vSNR.mean()
+        iSNRM2 = np.sum((self.vSNR - iSNR)**2)
+        nSuccess = 0
+        if self.wasParamGiven('iSNRSuccess'):
+            nSuccess = np.sum(self.vSNR >= self.iSNRSuccess)
+        self._accumulate(nSigs, iSNR, iSNRM2, self.vSNR.min(), self.vSNR.max(), nSuccess)
+
+        # Accumulate histogram of SNR
+        if self.wasParamGiven('vSNREdges'):
+            (vSNRHist, _) = np.histogram(self.vSNR, self.vSNREdges)
+            if 'vSNRHist' in self.__dict__:
+                self.vSNRHist = self.vSNRHist + vSNRHist
+            else:
+                self.vSNRHist = vSNRHist
+
+        # Print results
+        if self.bMute == 0:
+            self._printResults()
+
+        return
+
+    # Compute SNR of signals, chunk by chunk
+    def _computeSNR(self, mSig, mSigRef, iNSigsChunk):
+        """
+        This function computes SNR of signals. The signals are processed in
+        chunks of rows, the noise of a chunk is computed in a preallocated
+        buffer.
+
+        Args:
+            mSig (Numpy array 2D):     signals under test
+            mSigRef (Numpy array 2D):  reference signals
+            iNSigsChunk (int):         the max number of signals processed in one chunk
+
+        Returns:
+            vSNR (Numpy array 1D):  SNR of every signal
+        """
+        (nSigs, iSizSig) = mSig.shape
+        vNoiseP = np.zeros(nSigs)                    # Power of noise
+        vSigP = np.zeros(nSigs)                      # Power of reference signals
+        mNoise = np.empty((min(iNSigsChunk, nSigs), iSizSig), dtype=np.result_type(mSig, mSigRef))
+
+        # Loop over all chunks of signals
+        for inxStart in range(0, nSigs, iNSigsChunk):
+            inxStop = min(inxStart + iNSigsChunk, nSigs)
+            mNoise_ = mNoise[:(inxStop - inxStart), :]
+            np.subtract(mSig[inxStart:inxStop, :], mSigRef[inxStart:inxStop, :], out=mNoise_)
+            vNoiseP[inxStart:inxStop] = np.einsum('ij,ij->i', mNoise_, mNoise_)
+            vSigP[inxStart:inxStop] = np.einsum('ij,ij->i', mSigRef[inxStart:inxStop, :], mSigRef[inxStart:inxStop, :])
+
+        return 10 * np.log10(vSigP / vNoiseP)
+
+    # Add statistics of a group of signals to the accumulated statistics
+    def _accumulate(self, nSigs, iSNR, iSNRM2, iSNRMin, iSNRMax, nSuccess):
+        """
+        This function adds statistics of a group of signals to the accumulated
+        statistics (parallel version of Welford's algorithm).
+
+        Args:
+            nSigs (int):       the number of signals in the group
+            iSNR (float):      the average SNR of the group
+            iSNRM2 (float):    sum of squared differences from the average SNR of the group
+            iSNRMin (float):   the lowest SNR in the group
+            iSNRMax (float):   the highest SNR in the group
+            nSuccess (int):    the number of successful reconstructions in the group
+
+        Returns:
+            nothing
+        """
+        nSigsAll = self.nSigs + nSigs
+        if self.nSigs == 0:
+            self.iSNR = iSNR
+            self.iSNRM2 = iSNRM2
+        else:
+            iDelta = iSNR - self.iSNR
+            self.iSNR = self.iSNR + iDelta * nSigs / nSigsAll
+            self.iSNRM2 = self.iSNRM2 + iSNRM2 + iDelta**2 * self.nSigs * nSigs / nSigsAll
+        self.nSigs = nSigsAll
+        self.iSNRStd = np.sqrt(self.iSNRM2 / self.nSigs)
+        self.iSNRMin = min(self.iSNRMin, iSNRMin)
+        self.iSNRMax = max(self.iSNRMax, iSNRMax)
+        self.nSuccess = self.nSuccess + nSuccess
+        if self.wasParamGiven('iSNRSuccess'):
+            self.iSR = self.nSuccess / self.nSigs
+        return
+
+    # Print the results of analysis
+    def _printResults(self):
+
+        rxcs.console.bullet_param('The number of accumulated signals',
+                                  self.nSigs, '-', '')
+        rxcs.console.param('The average SNR of the reconstruction',
+                           self.iSNR, '-', 'dB')
+        rxcs.console.param('Standard deviation of SNR',
+                           self.iSNRStd, '-', 'dB')
+        rxcs.console.param('The lowest SNR', self.iSNRMin, '-', 'dB')
+        rxcs.console.param('The highest SNR', self.iSNRMax, '-', 'dB')
+        if self.wasParamGivenVal(self.iSR):
+            rxcs.console.param('The Success Ratio', self.iSR, ' ', '')
+            rxcs.console.param('(success threshold)', self.iSNRSuccess, '-', 'dB')
+
+        return
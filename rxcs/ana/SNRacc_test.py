@@ -0,0 +1 @@
+../../test/analysis/SNRacc_test.py
\ No newline at end of file
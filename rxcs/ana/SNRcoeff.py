@@ -0,0 +1,307 @@
+"""|
+This module contains SNR evaluation of the reconstructed signals which is
+computed directly from the signal coefficients. |br|
+
+The SNR is computed in the coefficient domain, so the reconstructed and the
+reference signals do not have to be synthesized. This is valid for signals
+represented by a dictionary, for which the energy of a signal may be
+computed from its coefficients and the Gram matrix of the dictionary
+(Parseval's theorem). If **x** is a vector with coefficients of a signal,
+and **D** is the dictionary (one atom in a row), then the energy of the
+signal is:
+
+    x * G * x^H,     where    G = D * D^H
+
+is the Gram matrix of the dictionary.
+
+For orthogonal dictionaries (f.e. IDFT and IDHT dictionaries with tones placed
+on the FFT grid) the Gram matrix is diagonal, and only the diagonal of the Gram
+matrix (energy of every atom) is needed. Then the cost of computing the SNR
+is proportional to the number of coefficients, not to the number of signal
+samples. Both the IDFT and IDHT dictionary generators have a 'gram' function
+which returns the Gram information of a generated dictionary.
+
+
+REAL PART OF THE SIGNALS:
+The final signal reconstruction module (rxcs.cs.finalRecon) takes only the
+real part of the synthesized signals. For complex dictionaries (f.e. IDFT) the
+SNR of the real part of the signals can be computed if indices of the conjugate
+atoms are given (**vInxConj**). The IDFT dictionary generator returns these
+indices as 'vInxConj'. For real dictionaries with complex coefficients
+this vector is simply [0, 1, 2, ..., N-1].
+
+
+*Examples*:
+    Please go to the *examples/analysis* directory for examples
+    on how to use the SNR analysis modules. |br|
+
+*Settings*:
+    Parameters of the coefficient domain SNR analysis are described below.
+
+    Take a look on '__inputSignals' function for more info on the
+    parameters.
+
+    Parameters of the SNR analysis are attributes of the class which
+    must/can be set before the analysis is run.
+
+    Required parameters:
+
+    - a. **mCoeff** (*2D Numpy array or list*): coefficients of signals to be tested,
+                                               one signal in a row (or one 1D Numpy
+                                               array in the list)
+
+    - b. **mCoeffRef** (*2D Numpy array or list*): coefficients of the reference signals
+
+    - c. **mGram** (*1D or 2D Numpy array*): the Gram matrix of the dictionary,
+                                            or only its diagonal (1D Numpy array)
+                                            if the dictionary is orthogonal
+
+    Optional parameters:
+
+    - d. **vInxConj** (*1D Numpy array*):  indices of conjugate atoms of the
+                                           dictionary. If given, the SNR is computed
+                                           for real parts of the synthesized signals
+                                           [default = not given]
+
+    - e. **strComment** (*string*):   an optional comment to the name of
+                                      the SNR analysis module
+
+    - f. **iSNRSuccess** (*float*):   success threshold. SNR over this
+                                      threshold is treated as a successful
+                                      reconstruction [default = not given]
+
+    - g. **bMute** (*int*):    mute the console output from the module [default = 0]
+
+
+*Output*:
+    Description of the SNR analysis output is below.
+    This is the list of attributes of the class which are available after
+    calling the 'run' method:
+
+    - a. **iSNR** (*float*):  the average SNR
+
+    - b. **vSNR** (*float*):  SNR for every signal
+
+    - c. **iSR** (*float*):  average success ratio
+
+    - d. **vSuccessBits** (*float*):  list with success flags for every signal
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+class SNRcoeff(rxcs._RxCSobject):
+
+    def __init__(self, *args):
+        rxcs._RxCSobject.__init__(self)    # Make it a RxCS object
+
+        self.strRxCSgroup = 'Analysis'     # Name of group of RxCS modules
+        self.strModuleName = 'SNR (coefficient domain)'      # Module name
+
+        self.__inputSignals()      # Define the input signals
+        self.__parametersDefine()  # Define the parameters
+
+    # Define parameters
+    def __inputSignals(self):
+
+        # Coefficients of signals under test
+        self.paramAddMan('mCoeff', 'Coefficients of signals under test', noprint=1)
+        self.paramType('mCoeff', (np.ndarray, list))                    # Must be a Numpy array or a list
+        self.paramTypeEl('mCoeff', (int, float, complex, np.ndarray))   # Elements must be numbers or Numpy arrays
+
+        # Coefficients of reference signals
+        self.paramAddMan('mCoeffRef', 'Coefficients of reference signals', noprint=1)
+        self.paramType('mCoeffRef', (np.ndarray, list))                    # Must be a Numpy array or a list
+        self.paramTypeEl('mCoeffRef', (int, float, complex, np.ndarray))   # Elements must be numbers or Numpy arrays
+        self.paramSizEq('mCoeffRef', 'mCoeff')                             # The number of reference signals must
+                                                                           # equal the number of signals under test
+        # The Gram matrix of the dictionary (or its diagonal)
+        self.paramAddMan('mGram', 'The Gram matrix of the dictionary', noprint=1)
+        self.paramType('mGram', np.ndarray)                    # Must be a Numpy array
+        self.paramTypeEl('mGram', (int, float, complex))       # Elements must be numbers
+        self.paramNDimLE('mGram', 2)                           # Must be a 1, or 2 dimensional matrix
+
+        # Indices of conjugate atoms of the dictionary
+        self.paramAddOpt('vInxConj', 'Indices of conjugate atoms of the dictionary', noprint=1)
+        self.paramType('vInxConj', np.ndarray)         # Must be a Numpy array
+        self.paramTypeEl('vInxConj', (int))            # Elements must be of int type
+        self.paramNDimEq('vInxConj', 1)                # Must be a 1 dimensional matrix
+        self.paramHE('vInxConj', 0)                    # Indices can not be lower than zero
+
+    # Define parameters
+    def __parametersDefine(self):
+
+        # Success threshold
+        self.paramAddOpt('iSNRSuccess', 'Success threshold')
+        self.paramType('iSNRSuccess', (int, float))   # Must be a number
+        self.paramH('iSNRSuccess', -np.inf)
+        self.paramL('iSNRSuccess', np.inf)
+
+        # Additional comment in printing
+        self.paramAddOpt('strComment', 'Additional comment in printing', noprint=1, default='')
+        self.paramType('strComment', (str))   # Must be a string
+
+        # 'Mute the output' flag
+        self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
+        self.paramType('bMute', int)           # Must be of int type
+        self.paramAllowed('bMute',[0, 1])      # It can be either 1 or 0
+
+    # Run
+    def run(self):
+
+        self.parametersCheck()    # Check if all the needed partameters are in place and are correct
+        self.addComment2Name()    # Add a comment to the name of the SNR analysis, if needed
+
+        self.parametersPrint()    # Print the values of parameters
+
+        self.engineStartsInfo()  # Info that the engine starts
+        self.__engine()          # Run the engine
+        self.engineStopsInfo()   # Info that the engine ends
+        return self.__dict__     # Return dictionary with the parameters
+
+    # Add a comment to the name of the module, if needed
+    def addComment2Name(self):
+        if not (self.strComment == ''):
+            if not 'strModuleName_' in self.__dict__:
+                self.strModuleName_ = self.strModuleName
+            self.strModuleName = self.strModuleName_ + ' [' + self.strComment + ']'
+            self.strComment = ''
+        return
+
+    # Engine - compute the noise and the success rate
+    def __engine(self):
+
+        # Make the 2D matrices with coefficients of signals under test and reference signals
+        mCoeff = self._makeCoeffMatrix(self.mCoeff)
+        mCoeffRef = self._makeCoeffMatrix(self.mCoeffRef)
+        self._checkCoeff(mCoeff, mCoeffRef)
+
+        # Take only the real parts of the signals, if requested
+        if self.wasParamGiven('vInxConj'):
+            mCoeff = self._realPartCoeff(mCoeff, self.vInxConj)
+            mCoeffRef = self._realPartCoeff(mCoeffRef, self.vInxConj)
+
+        # Compute the energy of noise and the energy of reference signals
+        vNoiseE = self._energy(mCoeff - mCoeffRef, self.mGram)
+        vSigE = self._energy(mCoeffRef, self.mGram)
+
+        # Compute the SNR for every reconstructed signal and the average SNR
+        self.vSNR = 10 * np.log10(vSigE / vNoiseE)
+        self.iSNR = self.vSNR.mean()
+
+        # Compute the success for every reconstructed signal and the success ratio
+        self.iSR = np.nan
+        if self.wasParamGiven('iSNRSuccess'):
+            self.vSuccessBits = (self.vSNR >= self.iSNRSuccess)
+            self.iSR = self.vSuccessBits.mean()
+
+        # Print results
+        if self.bMute == 0:
+            self._printResults(self.iSNR, self.iSR, self.iSNRSuccess)
+
+        return
+
+    # Make a 2D matrix with coefficients
+    def _makeCoeffMatrix(self, mCoeff):
+        """
+        This function makes a 2D Numpy array with coefficients (one signal in
+        a row) from a list with 1D Numpy arrays or from a 1D/2D Numpy array.
+
+        Args:
+            mCoeff (list or Numpy array):  coefficients of signals
+
+        Returns:
+            mCoeff (Numpy array 2D):  coefficients of signals, one signal in a row
+        """
+        if isinstance(mCoeff, list):
+            return np.vstack(mCoeff)
+        return self.makeArray2Dim(mCoeff)
+
+    # Check if the coefficients and the Gram matrix fit together
+    def _checkCoeff(self, mCoeff, mCoeffRef):
+        """
+        This function checks if the coefficients of signals under test,
+        the coefficients of reference signals and the Gram matrix have correct
+        sizes.
+
+        Args:
+            mCoeff (Numpy array 2D):     coefficients of signals under test
+            mCoeffRef (Numpy array 2D):  coefficients of reference signals
+
+        Returns:
+            nothing
+        """
+        if not (mCoeff.shape == mCoeffRef.shape):
+            strE = 'The coefficients of signals under test and the coefficients of reference signals '
+            strE = strE + 'must have equal shapes!'
+            raise ValueError(strE)
+
+        (_, nCoeff) = mCoeff.shape   # The number of coefficients
+        if (self.mGram.ndim == 1 and not (self.mGram.size == nCoeff)) or \
+           (self.mGram.ndim == 2 and not (self.mGram.shape == (nCoeff, nCoeff))):
+            strE = 'The size of the Gram matrix does not fit the number of signal coefficients (%d)!' % (nCoeff)
+            raise ValueError(strE)
+
+        if self.wasParamGiven('vInxConj'):
+            if not (self.vInxConj.size == nCoeff) or (self.vInxConj.max() >= nCoeff):
+                strE = 'The vector with indices of conjugate atoms does not fit '
+                strE = strE + 'the number of signal coefficients (%d)!' % (nCoeff)
+                raise ValueError(strE)
+        return
+
+    # Coefficients of the real parts of the signals
+    def _realPartCoeff(self, mCoeff, vInxConj):
+        """
+        This function computes coefficients of the real parts of the signals.
+
+        If d_k is an atom of the dictionary and d_k' is its conjugate atom, then
+        Re(x*D) = sum over k of: 0.5 * (x_k + conj(x_k')) * d_k
+
+        Args:
+            mCoeff (Numpy array 2D):    coefficients of signals
+            vInxConj (Numpy array 1D):  indices of conjugate atoms of the dictionary
+
+        Returns:
+            mCoeff (Numpy array 2D):  coefficients of the real parts of signals
+        """
+        return 0.5 * (mCoeff + mCoeff[:, vInxConj].conj())
+
+    # Compute the energy of signals from their coefficients
+    def _energy(self, mCoeff, mGram):
+        """
+        This function computes the energy of signals from their coefficients
+        and the Gram matrix of the dictionary (or the diagonal of the Gram matrix).
+
+        Args:
+            mCoeff (Numpy array 2D):     coefficients of signals, one signal in a row
+            mGram (Numpy array 1D/2D):   the Gram matrix of the dictionary, or its diagonal
+
+        Returns:
+            vE (Numpy array 1D):  energy of every signal
+        """
+        if mGram.ndim == 1:
+            mCoeffP = mCoeff.real**2 + mCoeff.imag**2    # Squared magnitudes of the coefficients
+            return np.dot(mCoeffP, mGram.real)
+        return np.sum(np.dot(mCoeff, mGram) * mCoeff.conj(), axis=1).real
+
+    # Print the results of analysis
+    def _printResults(self, iSNR, iSR, iSNRSuccess):
+
+        rxcs.console.bullet_param('The average SNR of the reconstruction',
+                                  self.iSNR, '-', 'dB')
+        if self.wasParamGivenVal(self.iSR):
+            rxcs.console.param('The Success Ratio', iSR, ' ', '')
+            rxcs.console.param('(success threshold)', iSNRSuccess, '-', 'dB')
+
+        return
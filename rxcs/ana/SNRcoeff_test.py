@@ -0,0 +1 @@
+../../test/analysis/SNRcoeff_test.py
\ No newline at end of file
@@ -1,3 +1,8 @@
-
 # Import SNR evaluation of the reconstructed signal
 from SNR import SNR
+
+# Import SNR evaluation computed from the signal coefficients
+from SNRcoeff import SNRcoeff
+
+# Import SNR accumulator of the reconstructed signals
+from SNRacc import SNRacc
@@ -0,0 +1,163 @@
+"""
+This module contains a simple least recently used (LRU) cache. |br|
+
+The cache keeps at most **nMax** elements. If a new element is put into
+a full cache, the least recently used element is removed from the cache.
+Every read of an element ('get') marks the element as the most recently
+used one.
+
+The size of the elements may be limited also in bytes (**iMaxBytes**):
+the least recently used elements are removed until the Numpy arrays kept
+in the cache (arrays in tuples, lists and dictionaries are counted too)
+take at most iMaxBytes bytes. An element bigger than iMaxBytes is not put
+into the cache.
+
+The cache is used by RxCS modules which memoize results of computations
+(f.e. dictionary matrices), it is not a RxCS module itself.
+
+Usage:
+
+    cache = rxcs.auxiliary.LRUcache(8)     # Cache with at most 8 elements
+    cache = rxcs.auxiliary.LRUcache(8, 2**20)   # ... which take at most 1 MB
+    cache.put(key, value)                  # Put an element into the cache
+    value = cache.get(key)                 # Get an element (None if the element is not in the cache)
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+    1.1    | 19-OCT-2026 : * Limit of the size of the elements in bytes |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import collections
+import numpy as np
+
+
+class LRUcache():
+
+    def __init__(self, nMax=16, iMaxBytes=0):
+        """
+        Args:
+            nMax (int):       the maximum number of elements in the cache
+                              (0 - the cache is switched off)
+            iMaxBytes (int):  the maximum size of the elements in the cache [bytes]
+                              (0 - the size is not limited)
+        """
+        self.nMax = nMax
+        self.iMaxBytes = iMaxBytes
+        self.iBytes = 0          # The current size of the elements [bytes]
+        self.dElements = collections.OrderedDict()
+        self.dBytes = {}         # Sizes of the elements [bytes]
+
+    # Get an element from the cache
+    def get(self, key, default=None):
+        """
+        This function gets an element from the cache. The element is marked
+        as the most recently used one.
+
+        Args:
+            key:      key of the element
+            default:  value returned if the element is not in the cache
+
+        Returns:
+            value of the element (or the default value)
+        """
+        if key not in self.dElements:
+            return default
+        value = self.dElements.pop(key)    # Move the element to the end of the cache
+        self.dElements[key] = value        # ^
+        return value
+
+    # Put an element into the cache
+    def put(self, key, value):
+        """
+        This function puts an element into the cache. The least recently
+        used elements are removed if the cache is full.
+
+        Args:
+            key:    key of the element
+            value:  value of the element
+
+        Returns:
+            value of the element
+        """
+        if self.nMax <= 0:
+            return value
+        self.remove(key)
+        iBytes = _nBytes(value)
+        if (self.iMaxBytes > 0) and (iBytes > self.iMaxBytes):
+            return value
+        self.dElements[key] = value
+        self.dBytes[key] = iBytes
+        self.iBytes += iBytes
+        self._evict()
+        return value
+
+    # Change the maximum number of elements in the cache
+    def resize(self, nMax):
+        """
+        This function changes the maximum number of elements in the cache.
+        The least recently used elements are removed if there are too many
+        elements in the cache.
+        """
+        self.nMax = nMax
+        self._evict()
+        return
+
+    # Remove the least recently used elements
+    def _evict(self):
+        """
+        This function removes the least recently used elements, until the
+        number of elements and their size are within the limits.
+        """
+        while (len(self.dElements) > max(self.nMax, 0)) or \
+              ((self.iMaxBytes > 0) and (self.iBytes > self.iMaxBytes)):
+            (key, _) = self.dElements.popitem(last=False)
+            self.iBytes -= self.dBytes.pop(key)
+        return
+
+    # Remove an element from the cache
+    def remove(self, key):
+        """
+        This function removes an element from the cache (if it is in the cache).
+        """
+        if key in self.dElements:
+            del self.dElements[key]
+            self.iBytes -= self.dBytes.pop(key)
+        return
+
+    # Remove all the elements from the cache
+    def clear(self):
+        """
+        This function removes all the elements from the cache.
+        """
+        self.dElements.clear()
+        self.dBytes.clear()
+        self.iBytes = 0
+        return
+
+    def __contains__(self, key):
+        return key in self.dElements
+
+    def __len__(self):
+        return len(self.dElements)
+
+
+# Size of an element in bytes
+def _nBytes(value):
+    """
+    This function computes the size of Numpy arrays in an element
+    (arrays in tuples, lists and dictionaries are counted too).
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum([_nBytes(el) for el in value])
+    if isinstance(value, dict):
+        return sum([_nBytes(el) for el in value.values()])
+    return 0
@@ -4,5 +4,14 @@ import krls
 
 from parExp import parExp
 
+# Import the least recently used (LRU) cache
+from LRUcache import LRUcache
+
+# Import the reproducible streams of random numbers
+import randStream
+
+# Import the lazy set of signals
+from lazySet import lazySet
+
 # Import L2 solver which uses KRLS method
 from aldkrlsL2 import aldkrlsL2
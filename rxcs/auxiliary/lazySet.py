@@ -0,0 +1,209 @@
+"""
+This module contains a lazy set of signals. |br|
+
+A lazy set of signals does not store the signals. It stores only the
+configuration (parameters) of a RxCS module which generates the signals
+(a signal generator or a sampler) and the seed of streams of random numbers.
+Signals are divided into packs of signals, every pack is generated with its
+own seed, spawned from the seed with the index of the pack (look at
+rxcs.auxiliary.randStream). So every pack (and every signal) can be
+regenerated on demand, exactly the same, at any time.
+
+Recently generated packs are kept in a small least recently used (LRU) cache
+(**nCache** packs).
+
+A lazy set of signals may be an input of another lazy set, f.e. a lazy set
+of observed signals of a sampler may take the signals from a lazy set of
+signals of a generator (pack #k of the sampler samples pack #k of the
+generator).
+
+The lazy set supports:
+
+    - **len(ls)** - the number of signals in the set
+
+    - **ls[key]** - signals (the first output of the module) with the given
+      indices; key may be an integer, a slice or a list/array of indices
+
+    - **rows(vInx, strName)** - the given output (f.e. 'mSigNN') of the
+      signals with the given indices
+
+    - **pack(inxPack)** - dictionary with all the outputs of a pack
+
+    - **toarray(strName)** - the given output of all the signals
+
+Usage:
+
+    gen = rxcs.sig.randMult()
+    ...                                        # Configure the generator
+    gen.iSeed = 7                              # The seed must be given
+    ls = gen.lazy(nSigsPack=100)               # Lazy set of signals
+    vSig = ls[12345]                           # Signal #12345
+    mSigNN = ls.rows(range(10), 'mSigNN')      # Non noisy signals #0 - #9
+
+    smp = rxcs.acq.nonuniExtern()
+    ...                                        # Configure the sampler
+    lsObs = rxcs.auxiliary.lazySet(smp, 7, lOutputs=['mObSig'], dInputs={'mSig': ls})
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+from rxcs.auxiliary.LRUcache import LRUcache
+from rxcs.auxiliary import randStream
+
+
+class lazySet(object):
+
+    def __init__(self, oModule, iSeed, nSigs=0, nSigsPack=0, lOutputs=('mSig',), strNSigs='nSigs',
+                 dInputs=None, nCache=4):
+        """
+        Args:
+            oModule:            configured RxCS module which generates the signals
+                                (the module must have the 'iSeed' parameter)
+            iSeed (int/tuple):  seed of streams of random numbers
+            nSigs (int):        the number of signals
+                                (0 - taken from the input lazy sets)
+            nSigsPack (int):    the number of signals in a pack
+                                (0 - taken from the input lazy sets)
+            lOutputs (list):    names of outputs of the module which are given by the set
+                                (the first output is given by indexing the set)
+            strNSigs (string):  name of the parameter of the module with the number of
+                                signals ('' - the module does not have such parameter)
+            dInputs (dict):     input lazy sets, keys are names of parameters of the module
+            nCache (int):       the number of packs kept in the cache
+        """
+        if not randStream.isGiven(iSeed):
+            raise ValueError('A lazy set of signals requires a seed (iSeed)!')
+        self.iSeed = iSeed
+        self.lOutputs = list(lOutputs)
+        self.strNSigs = strNSigs
+        self.dInputs = {} if dInputs is None else dict(dInputs)
+
+        # The number of signals and the number of signals in a pack
+        # (taken from the input sets, if not given)
+        for lsInput in self.dInputs.values():
+            if nSigs <= 0:
+                nSigs = lsInput.nSigs
+            if nSigsPack <= 0:
+                nSigsPack = lsInput.nSigsPack
+            if (lsInput.nSigs != nSigs) or (lsInput.nSigsPack != nSigsPack):
+                raise ValueError('Input lazy sets must have the same number of signals and packs!')
+        if nSigs <= 0:
+            raise ValueError('The number of signals in a lazy set must be higher than zero!')
+        self.nSigs = int(nSigs)
+        self.nSigsPack = int(min(max(nSigsPack, 1), nSigs)) if nSigsPack > 0 else self.nSigs
+        self.nPacks = int(np.ceil(self.nSigs / self.nSigsPack))
+
+        # Copy of the module and the given parameters of the module
+        self.oModule = oModule.__class__()
+        self.dParam = {}
+        for dParameter in oModule.lParameters:
+            strName = dParameter['strName']
+            if strName in oModule.__dict__:
+                param = oModule.__dict__[strName]
+                if isinstance(param, np.ndarray):
+                    param = param.copy()
+                self.dParam[strName] = param
+
+        # Cache of the generated packs
+        self.cachePacks = LRUcache(nCache)
+
+    def __len__(self):
+        return self.nSigs
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.rows([key], self.lOutputs[0])[0]
+        return self.rows(key, self.lOutputs[0])
+
+    # Generate a pack of signals
+    def pack(self, inxPack):
+        """
+        This function gives a dictionary with all the outputs of a pack
+        of signals. The pack is generated, if it is not in the cache.
+        """
+        dOut = self.cachePacks.get(inxPack)
+        if dOut is not None:
+            return dOut
+
+        if (inxPack < 0) or (inxPack >= self.nPacks):
+            raise IndexError('Index of a pack of signals is out of range!')
+
+        # Configure the module
+        for strName in self.dParam:
+            setattr(self.oModule, strName, self.dParam[strName])
+        if len(self.strNSigs) > 0:
+            setattr(self.oModule, self.strNSigs, self._nSigsInPack(inxPack))
+        for strName in self.dInputs:
+            lsInput = self.dInputs[strName]
+            setattr(self.oModule, strName, lsInput.pack(inxPack)[lsInput.lOutputs[0]])
+        self.oModule.iSeed = randStream.spawn(self.iSeed, inxPack)
+        self.oModule.bMute = 1
+
+        # Generate the pack
+        self.oModule.run()
+        dOut = {}
+        for strName in self.lOutputs:
+            dOut[strName] = getattr(self.oModule, strName)
+        return self.cachePacks.put(inxPack, dOut)
+
+    # Outputs of the signals with the given indices
+    def rows(self, vInx, strName='mSig'):
+        """
+        This function gives the output (f.e. 'mSig') of signals with the
+        given indices. Indices may be a slice or a list/array of indices.
+        """
+        if isinstance(vInx, slice):
+            vInx = np.arange(*vInx.indices(self.nSigs))
+        vInx = np.asarray(vInx, dtype=int).ravel()
+        vInx = np.where(vInx < 0, vInx + self.nSigs, vInx)
+        if np.any(vInx < 0) or np.any(vInx >= self.nSigs):
+            raise IndexError('Index of a signal is out of range!')
+
+        # Gather the signals pack after pack
+        vInxPack = vInx // self.nSigsPack
+        lWhere = []
+        lBlocks = []
+        for inxPack in np.unique(vInxPack):
+            vWhere = np.where(vInxPack == inxPack)[0]
+            vInxLocal = vInx[vWhere] - inxPack * self.nSigsPack
+            output = self.pack(int(inxPack))[strName]
+            if isinstance(output, np.ndarray):
+                lBlocks.append(output[vInxLocal])
+            else:
+                lBlocks.append([output[inxL] for inxL in vInxLocal])    # Outputs which are lists
+            lWhere.append(vWhere)
+
+        # Put the signals in the requested order
+        if len(lBlocks) == 0:
+            return np.zeros(0)
+        if all([isinstance(block, np.ndarray) for block in lBlocks]) and \
+           len(set([block.shape[1:] for block in lBlocks])) == 1:
+            mRows = np.empty((vInx.size, ) + lBlocks[0].shape[1:], dtype=np.result_type(*lBlocks))
+            for (vWhere, block) in zip(lWhere, lBlocks):
+                mRows[vWhere] = block
+            return mRows
+        lRows = [None] * vInx.size
+        for (vWhere, block) in zip(lWhere, lBlocks):
+            for (inxW, row) in zip(vWhere, block):
+                lRows[inxW] = row
+        return lRows
+
+    # All the signals
+    def toarray(self, strName='mSig'):
+        """
+        This function gives the output (f.e. 'mSig') of all the signals.
+        """
+        return self.rows(slice(None), strName)
+
+    # The number of signals in a pack
+    def _nSigsInPack(self, inxPack):
+        return min(self.nSigsPack, self.nSigs - inxPack * self.nSigsPack)
@@ -0,0 +1 @@
+../../test/auxiliary/lazySet_test.py
\ No newline at end of file
@@ -5,11 +5,23 @@ This is a multi CPU wrapper. |br|
 *Examples*:
     Please go to the *examples/auxiliary* directory for examples on how to use the wrapper. 
 
+*Reproducibility*:
+    If the seed (**iSeed**) is given, every signal pack of every sweep point
+    gets its own seed, spawned from the seed with the index of the sweep
+    point and the index of the pack (look at rxcs.auxiliary.randStream).
+    Before the experiment function is called for a pack, the global Numpy
+    random state is seeded with the seed of the pack, and the seed of the pack
+    is given to the experiment function in the experiment dictionary
+    (key '__iSeed__'), so it can be passed to RxCS modules (parameter iSeed).
+    The results do not depend on the number of processes then: a single CPU
+    run and a multi CPU run give the same results.
+
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
 
 *Version*:
     1.0    | 02-MAY-2016 : * Version 1.0 released. |br|
+    1.1    | 19-OCT-2026 : * Seed of streams of random numbers of signal packs (iSeed) |br|
 
 *License*:
     BSD 2-Clause
@@ -70,6 +82,10 @@ class parExp(rxcs._RxCSobject):
         self.paramType('iMaxProc', (int, float))    
         self.paramH('iMaxProc', 0)
 
+        # Seed of streams of random numbers
+        self.paramAddOpt('iSeed', 'Seed of streams of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)  
         self.paramType('bMute', int)           # Must be of int type
@@ -132,10 +148,9 @@ def _runSweepPoint_singleCPU(dExperiment, _parExp, funct):
 
         # Loop over all signal packs
         lPacksResults = []
-        for _iNSigs in lNSigs:
-            dResults = funct(dExperiment, iSweepVal, _iNSigs)
-            dResults['__iNSigs__'] = _iNSigs
-            lPacksResults.append(dResults.copy())
+        for (iPackInx, _iNSigs) in enumerate(lNSigs):
+            dResults = _runPack(dExperiment, _parExp, funct, iSweepVal, _iNSigs, iSweepInx, iPackInx)
+            lPacksResults.append(dResults)
 
         # Store all the packs
         lSweepResults.append(lPacksResults)
@@ -180,7 +195,7 @@ def _runSweepPoint_multiCPU(dExperiment, _parExp, funct):
     ltArgs = []
     for iProc in range(iNProc):
         vSweep_ = _parExp.vSweep[lInxGrid4Process[iProc]]
-        ltArgs.append(tArgs + (vSweep_, iProc, funct))
+        ltArgs.append(tArgs + (vSweep_, lInxGrid4Process[iProc], iProc, funct))
 
     # Run the computations on all the processes
     lProcOut = CPUpool.map(_runSweepPoint_multiCPU_poolFunc, ltArgs)
@@ -202,7 +217,7 @@ def _runSweepPoint_multiCPU(dExperiment, _parExp, funct):
 
 def _runSweepPoint_multiCPU_poolFunc(tArgs):
 
-    (dExperiment, _parExp, vSweep, iProc, funct) = tArgs  # Unpack the arguments tuple
+    (dExperiment, _parExp, vSweep, lInxSweep, iProc, funct) = tArgs  # Unpack the arguments tuple
 
     # List with lists (lPacksResults) from all the results
     lSweepResults = []
@@ -224,10 +239,9 @@ def _runSweepPoint_multiCPU_poolFunc(tArgs):
         
         # Loop over all signal packs
         lPacksResults = []
-        for _iNSigs in lNSigs:
-            dResults = funct(dExperiment, iSweepVal, int(_iNSigs))
-            dResults['__iNSigs__'] = _iNSigs
-            lPacksResults.append(dResults.copy())
+        for (iPackInx, _iNSigs) in enumerate(lNSigs):
+            dResults = _runPack(dExperiment, _parExp, funct, iSweepVal, int(_iNSigs), lInxSweep[iSweepInx], iPackInx)
+            lPacksResults.append(dResults)
 
         # Progress bar
         if iProc == 0:
@@ -239,6 +253,25 @@ def _runSweepPoint_multiCPU_poolFunc(tArgs):
     return (lSweepResults, iProc)
 
 
+"""
+    SIGNAL PACK FUNCTION:
+"""
+def _runPack(dExperiment, _parExp, funct, iSweepVal, iNSigs, iSweepInx, iPackInx):
+
+    # Seed the global Numpy random state with the seed of the pack
+    # and give the seed of the pack to the experiment function, if the seed is given
+    if rxcs.auxiliary.randStream.isGiven(_parExp.iSeed):
+        tSeed = rxcs.auxiliary.randStream.spawn(_parExp.iSeed, iSweepInx, iPackInx)
+        np.random.seed(rxcs.auxiliary.randStream.seedWords(tSeed))
+        dExperiment = dExperiment.copy()
+        dExperiment['__iSeed__'] = tSeed
+
+    # Run the experiment function for the pack
+    dResults = funct(dExperiment, iSweepVal, iNSigs)
+    dResults['__iNSigs__'] = iNSigs
+    return dResults.copy()
+
+
 """
     PROCESS OUTPUT:
 """
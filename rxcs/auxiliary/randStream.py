@@ -0,0 +1,206 @@
+"""
+This module contains reproducible independent streams of random numbers. |br|
+
+RxCS modules which draw random numbers (signal generators, samplers) accept
+a seed (parameter **iSeed**). If the seed is given, a module draws random
+numbers from its own stream of random numbers (a Numpy RandomState) which is
+initialized by the seed. If the seed is not given (NaN), a module draws
+random numbers from the global Numpy random state, as before.
+
+A seed is an integer or a tuple of integers. Child seeds are spawned from
+a seed by adding keys to the seed (f.e. an index of a sweep point and an
+index of a signal pack). A stream is initialized with a SHA-256 hash of all
+the integers in a seed, so streams of different seeds (f.e. of different
+children of a seed) are independent, and a stream depends only on its seed,
+not on the order of computations or on the number of processes.
+
+Usage:
+
+    rs = randStream.stream(iSeed)                     # Stream of random numbers
+    vX = rs.randn(10)                                 # (a Numpy RandomState)
+    tSeedChild = randStream.spawn(iSeed, 3, 1)        # Seed of the child #(3, 1)
+    rsChild = randStream.stream(tSeedChild)           # Stream of the child
+
+The module contains also a function which draws indices without replacement
+for many vectors at once (drawNoReplace), used by signal generators.
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+    1.1    | 19-OCT-2026 : * Drawing of indices without replacement for many vectors at once |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import hashlib
+import numpy as np
+
+
+# Stream of random numbers
+def stream(seed):
+    """
+    This function gives a stream of random numbers for a seed.
+
+    Args:
+        seed (int, tuple or NaN):  the seed
+
+    Returns:
+        stream of random numbers: Numpy RandomState initialized by the seed,
+                                  or the global Numpy random state (numpy.random)
+                                  if the seed is not given (NaN or None)
+    """
+    if not isGiven(seed):
+        return np.random
+    return np.random.RandomState(seedWords(seed))
+
+
+# Spawn a child seed
+def spawn(seed, *tKeys):
+    """
+    This function spawns a child seed of a seed.
+
+    Args:
+        seed (int or tuple):  the seed
+        *tKeys (int):         keys of the child (f.e. indices of a sweep point and a signal pack)
+
+    Returns:
+        tSeed (tuple):   the child seed
+    """
+    return _seedTuple(seed) + tuple([int(iKey) for iKey in tKeys])
+
+
+# Check if a seed is given
+def isGiven(seed):
+    """
+    This function checks if a seed is given (is not NaN or None).
+    """
+    if seed is None:
+        return False
+    if isinstance(seed, tuple):
+        return True
+    return not np.isnan(seed)
+
+
+# Initialization words of a stream
+def seedWords(seed):
+    """
+    This function computes the words (32 bit unsigned integers) which
+    initialize a stream of random numbers: the SHA-256 hash of all the
+    integers in the seed.
+    """
+    strSeed = ','.join(['%d' % iX for iX in _seedTuple(seed)])
+    strHash = hashlib.sha256(strSeed.encode('ascii')).digest()
+    return np.frombuffer(strHash, dtype='<u4').astype(np.uint32)
+
+
+# Draw indices without replacement
+def drawNoReplace(randState, nRows, nAvail, nTake):
+    """
+    This function draws 'nTake' indices from 'nAvail' indices without
+    replacement, independently for 'nRows' rows (f.e. signals or vectors).
+    Every ordered set of 'nTake' distinct indices is equally probable
+    (as the first 'nTake' elements of a random permutation of the indices).
+
+    The method depends on the number of taken indices:
+
+        - nTake^2 < nAvail: indices are drawn with replacement, rows with
+          repeated indices are drawn again (rejection sampling),
+
+        - nTake <= nAvail/4: ~1.25*nTake indices are drawn with replacement,
+          'nTake' of the distinct drawn indices are taken in a random order
+          (rows with too few distinct indices are drawn again),
+
+        - otherwise: every row gets a vector of random keys, indices of the
+          'nTake' lowest keys (sorted by keys) are taken.
+
+    Args:
+        randState:       stream of random numbers (look at 'stream')
+        nRows (int):     the number of rows
+        nAvail (int):    the number of available indices
+        nTake (int):     the number of indices to be taken for every row
+
+    Returns:
+        mTakenInx (matrix):  matrix with the taken indices (one row - one row)
+    """
+    if nTake == 0:
+        return np.zeros((nRows, 0), dtype=int)
+
+    # Rejection sampling
+    if nTake * nTake < nAvail:
+        mTakenInx = randState.randint(0, nAvail, (nRows, nTake))
+        vRep = _hasRepeated(mTakenInx)
+        while vRep.any():
+            mTakenInx[vRep] = randState.randint(0, nAvail, (np.sum(vRep), nTake))
+            vRep[vRep] = _hasRepeated(mTakenInx[vRep])
+        return mTakenInx
+
+    # Oversampling with replacement
+    if 4 * nTake <= nAvail:
+        nDraw = int(1.25 * nTake) + 16
+        mDrawn = np.empty((nRows, nDraw), dtype=int)
+        mRep = np.empty((nRows, nDraw), dtype=bool)
+        vShort = np.ones(nRows, dtype=bool)
+        while vShort.any():
+            mDrawnS = np.sort(randState.randint(0, nAvail, (np.sum(vShort), nDraw)), axis=1)
+            mRepS = np.zeros(mDrawnS.shape, dtype=bool)
+            mRepS[:, 1:] = (mDrawnS[:, 1:] == mDrawnS[:, :-1])    # Repeated indices
+            mDrawn[vShort] = mDrawnS
+            mRep[vShort] = mRepS
+            vShort[vShort] = (nDraw - np.sum(mRepS, axis=1)) < nTake
+        mKeys = randState.rand(nRows, nDraw)    # Random keys of the distinct indices
+        mKeys[mRep] = 2.0                       # (repeated indices are never taken)
+        return _lowestKeys(mDrawn, mKeys, nTake)
+
+    # Random keys (in packs of rows, a pack has at most 2^22 keys)
+    mTakenInx = np.empty((nRows, nTake), dtype=int)
+    nRowsPack = max(1, int(2**22 / nAvail))
+    for inxStart in range(0, nRows, nRowsPack):
+        inxStop = min(inxStart + nRowsPack, nRows)
+        mKeys = randState.rand(inxStop - inxStart, nAvail)    # Random keys
+        mInx = np.tile(np.arange(nAvail), (inxStop - inxStart, 1))
+        mTakenInx[inxStart:inxStop] = _lowestKeys(mInx, mKeys, nTake)
+    return mTakenInx
+
+
+# Elements with the lowest keys
+def _lowestKeys(mVal, mKeys, nTake):
+    """
+    This function takes 'nTake' elements with the lowest keys from every row
+    of a matrix, the elements are sorted by keys.
+    """
+    vRows = np.arange(mVal.shape[0])[:, np.newaxis]
+
+    # Find the 'nTake' lowest keys (unsorted)
+    if nTake < mVal.shape[1]:
+        mTaken = np.argpartition(mKeys, nTake - 1, axis=1)[:, :nTake]
+    else:
+        mTaken = np.tile(np.arange(mVal.shape[1]), (mVal.shape[0], 1))
+
+    # Sort the taken elements by keys
+    mOrder = np.argsort(mKeys[vRows, mTaken], axis=1)
+    return mVal[vRows, mTaken[vRows, mOrder]]
+
+
+# Check if there are repeated indices in rows of a matrix
+def _hasRepeated(mInx):
+    """
+    This function checks which rows of a matrix contain repeated elements.
+    """
+    mInxSorted = np.sort(mInx, axis=1)
+    return np.any(mInxSorted[:, 1:] == mInxSorted[:, :-1], axis=1)
+
+
+# Seed as a tuple of integers
+def _seedTuple(seed):
+    """
+    This function gives a seed as a tuple of integers.
+    """
+    if isinstance(seed, tuple):
+        return tuple([int(iX) for iX in seed])
+    if not isGiven(seed):
+        raise ValueError('A seed must be given to spawn a child seed!')
+    return (int(seed), )
@@ -0,0 +1 @@
+../../test/auxiliary/randStream_test.py
\ No newline at end of file
@@ -39,6 +39,14 @@ Warning: the module does not support reconstruction of complex signals!
          that the complex part of the reconstructed signal is 0.
 
 
+WARM START:
+Initial signal coefficients may be given in the 'lCoeffInit' list
+(f.e. coefficients found for a previous, overlapping time window of
+a signal). Then the IRLS starts from the average of the initial L2 solution
+and the given initial coefficients, so that the weights of the first
+iteration already favour the previously found support of the signal.
+
+
 OUTPUT MATRIX WITH SIGNAL COEFFICIENS:
 The found signal coefficients are given as a list with 1D Numpy arrays,
 where one element of a list corresponds to a one array with found 
@@ -78,7 +86,10 @@ in the input list with observed signals.
     - e, **bComplex** (*float*):   'complex' problem flag, should be switched 
                                    if Theta matrices are complex [default = 0]
 
-    - f. **bMute** (*int*):    mute the console output from the sampler [default = 0]
+    - f, **lCoeffInit** (*list*):  list with initial signal coefficients 
+                                   (warm start) [default = not given]
+
+    - g. **bMute** (*int*):    mute the console output from the sampler [default = 0]
 
 
 *Output*:
@@ -105,6 +116,7 @@ in the input list with observed signals.
 *Version*:
     1.0    | 22-JAN-2014 : * Version 1.0 released. |br|
     2.0    | 31-AUG-2015 : * Version 2,0 (objectified version) released. |br|
+    2.1    | 19-OCT-2026 : * Warm start with initial signal coefficients is added. |br|
 
 *License*:
     BSD 2-Clause
@@ -168,6 +180,13 @@ class irlsL1(rxcs._RxCSobject):
         self.paramH('iConvStop', 0)  # The convergence parameter should be higher than 0
         self.paramL('iConvStop', 1)  # and lower than 1 
 
+        # Initial signal coefficients (warm start)
+        self.paramAddOpt('lCoeffInit', 'Initial signal coefficients', noprint=1)
+        self.paramType('lCoeffInit', list)              # Must be a list
+        self.paramTypeEl('lCoeffInit', (np.ndarray))    # Elements must be np.ndarray
+        self.paramSizEq('lCoeffInit', 'lObserved')      # The number of vectors with initial coefficients
+                                                        # must equal the number of observed signals
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -229,6 +248,13 @@ class irlsL1(rxcs._RxCSobject):
         if self.bComplex == 1:
             self.lTheta = self._makeRealProblem(self.lTheta)
 
+        # Get the initial signal coefficients (warm start), if they were given
+        lXInit = nObSig * [np.nan]
+        if self.wasParamGiven('lCoeffInit'):
+            lXInit = self.lCoeffInit
+            if self.bComplex == 1:
+                lXInit = self._makeRealInit(lXInit)
+
         # -----------------------------------------------------------------
         # Loop over all the observed signals
         self.lCoeff = []   # Start a list with signal coefficients
@@ -237,7 +263,7 @@ class irlsL1(rxcs._RxCSobject):
         for inxSig in np.arange(nObSig):
 
             # Run reconstruction of the current signal
-            (vCoef, mX, iIter) = self._recon1sig(inxSig)                    
+            (vCoef, mX, iIter) = self._recon1sig(inxSig, lXInit[inxSig])
                         
             # Store the coefficients in the list with coefficients
             self.lCoeff.append(vCoef)
@@ -302,12 +328,29 @@ class irlsL1(rxcs._RxCSobject):
 
         return lThetaR
 
+    # Make real-only initial coefficients, if it is needed
+    def _makeRealInit(self, lXInit):
+        """
+        This function makes real-only initial signal coefficients from complex
+        initial coefficients (the reverse of '_makeComplexOutput').
+
+        Args:
+            lXInit (list): The list with complex initial coefficients
+
+        Returns:
+            lXInitR (list): The list with real only initial coefficients
+        """
+        lXInitR = []
+        for vXInit in lXInit:
+            lXInitR.append(np.hstack((vXInit.real, -vXInit.imag)))
+        return lXInitR
 
     # Reconstruct a single signal
-    def _recon1sig(self, inxSig):
+    def _recon1sig(self, inxSig, vXInit=np.nan):
         """
         Args:
             inxSig (list):  Index of the signal from the list with observed signals
+            vXInit (Numpy array 1D):  initial signal coefficients (or NaN if not given)
     
         Returns:
             vCoef (Numpy array 1D):  reconstructed signal coefficients    
@@ -320,13 +363,13 @@ class irlsL1(rxcs._RxCSobject):
         vObSig = self.lObserved[inxSig]
 
         # Run the engine: Reconstruct the signal coefficients
-        (vCoef, mX, iIter) = self.L1(mTheta, vObSig, self.iMaxIter, self.iConvStop)
+        (vCoef, mX, iIter) = self.L1(mTheta, vObSig, self.iMaxIter, self.iConvStop, vXInit)
         vCoef.shape = (vCoef.size,)
 
         return (vCoef, mX, iIter)        
 
 
-    def L1(self, mA, vY, iMaxIter, iConvStop):
+    def L1(self, mA, vY, iMaxIter, iConvStop, vXInit=np.nan):
         """
          This function looks for an optimum solution Ax = y, minimizing the
          L_1 norm ||x||_1, using Iterative Reweighted Least Squares algortihm.
@@ -341,6 +384,7 @@ class irlsL1(rxcs._RxCSobject):
             vY  (numpy array):    vector y   (look desc. above)
             iMaxIter (number):    the max number of iterations
             iConvStop (number):   convergence parameter
+            vXInit (numpy array): initial vector x (warm start), optional
 
         Returns:
             vX  (numpy array):    found vector x (look desc. above)
@@ -357,6 +401,9 @@ class irlsL1(rxcs._RxCSobject):
         self.L2solv.bMute = 1
         self.L2solv.run()   # Find the initial vector X
         vX = self.L2solv.vX.copy()        
+        if isinstance(vXInit, np.ndarray):  # Warm start: move towards the initial vector X
+            vX.shape = (nCols,)
+            vX = 0.5 * (vX + vXInit)
         mX[:, 0] = vX
           
         # Loop over all iterations      
@@ -20,9 +20,15 @@ if cvxoptOK == 1:
 from irlsL1 import irlsL1
 from irlsL1X import irlsL1X
 
+# Import composed Theta operator
+from thetaOp import thetaOp
+
 # Import Theta matrix generator
 from makeTheta import makeTheta
 
 # Import final reconstruction
 from finalRecon import finalRecon
 
+
+# Import sliding-window streaming reconstruction
+from streamRecon import streamRecon
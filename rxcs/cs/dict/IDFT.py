@@ -55,6 +55,52 @@ where N is the number of tones in the dictionary.
 (the **bFreqSym** flag was added in v2.1, 14 January 2016).         
 
 
+TIME SHIFT:
+Shifting the time window of a generated dictionary by tShift is a phase
+rotation exp(j*2*pi*f*tShift) of every row (tone) of the dictionary.
+Functions 'shift', 'shiftR' and 'shiftTheta' give a dictionary (or a Theta
+matrix) shifted in time, without generating the dictionary again:
+
+    shift(tShift)              - the dictionary shifted in time (mDict)
+    shiftR(tShift)             - the real-valued dictionary shifted in time (mDictR)
+    shiftTheta(mTheta, tShift) - a Theta matrix generated from mDict or mDictR shifted in time
+    shiftPhasor(tShift)        - phase rotations of all the tones of the dictionary
+
+f.e. a dictionary generated with tStart = 0 and shifted with tShift = 1e-3 is
+equal to a dictionary generated with tStart = 1e-3.
+
+
+LAZY GENERATION OF THE DICTIONARY MATRICES:
+The dictionary matrices (mDict and mDictR) are generated when they are
+accessed for the first time after the 'run' function, so only the matrices
+which are really used are generated. Therefore the matrices are not in the
+dictionary returned by the 'run' function, they must be accessed as
+attributes of the generator (f.e. IDFT.mDict).
+
+
+CACHE OF THE DICTIONARY MATRICES:
+If the **bCache** flag is set, the dictionary matrices are taken from the
+cache of dictionary matrices (look at the 'dictCache' module), so dictionaries
+with the same parameters are generated only once. If the **strCacheDir**
+directory is given, the matrices are stored in the directory and are shared
+(as read-only memory-mapped files) by all the processes which use the directory.
+Matrices taken from the cache are read-only.
+
+
+BAND-RESTRICTED SUB-DICTIONARIES:
+Functions 'freqBands' and 'freqBandsR' give sub-dictionaries (rxcs.cs.dict.subDict)
+with tones from one or more frequency bands. A sub-dictionary is a view on
+blocks of rows of the dictionary (mDict or mDictR), rows are not copied.
+Sub-dictionaries may be given directly to the Theta matrix generator (makeTheta).
+
+
+FFT-BACKED DICTIONARY OPERATOR:
+Function 'fftOperator' gives an operator (rxcs.cs.dict.fftDict) which represents
+the dictionary (mDict) without generating it. Products with the operator are
+computed with the FFT. The operator may be used if the representation sampling
+frequency (fR) is a multiple of the frequency separation between tones (fDelta).
+
+
 *Examples*:
     Please go to the *examples/dictionaries* directory for examples on how to 
     use the dictionary generator. |br|
@@ -85,7 +131,14 @@ where N is the number of tones in the dictionary.
 
     - f, **fFirst** (*float*):  the first frequency in the spectrum  [default = fDelta]
 
-    - g. **bMute** (*int*):    mute the console output from the sampler [default = 0]
+    - g. **bFreqSym** (*int*):  symmetrical frequency distribution flag [default = 0]
+
+    - h. **bCache** (*int*):  take the dictionary matrices from the cache [default = 0]
+
+    - i. **strCacheDir** (*string*):  directory of the on-disk cache of the dictionary matrices
+                                      ['' - the on-disk cache is not used, default = '']
+
+    - j. **bMute** (*int*):    mute the console output from the sampler [default = 0]
 
 
 *Output*:
@@ -101,14 +154,16 @@ where N is the number of tones in the dictionary.
 
     - d. **vF** (*Numpy array 1D*):  frequency vector for the dictionary    
 
+    - e. **vInxConj** (*Numpy array 1D*):  indices of conjugate tones (rows) of the dictionary
+
  
     Additional parameters of the generated dictionary:
 
-    - e. **Tg**  (*float*):  dictionary time representation period
+    - f. **Tg**  (*float*):  dictionary time representation period
     
-    - f. **nSamp** (*int*):  the number of time representation samples
+    - g. **nSamp** (*int*):  the number of time representation samples
 
-    - g. **bFreqSym** (*int*):  symmetrical/non-symmetrical frequency distribution flag
+    - h. **bFreqSym** (*int*):  symmetrical/non-symmetrical frequency distribution flag
 
 
 *Author*:
@@ -124,7 +179,17 @@ where N is the number of tones in the dictionary.
     2.1    | 14-JAN-2016 : * Frequencies of tones may be organized non-symetrical |br|
     2.2    | 28-JAN-2016 : * Function 'freqRange' which gives indices of columns corresponding to a given frequency
                              range is added |br|    
-    2.3    | 28-JAN-2016 : * Additional, real-valued only version of IDFT dictionary is returned
+    2.3    | 28-JAN-2016 : * Additional, real-valued only version of IDFT dictionary is returned |br|
+    2.4    | 19-OCT-2026 : * Function 'gram' which gives the Gram matrix of the dictionary is added,
+                             indices of conjugate tones are returned |br|
+    2.5    | 19-OCT-2026 : * Functions which shift the dictionary in time are added |br|
+    2.6    | 19-OCT-2026 : * Dictionary matrices are generated lazily, on the first access;
+                             faster generation of the dictionary matrices |br|
+    2.7    | 19-OCT-2026 : * Dictionary matrices may be taken from the cache of dictionary matrices |br|
+    2.8    | 19-OCT-2026 : * Functions 'freqBands' and 'freqBandsR' which give band-restricted sub-dictionaries
+                             (views on the dictionary) are added, 'freqRange' computes indices directly |br|
+    2.9    | 19-OCT-2026 : * Function 'fftOperator' which gives an FFT-backed operator of the dictionary is added |br|
+    2.9r1  | 19-OCT-2026 : * Version of the generated matrices is a part of the key in the cache |br|
 
 
 *License*:
@@ -135,6 +200,10 @@ from __future__ import division
 import rxcs
 import numpy as np
 
+# Version of the dictionary matrices in the cache of dictionary matrices
+# (it must be changed every time the generated matrices change)
+_strCacheVersion = '2.9'
+
 class IDFT(rxcs._RxCSobject):
 
     def __init__(self, *args):
@@ -189,6 +258,15 @@ class IDFT(rxcs._RxCSobject):
         self.paramType('bFreqSym', (int))
         self.paramAllowed('bFreqSym',[0, 1])      # It can be either 1 or 0
 
+        # 'Take the dictionary matrices from the cache' flag
+        self.paramAddOpt('bCache', 'Take the dictionary matrices from the cache', default=0)
+        self.paramType('bCache', (int))
+        self.paramAllowed('bCache',[0, 1])        # It can be either 1 or 0
+
+        # Directory of the on-disk cache of the dictionary matrices
+        self.paramAddOpt('strCacheDir', 'Directory of the on-disk cache of the dictionary matrices', noprint=1, default='')
+        self.paramType('strCacheDir', str)
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -217,9 +295,16 @@ class IDFT(rxcs._RxCSobject):
         self._printExtraParam()
 
         self.engineStartsInfo()      # Info that the engine starts
+        self._tCacheKey = (self.tS, self.fR, self.fDelta, self.nTones, self.fFirst, self.tStart, self.bFreqSym)  # Key of the cache
         self.vF = self._generateFVector(self.fFirstHigh, self.fDelta, self.fHigh)            # Frequency vector
         self.vT = self._generateTVector(self.Tg, self.nSamp, self.tStart)                    # Time vector
-        (self.mDict, self.mDictR, self.vF, self.vFr) = self._generateIDFT(self.vT, self.vF)  # The dicionary matrices
+        self.vFr = np.hstack((self.vF, self.vF))                                             # Frequency vector of mDictR
+
+        # The dictionary matrices are generated on the first access (look at '__getattr__'),
+        # remove matrices generated by a previous run
+        self.__dict__.pop('mDict', None)
+        self.__dict__.pop('mDictR', None)
+        self.vInxConj = self._generateConjInx(self.vF)                                       # Indices of conjugate tones
         self.engineStopsInfo()       # Info that the engine ends
         return
 
@@ -348,6 +433,8 @@ class IDFT(rxcs._RxCSobject):
         vF_pos = np.arange((fFirstHigh/fDelta), (fHigh/fDelta)+1)  # positive freqs
         vF_neg = -1 * vF_pos                                       # negative freqs
         vF_neg.sort()
+        if self.bFreqSym == 0:
+            vF_neg = vF_neg[::-1]
         vF = fDelta * np.concatenate( (vF_pos, vF_neg) )
         vF.shape = (vF.size, )
         return vF
@@ -372,51 +459,276 @@ class IDFT(rxcs._RxCSobject):
         vT.shape = (vT.size, )
         return vT
 
+    # Lazy generation of the dictionary matrices
+    def __getattr__(self, strName):
+        """
+        The dictionary matrices (mDict and mDictR) are generated on the first
+        access after the 'run' function.
+        """
+        if (strName == 'mDict') and ('vT' in self.__dict__):
+            self.mDict = self._cached('mDict', lambda: self._generateIDFT(self.vT, self.vF))
+            return self.mDict
+        if (strName == 'mDictR') and ('vT' in self.__dict__):
+            self.mDictR = self._cached('mDictR', lambda: self._generateIDFTR(self.vT, self.vF))
+            return self.mDictR
+        raise AttributeError(strName)
+
+    # Take a dictionary matrix from the cache
+    def _cached(self, strName, funcGen):
+        """
+        This function takes a dictionary matrix from the cache of dictionary
+        matrices, if the cache is switched on. Otherwise the matrix is generated.
+        The matrix is cached under the parameters of the last run (not the
+        current parameters, which may have changed after the run).
+
+        Args:
+            strName (string):    name of the matrix
+            funcGen (function):  function which generates the matrix
+
+        Returns:
+            mMat (Numpy array 2D):  the matrix
+        """
+        if self.bCache == 0:
+            return funcGen()
+        return rxcs.cs.dict.dictCache.get('IDFT', strName, self._tCacheKey, funcGen, self.strCacheDir,
+                                          _strCacheVersion)
+
+    # Generate phases of positive tones
+    def _generatePhase(self, vT, vF):
+        """
+        This function generates phases (2*pi*f*t) of the positive tones of
+        the dictionary.
+
+        Args:
+            vT  (Numpy array 1D): time vector for the dictionary
+            vF  (Numpy array 1D): frequency vector for the dictionary
+
+        Returns:
+            mPhase  (Numpy array 2D):  phases of the positive tones, one tone in a row
+        """
+        nTones = int(vF.size / 2)
+        return np.outer(2 * np.pi * vF[:nTones], vT)
+
+    # Organize the negative tones
+    def _negRows(self, mRows):
+        """
+        This function organizes rows which correspond to positive tones
+        (f1, ..., fN) in the order of the negative tones in the dictionary.
+        The function returns a view on the input matrix.
+        """
+        if self.bFreqSym == 1:
+            return mRows[::-1, :]    # -fN, ..., -f1
+        return mRows                 # -f1, ..., -fN
+
     # Generate the IDFT dictionary
     def _generateIDFT(self, vT, vF):
         """
         This function generates the IDFT dictionary.
 
+        Rows of negative tones are complex conjugates of rows of positive tones,
+        so sines and cosines are computed only for the positive tones.
+
         Args:
             vT  (Numpy array 1D): time vector for the dictionary          
             vF  (Numpy array 1D): frequency vector for the dictionary          
  
         Returns:
             mDict   (Numpy array 2D):  the generated dictionary         
+        """
+        nTones = int(vF.size / 2)                  # The number of positive tones
+        mPhase = self._generatePhase(vT, vF)       # Phases of the positive tones
+
+        # -----------------------------------------------------------------
+        # Generate the Dictionary matrix:  0.5 * exp(j*2*pi*f*t)
+        mDict = np.empty((vF.size, vT.size), dtype=complex)
+        np.cos(mPhase, out=mDict.real[:nTones, :])
+        np.sin(mPhase, out=mDict.imag[:nTones, :])
+        del mPhase
+        mDict[:nTones, :] *= 0.5
+        np.conjugate(self._negRows(mDict[:nTones, :]), out=mDict[nTones:, :])
+        return mDict
+
+    # Generate the real-valued IDFT dictionary
+    def _generateIDFTR(self, vT, vF):
+        """
+        This function generates the real-valued IDFT dictionary.
+
+        Rows of the real-valued dictionary are:  [Re(D+); -Re(D-); Im(D+); Im(D-)],
+        where D+ are rows of positive tones, D- are rows of negative tones.
+
+        Args:
+            vT  (Numpy array 1D): time vector for the dictionary          
+            vF  (Numpy array 1D): frequency vector for the dictionary          
+ 
+        Returns:
             mDictR  (Numpy array 2D):  the generated dictionary, real values only
-            vF (Numpy array 1D): frequencies vector
         """
-        
-        # Change shape of the vectors, so that they can be multiplies
-        vT.shape = (1, vT.size)
-        vF.shape = (vF.size, 1)
+        nTones = int(vF.size / 2)                  # The number of positive tones
+        mDictR = np.empty((2 * vF.size, vT.size))  # Real-only dictionary matrix
+        mCos = mDictR[:nTones, :]                  # Views on the real-only dictionary matrix
+        mSin = mDictR[(2 * nTones):(3 * nTones), :]   # ^
 
         # -----------------------------------------------------------------
-        # Generate the Dictionary matrix
-        d = (1j * 2 * np.pi)   # d coefficient
-        mDict = 0.5 * np.e**np.dot(vF, (d * vT))
-        if self.bFreqSym == 0:
-            (nRows, _) = mDict.shape
-            mDict[np.arange(int(nRows/2), nRows), :] = mDict[np.arange(int(nRows) - 1, int(nRows/2) - 1, -1), :]
-            vF[np.arange(int(nRows/2), nRows)] = vF[np.arange(int(nRows) - 1, int(nRows/2) - 1, -1)]
+        # Cosines and sines of the positive tones are taken from the complex
+        # dictionary (if it was already generated), or computed
+        if 'mDict' in self.__dict__:
+            mCos[...] = self.mDict.real[:nTones, :]
+            mSin[...] = self.mDict.imag[:nTones, :]
+        else:
+            mPhase = self._generatePhase(vT, vF)
+            np.cos(mPhase, out=mCos)
+            np.sin(mPhase, out=mSin)
+            del mPhase
+            mCos *= 0.5
+            mSin *= 0.5
 
         # -----------------------------------------------------------------
-        (nRows, nCols ) = mDict.shape                 # Get the number of rows/cols in the dictionary
-        mDictR = np.zeros((2*nRows, nCols))           # Construct a new empty real-only dictionary matrix
-        mDictR[np.arange(int(nRows/2)), :] = mDict.real[np.arange(int(nRows/2)) , :]   
-        mDictR[np.arange(int(nRows/2) , nRows), :] = -1 * mDict.real[np.arange(int(nRows/2), nRows), :]
-        mDictR[np.arange(nRows, 2*nRows), :] = mDict.imag
+        # Negative tones:  -Re(D-) = -Re(D+),  Im(D-) = -Im(D+)
+        np.negative(self._negRows(mCos), out=mDictR[nTones:(2 * nTones), :])
+        np.negative(self._negRows(mSin), out=mDictR[(3 * nTones):, :])
+        return mDictR
 
-        vT.shape = (vT.size, )
-        vF.shape = (vF.size, )
-        vFr = np.hstack((vF, vF))
+    # Generate indices of conjugate tones
+    def _generateConjInx(self, vF):
+        """
+        This function generates indices of conjugate tones of the dictionary.
+        Row vInxConj[k] of the dictionary is the complex conjugate of row k.
 
-        return (mDict, mDictR, vF, vFr)
+        Args:
+            vF  (Numpy array 1D): frequency vector for the dictionary
 
+        Returns:
+            vInxConj  (Numpy array 1D): indices of conjugate tones
+        """
+        nRows = vF.size                  # The number of rows in the dictionary
+        vInx = np.arange(nRows)          # Indices of rows in the dictionary
+        if self.bFreqSym == 0:
+            vInxConj = (vInx + int(nRows/2)) % nRows    # f1, ..., fN, -f1, ..., -fN
+        else:
+            vInxConj = nRows - 1 - vInx                 # f1, ..., fN, -fN, ..., -f1
+        return vInxConj
 
-    def freqRange(self, iFMin, iFMax):
+    # Phase rotations of tones for a time shift
+    def shiftPhasor(self, tShift):
         """
-        Find indices of cols of the dictionary which correspond to a frequency range <iFMin, iFMax>
+        Get phase rotations exp(j*2*pi*f*tShift) of all the tones (rows) of the
+        dictionary, which shift the dictionary in time by tShift.
+        """
+        if not 'vF' in self.__dict__:
+            raise RuntimeError('Dictionary generator did not generate a dictionary yet!')
+        return np.exp(1j * 2 * np.pi * self.vF * tShift)
+
+    # Dictionary shifted in time
+    def shift(self, tShift):
+        """
+        Get the dictionary (mDict) shifted in time by tShift.
+        """
+        vPhasor = self.shiftPhasor(tShift)
+        return self.mDict * vPhasor[:, np.newaxis]
+
+    # Real-valued dictionary shifted in time
+    def shiftR(self, tShift):
+        """
+        Get the real-valued dictionary (mDictR) shifted in time by tShift.
+        """
+        vPhasor = self.shiftPhasor(tShift)
+        return self._rotateR(self.mDictR, vPhasor)
+
+    # Theta matrix shifted in time
+    def shiftTheta(self, mTheta, tShift):
+        """
+        Get a Theta matrix shifted in time by tShift.
+        The Theta matrix must be generated from the whole dictionary mDict
+        (complex Theta, one column p. tone) or from the whole dictionary
+        mDictR (real Theta, two columns p. tone).
+        """
+        vPhasor = self.shiftPhasor(tShift)
+        (_, nCols) = mTheta.shape
+        if nCols == vPhasor.size:
+            return mTheta * vPhasor
+        if nCols == 2 * vPhasor.size:
+            return self._rotateR(mTheta.T, vPhasor).T
+        strE = 'The number of columns of the Theta matrix (%d) does not fit the dictionary!' % (nCols)
+        raise ValueError(strE)
+
+    # Rotate phase of tones in a real-valued dictionary
+    def _rotateR(self, mDictR, vPhasor):
+        """
+        This function rotates phases of tones in a real-valued dictionary.
+
+        Rows of the real-valued dictionary are:  [sgn * Re(D); Im(D)],
+        where sgn is 1 for the first half of D, and -1 for the second half.
+        Rotation of D by p gives:
+
+            Re(D') = Re(D)*Re(p) - Im(D)*Im(p)
+            Im(D') = Re(D)*Im(p) + Im(D)*Re(p)
+
+        Args:
+            mDictR (Numpy array 2D):   the real-valued dictionary, one row p. real/imag part of a tone
+            vPhasor (Numpy array 1D):  phase rotations of tones
+
+        Returns:
+            mDictRS (Numpy array 2D):  the rotated real-valued dictionary
+        """
+        nRows = vPhasor.size                     # The number of tones
+        vSgn = np.ones(nRows)                    # Signs of the real parts of tones
+        vSgn[int(nRows/2):] = -1                 # ^
+        vCos = vPhasor.real[:, np.newaxis]
+        vSin = vPhasor.imag[:, np.newaxis]
+        vSgnSin = (vSgn * vPhasor.imag)[:, np.newaxis]
+
+        mDictRS = np.empty(mDictR.shape)
+        mDictRS[:nRows, :] = mDictR[:nRows, :] * vCos - mDictR[nRows:, :] * vSgnSin
+        mDictRS[nRows:, :] = mDictR[:nRows, :] * vSgnSin + mDictR[nRows:, :] * vCos
+        return mDictRS
+
+    # Check if the dictionary is orthogonal
+    def _isOrthogonal(self):
+        """
+        This function checks if the generated dictionary is orthogonal.
+        It is orthogonal if all the tones are placed on the FFT grid of the
+        dictionary (1/tS) and all the tones are below the Nyquist frequency.
+        """
+        iDeltaBins = self.fDelta * self.tS           # Separation between tones in FFT bins
+        iFirstBins = 2 * self.fFirstHigh * self.tS   # Separation between the lowest +/- tones in FFT bins
+        if not self.isequal(iDeltaBins, np.round(iDeltaBins), 1e-6):
+            return 0
+        if not self.isequal(iFirstBins, np.round(iFirstBins), 1e-6):
+            return 0
+        if not (self.fR > 2 * self.fHigh):
+            return 0
+        return 1
+
+    # Gram matrix of the dictionary
+    def gram(self):
+        """
+        Get the Gram matrix of the dictionary (mDict * mDict^H).
+
+        If the dictionary is orthogonal, only the diagonal of the Gram matrix
+        is returned (1D Numpy array with energy of every tone). Otherwise the
+        full Gram matrix is computed.
+        """
+        if not 'vF' in self.__dict__:
+            raise RuntimeError('Dictionary generator did not generate a dictionary yet!')
+        if self._isOrthogonal():
+            return 0.25 * self.nSamp * np.ones(self.vF.size)
+        return np.dot(self.mDict, self.mDict.conj().T)
+
+
+    # Indices of tones in a frequency range
+    def _toneRange(self, iFMin, iFMax):
+        """
+        This function finds the first and the last + 1 index of positive tones
+        which are in a frequency range <iFMin, iFMax>. Frequencies of tones
+        lie on a uniform grid, so the indices are computed directly.
+
+        Args:
+            iFMin (float):  the low frequency of the range
+            iFMax (float):  the high frequency of the range
+
+        Returns:
+            iStart (int):   index of the first tone in the range
+            iStop (int):    index of the last tone in the range + 1
         """
         if not 'vF' in self.__dict__:
             raise RuntimeError('Dictionary generator did not generate a dictionary yet!')
@@ -426,34 +738,115 @@ class IDFT(rxcs._RxCSobject):
             raise RuntimeError('Frequencies which define the frequency range can not be lower than zero!')
         if (iFMin > self.fHigh):
             raise RuntimeError('Requested frequency range is not in the dictionary!')
-                                 
-        iNf = self.vF.size          # The number of frequencies in the dictionary
-        vInx = np.arange(iNf)       # All the indices of frequencies in the dictionary
-        vFiltInx_p = vInx[np.multiply(self.vF >= iFMin, self.vF <= iFMax)]
-        vFiltInx_n = vInx[np.multiply(self.vF <= -iFMin, self.vF >= -iFMax)]
-        vFiltInx = np.hstack((vFiltInx_n, vFiltInx_p))
+
+        nTones = int(self.vF.size / 2)   # The number of positive tones
+        iStart = int(np.ceil((iFMin - self.fFirstHigh) / self.fDelta - 1e-9))
+        iStop = int(np.floor((iFMax - self.fFirstHigh) / self.fDelta + 1e-9)) + 1
+        iStart = min(max(iStart, 0), nTones)
+        iStop = min(max(iStop, iStart), nTones)
+        return (iStart, iStop)
+
+    # Slices of rows of the dictionary which correspond to a frequency range
+    def _bandSlices(self, iFMin, iFMax):
+        """
+        This function finds slices of rows of the dictionary (mDict) which
+        correspond to a frequency range <iFMin, iFMax>.
+
+        Returns:
+            tPos (tuple):   slice of rows with positive tones (first row, last row + 1)
+            tNeg (tuple):   slice of rows with negative tones (first row, last row + 1)
+        """
+        nTones = int(self.vF.size / 2)   # The number of positive tones
+        (iStart, iStop) = self._toneRange(iFMin, iFMax)
+        tPos = (iStart, iStop)
+        if self.bFreqSym == 1:
+            tNeg = (2 * nTones - iStop, 2 * nTones - iStart)   # -fN, ..., -f1
+        else:
+            tNeg = (nTones + iStart, nTones + iStop)           # -f1, ..., -fN
+        return (tPos, tNeg)
+
+    # Make a list of frequency bands
+    def _bandList(self, lBands):
+        """
+        This function makes a list of frequency bands. A single band may be
+        given as a tuple (iFMin, iFMax).
+        """
+        if isinstance(lBands, tuple) and (len(lBands) == 2) and np.isscalar(lBands[0]):
+            return [lBands]
+        return list(lBands)
+
+    def freqRange(self, iFMin, iFMax):
+        """
+        Find indices of cols of the dictionary which correspond to a frequency range <iFMin, iFMax>
+        """
+        ((iPosStart, iPosStop), (iNegStart, iNegStop)) = self._bandSlices(iFMin, iFMax)
+        vFiltInx = np.hstack((np.arange(iNegStart, iNegStop), np.arange(iPosStart, iPosStop)))
         return vFiltInx
-        
-        
-        
+
     def freqRangeR(self, iFMin, iFMax):
         """
         Find indices of cols of the dictionary which correspond to a frequency range <iFMin, iFMax>  
         (dictionary with only real values)
         """
-        if not 'vFr' in self.__dict__:
+        nRows = self.vF.size   # The number of rows of the complex dictionary
+        ((iPosStart, iPosStop), (iNegStart, iNegStop)) = self._bandSlices(iFMin, iFMax)
+        vFiltInx = np.hstack((np.arange(iNegStart, iNegStop), np.arange(iNegStart, iNegStop) + nRows,
+                              np.arange(iPosStart, iPosStop), np.arange(iPosStart, iPosStop) + nRows))
+        return vFiltInx
+
+    # Sub-dictionary with frequency bands
+    def freqBands(self, lBands, bPosOnly=0):
+        """
+        This function gives a sub-dictionary (a view on the dictionary mDict,
+        without copying) with tones from the given frequency bands.
+
+        Args:
+            lBands (list):    list with frequency bands, every band is a tuple (iFMin, iFMax)
+                              (a single band may be given as a tuple)
+            bPosOnly (int):   take only positive tones
+
+        Returns:
+            subDict (rxcs.cs.dict.subDict):  the sub-dictionary, positive tones from all
+                                             the bands followed by negative tones from
+                                             all the bands
+        """
+        lSlices = [self._bandSlices(iFMin, iFMax) for (iFMin, iFMax) in self._bandList(lBands)]
+        lPos = [tPos for (tPos, _) in lSlices]
+        lNeg = [] if bPosOnly else [tNeg for (_, tNeg) in lSlices]
+        return rxcs.cs.dict.subDict(self.mDict, lPos + lNeg)
+
+    # Sub-dictionary with frequency bands (dictionary with only real values)
+    def freqBandsR(self, lBands):
+        """
+        This function gives a sub-dictionary (a view on the real-valued
+        dictionary mDictR, without copying) with tones from the given frequency
+        bands.
+
+        Args:
+            lBands (list):    list with frequency bands, every band is a tuple (iFMin, iFMax)
+                              (a single band may be given as a tuple)
+
+        Returns:
+            subDict (rxcs.cs.dict.subDict):  the sub-dictionary, rows are organized
+                                             in the same way as in mDictR
+        """
+        nRows = self.vF.size   # The number of rows of the complex dictionary
+        lSlices = [self._bandSlices(iFMin, iFMax) for (iFMin, iFMax) in self._bandList(lBands)]
+        lPos = [tPos for (tPos, _) in lSlices]
+        lNeg = [tNeg for (_, tNeg) in lSlices]
+        lRe = lPos + lNeg                                          # Real parts
+        lIm = [(iStart + nRows, iStop + nRows) for (iStart, iStop) in lRe]   # Imaginary parts
+        return rxcs.cs.dict.subDict(self.mDictR, lRe + lIm)
+
+    # FFT-backed operator of the dictionary
+    def fftOperator(self):
+        """
+        This function gives an FFT-backed operator which represents the
+        dictionary (mDict) without generating the dictionary matrix.
+
+        Returns:
+            fftDict (rxcs.cs.dict.fftDict):  the operator, one tone in a row
+        """
+        if not 'vT' in self.__dict__:
             raise RuntimeError('Dictionary generator did not generate a dictionary yet!')
-        if iFMin > iFMax:
-            raise RuntimeError('Low frequency defining the frequency range can not be higher than the high frequency!')
-        if (iFMin < 0) or (iFMax < 0):
-            raise RuntimeError('Frequencies which define the frequency range can not be lower than zero!')
-        if (iFMin > self.fHigh):
-            raise RuntimeError('Requested frequency range is not in the dictionary!')
-                                 
-        iNf = self.vFr.size          # The number of frequencies in the dictionary
-        vInx = np.arange(iNf)       # All the indices of frequencies in the dictionary
-        vFiltInx_p = vInx[np.multiply(self.vFr >= iFMin, self.vFr <= iFMax)]
-        vFiltInx_n = vInx[np.multiply(self.vFr <= -iFMin, self.vFr >= -iFMax)]
-        vFiltInx = np.hstack((vFiltInx_n, vFiltInx_p))
-        return vFiltInx        
-        
\ No newline at end of file
+        return rxcs.cs.dict.fftDict(self.vF, self.vT, self.fR, self.fDelta)
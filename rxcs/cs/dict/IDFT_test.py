@@ -0,0 +1 @@
+../../../test/dictionaries/IDFT_test.py
\ No newline at end of file
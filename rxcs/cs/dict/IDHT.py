@@ -43,6 +43,13 @@ are organized like this:
 (the **bFreqSym** flag was added in v2.1, 14 January 2016).         
               
            
+BAND-RESTRICTED SUB-DICTIONARIES:
+Function 'freqBands' gives sub-dictionaries (rxcs.cs.dict.subDict) with tones
+from one or more frequency bands. A sub-dictionary is a view on blocks of rows
+of the dictionary, rows are not copied. Sub-dictionaries may be given directly
+to the Theta matrix generator (makeTheta).
+
+
 *Examples*:
     Please go to the *examples/dictionaries* directory for examples on how to 
     use the dictionary generator. |br|
@@ -73,7 +80,15 @@ are organized like this:
 
     - f, **fFirst** (*float*):  the first frequency in the spectrum  [default = fDelta]
 
-    - g. **bMute** (*int*):    mute the console output from the sampler [default = 0]
+    - g. **bFreqSym** (*int*):  symmetrical frequency distribution flag [default = 0]
+
+    - h. **bCache** (*int*):  take the dictionary matrix from the cache of dictionary
+                              matrices (look at the 'dictCache' module) [default = 0]
+
+    - i. **strCacheDir** (*string*):  directory of the on-disk cache of the dictionary matrices
+                                      ['' - the on-disk cache is not used, default = '']
+
+    - j. **bMute** (*int*):    mute the console output from the sampler [default = 0]
 
 
 *Output*:
@@ -109,6 +124,11 @@ are organized like this:
     2.1r1  | 15-JAN-2016 : * Bug in entering the silent mode is repaired |br|
     2.2    | 18-JAN-2016 : * Function 'freqRange' which gives indices of columns corresponding to a given frequency
                              range is added |br|
+    2.3    | 19-OCT-2026 : * Function 'gram' which gives the Gram matrix of the dictionary is added |br|
+    2.4    | 19-OCT-2026 : * Dictionary matrix may be taken from the cache of dictionary matrices |br|
+    2.5    | 19-OCT-2026 : * Function 'freqBands' which gives band-restricted sub-dictionaries
+                             (views on the dictionary) is added, 'freqRange' computes indices directly |br|
+    2.5r1  | 19-OCT-2026 : * Version of the generated matrices is a part of the key in the cache |br|
     
 *License*:
     BSD 2-Clause
@@ -118,6 +138,10 @@ from __future__ import division
 import rxcs
 import numpy as np
 
+# Version of the dictionary matrices in the cache of dictionary matrices
+# (it must be changed every time the generated matrices change)
+_strCacheVersion = '2.5'
+
 class IDHT(rxcs._RxCSobject):
 
     def __init__(self, *args):
@@ -172,6 +196,15 @@ class IDHT(rxcs._RxCSobject):
         self.paramType('bFreqSym', (int))
         self.paramAllowed('bFreqSym',[0, 1])      # It can be either 1 or 0
 
+        # 'Take the dictionary matrix from the cache' flag
+        self.paramAddOpt('bCache', 'Take the dictionary matrix from the cache', default=0)
+        self.paramType('bCache', (int))
+        self.paramAllowed('bCache',[0, 1])        # It can be either 1 or 0
+
+        # Directory of the on-disk cache of the dictionary matrices
+        self.paramAddOpt('strCacheDir', 'Directory of the on-disk cache of the dictionary matrices', noprint=1, default='')
+        self.paramType('strCacheDir', str)
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -200,9 +233,10 @@ class IDHT(rxcs._RxCSobject):
         self._printExtraParam()
 
         self.engineStartsInfo()      # Info that the engine starts
+        self._tCacheKey = (self.tS, self.fR, self.fDelta, self.nTones, self.fFirst, self.tStart, self.bFreqSym)  # Key of the cache
         self.vF = self._generateFVector(self.fFirstHigh, self.fDelta, self.nTones)   # Frequency vector
         self.vT = self._generateTVector(self.Tg, self.nSamp, self.tStart)            # Time vector
-        (self.mDict, self.vF) = self._generateIDHT(self.vT, self.vF)                            # The dicionary matrix                        
+        self.mDict = self._cached('mDict', lambda: self._generateIDHT(self.vT, self.vF))  # The dicionary matrix
         self.engineStopsInfo()       # Info that the engine ends
         return
 
@@ -330,7 +364,10 @@ class IDHT(rxcs._RxCSobject):
         # -----------------------------------------------------------------
         # Generate the frequency vector
         vF = np.arange(fFirstHigh, fFirstHigh + (fDelta * nTones), fDelta)
-        vF = np.hstack((vF, vF))
+        if self.bFreqSym == 1:
+            vF = np.hstack((vF, vF[::-1]))    # Frequencies of sine tones are reversed
+        else:
+            vF = np.hstack((vF, vF))
         return vF
 
     # Generate the time vector
@@ -364,12 +401,11 @@ class IDHT(rxcs._RxCSobject):
  
         Returns:
             mDict (Numpy array 2D): the generated dictionary         
-            vF  (Numpy array 1D):   frequency vector for the dictionary
         """
         
         # Change shape of the vectors, so that they can be multiplied  
         vT.shape = (1, vT.size)
-        vF_ = vF[0: vF.size / 2]  # Take only half of the frequency vector 
+        vF_ = vF[0: int(vF.size / 2)]  # Take only half of the frequency vector 
         vF_.shape = (vF_.size, 1)
 
         # -----------------------------------------------------------------
@@ -386,16 +422,78 @@ class IDHT(rxcs._RxCSobject):
         if self.bFreqSym == 1:
             (nRows, _) = mDict.shape
             mDict[np.arange(int(nRows/2), nRows), :] = mDict[np.arange(int(nRows) - 1, int(nRows/2) - 1, -1), :]
-            vF[np.arange(int(nRows/2), int(nRows))] = vF[np.arange(int(nRows) - 1, int(nRows/2) - 1, -1)]
-        
+
         # -----------------------------------------------------------------
         vT.shape = (vT.size, )   # Restore shape of the time vector
-        return (mDict, vF)
+        return mDict
 
+    # Take a dictionary matrix from the cache
+    def _cached(self, strName, funcGen):
+        """
+        This function takes a dictionary matrix from the cache of dictionary
+        matrices, if the cache is switched on. Otherwise the matrix is generated.
+        The matrix is cached under the parameters of the last run (not the
+        current parameters, which may have changed after the run).
 
-    def freqRange(self, iFMin, iFMax):
+        Args:
+            strName (string):    name of the matrix
+            funcGen (function):  function which generates the matrix
+
+        Returns:
+            mMat (Numpy array 2D):  the matrix
         """
-        Find indices of cols of the dictionary which correspond to a frequency range <iFMin, iFMax>
+        if self.bCache == 0:
+            return funcGen()
+        return rxcs.cs.dict.dictCache.get('IDHT', strName, self._tCacheKey, funcGen, self.strCacheDir,
+                                          _strCacheVersion)
+
+    # Check if the dictionary is orthogonal
+    def _isOrthogonal(self):
+        """
+        This function checks if the generated dictionary is orthogonal.
+        It is orthogonal if all the tones are placed on the FFT grid of the
+        dictionary (1/tS) and all the tones are below the Nyquist frequency.
+        """
+        iDeltaBins = self.fDelta * self.tS           # Separation between tones in FFT bins
+        iFirstBins = 2 * self.fFirstHigh * self.tS   # Separation between the lowest +/- tones in FFT bins
+        if not self.isequal(iDeltaBins, np.round(iDeltaBins), 1e-6):
+            return 0
+        if not self.isequal(iFirstBins, np.round(iFirstBins), 1e-6):
+            return 0
+        if not (self.fR > 2 * self.fHigh):
+            return 0
+        return 1
+
+    # Gram matrix of the dictionary
+    def gram(self):
+        """
+        Get the Gram matrix of the dictionary (mDict * mDict^T).
+
+        If the dictionary is orthogonal, only the diagonal of the Gram matrix
+        is returned (1D Numpy array with energy of every row). Otherwise the
+        full Gram matrix is computed.
+        """
+        if not 'vF' in self.__dict__:
+            raise RuntimeError('Dictionary generator did not generate a dictionary yet!')
+        if self._isOrthogonal():
+            return 0.5 * self.nSamp * np.ones(self.vF.size)
+        return np.dot(self.mDict, self.mDict.T)
+
+
+    # Slices of rows of the dictionary which correspond to a frequency range
+    def _bandSlices(self, iFMin, iFMax):
+        """
+        This function finds slices of rows of the dictionary which correspond
+        to a frequency range <iFMin, iFMax>. Frequencies of tones lie on a
+        uniform grid, so the slices are computed directly.
+
+        Args:
+            iFMin (float):  the low frequency of the range
+            iFMax (float):  the high frequency of the range
+
+        Returns:
+            tCos (tuple):   slice of rows with cosine tones (first row, last row + 1)
+            tSin (tuple):   slice of rows with sine tones (first row, last row + 1)
         """
         if not 'vF' in self.__dict__:
             raise RuntimeError('Dictionary generator did not generate a dictionary yet!')
@@ -405,11 +503,46 @@ class IDHT(rxcs._RxCSobject):
             raise RuntimeError('Frequencies which define the frequency range can not be lower than zero!')
         if (iFMin > self.fHigh):
             raise RuntimeError('Requested frequency range is not in the dictionary!')
-                                 
-        iNf = self.vF.size          # The number of frequencies in the dictionary
-        vInx = np.arange(iNf)       # All the indices of frequencies in the dictionary
-        vFiltInx_p = vInx[np.multiply(self.vF >= iFMin, self.vF <= iFMax)]
-        vFiltInx_n = vInx[np.multiply(self.vF <= -iFMin, self.vF >= -iFMax)]
-        vFiltInx = np.hstack((vFiltInx_n, vFiltInx_p))
+
+        nTones = int(self.vF.size / 2)   # The number of tones
+        iStart = int(np.ceil((iFMin - self.fFirstHigh) / self.fDelta - 1e-9))
+        iStop = int(np.floor((iFMax - self.fFirstHigh) / self.fDelta + 1e-9)) + 1
+        iStart = min(max(iStart, 0), nTones)
+        iStop = min(max(iStop, iStart), nTones)
+
+        tCos = (iStart, iStop)
+        if self.bFreqSym == 1:
+            tSin = (2 * nTones - iStop, 2 * nTones - iStart)   # fN, ..., f1
+        else:
+            tSin = (nTones + iStart, nTones + iStop)           # f1, ..., fN
+        return (tCos, tSin)
+
+    def freqRange(self, iFMin, iFMax):
+        """
+        Find indices of cols of the dictionary which correspond to a frequency range <iFMin, iFMax>
+        """
+        ((iCosStart, iCosStop), (iSinStart, iSinStop)) = self._bandSlices(iFMin, iFMax)
+        vFiltInx = np.hstack((np.arange(iCosStart, iCosStop), np.arange(iSinStart, iSinStop)))
         return vFiltInx
 
+    # Sub-dictionary with frequency bands
+    def freqBands(self, lBands):
+        """
+        This function gives a sub-dictionary (a view on the dictionary mDict,
+        without copying) with tones from the given frequency bands.
+
+        Args:
+            lBands (list):    list with frequency bands, every band is a tuple (iFMin, iFMax)
+                              (a single band may be given as a tuple)
+
+        Returns:
+            subDict (rxcs.cs.dict.subDict):  the sub-dictionary, cosine tones from all
+                                             the bands followed by sine tones from
+                                             all the bands
+        """
+        if isinstance(lBands, tuple) and (len(lBands) == 2) and np.isscalar(lBands[0]):
+            lBands = [lBands]
+        lSlices = [self._bandSlices(iFMin, iFMax) for (iFMin, iFMax) in lBands]
+        lCos = [tCos for (tCos, _) in lSlices]
+        lSin = [tSin for (_, tSin) in lSlices]
+        return rxcs.cs.dict.subDict(self.mDict, lCos + lSin)
@@ -1,3 +1,12 @@
+# Import the cache of dictionary matrices
+import dictCache
+
+# Import the sub-dictionary (a view on blocks of rows of a dictionary)
+from subDict import subDict
+
+# Import the FFT-backed IDFT dictionary operator
+from fftDict import fftDict
+
 
 # Import the generator of oversampeld IDFT dictionary
 from IDFT import IDFT
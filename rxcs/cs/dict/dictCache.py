@@ -0,0 +1,180 @@
+"""
+This module is a cache of dictionary matrices. |br|
+
+Dictionary generators (IDFT, IDHT) generate the same dictionary matrices
+over and over again, if they are run with the same parameters (f.e. in every
+sweep point or in every process of a multi CPU experiment). The cache
+memoizes the generated matrices. A matrix is identified by the kind of the
+dictionary, the name of the matrix, the parameters of the dictionary
+(tS, fR, fDelta, nTones, fFirst, tStart, bFreqSym), the version of the
+generator of the dictionary and the version of the format of the cache.
+
+A generator must change its version every time it starts to generate
+different matrices, so that matrices generated by an older generator
+(f.e. stored in the on-disk layer) are never reused.
+
+The cache has two layers:
+
+    - in-process layer: the least recently used (LRU) cache of matrices,
+      keeps at most 'nMax' matrices which take at most 'iMaxBytes' bytes
+      (16 matrices, 1 GB by default, look at 'setSize')
+
+    - on-disk layer (optional): matrices are stored in a directory as *.npy
+      files and are opened as read-only memory-mapped arrays, so processes
+      which use the same directory share the same read-only memory pages
+      instead of generating and keeping their own copies of the matrices.
+      A file is first written to a temporary file and then renamed, so other
+      processes never open a partially written file.
+
+Matrices given by the cache are read-only.
+
+Usage:
+
+    mDict = dictCache.get('IDFT', 'mDict', tParam, funcGen, strDir, strVersion)
+
+where 'funcGen' is a function (without arguments) which generates the matrix
+if it is not in the cache and 'strVersion' is the version of the generator.
+If 'strDir' is an empty string, the on-disk layer is not used.
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+    1.1    | 19-OCT-2026 : * The in-process layer is limited also in bytes |br|
+    1.2    | 19-OCT-2026 : * Versions of the generator and of the cache format are parts of the key |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import os
+import glob
+import hashlib
+import tempfile
+import numpy as np
+from rxcs.auxiliary.LRUcache import LRUcache
+
+# Prefix of names of files in the on-disk layer of the cache
+_strFilePrefix = 'rxcsdict_'
+
+# Version of the format of the keys and the files of the cache
+_strFormat = '2'
+
+# The in-process layer of the cache (at most 16 matrices, at most 1 GB)
+_lruCache = LRUcache(16, 2**30)
+
+
+# Get a matrix from the cache
+def get(strKind, strName, tParam, funcGen, strDir='', strVersion=''):
+    """
+    This function gets a dictionary matrix from the cache. If the matrix is
+    not in the cache, it is generated and put into the cache.
+
+    Args:
+        strKind (string):   kind of the dictionary (f.e. 'IDFT')
+        strName (string):   name of the matrix (f.e. 'mDict')
+        tParam (tuple):     parameters of the dictionary
+        funcGen (function): function which generates the matrix
+        strDir (string):    directory of the on-disk layer of the cache
+                            ('' - the on-disk layer is not used)
+        strVersion (string): version of the generator of the dictionary
+
+    Returns:
+        mMat (Numpy array 2D):  the matrix (read-only)
+    """
+    strKey = _makeKey(strKind, strName, tParam, strVersion)
+
+    # The in-process layer
+    mMat = _lruCache.get((strKey, strDir))
+    if mMat is not None:
+        return mMat
+
+    # The on-disk layer
+    if len(strDir) > 0:
+        strFile = os.path.join(strDir, strKey + '.npy')
+        if not os.path.isfile(strFile):
+            _save(strFile, funcGen())
+        mMat = np.load(strFile, mmap_mode='r')
+    else:
+        mMat = funcGen()
+        mMat.setflags(write=False)
+
+    return _lruCache.put((strKey, strDir), mMat)
+
+
+# Set the size of the in-process layer of the cache
+def setSize(nMax, iMaxBytes=None):
+    """
+    This function sets the maximum number of matrices in the in-process layer
+    of the cache (0 - the in-process layer is switched off) and, optionally,
+    the maximum size of the matrices in bytes (0 - the size is not limited).
+    """
+    if iMaxBytes is not None:
+        _lruCache.iMaxBytes = iMaxBytes
+    _lruCache.resize(nMax)
+    return
+
+
+# Clear the cache
+def clear(strDir=''):
+    """
+    This function clears the in-process layer of the cache. If a directory
+    is given, all the matrices stored in the directory are removed.
+    """
+    _lruCache.clear()
+    if len(strDir) > 0:
+        for strFile in glob.glob(os.path.join(strDir, _strFilePrefix + '*.npy')):
+            os.remove(strFile)
+    return
+
+
+# Make a key of a matrix
+def _makeKey(strKind, strName, tParam, strVersion=''):
+    """
+    This function makes a key of a dictionary matrix. The key is also a name
+    of a file (without extension) in the on-disk layer of the cache.
+
+    Args:
+        strKind (string):    kind of the dictionary (f.e. 'IDFT')
+        strName (string):    name of the matrix (f.e. 'mDict')
+        tParam (tuple):      parameters of the dictionary
+        strVersion (string): version of the generator of the dictionary
+
+    Returns:
+        strKey (string):    key of the matrix
+    """
+    strParam = ','.join([repr(float(x)) for x in tParam])
+    strParam = '%s;%s;%s' % (_strFormat, strVersion, strParam)
+    strHash = hashlib.sha1(strParam.encode('ascii')).hexdigest()
+    return '%s%s_%s_%s' % (_strFilePrefix, strKind, strName, strHash)
+
+
+# Save a matrix in a file
+def _save(strFile, mMat):
+    """
+    This function saves a matrix in a *.npy file. The matrix is written to
+    a temporary file which is then renamed, so the file is never seen
+    partially written.
+    """
+    strDir = os.path.dirname(strFile)
+    if not os.path.isdir(strDir):
+        try:
+            os.makedirs(strDir)
+        except OSError:
+            if not os.path.isdir(strDir):   # The directory may be created
+                raise                       # by another process
+    (iFd, strTmpFile) = tempfile.mkstemp(suffix='.tmp', dir=strDir)
+    try:
+        with os.fdopen(iFd, 'wb') as f:
+            np.save(f, mMat)
+        os.rename(strTmpFile, strFile)
+    except OSError:
+        # Another process has already stored the matrix
+        # (rename does not overwrite files on some systems)
+        if os.path.isfile(strTmpFile):
+            os.remove(strTmpFile)
+        if not os.path.isfile(strFile):
+            raise
+    return
@@ -0,0 +1 @@
+../../test/dictionaries/dictCache_test.py
\ No newline at end of file
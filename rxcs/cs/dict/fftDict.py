@@ -0,0 +1,152 @@
+"""
+This module contains an FFT-backed IDFT dictionary operator. |br|
+
+The operator represents the IDFT dictionary matrix (mDict, one tone in a row)
+without generating the matrix. Products with the dictionary are computed
+with the FFT, which costs O(nFFT * log(nFFT)) instead of O(nTones * nSamp)
+operations.
+
+Frequencies of tones of the IDFT dictionary lie on a uniform grid:
+f = q * fDelta. If the representation sampling frequency fR is a multiple of
+fDelta (P = fR / fDelta is an integer), then a tone sampled with the period
+1/fR is a periodic sequence with the period P, so every tone corresponds
+to one bin of an FFT of size nFFT (nFFT is the lowest multiple of P which is
+not lower than the number of samples in the dictionary).
+
+The operator can be used in the same way as a dictionary matrix in the most
+common operations:
+
+    - **shape**, **ndim**, **dtype** - shape, the number of dimensions and type of the dictionary
+
+    - **T** - transposed dictionary (one atom in a column)
+
+    - **dot(mX)** - product of the dictionary and a matrix (dictionary * mX)
+
+    - **rdot(mX)** - product of a matrix and the dictionary (mX * dictionary)
+
+    - **rows(vInx)** - rows of the dictionary with the given indices
+
+    - **toarray()** - the dictionary as a Numpy array
+
+The operator is given by the 'fftOperator' function of the IDFT dictionary
+generator. The Theta matrix generator (makeTheta) accepts the operator.
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+
+
+class fftDict(object):
+
+    def __init__(self, vF, vT, fR, fDelta, bT=0):
+        """
+        Args:
+            vF (Numpy array 1D):  frequency vector of the dictionary
+            vT (Numpy array 1D):  time vector of the dictionary
+            fR (float):           the dictionary representation sampling frequency
+            fDelta (float):       the frequency separation between tones
+            bT (int):             'the dictionary is transposed' flag
+        """
+        self.vF = vF
+        self.vT = vT
+        self.fR = fR
+        self.fDelta = fDelta
+        self.bT = bT
+
+        # The period of tones (in samples) and the size of the FFT
+        iP = fR / fDelta
+        if not (abs(iP - np.round(iP)) < 1e-6):
+            strE = 'FFT operator can be used only if the representation sampling frequency (fR) '
+            strE = strE + 'is a multiple of the frequency separation between tones (fDelta)!'
+            raise ValueError(strE)
+        iP = int(np.round(iP))
+        self.nSamp = vT.size
+        self.nFFT = iP * int(np.ceil(self.nSamp / iP))
+
+        # FFT bins of tones and phases of tones at the starting time point
+        vQ = np.round(vF / fDelta).astype(int)
+        self.vBins = (vQ * int(self.nFFT / iP)) % self.nFFT
+        self.bUniqueBins = (np.unique(self.vBins).size == self.vBins.size)
+        self.vPhasor = 0.5 * np.exp(1j * 2 * np.pi * vF * vT[0])
+
+    @property
+    def shape(self):
+        if self.bT:
+            return (self.nSamp, self.vF.size)
+        return (self.vF.size, self.nSamp)
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def dtype(self):
+        return np.dtype(complex)
+
+    @property
+    def T(self):
+        return fftDict(self.vF, self.vT, self.fR, self.fDelta, 1 - self.bT)
+
+    # Synthesis:  tones -> samples
+    def _synth(self, mX):
+        """
+        This function computes mDict.T * mX, mX has one row p. tone.
+        """
+        mX = mX * self.vPhasor.reshape((-1, ) + (1, ) * (mX.ndim - 1))
+        mZ = np.zeros((self.nFFT, ) + mX.shape[1:], dtype=complex)
+        if self.bUniqueBins:
+            mZ[self.vBins] = mX
+        else:
+            np.add.at(mZ, self.vBins, mX)
+        return self.nFFT * np.fft.ifft(mZ, axis=0)[:self.nSamp]
+
+    # Analysis:  samples -> tones
+    def _anal(self, mW):
+        """
+        This function computes mDict * mW, mW has one row p. sample.
+        """
+        mZ = self.nFFT * np.fft.ifft(mW, n=self.nFFT, axis=0)
+        return mZ[self.vBins] * self.vPhasor.reshape((-1, ) + (1, ) * (mW.ndim - 1))
+
+    # Product of the dictionary and a matrix
+    def dot(self, mX):
+        """
+        This function computes a product of the dictionary and a matrix
+        (or a vector): dictionary * mX.
+        """
+        if self.bT:
+            return self._synth(mX)
+        return self._anal(mX)
+
+    # Product of a matrix and the dictionary
+    def rdot(self, mX):
+        """
+        This function computes a product of a matrix (or a vector) and the
+        dictionary: mX * dictionary.
+        """
+        return self.T.dot(mX.T).T
+
+    # Rows of the dictionary
+    def rows(self, vInx):
+        """
+        This function gives rows of the dictionary with the given indices.
+        """
+        if self.bT:
+            return 0.5 * np.exp(1j * 2 * np.pi * np.outer(self.vT[vInx], self.vF))
+        return 0.5 * np.exp(1j * 2 * np.pi * np.outer(self.vF[vInx], self.vT))
+
+    # The dictionary as a Numpy array
+    def toarray(self):
+        """
+        This function gives the dictionary as a Numpy array.
+        """
+        return self.rows(np.arange(self.shape[0]))
@@ -0,0 +1,149 @@
+"""
+This module contains a sub-dictionary: a view on a number of blocks of rows
+of a dictionary matrix. |br|
+
+A sub-dictionary is used to represent a band-restricted dictionary (f.e. a
+dictionary with tones from a number of frequency bands) without copying rows
+of a dictionary matrix. Rows of a band of a dictionary are contiguous
+(frequencies of a dictionary lie on a uniform grid), so the sub-dictionary
+keeps a list of slices of the dictionary matrix (Numpy views). Rows of the
+sub-dictionary are rows of the slices, slice after slice.
+
+A sub-dictionary is not a Numpy array, but it can be used in the same way as a
+dictionary matrix in the most common operations:
+
+    - **shape**, **ndim** - shape and the number of dimensions of the sub-dictionary
+
+    - **T** - transposed sub-dictionary (one atom in a column), also without copying
+
+    - **dot(mX)** - product of the sub-dictionary and a matrix (sub-dictionary * mX)
+
+    - **rdot(mX)** - product of a matrix and the sub-dictionary (mX * sub-dictionary)
+
+    - **rows(vInx)** - rows of the sub-dictionary with the given indices (a copy)
+
+    - **toarray()** - the sub-dictionary as a Numpy array (a copy)
+
+    - **vInx** - indices of rows of the dictionary matrix which are in the sub-dictionary
+
+Sub-dictionaries are given by 'freqBands' functions of dictionary generators.
+The Theta matrix generator (makeTheta) accepts sub-dictionaries.
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+
+
+class subDict(object):
+
+    def __init__(self, mBase, lSlices, bT=0):
+        """
+        Args:
+            mBase (Numpy array 2D):  the dictionary matrix, one atom in a row
+            lSlices (list):          list with slices of rows, every slice is
+                                     a tuple (index of the first row, index of the last row + 1)
+            bT (int):                'the sub-dictionary is transposed' flag
+        """
+        self.mBase = mBase
+        self.bT = bT
+
+        # Remove empty slices and merge adjacent slices
+        self.lSlices = []
+        for (iStart, iStop) in lSlices:
+            if iStop <= iStart:
+                continue
+            if (len(self.lSlices) > 0) and (self.lSlices[-1][1] == iStart):
+                self.lSlices[-1] = (self.lSlices[-1][0], iStop)
+            else:
+                self.lSlices.append((iStart, iStop))
+
+        # Views on the blocks of rows and offsets of the blocks in the sub-dictionary
+        self.lBlocks = [mBase[iStart:iStop, :] for (iStart, iStop) in self.lSlices]
+        self.vOffsets = np.cumsum([0] + [iStop - iStart for (iStart, iStop) in self.lSlices])
+
+    @property
+    def nAtoms(self):
+        return int(self.vOffsets[-1])
+
+    @property
+    def shape(self):
+        if self.bT:
+            return (self.mBase.shape[1], self.nAtoms)
+        return (self.nAtoms, self.mBase.shape[1])
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def dtype(self):
+        return self.mBase.dtype
+
+    @property
+    def T(self):
+        return subDict(self.mBase, self.lSlices, 1 - self.bT)
+
+    @property
+    def vInx(self):
+        if len(self.lSlices) == 0:
+            return np.zeros(0, dtype=int)
+        return np.hstack([np.arange(iStart, iStop) for (iStart, iStop) in self.lSlices])
+
+    # Product of the sub-dictionary and a matrix
+    def dot(self, mX):
+        """
+        This function computes a product of the sub-dictionary and a matrix
+        (or a vector): sub-dictionary * mX.
+        """
+        if self.bT:
+            # (samples x atoms) * (atoms x k): sum of products of blocks
+            mY = np.zeros((self.mBase.shape[1], ) + mX.shape[1:], dtype=np.result_type(self.mBase, mX))
+            for (inxB, mBlock) in enumerate(self.lBlocks):
+                mY += mBlock.T.dot(mX[self.vOffsets[inxB]:self.vOffsets[inxB + 1]])
+            return mY
+
+        # (atoms x samples) * (samples x k): products of blocks, block after block
+        mY = np.empty((self.nAtoms, ) + mX.shape[1:], dtype=np.result_type(self.mBase, mX))
+        for (inxB, mBlock) in enumerate(self.lBlocks):
+            mY[self.vOffsets[inxB]:self.vOffsets[inxB + 1]] = mBlock.dot(mX)
+        return mY
+
+    # Product of a matrix and the sub-dictionary
+    def rdot(self, mX):
+        """
+        This function computes a product of a matrix (or a vector) and the
+        sub-dictionary: mX * sub-dictionary.
+        """
+        return self.T.dot(mX.T).T
+
+    # Rows of the sub-dictionary
+    def rows(self, vInx):
+        """
+        This function gives rows of the sub-dictionary with the given indices.
+        """
+        if self.bT:
+            # Rows of the transposed sub-dictionary are columns of the blocks
+            mRows = np.empty((len(vInx), self.nAtoms), dtype=self.dtype)
+            for (inxB, mBlock) in enumerate(self.lBlocks):
+                mRows[:, self.vOffsets[inxB]:self.vOffsets[inxB + 1]] = mBlock[:, vInx].T
+            return mRows
+        return self.mBase[self.vInx[vInx], :]
+
+    # The sub-dictionary as a Numpy array
+    def toarray(self):
+        """
+        This function gives the sub-dictionary as a Numpy array (a copy).
+        """
+        mArr = self.mBase[self.vInx, :]
+        if self.bT:
+            return mArr.T
+        return mArr
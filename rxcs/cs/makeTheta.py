@@ -10,7 +10,46 @@
  Both the lists should have the same length. However, tt is allowed, that
  the lists contain only one element. In this case the singular dictionary
  matrix or the singular observation matrix will be used for constructing all 
- the Theta  matrices. 
+ the Theta  matrices. The number of Theta matrices is equal to the length of
+ the longer list (since version 1.3; before, a single observation matrix with
+ a list of dictionaries gave only one Theta matrix).
+
+ Dictionaries may be given as Numpy arrays or as sub-dictionaries
+ (rxcs.cs.dict.subDict, f.e. band-restricted dictionaries given by 'freqBands'
+ functions of dictionary generators). Theta matrices are computed directly
+ from blocks of a sub-dictionary, rows of the dictionary are not copied.
+
+ Identical pairs of a dictionary and an observation matrix (the same objects)
+ are detected, the Theta matrix of such pairs is computed only once and
+ shared by reference in the output list. Observation matrices which share
+ the same dictionary are stacked (copied into one matrix, at most **iNBatch**
+ observation matrices at once) and multiplied with the dictionary in a single
+ matrix product. The Theta matrices of such observation matrices are views on
+ the common product, so the whole product is kept in the memory as long as
+ any of the Theta matrices is kept. The Theta matrices in the output list
+ should not be modified in place. Pairs of distinct dictionaries and
+ observation matrices are multiplied pair by pair.
+
+ If the **bOperator** flag is set, Theta matrices are not computed. Elements
+ of the output list are composed Theta operators (rxcs.cs.thetaOp), which keep
+ an observation matrix and a dictionary and compute products with Theta as
+ products with the components. Dictionaries may then also be FFT-backed IDFT
+ dictionary operators (rxcs.cs.dict.fftDict), so matrix-free solvers never
+ need the dense Theta matrices.
+
+ If observation matrices come from a bank of sampling patterns (f.e. from the
+ nonuniExtern sampler), indices of the sampling patterns may be given in
+ **vPattInx**. Theta matrices are then kept in the least recently used (LRU)
+ cache of Theta matrices, keyed by the index of a sampling pattern and the
+ dictionary. Theta matrices are computed only for patterns which are not in
+ the cache, so the work scales with the number of distinct patterns, not with
+ the number of signals. The cache is kept between runs of the generator.
+ The observation matrix of a pattern is kept in the cache together with the
+ Theta matrix, a Theta matrix is taken from the cache only if the observation
+ matrix is the same (the same object, or an equal matrix). So if the bank of
+ sampling patterns changes, Theta matrices of the changed patterns are
+ computed again. Observation matrices with the same index of a sampling pattern
+ in one run must be equal.
 
 *Examples*:
     Please go to the *examples/reconstruction* directory for examples 
@@ -27,7 +66,8 @@
 
     Required parameters:
 
-    - a. **lDict** (*list with 2D Numpy arrays*): list with dictionaries
+    - a. **lDict** (*list with 2D Numpy arrays, sub-dictionaries or FFT-backed dictionary
+                      operators*): list with dictionaries
 
     - b. **lPhi** (*list with 2D Numpy arrays*): list with observation matrices
 
@@ -35,7 +75,19 @@
 
     - c  **bNonuniform**  (*int*):   observation matrix comes from nonuniform sampling
     
-    - d. **bMute** (*int*):    mute the console output from the sampler [default = 0]
+    - d. **iNBatch** (*int*):  the maximum number of Theta matrices computed in one
+                               batched matrix product [default = 64]
+
+    - e. **vPattInx** (*Numpy array 1D*):  indices of sampling patterns of the observation
+                                           matrices (one index p. Theta matrix)
+
+    - f. **iNCache** (*int*):  the maximum number of Theta matrices in the cache
+                               of Theta matrices [default = 64]
+
+    - g. **bOperator** (*int*):  give composed Theta operators instead of Theta matrices
+                                 [default = 0]
+
+    - h. **bMute** (*int*):    mute the console output from the sampler [default = 0]
 
 *Output*:
     Description of the Theta matrix generator output is below.
@@ -43,7 +95,7 @@
     after calling the 'run' method:
 
     - a. **lTheta** (*list with 1D Numpy arrays*):  list with the generated 
-                                                    Theta matrices
+                                                    Theta matrices (or Theta operators)
 
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
@@ -51,6 +103,15 @@
 *Version*:
     1,0    | 25-AUG-2015 : * Version 1.0 released |br|
     1.1    | 17-MAR-2016 : Flag 'bNonuniform' is added |br|
+    1.2    | 19-OCT-2026 : Sub-dictionaries (rxcs.cs.dict.subDict) are accepted |br|
+    1.3    | 19-OCT-2026 : Theta matrices of identical pairs are computed once,
+                           batched computation of Theta matrices,
+                           a single observation matrix with a list of dictionaries
+                           gives one Theta matrix p. dictionary |br|
+    1.4    | 19-OCT-2026 : Cache of Theta matrices keyed by indices of sampling patterns
+                           (observation matrices are checked against the cache) |br|
+    1.5    | 19-OCT-2026 : Composed Theta operators may be given instead of Theta matrices,
+                           FFT-backed dictionary operators are accepted |br|
 
 *License*:
     BSD 2-Clause
@@ -59,6 +120,7 @@
 from __future__ import division
 import rxcs
 import numpy as np
+import collections
 
 
 # =================================================================
@@ -75,13 +137,16 @@ class makeTheta(rxcs._RxCSobject):
 
         self.__parametersDefine()  # Define the parameters
 
+        # The cache of Theta matrices (keyed by indices of sampling patterns)
+        self.cacheTheta = rxcs.auxiliary.LRUcache(64)
+
     # Define parameters
     def __parametersDefine(self):
 
         # Dictionaries:
         self.paramAddMan('lDict', 'dictionary matrix', noprint=1)
         self.paramType('lDict', list)          # Must be a list
-        self.paramTypeEl('lDict', np.ndarray)  # with Numpy arrays
+        self.paramTypeEl('lDict', (np.ndarray, rxcs.cs.dict.subDict, rxcs.cs.dict.fftDict))  # with Numpy arrays or dictionary operators
         self.paramSizH('lDict', 0)             # The list can not be empty
 
         # Observation matrices:
@@ -95,6 +160,28 @@ class makeTheta(rxcs._RxCSobject):
         self.paramType('bNonuniform', int)           # Must be of int type
         self.paramAllowed('bNonuniform', [0, 1])     # It can be either 1 or 0
 
+        # The maximum number of Theta matrices computed in one batched matrix product
+        self.paramAddOpt('iNBatch', 'The maximum number of Theta matrices in one batched product', default=64)
+        self.paramType('iNBatch', int)         # Must be of int type
+        self.paramH('iNBatch', 0)              # Must be higher than 0
+
+        # Indices of sampling patterns of the observation matrices
+        self.paramAddOpt('vPattInx', 'Indices of sampling patterns of the observation matrices', noprint=1)
+        self.paramType('vPattInx', np.ndarray)
+        self.paramTypeEl('vPattInx', int)
+        self.paramNDimEq('vPattInx', 1)
+        self.paramHE('vPattInx', 0)            # All the indices must be higher or equal to 0
+
+        # The maximum number of Theta matrices in the cache of Theta matrices
+        self.paramAddOpt('iNCache', 'The maximum number of Theta matrices in the cache', default=64)
+        self.paramType('iNCache', int)         # Must be of int type
+        self.paramHE('iNCache', 0)             # Must be higher or equal to 0
+
+        # 'Give composed Theta operators' flag
+        self.paramAddOpt('bOperator', 'Give composed Theta operators instead of Theta matrices', default=0)
+        self.paramType('bOperator', int)           # Must be of int type
+        self.paramAllowed('bOperator', [0, 1])     # It can be either 1 or 0
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -127,16 +214,184 @@ class makeTheta(rxcs._RxCSobject):
         # Check if all the dictionaries and observation matrices have correct dimensions
         self.checkDictPhiDim(self.lDict, self.lPhi, nDict, nPhi)
 
-        # Loop over all the observation matrices
-        self.lTheta = []
-        for inxPhi in np.arange(nPhi):
-            mPhi = self.lPhi[inxPhi]
-            mDict = self.lDict[inxPhi]
+        # Theta matrices for observation matrices from a bank of sampling patterns
+        if self.wasParamGivenVal(self.vPattInx):
+            self.lTheta = self._makeThetaPatt(self.lPhi, self.lDict, self.vPattInx)
+            return
+
+        # Find unique pairs of observation matrices and dictionaries
+        (lPairs, lInxPair) = self._uniquePairs(self.lPhi, self.lDict)
+
+        # Compute Theta matrices for the unique pairs, Theta matrices of
+        # identical pairs are shared by reference
+        lThetaU = self._makeThetaUnique(lPairs)
+        self.lTheta = [lThetaU[inxPair] for inxPair in lInxPair]
+
+
+    # Clear the cache of Theta matrices
+    def clearCache(self):
+        """
+        This function clears the cache of Theta matrices (f.e. to free
+        the memory).
+        """
+        self.cacheTheta.clear()
+        return
+
+
+    # Make Theta matrices for observation matrices from a bank of sampling patterns
+    def _makeThetaPatt(self, lPhi, lDict, vPattInx):
+        """
+        This function makes Theta matrices for observation matrices which come
+        from a bank of sampling patterns. Theta matrices are taken from the cache
+        of Theta matrices, only the missing Theta matrices are computed
+        (once for every pair of a sampling pattern and a dictionary).
+        A Theta matrix is taken from the cache only if its observation matrix
+        is the same as the given observation matrix.
+
+        Args:
+            lPhi (list):                list with observation matrices
+            lDict (list):               list with dictionaries
+            vPattInx (Numpy array 1D):  indices of sampling patterns of the observation matrices
+
+        Returns:
+            lTheta (list):    list with Theta matrices
+        """
+        if not (vPattInx.size == len(lPhi)):
+            strE = 'The number of indices of sampling patterns (vPattInx) must be equal '
+            strE = strE + 'to the number of Theta matrices!'
+            raise ValueError(strE)
+        self.cacheTheta.resize(self.iNCache)
+
+        # Take Theta matrices from the cache, find the missing Theta matrices
+        lTheta = [None] * len(lPhi)
+        dMissing = collections.OrderedDict()    # Indices of missing Theta matrices p. key
+        for (inxTheta, (mPhi, mDict)) in enumerate(zip(lPhi, lDict)):
+            # The dictionary is kept in the cache together with the Theta matrix,
+            # so its id is not reused while the Theta matrix is in the cache
+            tKey = (int(vPattInx[inxTheta]), id(mDict), self.bNonuniform, self.bOperator)
+            tCached = self.cacheTheta.get(tKey)
+            if (tCached is not None) and self._samePhi(tCached[0], mPhi):
+                lTheta[inxTheta] = tCached[2]
+            elif tKey in dMissing:
+                if not self._samePhi(lPhi[dMissing[tKey][0]], mPhi):
+                    strE = 'Observation matrices #%d and #%d have the same index of a sampling pattern ' \
+                        % (dMissing[tKey][0], inxTheta)
+                    strE = strE + '(vPattInx), but they are different!'
+                    raise ValueError(strE)
+                dMissing[tKey].append(inxTheta)
+            else:
+                dMissing[tKey] = [inxTheta]
+
+        # Compute the missing Theta matrices, once p. key
+        lPairs = [(lPhi[lInx[0]], lDict[lInx[0]]) for lInx in dMissing.values()]
+        lThetaM = self._makeThetaUnique(lPairs)
+        for ((tKey, lInx), mTheta) in zip(dMissing.items(), lThetaM):
+            self.cacheTheta.put(tKey, (lPhi[lInx[0]], lDict[lInx[0]], mTheta))
+            for inxTheta in lInx:
+                lTheta[inxTheta] = mTheta
+        return lTheta
+
+
+    # Check if two observation matrices are the same
+    def _samePhi(self, mPhiA, mPhiB):
+        """
+        This function checks if two observation matrices are the same object
+        or are equal.
+        """
+        if mPhiA is mPhiB:
+            return True
+        return (mPhiA.shape == mPhiB.shape) and np.array_equal(mPhiA, mPhiB)
+
+
+    # Find unique pairs of observation matrices and dictionaries
+    def _uniquePairs(self, lPhi, lDict):
+        """
+        This function finds unique pairs of observation matrices and
+        dictionaries. Pairs are identical if they contain the same objects.
+
+        Args:
+            lPhi (list):    list with observation matrices
+            lDict (list):   list with dictionaries
+
+        Returns:
+            lPairs (list):    list with unique pairs (observation matrix, dictionary)
+            lInxPair (list):  index of a unique pair for every element of the input lists
+        """
+        dPairs = {}      # Indices of unique pairs
+        lPairs = []
+        lInxPair = []
+        for (mPhi, mDict) in zip(lPhi, lDict):
+            tKey = (id(mPhi), id(mDict))
+            if tKey not in dPairs:
+                dPairs[tKey] = len(lPairs)
+                lPairs.append((mPhi, mDict))
+            lInxPair.append(dPairs[tKey])
+        return (lPairs, lInxPair)
+
+
+    # Compute Theta matrices for unique pairs
+    def _makeThetaUnique(self, lPairs):
+        """
+        This function computes Theta matrices for unique pairs of observation
+        matrices and dictionaries.
+
+        Observation matrices which share a dictionary are stacked and multiplied
+        with the dictionary in one matrix product (Theta matrices are views on
+        the product). The rest of the pairs are multiplied pair by pair
+        (a stacked product of distinct dictionaries would copy all the
+        dictionaries and is not faster).
+
+        Args:
+            lPairs (list):    list with unique pairs (observation matrix, dictionary)
+
+        Returns:
+            lTheta (list):    list with Theta matrices
+        """
+        # Composed Theta operators
+        if self.bOperator == 1:
+            return [rxcs.cs.thetaOp(mPhi, mDict, self.bNonuniform) for (mPhi, mDict) in lPairs]
+
+        lTheta = [None] * len(lPairs)
+
+        # Theta from nonuniform observation matrices and from dictionary operators
+        # are computed pair by pair
+        lInxRest = []
+        for (inxPair, (mPhi, mDict)) in enumerate(lPairs):
             if self.bNonuniform == 1:
-                mTheta = self._makeTheteNonuniform(mPhi, mDict)
+                lTheta[inxPair] = self._makeTheteNonuniform(mPhi, mDict)
+            elif not isinstance(mDict, np.ndarray):
+                lTheta[inxPair] = mDict.rdot(mPhi)
             else:
-                mTheta = np.dot(mPhi, mDict)
-            self.lTheta.append(mTheta)
+                lInxRest.append(inxPair)
+
+        # Group the pairs by dictionaries
+        dGroups = collections.OrderedDict()
+        for inxPair in lInxRest:
+            dGroups.setdefault(id(lPairs[inxPair][1]), []).append(inxPair)
+
+        # Observation matrices which share a dictionary:  stacked, one product
+        for lInxGroup in dGroups.values():
+            if len(lInxGroup) == 1:
+                (mPhi, mDict) = lPairs[lInxGroup[0]]
+                lTheta[lInxGroup[0]] = np.dot(mPhi, mDict)
+                continue
+            for lInxBatch in self._batches(lInxGroup):
+                mDict = lPairs[lInxBatch[0]][1]
+                lPhi = [lPairs[inxPair][0] for inxPair in lInxBatch]
+                vOffsets = np.cumsum([0] + [mPhi.shape[0] for mPhi in lPhi])
+                mThetaS = np.dot(np.vstack(lPhi), mDict)
+                for (inxB, inxPair) in enumerate(lInxBatch):
+                    lTheta[inxPair] = mThetaS[vOffsets[inxB]:vOffsets[inxB + 1], :]
+        return lTheta
+
+
+    # Divide a list of indices into batches
+    def _batches(self, lInx):
+        """
+        This function divides a list of indices into batches with at most
+        'iNBatch' indices.
+        """
+        return [lInx[inxB:inxB + self.iNBatch] for inxB in range(0, len(lInx), self.iNBatch)]
 
 
     # Make Theta from nonuniform observation matrix
@@ -149,7 +404,10 @@ class makeTheta(rxcs._RxCSobject):
         vSumPhi = np.sum(mPhi, axis=0)        
         vInxRows = np.arange(vSumPhi.size)
         vInxRows = vInxRows[vSumPhi == 1]
-        mTheta = mDict[vInxRows, :]        
+        if not isinstance(mDict, np.ndarray):
+            mTheta = mDict.rows(vInxRows)
+        else:
+            mTheta = mDict[vInxRows, :]
         return mTheta        
 
 
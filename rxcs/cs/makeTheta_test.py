@@ -0,0 +1 @@
+../../test/reconstruction/makeTheta_test.py
\ No newline at end of file
@@ -0,0 +1,361 @@
+"""
+This a sliding-window streaming reconstruction module. |br|
+
+The module reconstructs a long nonuniformly sampled signal, which does not
+fit a single dictionary window. The signal is split into overlapping time
+windows, and every window is reconstructed separately with an IDFT dictionary
+placed at the beginning of a window. The dictionary is generated once, and
+then shifted in time to every window (function 'shift' of the IDFT dictionary
+generator). The windows are reconstructed with the L1 IRLS reconstruction
+module (rxcs.cs.irlsL1).
+
+
+   |<-------- window #1 -------->|
+                       |<-------- window #2 -------->|
+                                           |<-------- window #3 -------->|
+                       |<------->|
+                        overlap
+
+
+WARM START:
+Coefficients of an IDFT dictionary placed at the beginning of a window refer
+to the absolute time, so coefficients of a stationary tone are equal in every
+window. Coefficients found for a window are therefore used as a warm start
+for the reconstruction of the next window.
+
+
+CROSS-FADE:
+In the overlapping part of two windows the reconstructed signal is linearly
+cross-faded from the previous window to the current window.
+
+
+BLOCKS OF THE RECONSTRUCTED SIGNAL:
+The reconstructed signal is generated by the 'blocks' generator, block after
+block. Block #1 starts at the beginning of the signal, next blocks follow
+the previous blocks. Every block corresponds to one window (the overlapping part
+of a window is given with the next block). Only one window is kept in the
+memory, so the memory needed by the module does not depend on the length of
+the signal.
+
+The 'run' method collects all the blocks into one reconstructed signal.
+
+
+OBSERVED SIGNAL:
+The observed signal is given as a vector with observed samples (vObSig),
+and a vector with indices of the observed samples on the representation
+sampling grid (vPattRep). Indices must be sorted.
+
+
+*Examples*:
+    Please go to the *examples/reconstruction* directory for examples on how to
+    use the streaming reconstruction module. |br|
+
+*Settings*:
+    Parameters of the streaming reconstruction module are described below.
+
+    Take a look on '__parametersDefine' function for more info on the
+    parameters.
+
+    Parameters of the streaming reconstruction module are attributes of the
+    class which must/can be set before the reconstruction is run.
+
+    Required parameters:
+
+    - a. **vObSig** (*1D Numpy array*): observed samples of the signal
+
+    - b. **vPattRep** (*1D Numpy array*): indices of observed samples
+                                          on the representation sampling grid
+
+    - c. **fR** (*float*): signal representation sampling frequency
+
+    - d. **tW** (*float*): time of a window
+
+    - e. **fDelta** (*float*): the frequency separation between tones of
+                               the dictionary
+
+    - f. **nTones** (*int*): the number of tones in the dictionary
+
+
+    Optional parameters:
+
+    - g. **tOverlap** (*float*):  time of overlap of windows [default = 0.25 * tW]
+
+    - h. **fFirst** (*float*):  the first frequency in the dictionary [default = fDelta]
+
+    - i. **tS** (*float*):  time of the signal [default = time of the last observed sample]
+
+    - j. **iMaxIter** (*int*):   the maximum number of IRLS iterations [default = 100]
+
+    - k. **iConvStop** (*float*):  IRLS convergence stop parameter  [default = 0.001]
+
+    - l. **bMute** (*int*):    mute the console output from the module [default = 0]
+
+
+*Output*:
+    Description of the streaming reconstruction module output is below.
+    This is the list of attributes of the class which are available
+    after calling the 'run' method:
+
+    - a. **vSig** (*1D Numpy array*):  the reconstructed signal
+
+    - b. **nSmp** (*int*):  the number of samples of the reconstructed signal
+
+    - c. **nWin** (*int*):  the number of windows
+
+    - d. **vCoeff** (*1D Numpy array*):  signal coefficients found in the last window
+
+------------------------------------------------------------------------------
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+    1.1    | 19-OCT-2026 : * The dictionary is shifted in time instead of being generated
+                             for every window |br|
+
+*License*:
+    BSD 2-Clause
+"""
+
+from __future__ import division
+import rxcs
+import numpy as np
+
+
+class streamRecon(rxcs._RxCSobject):
+
+    def __init__(self, *args):
+        rxcs._RxCSobject.__init__(self)    # Make it a RxCS object
+
+        # Name of group of RxCS modules and module name
+        self.strRxCSgroup = 'Reconstruction'
+        self.strModuleName = 'Sliding-window streaming reconstruction'
+
+        self.__inputSignals()      # Define the input signals
+        self.__parametersDefine()  # Define the parameters
+
+        # Start the dictionary generator and the L1 solver
+        self.IDFT = rxcs.cs.dict.IDFT()
+        self.L1solv = rxcs.cs.irlsL1()
+
+    # Define parameters
+    def __inputSignals(self):
+
+        # Observed samples of the signal
+        self.paramAddMan('vObSig', 'Observed samples of the signal', noprint=1)
+        self.paramType('vObSig', np.ndarray)          # Must be a Numpy array
+        self.paramTypeEl('vObSig', (int, float))      # Elements must be of float or int type
+        self.paramNDimEq('vObSig', 1)                 # Must be a 1 dimensional matrix
+
+        # Indices of observed samples on the representation sampling grid
+        self.paramAddMan('vPattRep', 'Indices of observed samples on the representation grid', noprint=1)
+        self.paramType('vPattRep', np.ndarray)        # Must be a Numpy array
+        self.paramTypeEl('vPattRep', (int))           # Elements must be of int type
+        self.paramNDimEq('vPattRep', 1)               # Must be a 1 dimensional matrix
+        self.paramSizEq('vPattRep', 'vObSig')         # Must have the size equal to the size of vObSig
+        self.paramHE('vPattRep', 0)                   # Indices can not be lower than zero
+
+    # Define parameters
+    def __parametersDefine(self):
+
+        # The signal representation sampling frequency [Hz]
+        self.paramAddMan('fR', 'The signal representation sampling frequency', unit='Hz')
+        self.paramType('fR', (int, float))
+        self.paramH('fR', 0)
+        self.paramL('fR', np.inf)
+
+        # Time of a window [s]
+        self.paramAddMan('tW', 'Time of a window', unit='s')
+        self.paramType('tW', (int, float))
+        self.paramH('tW', 0)
+        self.paramL('tW', np.inf)
+
+        # Time of overlap of windows [s]
+        self.paramAddOpt('tOverlap', 'Time of overlap of windows', unit='s', default='$$tW', mul=0.25)
+        self.paramType('tOverlap', (int, float))
+        self.paramHE('tOverlap', 0)
+        self.paramL('tOverlap', 'tW')
+
+        # The frequency separation between tones [Hz]
+        self.paramAddMan('fDelta', 'The frequency separation between tones', unit='Hz')
+        self.paramType('fDelta', (int, float))
+        self.paramH('fDelta', 0)
+        self.paramL('fDelta', np.inf)
+
+        # The number of tones
+        self.paramAddMan('nTones', 'The number of tones')
+        self.paramType('nTones', int)
+        self.paramH('nTones', 0)
+        self.paramL('nTones', np.inf)
+
+        # The first frequency in the spectrum
+        self.paramAddOpt('fFirst', 'The first frequency in the spectrum', unit='Hz', default='$$fDelta')
+        self.paramType('fFirst', (int, float))
+        self.paramH('fFirst', 0)
+        self.paramL('fFirst', np.inf)
+
+        # Time of the signal [s]
+        self.paramAddOpt('tS', 'Time of the signal', unit='s')
+        self.paramType('tS', (int, float))
+        self.paramH('tS', 0)
+        self.paramL('tS', np.inf)
+
+        # the maximum number of iterations
+        self.paramAddOpt('iMaxIter', 'The maximum number of iterations', default=100)
+        self.paramType('iMaxIter', (int))       # Must be an integer number
+        self.paramH('iMaxIter', 0)              # It must be higher than 0
+
+        # convergence parameter
+        self.paramAddOpt('iConvStop', 'Convergence stop parameter', default=0.001)
+        self.paramType('iConvStop', (int, float))  # Must be a number  type
+        self.paramH('iConvStop', 0)  # The convergence parameter should be higher than 0
+        self.paramL('iConvStop', 1)  # and lower than 1
+
+        # 'Mute the output' flag
+        self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
+        self.paramType('bMute', int)           # Must be of int type
+        self.paramAllowed('bMute', [0, 1])     # It can be either 1 or 0
+
+    # Run
+    def run(self):
+
+        # Collect all the blocks of the reconstructed signal
+        lBlocks = [vBlock for vBlock in self.blocks()]
+        self.vSig = np.hstack(lBlocks)
+        return self.__dict__     # Return dictionary with the parameters
+
+    # Generator of blocks of the reconstructed signal
+    def blocks(self):
+        """
+        Generator of blocks of the reconstructed signal.
+        Blocks are 1D Numpy arrays, the first block starts at the
+        beginning of the signal, every next block follows the previous one.
+        """
+        self.parametersCheck()    # Check if all the needed partameters are in place and are correct
+        self._checkConf()         # Check if the configuration makes sense and compute window parameters
+        self.parametersPrint()    # Print the values of parameters
+        return self.__engine()
+
+    # Check configuration
+    def _checkConf(self):
+        """
+        This function checks if the configuration of the module is correct,
+        and computes the parameters of windows.
+        """
+
+        # The number of samples in a window and in the overlap of windows
+        nSmpW = self.tW * self.fR
+        if not self.isequal(nSmpW, np.round(nSmpW), 1e-6):
+            strE = 'Time of a window (tW) is incompatible with '
+            strE = strE + 'the representation sampling frequency (fR)!'
+            raise ValueError(strE)
+        nSmpO = self.tOverlap * self.fR
+        if not self.isequal(nSmpO, np.round(nSmpO), 1e-6):
+            strE = 'Time of overlap of windows (tOverlap) is incompatible with '
+            strE = strE + 'the representation sampling frequency (fR)!'
+            raise ValueError(strE)
+        self.nSmpW = int(np.round(nSmpW))
+        self.nSmpO = int(np.round(nSmpO))
+        self.nSmpH = self.nSmpW - self.nSmpO   # Hop between windows
+
+        # Indices of observed samples must be sorted
+        if np.any(np.diff(self.vPattRep) <= 0):
+            strE = 'Indices of observed samples (vPattRep) must be sorted and unique!'
+            raise ValueError(strE)
+
+        # The number of samples of the signal
+        if self.wasParamGiven('tS'):
+            self.nSmp = int(np.round(self.tS * self.fR))
+        else:
+            self.nSmp = int(self.vPattRep[-1]) + 1
+        if (self.vPattRep.size > 0) and (self.vPattRep[-1] >= self.nSmp):
+            strE = 'Indices of observed samples (vPattRep) exceed the time of the signal (tS)!'
+            raise ValueError(strE)
+
+        # The number of windows
+        self.nWin = 1 + max(0, int(np.ceil((self.nSmp - self.nSmpW) / self.nSmpH)))
+        return
+
+    # Engine - reconstruct the signal window by window
+    def __engine(self):
+
+        self.engineStartsInfo()  # Info that the engine starts
+
+        # Configure the dictionary generator
+        self.IDFT.tS = self.tW
+        self.IDFT.fR = self.fR
+        self.IDFT.fDelta = self.fDelta
+        self.IDFT.nTones = self.nTones
+        self.IDFT.fFirst = self.fFirst
+        self.IDFT.tStart = 0
+        self.IDFT.bMute = 1
+        self.IDFT.run()        # Generate the base dictionary, it is shifted to every window
+
+        # Configure the L1 solver
+        self.L1solv.bComplex = 1
+        self.L1solv.iMaxIter = self.iMaxIter
+        self.L1solv.iConvStop = self.iConvStop
+        self.L1solv.bMute = 1
+
+        vFadeIn = (np.arange(self.nSmpO) + 0.5) / self.nSmpO   # Cross-fade weights
+        vTail = np.zeros(0)                                    # Overlapping part of the previous window
+        self.vCoeff = np.nan                                   # Coefficients found in the previous window
+
+        # Loop over all windows
+        for inxWin in range(self.nWin):
+            inxStart = inxWin * self.nSmpH    # The first sample of the current window
+
+            # Reconstruct the current window
+            vSigW = self._recon1win(inxStart)
+
+            # Cross-fade the overlapping part with the previous window
+            if vTail.size > 0:
+                vSigW[:self.nSmpO] = vTail * (1 - vFadeIn) + vSigW[:self.nSmpO] * vFadeIn
+
+            # Emit a block of the reconstructed signal
+            if inxWin < (self.nWin - 1):
+                vTail = vSigW[self.nSmpH:].copy()
+                yield vSigW[:self.nSmpH]
+            else:
+                yield vSigW[:(self.nSmp - inxStart)]
+
+        self.engineStopsInfo()   # Info that the engine ends
+        return
+
+    # Reconstruct a single window
+    def _recon1win(self, inxStart):
+        """
+        This function reconstructs a single window of the signal.
+
+        Args:
+            inxStart (int):  index of the first sample of the window
+
+        Returns:
+            vSigW (Numpy array 1D):  the reconstructed window of the signal
+        """
+
+        # Shift the base dictionary to the beginning of the window
+        mDict = self.IDFT.shift(inxStart / self.fR)
+
+        # Get the observed samples which belong to the current window
+        inxObFirst = np.searchsorted(self.vPattRep, inxStart)
+        inxObLast = np.searchsorted(self.vPattRep, inxStart + self.nSmpW)
+        vPattW = self.vPattRep[inxObFirst:inxObLast] - inxStart
+        vObSigW = self.vObSig[inxObFirst:inxObLast]
+
+        # Reconstruct the signal coefficients (if there are any observed samples in the window),
+        # use coefficients from the previous window as a warm start
+        if vPattW.size > 0:
+            self.L1solv.lObserved = [vObSigW]
+            self.L1solv.lTheta = [mDict[:, vPattW].T]
+            self.L1solv.lCoeffInit = np.nan
+            if isinstance(self.vCoeff, np.ndarray):
+                self.L1solv.lCoeffInit = [self.vCoeff]
+            self.L1solv.run()
+            self.vCoeff = self.L1solv.lCoeff[0]
+
+        # Synthesize the window of the signal
+        if not isinstance(self.vCoeff, np.ndarray):
+            return np.zeros(self.nSmpW)
+        return self.vCoeff.dot(mDict).real
@@ -0,0 +1 @@
+../../test/reconstruction/streamRecon_test.py
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+This module contains a composed Theta operator: an observation matrix
+(or a selection of samples) composed with a dictionary. |br|
+
+A Theta matrix is a product of an observation matrix Phi and a dictionary
+(Theta = Phi * Dict, the dictionary has one atom in a column). For long
+signals the dense Theta matrix is expensive to compute and to keep, while
+products with Phi (a selection of samples in case of nonuniform sampling)
+and with the dictionary (f.e. an FFT-backed dictionary operator) are cheap.
+The Theta operator keeps Phi and the dictionary and computes products with
+Theta as a sequence of products with the components, the dense Theta matrix
+is never computed (unless 'toarray' is called).
+
+The operator supports:
+
+    - **shape** - shape of the Theta matrix
+
+    - **matvec(vX)** - product Theta * vX (vX may also be a matrix)
+
+    - **rmatvec(vY)** - product Theta^H * vY (the conjugate transpose of Theta)
+
+    - **cols(vInx)** - operator with a subset of columns of Theta
+
+    - **toarray()** - the Theta matrix as a Numpy array (materialization)
+
+The dictionary may be a Numpy array, a sub-dictionary (rxcs.cs.dict.subDict)
+or an FFT-backed IDFT dictionary operator (rxcs.cs.dict.fftDict), always with
+one atom in a column. Theta operators are given by the Theta matrix generator
+(makeTheta) if the **bOperator** flag is set.
+
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0    | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+
+
+class thetaOp(object):
+
+    def __init__(self, mPhi, mDict, bNonuniform=0, vInxCols=None):
+        """
+        Args:
+            mPhi (Numpy array 2D):   the observation matrix
+            mDict:                   the dictionary, one atom in a column (Numpy array 2D,
+                                     rxcs.cs.dict.subDict or rxcs.cs.dict.fftDict)
+            bNonuniform (int):       the observation matrix comes from nonuniform sampling
+                                     (it is a selection of samples)
+            vInxCols (Numpy array 1D):  indices of columns of Theta (None - all the columns)
+        """
+        self.mPhi = mPhi
+        self.mDict = mDict
+        self.bNonuniform = bNonuniform
+        self.vInxCols = vInxCols
+
+        # Nonuniform observation matrix is kept as indices of the selected samples
+        if bNonuniform == 1:
+            vSumPhi = np.sum(mPhi, axis=0)
+            self.vInxRows = np.arange(vSumPhi.size)[vSumPhi == 1]
+
+    @property
+    def shape(self):
+        nCols = self.mDict.shape[1] if self.vInxCols is None else self.vInxCols.size
+        return (self.mPhi.shape[0], nCols)
+
+    @property
+    def ndim(self):
+        return 2
+
+    # Product with the observation matrix
+    def _phi(self, mS):
+        if self.bNonuniform == 1:
+            return mS[self.vInxRows]
+        return self.mPhi.dot(mS)
+
+    # Product with the transposed observation matrix
+    def _phiT(self, mY):
+        if self.bNonuniform == 1:
+            mS = np.zeros((self.mPhi.shape[1], ) + mY.shape[1:], dtype=mY.dtype)
+            mS[self.vInxRows] = mY
+            return mS
+        return self.mPhi.T.dot(mY)
+
+    # Product Theta * mX
+    def matvec(self, mX):
+        """
+        This function computes a product of Theta and a vector (or a matrix):
+        Theta * mX.
+        """
+        if self.vInxCols is not None:
+            mXFull = np.zeros((self.mDict.shape[1], ) + mX.shape[1:], dtype=mX.dtype)
+            mXFull[self.vInxCols] = mX
+            mX = mXFull
+        return self._phi(self.mDict.dot(mX))
+
+    # Product Theta^H * mY
+    def rmatvec(self, mY):
+        """
+        This function computes a product of the conjugate transpose of Theta
+        and a vector (or a matrix): Theta^H * mY.
+        """
+        mS = self._phiT(np.conj(mY))
+        mX = np.conj(self.mDict.T.dot(mS))
+        if self.vInxCols is not None:
+            mX = mX[self.vInxCols]
+        return mX
+
+    # Operator with a subset of columns
+    def cols(self, vInx):
+        """
+        This function gives the Theta operator with a subset of columns of Theta.
+        """
+        vInx = np.asarray(vInx)
+        if self.vInxCols is not None:
+            vInx = self.vInxCols[vInx]
+        return thetaOp(self.mPhi, self.mDict, self.bNonuniform, vInx)
+
+    # The Theta matrix as a Numpy array
+    def toarray(self):
+        """
+        This function computes the Theta matrix (materialization of the operator).
+        """
+        if self.bNonuniform == 1:
+            if isinstance(self.mDict, np.ndarray):
+                mTheta = self.mDict[self.vInxRows, :]
+            else:
+                mTheta = self.mDict.rows(self.vInxRows)
+        elif isinstance(self.mDict, np.ndarray):
+            mTheta = np.dot(self.mPhi, self.mDict)
+        else:
+            mTheta = self.mDict.rdot(self.mPhi)
+        if self.vInxCols is not None:
+            mTheta = mTheta[:, self.vInxCols]
+        return mTheta
@@ -0,0 +1 @@
+../../test/reconstruction/thetaOp_test.py
\ No newline at end of file
@@ -8,6 +8,13 @@ The output signal of the amplifier is:
      x(t) is the input signal,
      a_1, a_2, ..., a_n are the amplifier coefficients.
 
+The polynomial is evaluated with the Horner's scheme:
+   y(t)  =  x(t) * (a_1 + x(t) * (a_2 + ... + x(t) * a_n))
+
+The module contains also the function which evaluates the polynomial
+(**horner(mX, vCoef, mOut=None)**), shared with the acquisition front-end
+(rxcs.acq.frontEnd).
+
 
 *Examples*:
     Please go to the *examples/signals* directory for examples on how to use 
@@ -48,6 +55,8 @@ The output signal of the amplifier is:
 *Version*:
     1.0    | 15-JUL-2014 : * Version 1.0 released. |br|
     1.0r1  | 18-AUG-2015 : * Adjusted to RxCSobject v1.0 |br|
+    1.1    | 19-OCT-2026 : * The polynomial is evaluated with the Horner's scheme |br|
+    1.1r1  | 19-OCT-2026 : * The polynomial is evaluated directly in the output matrix |br|
 
 
 *License*:
@@ -113,15 +122,40 @@ class LNA(rxcs._RxCSobject):
     # Engine of the function
     def __engine(self):
         
-        # Store the input signal        
-        mSigIn = self.mSig.copy()        
-        
-        # Apply the first coefficient 
-        self.mSig = self.vCoef[0] * mSigIn
-        
-        # Apply all the rest of coefficients
-        iExp = 2    # The current exponent
-        for iCoef in self.vCoef[1:len(self.vCoef)]:    
-            self.mSig = self.mSig + iCoef*mSigIn**iExp
-            iExp = iExp + 1
-
+        # Apply the coefficients (the input signal is not modified)
+        self.mSig = horner(self.mSig, self.vCoef)
+
+
+# Polynomial of the amplifier (Horner's scheme)
+def horner(mX, vCoef, mOut=None):
+    """
+    This function evaluates the polynomial of the amplifier:
+    y = a_1 * x + a_2 * x^2 + ... + a_n * x^n  (a_k = vCoef[k-1])
+    with the Horner's scheme, one multiplication and one addition p. coefficient,
+    without matrices with powers of the input signal.
+
+    Args:
+        mX (Numpy array):       the input signal(s)
+        vCoef (Numpy array 1D): the amplifier coefficients
+        mOut (Numpy array):     matrix for the output signal(s) [optional];
+                                the polynomial is evaluated directly in this
+                                matrix, unless it shares memory with the input
+                                signals (then the polynomial is evaluated in a
+                                temporary matrix which is copied into mOut)
+
+    Returns:
+        mOut (Numpy array):     the output signal(s)
+    """
+    if (mOut is None) or np.may_share_memory(mOut, mX):
+        mY = np.empty(mX.shape, dtype=np.result_type(mX, vCoef, float))
+    else:
+        mY = mOut
+    mY.fill(vCoef[-1])
+    for iCoef in vCoef[-2::-1]:
+        mY *= mX
+        mY += iCoef
+    mY *= mX
+    if (mOut is None) or (mY is mOut):
+        return mY
+    mOut[...] = mY
+    return mOut
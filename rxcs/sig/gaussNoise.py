@@ -55,7 +55,11 @@ frequency components. |br|
                               Applicable to Chebyshev and elliptic filt. only.
                               [default = 60]
 
-     - k. **bMute** (*int*):  mute the console output from the generator
+     - k. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the generator
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+     - l. **bMute** (*int*):  mute the console output from the generator
                               [default = 0]
 
 
@@ -71,6 +75,45 @@ frequency components. |br|
 
     - c. **vP** (*Numpy array 1D*): Vector with the power of signals
 
+    - d. **mSOS** (*Numpy array 2D*): The filter which limits the signals'
+                                      frequency components, as second-order
+                                      sections (None if there is no filter)
+
+*Filter*:
+    The filter is designed as second-order sections (SOS) and applied with
+    'scipy.signal.sosfilt', which is numerically robust also for high filter
+    orders. Designs of filters are cached (keyed by the type of the filter,
+    the order, the cutoff frequencies and the ripple/attenuation parameters),
+    so the filter is not designed again in the following runs.
+
+*Blocks of signals*:
+    Very long signals may be generated in consecutive time blocks by the
+    'blocks' method. The method is a generator which yields the dictionary
+    with the attributes of the generator after every time block, 'mSig'
+    contains only the current time block of all the signals.
+    The state of the filter is carried from block to block, so the signals
+    are continuous over the blocks.
+
+    The power of the signals can not be measured before the last block, so
+    the signals are adjusted with the expected power (computed from the
+    frequency response of the filter). vP is the expected power of the signals.
+
+    Arguments of the 'blocks' method:
+
+    - a. **nSmpBlock** (*int*): the number of samples in a block
+                                [default = 2^16 samples]
+
+    Additional attributes available in the yielded dictionary:
+
+    - a. **inxBlock** (*int*): index of the current block
+
+    - b. **inxSmp** (*int*): index of the first sample of the current block
+
+    - c. **mZi** (*Numpy array 3D*): the state of the filter after the current block
+
+    Example:
+        for dBlock in gen.blocks():
+            mSig = dBlock['mSig']     # Process the time block of the signals
 
 
 *Author*:
@@ -84,6 +127,11 @@ frequency components. |br|
     1,1    | 03-SEP-2015 : * Minimum frequency component and maximum frequency   
                              component regulation is added |br|
     1.2    | 01-OCT-2015 : * Power adjsutment is added
+    1.3    | 19-OCT-2026 : * Seed of the stream of random numbers (iSeed) |br|
+    1.4    | 19-OCT-2026 : * Cached filter designs, filter applied as second-order sections |br|
+                             * Generation of signals in time blocks |br|
+    1.5    | 19-OCT-2026 : * Power is adjusted in place with the shared kernel (powerRegulator.adjPower) |br|
+    1.5r1  | 19-OCT-2026 : * Bug in the check of the requested power in 'blocks' is fixed |br|
 
 *License*:
     BSD 2-Clause
@@ -94,6 +142,11 @@ from __future__ import division
 import numpy as np
 import scipy.signal as scsig
 import rxcs
+from rxcs.auxiliary.LRUcache import LRUcache
+from rxcs.sig.powerRegulator import adjPower
+
+# Cache of designs of filters (second-order sections, at most 32 filters, at most 16 MB)
+_cacheSOS = LRUcache(32, 2**24)
 
 
 class gaussNoise(rxcs._RxCSobject):
@@ -173,6 +226,10 @@ class gaussNoise(rxcs._RxCSobject):
 
         # --------------------------------------------------------------------
 
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # Mute the output flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)          # Must be of int type
@@ -200,54 +257,130 @@ class gaussNoise(rxcs._RxCSobject):
         
         # ---------------------------------------------------------------------
         # Generate the base signal
-        self.nSmp = round(self.fR * self.tS)  # The number of samples in the output signal
-        self.mSig = np.random.randn(self.nSigs, self.nSmp)   # Generate the noise
+        self.nSmp = int(round(self.fR * self.tS))  # The number of samples in the output signal
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)   # Stream of random numbers
+        self.mSig = self.randState.randn(self.nSigs, self.nSmp)   # Generate the noise
 
         # ---------------------------------------------------------------------
-        # Filter the signal with a low pass filter, if it is needed
-        if self.wasParamGiven('fMax') and self.wasParamGiven('fMin'):
+        # Filter the signal, if it is needed
+        self.mSOS = self._designFilter()
+        if self.mSOS is not None:
+            self.mSig = scsig.sosfilt(self.mSOS, self.mSig, axis=1)
 
-            # Design a iir low pass filter
-            iCFP_l = self.fMin/(0.5*self.fR)   # Compute the filter parameter for the low cutoff frequency 
-            iCFP_h = self.fMax/(0.5*self.fR)   # Compute the filter parameter for the high cutoff frequency 
+        # ---------------------------------------------------------------------
 
-            (vN, vD) = scsig.iirfilter(self.nFiltOrd, [iCFP_l, iCFP_h], btype='bandpass', ftype=self.strFilt,
-                                       rs=self.iRs, rp=self.iRp)
+        # Adjust the signal power
+        (self.mSig, self.vP) = self._adjPower(self.mSig, self.iP)
+        
+        return
 
-            # Apply the filter
-            self.mSig = scsig.lfilter(vN, vD, self.mSig)
-            
-        elif self.wasParamGiven('fMax'):
 
-            # Design a iir low pass filter
-            iCFP = self.fMax/(0.5*self.fR)   # Compute the filter parameter for the cutoff frequency 
-            (vN, vD) = scsig.iirfilter(self.nFiltOrd, iCFP, btype='lowpass', ftype=self.strFilt,
-                                       rs=self.iRs, rp=self.iRp)
+    def blocks(self, nSmpBlock=0):
+        """
+        This function is a generator which generates the signals in
+        consecutive time blocks. The dictionary with the attributes of the
+        generator is yielded after every block, 'mSig' contains the current
+        time block of all the signals.
 
-            # Apply the filter
-            self.mSig = scsig.lfilter(vN, vD, self.mSig)
+        Args:
+            nSmpBlock (int):  the number of samples in a block
+                              (0 - 2^16 samples)
+        """
+        self.parametersCheck()         # Check if all the needed partameters are in place and are correct
+        self.parametersPrint()         # Print the values of parameters
 
-        elif self.wasParamGiven('fMin'):
+        self.engineStartsInfo()   # Info that the engine starts
+        self.nSmp = int(round(self.fR * self.tS))  # The number of samples in the output signal
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)   # Stream of random numbers
+        if nSmpBlock <= 0:
+            nSmpBlock = 2**16
+        nSmpBlock = int(min(nSmpBlock, self.nSmp))
+
+        # Design the filter, the filter starts from the zero state
+        self.mSOS = self._designFilter()
+        if self.mSOS is not None:
+            self.mZi = np.zeros((self.mSOS.shape[0], self.nSigs, 2))
+
+        # Power adjustment coefficient (computed from the expected power of the signals)
+        iPExp = self._noiseGain(self.mSOS)
+        if not (np.isnan(self.iP) or np.isinf(self.iP)):
+            iPCoef = np.sqrt(self.iP / iPExp)
+            self.vP = self.iP * np.ones(self.nSigs)
+        else:
+            iPCoef = 1.0
+            self.vP = iPExp * np.ones(self.nSigs)
+
+        # Generate the blocks
+        for (inxBlock, inxSmp) in enumerate(range(0, self.nSmp, nSmpBlock)):
+            nSmpCurr = min(nSmpBlock, self.nSmp - inxSmp)
+            mSig = self.randState.randn(self.nSigs, nSmpCurr)   # Generate the noise
+            if self.mSOS is not None:
+                (mSig, self.mZi) = scsig.sosfilt(self.mSOS, mSig, axis=1, zi=self.mZi)
+            self.mSig = mSig * iPCoef
+
+            self.inxBlock = inxBlock
+            self.inxSmp = inxSmp
+            yield self.__dict__
 
-            # Design a iir low pass filter
-            iCFP = self.fMin/(0.5*self.fR)   # Compute the filter parameter for the cutoff frequency 
-            (vN, vD) = scsig.iirfilter(self.nFiltOrd, iCFP, btype='highpass', ftype=self.strFilt,
-                                       rs=self.iRs, rp=self.iRp)
+        self.engineStopsInfo()    # Info that the engine ends
+        return
 
-            # Apply the filter
-            self.mSig = scsig.lfilter(vN, vD, self.mSig)
 
-        # ---------------------------------------------------------------------
+    def _designFilter(self):
+        """
+        This function designs the filter which limits the signals' frequency
+        components (as second-order sections). The filter is taken from the
+        cache of designs, if it was designed before.
 
-        # Adjust the signal power
-        (self.mSig, self.vP) = self._adjPower(self.mSig, self.iP)
-        
-        return
+        Returns:
+            mSOS (Numpy array 2D):  the filter as second-order sections
+                                    (None if the filter is not needed)
+        """
+        if self.wasParamGiven('fMax') and self.wasParamGiven('fMin'):
+            strBType = 'bandpass'
+            tCFP = (self.fMin/(0.5*self.fR), self.fMax/(0.5*self.fR))   # Filter parameters for the cutoff frequencies
+        elif self.wasParamGiven('fMax'):
+            strBType = 'lowpass'
+            tCFP = (self.fMax/(0.5*self.fR), )   # Filter parameter for the cutoff frequency
+        elif self.wasParamGiven('fMin'):
+            strBType = 'highpass'
+            tCFP = (self.fMin/(0.5*self.fR), )   # Filter parameter for the cutoff frequency
+        else:
+            return None
+
+        # Take the filter from the cache or design it
+        tKey = (self.strFilt, self.nFiltOrd, strBType, tCFP, self.iRp, self.iRs)
+        mSOS = _cacheSOS.get(tKey)
+        if mSOS is None:
+            vCFP = list(tCFP) if len(tCFP) > 1 else tCFP[0]
+            mSOS = scsig.iirfilter(self.nFiltOrd, vCFP, btype=strBType, ftype=self.strFilt,
+                                   rs=self.iRs, rp=self.iRp, output='sos')
+            mSOS.setflags(write=False)
+            mSOS = _cacheSOS.put(tKey, mSOS)
+        return mSOS
+
+
+    def _noiseGain(self, mSOS):
+        """
+        This function computes the expected power of white gaussian noise
+        with unit power filtered with the filter (the mean of the squared
+        magnitude of the frequency response of the filter).
+
+        Args:
+            mSOS (Numpy array 2D):  the filter as second-order sections (None - no filter)
+
+        Returns:
+            iGain (float):  the expected power of the filtered noise
+        """
+        if mSOS is None:
+            return 1.0
+        (_, vH) = scsig.sosfreqz(mSOS, worN=2**16)
+        return np.mean(np.abs(vH)**2)
 
 
     def _adjPower(self, mSig, iP):
         """
-        This function adjustes powers of the generated signals.
+        This function adjustes powers of the generated signals (in place).
         If the requested power of the signals is equal to NaN or inf, then
         the signals are not adjusted.
     
@@ -259,24 +392,5 @@ class gaussNoise(rxcs._RxCSobject):
             mSig (matrix):   matrix with noisy signals
             vP (vector):     vector with powers of noisy signals
         """
-    
-        # Get the number of signals and the size of signals (the number of samples)
-        (nSigs, nSmp) = mSig.shape
-    
-        # Measure the power of the signals
-        vP = (np.sum(mSig * mSig, axis=1) / nSmp).reshape(nSigs, 1)
-    
-        # Adjust the signal power, if needed
-        if not np.isnan(iP) or np.isinf(iP):
-    
-            # Compute power adjustments coefficients for the noise signals
-            vPCoef = np.sqrt(iP / vP)
-
-            # Adjust the signal power
-            mPCoef = np.tile(vPCoef, (1, nSmp))
-            mSig = mSig * mPCoef
-        
-            # Measure the power of the adjusted signals
-            vP = np.sum(mSig*mSig, axis=1) / nSmp
-    
+        (mSig, vP, _) = adjPower(mSig, iP, bInPlace=1)
         return (mSig, vP)
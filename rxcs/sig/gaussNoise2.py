@@ -57,7 +57,23 @@ frequency components. |br|
                               Applicable to Chebyshev and elliptic filt. only.
                               [default = 60]
 
-     - k. **bMute** (*int*):  mute the console output from the generator
+     - k. **strEngine** (*string*):  engine of synthesis of signals,
+                                     'filter' or 'fft' [default = 'filter']
+
+          'filter' - white noise sampled with 2*fMax is filtered (IIR filter),
+                     oversampled to fR and its power is regulated,
+          'fft' - random complex spectra of all the signals are shaped in the
+                  frequency domain and the signals are synthesized with one
+                  real IFFT at fR (look below).
+
+          Filter parameters (strFilt, nFiltOrd, iRp, iRs) are not used by the
+          'fft' engine.
+
+     - l. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the generator
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+     - m. **bMute** (*int*):  mute the console output from the generator
                               [default = 0]
 
 
@@ -74,12 +90,24 @@ frequency components. |br|
     - c. **vP** (*Numpy array 1D*): Vector with the power of signals
 
 
+*FFT engine*:
+    The 'fft' engine draws a random complex gaussian spectrum (the positive
+    half) for every signal. Only the FFT bins with frequencies in the band
+    [fMin, fMax] are non-zero, so the band edges are exact (with the
+    resolution 1/tS). The power of a signal is computed from its spectrum
+    (Parseval's theorem) and the spectrum is scaled, so the power of the
+    signal is exactly iP. The signals are synthesized with the real IFFT in
+    one pass, in packs of signals (a pack has at most 2^22 FFT coefficients).
 
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
 
 *Version*:
     1.0    | 20-JAN-2016 : * Version 1.0 released. |br|
+    1.1    | 19-OCT-2026 : * Seed of the stream of random numbers (iSeed) |br|
+    1.2    | 19-OCT-2026 : * Frequency domain synthesis engine (strEngine = 'fft') |br|
+    1.3    | 19-OCT-2026 : * Band-limited (FFT) oversampling of the basic signals |br|
+    1.4    | 19-OCT-2026 : * Power of the signals is regulated in place |br|
 
 *License*:
     BSD 2-Clause
@@ -173,6 +201,15 @@ class gaussNoise2(rxcs._RxCSobject):
 
         # --------------------------------------------------------------------
 
+        # Engine of synthesis of signals
+        self.paramAddOpt('strEngine', 'Engine of synthesis of signals', default='filter')
+        self.paramType('strEngine', str)
+        self.paramAllowed('strEngine', ['filter', 'fft'])
+
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # Mute the output flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)          # Must be of int type
@@ -201,7 +238,14 @@ class gaussNoise2(rxcs._RxCSobject):
         # Generate the basic 
         if not self.wasParamGiven('fMax'):
             self.fMax = self.fR / 2
-            
+
+        # Frequency domain synthesis
+        if self.strEngine == 'fft':
+            self.nSmp = int(np.round(self.fR * self.tS))
+            self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)   # Stream of random numbers
+            (self.mSig, self.vP) = self._genSigsFFT(self.nSigs, self.nSmp, self.fR, self.fMin, self.fMax, self.iP)
+            return
+
         # Generate the basic nosie signal
         self.gaussNoise.fR = 2*self.fMax
         self.gaussNoise.tS = self.tS
@@ -212,6 +256,7 @@ class gaussNoise2(rxcs._RxCSobject):
         self.gaussNoise.nFiltOrd = self.nFiltOrd
         self.gaussNoise.iRp = self.iRp
         self.gaussNoise.iRs = self.iRs
+        self.gaussNoise.iSeed = self.iSeed
         self.gaussNoise.bMute = 1
         self.gaussNoise.run()
 
@@ -219,6 +264,7 @@ class gaussNoise2(rxcs._RxCSobject):
         self.oversampler.mSig = self.gaussNoise.mSig
         self.oversampler.iFLow = self.gaussNoise.fR
         self.oversampler.iFHigh = self.fR        
+        self.oversampler.strMethod = 'fft'    # Band-limited resampling
         self.oversampler.bMute = 1
         self.oversampler.run()
 
@@ -226,6 +272,7 @@ class gaussNoise2(rxcs._RxCSobject):
         # as the output signal
         self.powerRegulator.mSig = self.oversampler.mSigOversamp
         self.powerRegulator.iP = self.iP
+        self.powerRegulator.bInPlace = 1      # (the signals are a temporary matrix)
         self.powerRegulator.bMute = 1
         self.powerRegulator.run()
         self.mSig = self.powerRegulator.mSigOut
@@ -234,8 +281,68 @@ class gaussNoise2(rxcs._RxCSobject):
         # Compute the number of samples in the output signal
         self.nSmp = int(np.round(self.fR * self.tS))
         
-        return        
-        
-        
+        return
 
 
+    def _genSigsFFT(self, nSigs, nSmp, fR, fMin, fMax, iP):
+        """
+        This function generates band limited gaussian noise signals in the
+        frequency domain. Random complex gaussian spectra are put into the
+        FFT bins within the band [fMin, fMax], scaled to the requested power
+        and the signals are synthesized with the real IFFT.
+
+        Args:
+            nSigs (int):     the number of signals
+            nSmp (int):      the number of samples in the signals
+            fR (float):      signal representation sampling frequency
+            fMin (float):    minimum frequency component in the signals (NaN - not regulated)
+            fMax (float):    maximum frequency component in the signals
+            iP (float):      requested power of the signals
+
+        Returns:
+            mSig (matrix):   matrix with signals (one row - one signal)
+            vP (vector):     vector with powers of the signals
+        """
+
+        # Frequencies of the FFT bins (the positive half of the spectrum)
+        nHalf = int(nSmp/2) + 1
+        vF = np.arange(nHalf) * fR / nSmp
+
+        # Indices of the FFT bins within the band
+        vBand = (vF <= fMax)
+        if not np.isnan(fMin):
+            vBand = vBand & (vF >= fMin)
+        vInxBand = np.arange(nHalf)[vBand]
+        if vInxBand.size == 0:
+            strErr = 'There are no FFT bins within the band of the signals! '
+            strErr = strErr + 'The band is too narrow for the time of the signals (tS).'
+            raise ValueError(strErr)
+
+        # Bins which must be real: DC and Nyquist (if the number of samples is even)
+        vReal = (vInxBand == 0) | ((nSmp % 2 == 0) & (vInxBand == nHalf - 1))
+
+        # Weights of the bins in the power of a signal (Parseval's theorem)
+        vW = np.where(vReal, 1.0, 2.0) / nSmp**2
+
+        # Generate the signals in packs of signals
+        mSig = np.empty((nSigs, nSmp))
+        nSigsPack = max(1, int(2**22 / nHalf))
+        for inxSig in range(0, nSigs, nSigsPack):
+            nSigsCurr = min(nSigsPack, nSigs - inxSig)
+
+            # Random complex gaussian spectra
+            mSpec = self.randState.randn(nSigsCurr, vInxBand.size) + \
+                1j * self.randState.randn(nSigsCurr, vInxBand.size)
+            mSpec[:, vReal] = np.sqrt(2) * mSpec[:, vReal].real
+
+            # Scale the spectra, so that the power of the signals is iP
+            vPSpec = np.dot(np.abs(mSpec)**2, vW)
+            mSpec *= np.sqrt(iP / vPSpec)[:, np.newaxis]
+
+            # Synthesize the signals
+            mIFFT = np.zeros((nSigsCurr, nHalf), dtype=complex)
+            mIFFT[:, vInxBand] = mSpec
+            mSig[inxSig:(inxSig + nSigsCurr)] = np.fft.irfft(mIFFT, n=nSmp, axis=1)
+
+        vP = iP * np.ones(nSigs)    # (exact, the spectra were scaled)
+        return (mSig, vP)
@@ -0,0 +1 @@
+../../test/signals/gaussNoise2_test.py
\ No newline at end of file
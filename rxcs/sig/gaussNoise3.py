@@ -42,7 +42,11 @@ a given min and max boundaries. |br|
                              [default = 1]
 
 
-     - k. **bMute** (*int*):  mute the console output from the generator
+     - g. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the generator
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+     - h. **bMute** (*int*):  mute the console output from the generator
                               [default = 0]
 
 
@@ -58,12 +62,19 @@ a given min and max boundaries. |br|
 
     - c. **vP** (*Numpy array 1D*): Vector with the power of signals
 
+    - d. **vFC** (*Numpy array 1D*): Vector with carrier frequencies of the signals
+
 
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
 
 *Version*:
     0.01    | 15-MAR-2016 : * Version 1.0 released. |br|
+    0.02    | 19-OCT-2026 : * Seed of the stream of random numbers (iSeed) |br|
+    0.03    | 19-OCT-2026 : * All the signals are upconverted at once |br|
+    0.04    | 19-OCT-2026 : * Signals are upconverted in place |br|
+    0.05    | 19-OCT-2026 : * Band-limited (FFT) oversampling of the basic signals |br|
+    0.06    | 19-OCT-2026 : * Power of the signals is regulated in place |br|
 
 *License*:
     BSD 2-Clause
@@ -144,6 +155,10 @@ class gaussNoise3(rxcs._RxCSobject):
 
         # --------------------------------------------------------------------
 
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # Mute the output flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)          # Must be of int type
@@ -177,8 +192,13 @@ class gaussNoise3(rxcs._RxCSobject):
         # Compute the number of possible positions ofsignals
         iNPos = int(np.floor((self.fMax - self.fMin - self.fWidth)/self.fGrad)) + 1
 
-        # Allocate matrix for signals
-        self.mSig_ = np.nan*np.ones((self.nSigs, int(np.round(self.fR*self.tS))))
+        # Streams of random numbers (the basic signals and positions of the signals)
+        if rxcs.auxiliary.randStream.isGiven(self.iSeed):
+            self.gaussNoise.iSeed = rxcs.auxiliary.randStream.spawn(self.iSeed, 0)
+            self.randState = rxcs.auxiliary.randStream.stream(rxcs.auxiliary.randStream.spawn(self.iSeed, 1))
+        else:
+            self.gaussNoise.iSeed = np.nan
+            self.randState = np.random
 
         # Generate the basic signals
         self.gaussNoise.fR = 2*self.fWidth
@@ -197,6 +217,7 @@ class gaussNoise3(rxcs._RxCSobject):
         self.oversampler.mSig = self.gaussNoise.mSig
         self.oversampler.iFLow = 2*self.fWidth
         self.oversampler.iFHigh = self.fR
+        self.oversampler.strMethod = 'fft'    # Band-limited resampling
         self.oversampler.bMute = 1
         self.oversampler.run()
 
@@ -204,18 +225,19 @@ class gaussNoise3(rxcs._RxCSobject):
         self.upconvert.fR = self.fR
         self.upconvert.tS = self.tS
         self.upconvert.bMute = 1
-        vPos = np.random.randint(0, iNPos, self.nSigs)    # Draw positions of the signals
-        for iInxSig in range(self.nSigs):
-            fC = self.fMin + self.fWidth/2 + vPos[iInxSig] * self.fGrad
-            self.upconvert.fC = fC
-            self.upconvert.mSig = np.atleast_2d(self.oversampler.mSigOversamp[iInxSig, :])
-            self.upconvert.run()
-            self.mSig_[iInxSig, :] = self.upconvert.mSig[0, :]
+        vPos = self.randState.randint(0, iNPos, self.nSigs)    # Draw positions of the signals
+        self.vFC = self.fMin + self.fWidth/2 + vPos * self.fGrad  # Carrier frequencies of the signals
+        self.upconvert.fC = self.vFC
+        self.upconvert.mSig = self.oversampler.mSigOversamp
+        self.upconvert.mBuf = self.oversampler.mSigOversamp       # (upconverted in place)
+        self.upconvert.run()                                      # All the signals are upconverted at once
+        self.mSig_ = self.upconvert.mSig
 
         # Regulate the power of the signal and assign the signal with the regulated power
         # as the output signal
         self.powerRegulator.mSig = self.mSig_
         self.powerRegulator.iP = self.iP
+        self.powerRegulator.bInPlace = 1      # (the signals are a temporary matrix)
         self.powerRegulator.bMute = 1
         self.powerRegulator.run()
         self.mSig = self.powerRegulator.mSigOut
@@ -0,0 +1 @@
+../../test/signals/gaussNoise_test.py
\ No newline at end of file
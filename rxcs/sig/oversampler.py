@@ -25,7 +25,24 @@ This is a signal oversampler. |br|
 
     Optional parameters:
 
-     - d. **bMute** (*int*):  mute the console output from the LNA [default = 0]
+     - d. **strMethod** (*string*):  resampling method, 'linear', 'poly' or 'fft'
+                                     [default = 'linear']
+
+          'linear' - linear interpolation (all the signals at once),
+          'poly' - polyphase FIR filter, requires a rational ratio iFHigh/iFLow
+                   (with the denominator not higher than 1000),
+          'fft' - band-limited resampling in the frequency domain (the signals
+                  are treated as periodic).
+
+     - e. **strDType** (*string*):  type of samples of the output signals,
+                                    'float64' or 'float32' [default = 'float64']
+
+     - f. **mBuf** (*Numpy array 2D*):  buffer for the output signals (the number of signals x
+                                      the number of samples in the oversampled signals).
+                                      The output signals are written into the buffer.
+                                      [default = not given: a new matrix is allocated]
+
+     - g. **bMute** (*int*):  mute the console output from the LNA [default = 0]
 
 
 *Output*:
@@ -37,12 +54,23 @@ This is a signal oversampler. |br|
  
     - b. **vTOversamp** (*Numpy array 1D*): Time vector for the output signal
 
+*Methods*:
+    Signals are resampled in packs of signals (a pack has at most 2^22
+    samples of the output signals), so the temporary matrices are small.
+
+    The 'poly' and 'fft' methods keep the first sample of the input signals
+    in place, so the time vector of the output signals (vTOversamp) starts
+    at the time of the first input sample. Taps of polyphase filters are
+    cached (keyed by the resampling ratio).
+
 
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
 
 *Version*:
     1.0    | 19-JAN-2016 : * Version 1.0 released. |br|
+    1.1    | 19-OCT-2026 : * Linear interpolation of all the signals at once, polyphase and FFT
+                             resampling methods, output buffer and float32 output |br|
 
 
 *License*:
@@ -50,8 +78,14 @@ This is a signal oversampler. |br|
 """
 
 from __future__ import division
+from fractions import Fraction
 import numpy as np
+import scipy.signal as scsig
 import rxcs
+from rxcs.auxiliary.LRUcache import LRUcache
+
+# Cache of taps of polyphase filters (at most 16 filters, at most 16 MB)
+_cacheTaps = LRUcache(16, 2**24)
 
 
 class oversampler(rxcs._RxCSobject):
@@ -91,6 +125,20 @@ class oversampler(rxcs._RxCSobject):
         self.paramH('iFHigh', 0)
         self.paramH('iFHigh', 'iFLow')
 
+        # Resampling method
+        self.paramAddOpt('strMethod', 'Resampling method', default='linear')
+        self.paramType('strMethod', str)
+        self.paramAllowed('strMethod', ['linear', 'poly', 'fft'])
+
+        # Type of samples of the output signals
+        self.paramAddOpt('strDType', 'Type of samples of the output signals', default='float64')
+        self.paramType('strDType', str)
+        self.paramAllowed('strDType', ['float64', 'float32'])
+
+        # Buffer for the output signals
+        self.paramAddOpt('mBuf', 'Buffer for the output signals', noprint=1)
+        self.paramType('mBuf', np.ndarray)
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)  
         self.paramType('bMute', int)           # Must be of int type
@@ -113,19 +161,121 @@ class oversampler(rxcs._RxCSobject):
         
         # Generate the time vectors
         (self.vTLow, self.vTHigh, self.iNSampH) = self._generateTimeVectors(self.mSig, self.iFLow, self.iFHigh)
-        
-        if self.mSig.ndim == 1:
-            self.mSigOversamp = np.zeros((1, self.iNSampH))    # Allocate matrix for the oversampled signals            
-            self.mSigOversamp[0, :] = np.interp(self.vTHigh, self.vTLow, self.mSig)
+        mSig = np.atleast_2d(self.mSig)
+        (nSignals, _) = mSig.shape                       # Get the number of signals
+
+        # Buffer for the oversampled signals
+        if self.wasParamGiven('mBuf'):
+            if self.mBuf.shape != (nSignals, self.iNSampH):
+                strErr = 'Size of the buffer for the output signals must be (%d, %d)!' % (nSignals, self.iNSampH)
+                raise ValueError(strErr)
+            self.mSigOversamp = self.mBuf
+        else:
+            self.mSigOversamp = np.empty((nSignals, self.iNSampH), dtype=self.strDType)
+
+        # Resample the signals, pack after pack
+        if self.strMethod == 'linear':
+            self._interpLinear(mSig, self.vTLow, self.vTHigh, self.mSigOversamp)
+        elif self.strMethod == 'poly':
+            (iUp, iDown) = self._ratio(self.iFLow, self.iFHigh)
+            vTaps = self._taps(iUp, iDown)
+        nSigsPack = max(1, int(2**22 / self.iNSampH))
+        for inxSig in range(0, nSignals, nSigsPack):
+            vInx = slice(inxSig, min(inxSig + nSigsPack, nSignals))
+            if self.strMethod == 'poly':
+                mSigPack = scsig.resample_poly(mSig[vInx], iUp, iDown, axis=1, window=vTaps)
+                self.mSigOversamp[vInx] = mSigPack[:, :self.iNSampH]
+            elif self.strMethod == 'fft':
+                self._resampleFFT(mSig[vInx], self.iNSampH, self.mSigOversamp[vInx])
+
+        # Time vector of the output signals
+        if self.strMethod == 'linear':
+            self.vTOversamp = self.vTHigh
         else:
-            (nSignals, _) = self.mSig.shape                       # Get the number of signals
-            self.mSigOversamp = np.zeros((nSignals, self.iNSampH))    # Allocate matrix for the oversampled signals
+            self.vTOversamp = self.vTLow[0] + np.arange(self.iNSampH) / self.iFHigh
+
+
+    def _interpLinear(self, mSig, vTLow, vTHigh, mSigOut):
+        """
+        Linear interpolation of all the signals (the same as 'np.interp' for
+        every signal). The interpolated signals are written into 'mSigOut'.
+        The output is computed in small blocks (at most 2^16 samples), which
+        fit into the processor cache.
+        """
+        (nSignals, nSampL) = mSig.shape
+        nSampH = vTHigh.size
+        if nSampL == 1:
+            mSigOut[...] = mSig[:, :1]
+            return
+
+        # Positions of the output samples between the input samples
+        vPos = np.clip((vTHigh - vTLow[0]) * (nSampL - 1) / (vTLow[-1] - vTLow[0]), 0, nSampL - 1)
+        vInx = np.minimum(np.floor(vPos).astype(int), nSampL - 2)   # Indices of the left input samples
+        vFrac = vPos - vInx                                         # Distance from the left input samples
+        mDiff = np.diff(mSig, axis=1)                               # Differences between the input samples
+
+        # Interpolate block after block (rows x columns)
+        nSmpBlock = 2**16
+        nSigsPack = max(1, int(nSmpBlock / nSampH))
+        for inxSig in range(0, nSignals, nSigsPack):
+            vRows = slice(inxSig, min(inxSig + nSigsPack, nSignals))
+            for inxSmp in range(0, nSampH, nSmpBlock):
+                vCols = slice(inxSmp, min(inxSmp + nSmpBlock, nSampH))
+                mOut = mSigOut[vRows, vCols]
+                mOut[...] = np.take(mSig[vRows], vInx[vCols], axis=1)
+                mOut += np.take(mDiff[vRows], vInx[vCols], axis=1) * vFrac[vCols]
+        return
+
+
+    def _resampleFFT(self, mSig, nSampH, mSigOut):
+        """
+        Band-limited resampling of the signals in the frequency domain.
+        The spectra of the signals (real FFT) are padded with zeros and the
+        resampled signals are synthesized with the real IFFT. The resampled
+        signals are written into 'mSigOut'.
+        """
+        nSampL = mSig.shape[1]
+        mSpec = np.fft.rfft(mSig, axis=1)
+        mSpecH = np.zeros((mSig.shape[0], int(nSampH/2) + 1), dtype=complex)
+        nBins = min(mSpec.shape[1], mSpecH.shape[1])
+        mSpecH[:, :nBins] = mSpec[:, :nBins]
+
+        # The Nyquist component of the input signals is split into the positive
+        # and the negative frequency of the resampled signals
+        if (nSampL % 2 == 0) and (nSampH > nSampL):
+            mSpecH[:, int(nSampL/2)] *= 0.5
+
+        mSigOut[...] = np.fft.irfft(mSpecH, n=nSampH, axis=1) * (nSampH / nSampL)
+        return
 
-            # Loop over all signals
-            for inxSignal in np.arange(nSignals):
-                self.mSigOversamp[inxSignal, :] = np.interp(self.vTHigh, self.vTLow, self.mSig[inxSignal, :])
 
-        self.vTOversamp = self.vTHigh
+    def _ratio(self, iFLow, iFHigh):
+        """
+        Rational resampling ratio (iUp / iDown = iFHigh / iFLow) for the
+        polyphase method.
+        """
+        fracRatio = Fraction(iFHigh / iFLow).limit_denominator(1000)
+        (iUp, iDown) = (fracRatio.numerator, fracRatio.denominator)
+        if abs(iUp / iDown - iFHigh / iFLow) > 1e-9 * (iFHigh / iFLow):
+            strErr = 'Polyphase resampling requires a rational ratio of the sampling frequencies '
+            strErr = strErr + '(iFHigh / iFLow) with the denominator not higher than 1000!'
+            raise ValueError(strErr)
+        return (iUp, iDown)
+
+
+    def _taps(self, iUp, iDown):
+        """
+        Taps of the low-pass FIR filter of the polyphase method (the same
+        filter as the default filter of 'scipy.signal.resample_poly').
+        The taps are taken from the cache, if they were computed before.
+        """
+        vTaps = _cacheTaps.get((iUp, iDown))
+        if vTaps is None:
+            iMaxRate = max(iUp, iDown)
+            vTaps = scsig.firwin(2 * 10 * iMaxRate + 1, 1 / iMaxRate, window=('kaiser', 5.0))
+            vTaps.setflags(write=False)
+            vTaps = _cacheTaps.put((iUp, iDown), vTaps)
+        return vTaps
 
 
     def _generateTimeVectors(self, mSig, iFLow, iFHigh):
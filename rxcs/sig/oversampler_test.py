@@ -0,0 +1 @@
+../../test/signals/oversampler_test.py
\ No newline at end of file
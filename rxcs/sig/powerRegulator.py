@@ -22,7 +22,12 @@ This is a power regulator module. |br|
 
      - b. **iP** (*float*): signals' power  [default = not regulated]
 
-     - c. **bMute** (*int*):  mute the console output from the LNA [default = 0]
+     - c. **bInPlace** (*int*):  regulate the power of the input signals in place
+                                 (only a float matrix can be regulated in place,
+                                 other matrices are regulated into a new float
+                                 matrix) [default = 0]
+
+     - d. **bMute** (*int*):  mute the console output from the LNA [default = 0]
 
 
 *Output*:
@@ -34,12 +39,37 @@ This is a power regulator module. |br|
 
     - b. **vP** (*Numpy array 1D*): Vector with the power of signals
 
+    If the power is not regulated, mSigOut is a copy of the input matrix
+    (or the input matrix itself, if the bInPlace flag is set).
+
+*Power regulation kernel*:
+    The module contains also functions which measure and regulate power of
+    signals, shared by the signal generators:
+
+    - **sigPower(mSig, nSigsPack=0)** - powers of signals (one signal p. row)
+
+    - **adjPower(mSig, iP, bInPlace=0, nSigsPack=0)** - regulation of power of
+      signals (iP may be a vector, one power p. signal), returns the regulated signals, their powers and the power
+      adjustment coefficients
+
+    Powers are measured without a temporary matrix with squared samples and
+    signals are scaled by broadcasting (in place, or into a single output
+    matrix). The power of a pack of signals is measured, the pack is scaled
+    and the power of the scaled pack is measured at once, so the pack is read
+    from the memory only once. Signals are processed in packs of 'nSigsPack'
+    signals (0 - packs of at most 2^20 samples).
+
+    Usage:
+        from rxcs.sig.powerRegulator import adjPower
+        (mSig, vP, vPCoef) = adjPower(mSig, 1.0, bInPlace=1)
 
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
 
 *Version*:
     1.0    | 20-JAN-2016 : * Version 1.0 released. |br|
+    1.1    | 19-OCT-2026 : * Shared power regulation kernel (sigPower, adjPower), regulation in place |br|
+    1.1r1  | 19-OCT-2026 : * Signals which are not float are not regulated in place |br|
 
 *License*:
     BSD 2-Clause
@@ -85,6 +115,11 @@ class powerRegulator(rxcs._RxCSobject):
         self.paramH('iP', 0)            # Power of the signal must be higher than zero
         self.paramL('iP', np.inf)       # ...and lower than infinity
 
+        # Regulate the power in place
+        self.paramAddOpt('bInPlace', 'Regulate the power in place', noprint=1, default=0)
+        self.paramType('bInPlace', int)
+        self.paramAllowed('bInPlace', [0, 1])
+
         # --------------------------------------------------------------------
 
         # Mute the output flag
@@ -111,46 +146,93 @@ class powerRegulator(rxcs._RxCSobject):
         """
             Engine of the function    
         """
-        self.mSigOut = self.mSig.copy()
-        self.mSigOut = self.makeArray2Dim(self.mSigOut)
+        mSig = self.makeArray2Dim(self.mSig)
 
         if self.wasParamGiven('iP'):
-            (self.mSigOut, self.vP) = self._adjPower(self.mSig, self.iP)
+            (self.mSigOut, self.vP, _) = adjPower(mSig, self.iP, self.bInPlace)
+        else:
+            self.mSigOut = mSig if self.bInPlace else mSig.copy()
+            self.vP = sigPower(mSig)
         return
 
 
-    def _adjPower(self, mSig, iP):
-        """
-        This function adjustes powers of the generated signals.
-        If the requested power of the signals is equal to NaN or inf, then
-        the signals are not adjusted.
-    
-        Args:
-            mSig (matrix):   matrix with signals (one row - one signal)
-            iP (float):      requested power of the signals
-    
-        Returns:
-            mSig (matrix):   matrix with noisy signals
-            vP (vector):     vector with powers of noisy signals
-        """
-    
-        # Get the number of signals and the size of signals (the number of samples)
-        (nSigs, nSmp) = mSig.shape
-    
-        # Measure the power of the signals
-        vP = (np.sum(mSig * mSig, axis=1) / nSmp).reshape(nSigs, 1)
-    
-        # Adjust the signal power, if needed
-        if not np.isnan(iP) or np.isinf(iP):
-    
-            # Compute power adjustments coefficients for the noise signals
-            vPCoef = np.sqrt(iP / vP)
-
-            # Adjust the signal power
-            mPCoef = np.tile(vPCoef, (1, nSmp))
-            mSig = mSig * mPCoef
-        
-            # Measure the power of the adjusted signals
-            vP = np.sum(mSig*mSig, axis=1) / nSmp
-    
-        return (mSig, vP)
+# Powers of signals
+def sigPower(mSig, nSigsPack=0):
+    """
+    This function measures powers of signals.
+
+    Args:
+        mSig (matrix):     matrix with signals (one row - one signal)
+        nSigsPack (int):   the number of signals in a pack (0 - packs of at most 2^20 samples)
+
+    Returns:
+        vP (vector):     vector with powers of signals
+    """
+    (nSigs, nSmp) = mSig.shape
+    vP = np.empty(nSigs)
+    for vInx in _packs(nSigs, nSmp, nSigsPack):
+        vP[vInx] = _sumSquares(mSig[vInx]) / nSmp
+    return vP
+
+
+# Regulation of power of signals
+def adjPower(mSig, iP, bInPlace=0, nSigsPack=0):
+    """
+    This function adjusts powers of signals. If the requested power of the
+    signals is equal to NaN or inf, then the signals are not adjusted.
+
+    Args:
+        mSig (matrix):     matrix with signals (one row - one signal)
+        iP (float):        requested power of the signals
+                           (or a vector with requested powers, one p. signal)
+        bInPlace (int):    adjust the signals in place (if mSig is not a float matrix,
+                           the signals are adjusted into a new float matrix)
+        nSigsPack (int):   the number of signals in a pack (0 - packs of at most 2^20 samples)
+
+    Returns:
+        mSig (matrix):     matrix with adjusted signals
+        vP (vector):       vector with powers of adjusted signals
+        vPCoef (matrix):   power adjustment coefficients (one p. signal, column)
+    """
+    (nSigs, nSmp) = mSig.shape
+
+    # Nothing to adjust: measure the power only
+    if np.isscalar(iP) and (np.isnan(iP) or np.isinf(iP)):
+        return (mSig, sigPower(mSig, nSigsPack), np.ones((nSigs, 1)))
+    vIP = iP * np.ones(nSigs)    # Requested powers of the signals
+
+    # Output matrix (signals which are not float can not be scaled in place)
+    if bInPlace and np.issubdtype(mSig.dtype, np.floating):
+        mSigOut = mSig
+    else:
+        mSigOut = np.empty(mSig.shape, dtype=np.result_type(mSig, np.float32))
+
+    # Measure the power, adjust the signals and measure the power again, pack after pack
+    vP = np.empty(nSigs)
+    vPCoef = np.empty((nSigs, 1))
+    for vInx in _packs(nSigs, nSmp, nSigsPack):
+        vPCoef[vInx, 0] = np.sqrt(vIP[vInx] / (_sumSquares(mSig[vInx]) / nSmp))
+        np.multiply(mSig[vInx], vPCoef[vInx].astype(mSigOut.dtype), out=mSigOut[vInx])
+        vP[vInx] = _sumSquares(mSigOut[vInx]) / nSmp
+    return (mSigOut, vP, vPCoef)
+
+
+# Sums of squares of samples of signals
+def _sumSquares(mSig):
+    """
+    This function computes sums of squares of samples of signals (rows),
+    without a temporary matrix with squared samples.
+    """
+    if mSig.dtype == np.float64:
+        return np.einsum('ij,ij->i', mSig, mSig)
+    return np.einsum('ij,ij->i', mSig, mSig, dtype=float)
+
+
+# Packs of signals
+def _packs(nSigs, nSmp, nSigsPack):
+    """
+    This function gives slices with packs of signals.
+    """
+    if nSigsPack <= 0:
+        nSigsPack = max(1, int(2**20 / nSmp))
+    return [slice(inxSig, min(inxSig + nSigsPack, nSigs)) for inxSig in range(0, nSigs, nSigsPack)]
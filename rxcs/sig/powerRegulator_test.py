@@ -0,0 +1 @@
+../../test/signals/powerRegulator_test.py
\ No newline at end of file
@@ -22,12 +22,19 @@ This is a model of a single branch upconverter. |br|
 
     - c. **tS** (*float*): time of a signals
 
-    - d. **fC** (*float*): carrier frequency
+    - d. **fC** (*float or Numpy array 1D*): carrier frequency, or a vector with
+                                            carrier frequencies (one p. signal)
 
 
     Optional parameters:
 
-     - e. **bMute** (*int*):  mute the console output from the LNA [default = 0]
+     - e. **mBuf** (*Numpy array 2D*):  buffer for the output signals, of the same size as mSig.
+                                      The output signals are written into the buffer.
+                                      If mSig is given as the buffer, the signals are
+                                      upconverted in place.
+                                      [default = not given: a new matrix is allocated]
+
+     - f. **bMute** (*int*):  mute the console output from the LNA [default = 0]
 
 
 *Output*:
@@ -38,6 +45,23 @@ This is a model of a single branch upconverter. |br|
     - a. **mSig** (*Numpy array 2D*): Matrix with output upconverter signals
 
     - b. **vCarrier** (*Numpy array 1D*): Carrier signal
+                                          (if fC is a vector: carrier of the first signal)
+
+*Carriers*:
+    A carrier is computed once as a single row (a cosine with the carrier
+    frequency) and broadcast over all the signals. Carriers are cached
+    (keyed by the carrier frequency, fR and tS), so the following runs with
+    the same settings do not compute the carrier again.
+
+*Carrier frequencies vector*:
+    If **fC** is a vector, every signal is upconverted with its own carrier
+    frequency. If there are only a few different carrier frequencies, signals
+    are mixed in place with the cached carriers, run after run (a run is
+    a block of consecutive signals with the same carrier frequency, so there
+    are no temporary matrices). Otherwise carriers
+    of all the signals are computed at once as a matrix of cosines
+    (broadcasted product of the carrier frequencies and the time vector),
+    in packs of signals (a pack has at most 2^22 samples).
  
 
 *Author*:
@@ -46,6 +70,10 @@ This is a model of a single branch upconverter. |br|
 *Version*:
     1.0    | 04-SEP-2015 : * Version 1.0 released. |br|
     1.0r1  | 01-OCT-2015 : * Bug fix. |br|
+    1.1    | 19-OCT-2026 : * Vector of carrier frequencies (one p. signal) |br|
+    1.2    | 19-OCT-2026 : * Cache of carriers, mixing into an output buffer (mBuf) |br|
+    1.3    | 19-OCT-2026 : * Signals are mixed with cached carriers in place,
+                             the cache of carriers is limited in bytes |br|
 
 
 *License*:
@@ -56,6 +84,10 @@ This is a model of a single branch upconverter. |br|
 from __future__ import division
 import numpy as np
 import rxcs
+from rxcs.auxiliary.LRUcache import LRUcache
+
+# Cache of carriers (at most 64 carriers, at most 256 MB)
+_cacheCarriers = LRUcache(64, 2**28)
 
 
 class upconvert(rxcs._RxCSobject):
@@ -97,11 +129,16 @@ class upconvert(rxcs._RxCSobject):
 
         # Carrier frequency
         self.paramAddMan('fC', 'Carrier frequency')
-        self.paramType('fC', (float, int))
+        self.paramType('fC', (float, int, np.ndarray))
         self.paramH('fC', 0)
         self.paramL('fC', np.inf)
         self.paramL('fC', 'fR', mul=0.5)
 
+        # Buffer for the output signals
+        self.paramAddOpt('mBuf', 'Buffer for the output signals', noprint=1)
+        self.paramType('mBuf', np.ndarray)
+        self.paramSizEq('mBuf', 'mSig')
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)  
         self.paramType('bMute', int)           # Must be of int type
@@ -121,25 +158,94 @@ class upconvert(rxcs._RxCSobject):
     # Engine of the function
     def __engine(self):
 
-        # Get the number of signals
-        (nSigs, _) = self.mSig.shape
-
-        # Generate the carrier
-        genC = rxcs.sig.randMult()
-
-        genC.tS = self.tS        # Time of the signal
-        genC.fR = self.fR        # The signal rep. sampling frequency
-        genC.fRes = self.fC      # The signal spectrum resolution and the maximum freq.
-        genC.fMax = self.fC      # equals the carrier frequency 
-        genC.vFrqs = np.array([self.fC]) 
-        genC.vAmps = np.array([1])
-        genC.vPhs = np.array([0])
-        genC.nSigs = nSigs 
-        genC.bMute = 1
-        genC.run()
-        self.vCarrier = genC.mSig[0, :]
-
-        # Upconvert the input signal        
-        mSigIn = self.mSig.copy()        
-        self.mSig = mSigIn * genC.mSig 
-
+        # Buffer for the output signals
+        if self.wasParamGiven('mBuf'):
+            mSigOut = self.mBuf
+        else:
+            mSigOut = np.empty(self.mSig.shape, dtype=np.result_type(self.mSig, float))
+
+        # Carrier frequencies of signals are given as a vector
+        if isinstance(self.fC, np.ndarray):
+            self._upconvertVect(self.mSig, self.fC, self.fR, self.tS, mSigOut)
+            self.mSig = mSigOut
+            return
+
+        # Upconvert the input signal (the carrier is broadcast over all the signals)
+        self.vCarrier = self._carrier(self.fC, self.fR, self.tS)
+        np.multiply(self.mSig, self.vCarrier, out=mSigOut)
+        self.mSig = mSigOut
+
+    # Carrier
+    def _carrier(self, fC, fR, tS):
+        """
+        This function gives a carrier (a cosine with the carrier frequency).
+        The carrier is taken from the cache of carriers, if it was computed
+        before.
+
+        Args:
+            fC (float):   carrier frequency
+            fR (float):   signal representation sampling frequency
+            tS (float):   time of the signal
+
+        Returns:
+            vCarrier (vector):  the carrier (read-only)
+        """
+        tKey = (float(fC), float(fR), float(tS))
+        vCarrier = _cacheCarriers.get(tKey)
+        if vCarrier is None:
+            nSmp = int(round(tS * fR))
+            vCarrier = np.cos(2 * np.pi * fC * np.arange(nSmp) / fR)
+            vCarrier.setflags(write=False)
+            vCarrier = _cacheCarriers.put(tKey, vCarrier)
+        return vCarrier
+
+    # Upconversion with a vector of carrier frequencies
+    def _upconvertVect(self, mSig, vFC, fR, tS, mSigOut):
+        """
+        This function upconverts every signal with its own carrier frequency.
+        If there are only a few different carrier frequencies, signals are
+        mixed with cached carriers (in place, block after block of consecutive
+        signals with the same carrier). Otherwise carriers are computed as
+        a broadcasted matrix of cosines, in packs of signals.
+
+        Args:
+            mSig (matrix):      matrix with input signals (one row - one signal)
+            vFC (vector):       vector with carrier frequencies (one p. signal)
+            fR (float):         signal representation sampling frequency
+            tS (float):         time of the signals
+            mSigOut (matrix):   matrix for the upconverted signals
+                                (may be the matrix with input signals)
+        """
+        (nSigs, nSmp) = mSig.shape
+        vFC = vFC.ravel()
+        if vFC.size != nSigs:
+            strErr = 'The number of carrier frequencies (%d) must be equal ' % vFC.size
+            strErr = strErr + 'to the number of signals (%d)!' % nSigs
+            raise ValueError(strErr)
+
+        # A few different carrier frequencies: cached carriers
+        (vFCUnique, vInxFC) = np.unique(vFC, return_inverse=True)
+        if (vFCUnique.size <= _cacheCarriers.nMax) and \
+           (vFCUnique.size * nSmp * 8 <= _cacheCarriers.iMaxBytes):
+            lCarriers = [self._carrier(fC, fR, tS) for fC in vFCUnique]
+
+            # Runs of consecutive signals with the same carrier frequency
+            vStart = np.hstack((0, np.flatnonzero(np.diff(vInxFC)) + 1))
+            vStop = np.hstack((vStart[1:], nSigs))
+            for (inxStart, inxStop) in zip(vStart, vStop):
+                vCarrier = lCarriers[vInxFC[inxStart]]
+                np.multiply(mSig[inxStart:inxStop], vCarrier, out=mSigOut[inxStart:inxStop])
+            self.vCarrier = lCarriers[vInxFC[0]]
+            return
+
+        # Many different carrier frequencies: a broadcasted matrix of cosines
+        vTPi = 2 * np.pi * np.arange(nSmp) / fR    # Time vector (multiplied by 2pi)
+        nSigsPack = max(1, int(2**22 / nSmp))
+        for inxSig in range(0, nSigs, nSigsPack):
+            vInx = slice(inxSig, min(inxSig + nSigsPack, nSigs))
+            mCarrier = np.outer(vFC[vInx], vTPi)
+            np.cos(mCarrier, out=mCarrier)
+            if inxSig == 0:
+                self.vCarrier = mCarrier[0, :].copy()
+            np.multiply(mSig[vInx], mCarrier, out=mSigOut[vInx])
+        return
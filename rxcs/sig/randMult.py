@@ -61,7 +61,30 @@ given by a user. |br|
     - r. **iMaxPhs** (*float*): max allowed phase of a tone present in a signal  [default = +180 deg]
 
 
-    - s. **bMute** (*int*): mute the console output from the generator [default = 0]
+    - s. **strDType** (*string*): type of samples of the output signals,
+                                  'float64' or 'float32' [default = 'float64']
+
+
+    - t. **strEngine** (*string*): engine of synthesis of signals,
+                                   'auto', 'ifft' or 'direct' [default = 'auto']
+
+          'ifft' - signals are synthesized by the (real) IFFT,
+          'direct' - tones are evaluated directly (cosines of all time points),
+          'auto' - the cheaper engine is chosen by a cost model.
+
+          The IFFT engine requires that the signal spectrum resolution (fRes)
+          is a multiple of the FFT resolution of the signals (fR/nSmp).
+          The direct engine does not have this requirement, so tones which
+          are not on the FFT grid of the signals are allowed ('auto' chooses
+          the direct engine for such tones).
+
+
+    - u. **iSeed** (*int or tuple*): seed of the stream of random numbers of the generator
+                                     [default = NaN: the global Numpy random state]
+                                     (look at rxcs.auxiliary.randStream)
+
+
+    - v. **bMute** (*int*): mute the console output from the generator [default = 0]
 
 
 *Output*:
@@ -93,6 +116,106 @@ given by a user. |br|
 
     - l. **fFFTR** (*float*): Signal FFT frequency resolution
 
+    - m. **strEngineSel** (*string*): the engine used to synthesize the signals ('ifft' or 'direct')
+
+*Packs of signals*:
+    Instead of the 'run' method, the 'packs' method may be used. The method
+    is a generator which generates the signals in packs of signals, so that
+    the number of signals is not limited by the size of memory. 
+    The generator yields the dictionary with the attributes of the generator,
+    the output attributes (mSig, mSigNN, vP, vPNN, vPCoef, mFrqs, mAmps, mPhs,
+    mAmPh) contain only the signals from the current pack. 
+    Signals from different packs are independent and have the same statistics
+    as signals generated by the 'run' method.
+
+    Arguments of the 'packs' method:
+
+    - a. **nSigsPack** (*int*): the number of signals in a pack
+                                [default = computed from the memory budget]
+
+    - b. **iMemPack** (*int*): memory budget for a pack [bytes], used if 'nSigsPack'
+                               is not given [default = 64 MB]
+
+    Additional attributes available in the yielded dictionary:
+
+    - a. **inxPack** (*int*): index of the current pack
+
+    - b. **inxSig** (*int*): index of the first signal of the current pack
+
+    - c. **nSigsPack** (*int*): the number of signals in the current pack
+
+    Example:
+        gen.nSigs = 1000000
+        for dPack in gen.packs(iMemPack=2**28):
+            mSig = dPack['mSig']     # Process the pack of signals
+
+    If the seed (iSeed) is given, every pack is generated with its own stream
+    of random numbers (seed of the pack #k is spawned from iSeed with k), so 
+    a pack can be regenerated without generating the previous packs.
+
+*Lazy set of signals*:
+    The 'lazy' method gives a lazy set of signals (rxcs.auxiliary.lazySet).
+    The set stores only the parameters of the generator and the seed, packs of
+    signals are regenerated on demand (exactly the same as packs given by the
+    'packs' method) and a few recently used packs are cached. The seed (iSeed)
+    must be given.
+
+    Arguments of the 'lazy' method:
+
+    - a. **nSigsPack** (*int*): the number of signals in a pack
+                                [default = computed from the memory budget]
+
+    - b. **iMemPack** (*int*): memory budget for a pack [bytes], used if 'nSigsPack'
+                               is not given [default = 64 MB]
+
+    - c. **nCache** (*int*): the number of packs kept in the cache [default = 4]
+
+    Example:
+        gen.iSeed = 7
+        lsSig = gen.lazy(nSigsPack=1000)
+        vSig = lsSig[123456]                          # Signal #123456
+        mFrqs = lsSig.rows(range(10), 'mFrqs')        # Frequencies of tones in signals #0 - #9
+
+*Blocks of signals*:
+    Very long signals may be generated in consecutive time blocks by the
+    'blocks' method. The method is a generator which yields the dictionary
+    with the attributes of the generator after every time block, 'mSig' and
+    'mSigNN' contain only the current time block of all the signals.
+    Every block is synthesized by the real IFFT of the size of the block,
+    phases of tones are advanced analytically from block to block, so the
+    signals are continuous over the blocks. Tables with tones (mFrqs, mAmps,
+    mPhs, mAmPh) are computed for the whole signals before the first block.
+
+    The IFFT engine requires that the size of a block is a multiple of fR/fRes
+    (so that all the tones lie on the grid of the IFFT of a block), the direct
+    engine accepts any size of a block.
+    Powers of the signals (vPNN) are computed analytically from amplitudes
+    of tones. The noise is generated with the expected power (vP is the 
+    expected power of the noisy signals).
+
+    The 'toFile' method writes the blocks of the signals into a memory-mapped
+    *.npy file, so the length of the signals is limited by the disk size,
+    not by the size of memory.
+
+    Arguments of the 'blocks' method:
+
+    - a. **nSmpBlock** (*int*): the number of samples in a block
+                                [default = multiple of fR/fRes, around 2^16 samples]
+
+    Additional attributes available in the yielded dictionary:
+
+    - a. **inxBlock** (*int*): index of the current block
+
+    - b. **inxSmp** (*int*): index of the first sample of the current block
+
+    - c. **vTBlock** (*Numpy array 1D*): the time vector for the current block
+
+    Example:
+        for dBlock in gen.blocks():
+            mSig = dBlock['mSig']     # Process the time block of the signals
+
+        mSig = gen.toFile('signals.npy')  # Memory-mapped matrix with the signals
+
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
 
@@ -113,6 +236,18 @@ given by a user. |br|
     2.0r1  | 18-AUG-2015 : * Adjusted to RxCSobject v1.0 |br|
     2.1    | 02-SEP-2015 : * Max frequency in the spectrum is an optional parameter
                              printing improvements. |br|
+    2.2    | 19-OCT-2026 : * Frequencies of tones are drawn for many signals at once,
+                             tones are put into the IFFT matrix without a loop over signals |br|
+    2.3    | 19-OCT-2026 : * Signals are generated by the real IFFT (only the positive half
+                             of the spectrum), optional float32 output signals |br|
+    2.4    | 19-OCT-2026 : * Generator of packs of signals ('packs' method) |br|
+    2.5    | 19-OCT-2026 : * Generator of time blocks of signals ('blocks' method),
+                             writing signals into a memory-mapped file ('toFile') |br|
+    2.6    | 19-OCT-2026 : * Direct synthesis engine, the engine is chosen by a cost model |br|
+    2.7    | 19-OCT-2026 : * Seed of the stream of random numbers (iSeed) |br|
+    2.8    | 19-OCT-2026 : * Lazy set of signals ('lazy' method), packs have their own seeds |br|
+    2.9    | 19-OCT-2026 : * Power of signals and noise is adjusted in place with the shared kernel
+                             (powerRegulator.adjPower) |br|
 
 *License*:
     BSD 2-Clause
@@ -121,6 +256,7 @@ given by a user. |br|
 from __future__ import division
 import numpy as np
 import rxcs
+from rxcs.sig.powerRegulator import adjPower, sigPower
 
 
 class randMult(rxcs._RxCSobject):
@@ -255,6 +391,20 @@ class randMult(rxcs._RxCSobject):
         self.paramH('iMaxPhs',-180)
         self.paramLE('iMaxPhs',180)
 
+        # Type of samples of the output signals
+        self.paramAddOpt('strDType', 'Type of samples of the output signals', default='float64')
+        self.paramType('strDType', str)
+        self.paramAllowed('strDType', ['float64', 'float32'])
+
+        # Engine of synthesis of signals
+        self.paramAddOpt('strEngine', 'Engine of synthesis of signals', default='auto')
+        self.paramType('strEngine', str)
+        self.paramAllowed('strEngine', ['auto', 'ifft', 'direct'])
+
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # 'Mute the output' flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)           # Must be of int type
@@ -273,20 +423,228 @@ class randMult(rxcs._RxCSobject):
         return self.__dict__     # Return dictionary with the parameters
 
 
+    # Generator of packs of signals
+    def packs(self, nSigsPack=0, iMemPack=2**26):
+        """
+        This function is a generator which generates the signals in packs.
+        The dictionary with the attributes of the generator is yielded after
+        every pack, the output attributes contain signals from the current
+        pack only.
+
+        Args:
+            nSigsPack (int):  the number of signals in a pack
+                              (0 - computed from the memory budget)
+            iMemPack (int):   memory budget for a pack [bytes]
+        """
+        self.parametersCheck()         # Check if all the needed partameters are in place and are correct
+        self.parametersPrint()         # Print the values of parameters
+
+        self.engineStartsInfo()  # Info that the engine starts
+        self._checkConf()
+        nSigsPack = self._packSize(nSigsPack, iMemPack)
+
+        # Generate the time vector for the signal
+        self.vTSig = np.arange(self.nSmp) / self.fR 
+        self.vT = self.vTSig   # Name alias for vTSig is vT
+
+        # Generate the packs
+        for (inxPack, inxSig) in enumerate(range(0, self.nSigs, nSigsPack)):
+            self.inxPack = inxPack
+            self.inxSig = inxSig
+            self.nSigsPack = min(nSigsPack, self.nSigs - inxSig)
+            if rxcs.auxiliary.randStream.isGiven(self.iSeed):
+                tSeedPack = rxcs.auxiliary.randStream.spawn(self.iSeed, inxPack)
+                self.randState = rxcs.auxiliary.randStream.stream(tSeedPack)
+            self._genPack(self.nSigsPack)
+            yield self.__dict__
+
+        self.engineStopsInfo()   # Info that the engine ends
+        return
+
+
+    # Lazy set of signals
+    def lazy(self, nSigsPack=0, iMemPack=2**26, nCache=4):
+        """
+        This function gives a lazy set of signals (rxcs.auxiliary.lazySet).
+        Packs of signals are regenerated on demand, pack #k is the same as
+        pack #k given by the 'packs' method.
+
+        Args:
+            nSigsPack (int):  the number of signals in a pack
+                              (0 - computed from the memory budget)
+            iMemPack (int):   memory budget for a pack [bytes]
+            nCache (int):     the number of packs kept in the cache
+
+        Returns:
+            lsSig (rxcs.auxiliary.lazySet):  lazy set of signals
+        """
+        self.parametersCheck()         # Check if all the needed partameters are in place and are correct
+        self._checkConf()
+        nSigsPack = self._packSize(nSigsPack, iMemPack)
+
+        lOutputs = ['mSig', 'mSigNN', 'vP', 'vPNN', 'vPCoef', 'mFrqs', 'mAmps', 'mPhs', 'mAmPh']
+        return rxcs.auxiliary.lazySet(self, self.iSeed, self.nSigs, nSigsPack, lOutputs, nCache=nCache)
+
+
+    # Generator of time blocks of signals
+    def blocks(self, nSmpBlock=0):
+        """
+        This function is a generator which generates the signals in
+        consecutive time blocks. The dictionary with the attributes of the
+        generator is yielded after every block, 'mSig' and 'mSigNN'
+        contain the current time block of all the signals.
+
+        Args:
+            nSmpBlock (int):  the number of samples in a block
+                              (0 - chosen by the generator)
+        """
+        self.parametersCheck()         # Check if all the needed partameters are in place and are correct
+        self.parametersPrint()         # Print the values of parameters
+
+        self.engineStartsInfo()  # Info that the engine starts
+        self._checkConf()
+        (nSmpBlock, bGrid) = self._blockSize(nSmpBlock)
+        self.strEngineSel = self._chooseEngine(nSmpBlock, bGrid)
+
+        # Draw parameters of tones for all the signals
+        self.mFrqsInx = self._drawFreq(self.vFrqs, self.nTones, self.fMin, self.fMax, self.nSigs, self.fRes)         # Draw frequencies of the signals
+        self.mAmps = self._drawAmps(self.vAmps, self.nTones, self.nSigs, self.iMinAmp, self.iGraAmp, self.iMaxAmp)   # Draw amplitudes of the signals
+        self.mPhs = self._drawPhases(self.vPhs, self.nTones, self.nSigs, self.iMinPhs, self.iGraPhs, self.iMaxPhs)   # Draw phases of the signals
+        self.mFrqs = self.mFrqsInx * self.fRes
+        self.fFFTR = self.fR / self.nSmp
+
+        # Compute the powers of the signals and adjust the amplitudes of tones
+        vP = np.sum(self.mAmps**2, axis=1).reshape(self.nSigs, 1) / 2
+        if not np.isnan(self.iP):
+            self.vPCoef = np.sqrt(self.iP / vP)
+            self.mAmps = self.mAmps * self.vPCoef
+            vP = self.iP * np.ones((self.nSigs, 1))
+        else:
+            self.vPCoef = np.ones((self.nSigs, 1))
+        self.vPNN = vP[:, 0]
+
+        # Complex amplitudes/phases of tones (scaled as the IFFT coefficients of the whole signal)
+        mAmPh = self.mAmps * np.exp(1j * self.mPhs * np.pi / 180)
+        self.mAmPh = mAmPh * self.nSmp / 2
+
+        # Standard deviation of the noise
+        if not (np.isnan(self.iSNR) or np.isinf(self.iSNR)):
+            vNoiseStd = np.sqrt(vP / (10**(self.iSNR/10)))
+            self.vP = self.vPNN + vNoiseStd[:, 0]**2
+        else:
+            vNoiseStd = None
+            self.vP = self.vPNN
+
+        # Indices of frequencies of tones in the IFFT of a block
+        mBlockFrqsInx = np.around(self.mFrqs * nSmpBlock / self.fR).astype(int)
+        vRows = np.arange(self.nSigs)[:, np.newaxis]
+        nHalf = int(nSmpBlock/2) + 1
+
+        # Generate the blocks
+        for (inxBlock, inxSmp) in enumerate(range(0, self.nSmp, nSmpBlock)):
+            nSmpCurr = min(nSmpBlock, self.nSmp - inxSmp)
+
+            if self.strEngineSel == 'direct':
+                # Generate the block (evaluate the tones directly)
+                mSigNN = self._synthDirect(self.mFrqs, self.mAmps, self.mPhs, inxSmp, nSmpCurr, self.fR)
+            else:
+                # Advance the phases of tones to the beginning of the block
+                # (the number of periods of tones is computed modulo 1)
+                mCycles = np.mod(self.mFrqs * (inxSmp / self.fR), 1.0)
+                mIFFT = np.zeros((self.nSigs, nHalf), dtype=complex)
+                mIFFT[vRows, mBlockFrqsInx] = mAmPh * np.exp(2j * np.pi * mCycles) * nSmpBlock / 2
+
+                # Generate the block (perform the real IFFT)
+                mSigNN = np.fft.irfft(mIFFT, n=nSmpBlock, axis=1)[:, :nSmpCurr]
+            self.mSigNN = mSigNN.astype(self.strDType)
+
+            # Add the noise
+            if vNoiseStd is not None:
+                mSigNN += vNoiseStd * self.randState.randn(self.nSigs, nSmpCurr)
+                self.mSig = mSigNN.astype(self.strDType)
+            else:
+                self.mSig = self.mSigNN
+
+            self.inxBlock = inxBlock
+            self.inxSmp = inxSmp
+            self.vTBlock = (inxSmp + np.arange(nSmpCurr)) / self.fR
+            yield self.__dict__
+
+        self.engineStopsInfo()   # Info that the engine ends
+        return
+
+
+    # Write the signals into a memory-mapped file
+    def toFile(self, strFile, nSmpBlock=0):
+        """
+        This function generates the signals in time blocks (look at the 
+        'blocks' method) and writes the signals into a memory-mapped *.npy
+        file. The memory-mapped matrix with the signals is returned and
+        stored in 'mSig'.
+
+        Args:
+            strFile (string): name of the file
+            nSmpBlock (int):  the number of samples in a block
+                              (0 - chosen by the generator)
+
+        Returns:
+            mSig (Numpy memmap 2D):  memory-mapped matrix with the signals
+        """
+        mSigFile = None
+        for dBlock in self.blocks(nSmpBlock):
+            if mSigFile is None:
+                mSigFile = np.lib.format.open_memmap(strFile, mode='w+', dtype=self.strDType,
+                                                     shape=(self.nSigs, self.nSmp))
+            nSmpCurr = dBlock['mSig'].shape[1]
+            mSigFile[:, self.inxSmp:self.inxSmp + nSmpCurr] = dBlock['mSig']
+        mSigFile.flush()
+
+        # Generate the time vector for the signal
+        self.vTSig = np.arange(self.nSmp) / self.fR
+        self.vT = self.vTSig   # Name alias for vTSig is vT
+        self.mSig = mSigFile
+        self.mSigNN = None
+        return mSigFile
+
+
     # Engine of the function
     def __engine(self):
         self._checkConf()
 
+        # Generate all the signals in one pack
+        self._genPack(self.nSigs)
+        
+        # Generate the time vector for the signal
+        self.vTSig = np.arange(self.nSmp) / self.fR 
+        self.vT = self.vTSig   # Name alias for vTSig is vT
+
+        return
+
+
+    # Generate a pack of signals
+    def _genPack(self, nSigs):
+        """
+        This function generates a pack of signals. The generated signals and
+        their parameters are stored in the output attributes of the generator.
+
+        Args:
+            nSigs (int):  the number of signals in the pack
+        """
+
         # - - - - - - - - - - - - - - - - - - -        
         # Signal generation starts here:
         
-        self.mFrqsInx = self._drawFreq(self.vFrqs, self.nTones, self.fMin, self.fMax, self.nSigs, self.fRes)         # Draw frequencies of the signals
-        self.mAmps = self._drawAmps(self.vAmps, self.nTones, self.nSigs, self.iMinAmp, self.iGraAmp, self.iMaxAmp)   # Draw amplitudes of the signals
-        self.mPhs = self._drawPhases(self.vPhs, self.nTones, self.nSigs, self.iMinPhs, self.iGraPhs, self.iMaxPhs)   # Draw phases of the signals
+        self.mFrqsInx = self._drawFreq(self.vFrqs, self.nTones, self.fMin, self.fMax, nSigs, self.fRes)         # Draw frequencies of the signals
+        self.mAmps = self._drawAmps(self.vAmps, self.nTones, nSigs, self.iMinAmp, self.iGraAmp, self.iMaxAmp)   # Draw amplitudes of the signals
+        self.mPhs = self._drawPhases(self.vPhs, self.nTones, nSigs, self.iMinPhs, self.iGraPhs, self.iMaxPhs)   # Draw phases of the signals
         
-        # Generate the signals by IFFT
-        (mSig, self.mAmPh, self.mFrqs, self.fFFTR) = \
-            self._genSigs(self.mFrqsInx, self.mAmps, self.mPhs, self.nSigs, self.tS, self.fR, self.fRes)
+        # Generate the signals by IFFT or by direct evaluation of tones
+        if self.strEngineSel == 'ifft':
+            (mSig, self.mAmPh, self.mFrqs, self.fFFTR) = \
+                self._genSigs(self.mFrqsInx, self.mAmps, self.mPhs, nSigs, self.tS, self.fR, self.fRes, self.strDType)
+        else:
+            (mSig, self.mAmPh, self.mFrqs, self.fFFTR) = \
+                self._genSigsDirect(self.mFrqsInx, self.mAmps, self.mPhs, nSigs, self.tS, self.fR, self.fRes, self.strDType)
     
         # - - - - - - - - - - - - - - - - - - -
     
@@ -295,18 +653,124 @@ class randMult(rxcs._RxCSobject):
     
         # Add the AWGN noise to the signals
         (self.mSigNN, self.vPNN, self.mSig, self.vP) = self._addNoise(mSig, vP, self.iSNR)
-        
-        # Generate the time vector for the signal
-        self.vTSig = np.arange(self.nSmp) / self.fR 
-        self.vT = self.vTSig   # Name alias for vTSig is vT
 
         return
 
 
+    # Size of a time block
+    def _blockSize(self, nSmpBlock):
+        """
+        This function checks the size of a time block of signals. If the size
+        is not given, the lowest multiple of the period of the grid of tones
+        which is not lower than 2^16 is chosen (at most the size of signals).
+        If there is no such multiple (or the direct engine is requested),
+        the size is 2^16 (at most the size of signals).
+
+        Returns:
+            nSmpBlock (int):  the number of samples in a block
+            bGrid (int):      'tones lie on the grid of the IFFT of a block' flag
+        """
+        iPer = self.fR / self.fRes    # Period of the grid of tones [samples]
+
+        if nSmpBlock <= 0:
+            nSmpBlock = min(self.nSmp, 2**16)
+            if self.strEngine != 'direct':
+                for iK in range(1, 1001):
+                    if abs(iK * iPer - round(iK * iPer)) < 1e-9:
+                        nPer = int(round(iK * iPer))
+                        nSmpBlock = min(self.nSmp, nPer * int(np.ceil(2**16 / nPer)))
+                        break
+
+        bGrid = int(abs(nSmpBlock / iPer - round(nSmpBlock / iPer)) < 1e-9)
+        return (int(nSmpBlock), bGrid)
+
+
+    # Choose the engine of synthesis
+    def _chooseEngine(self, nSmp, bGrid):
+        """
+        This function chooses the engine of synthesis of signals.
+
+        The cost model (measured): the real IFFT costs ~nSmp * (sum of prime
+        factors of nSmp) [ns] per signal, direct evaluation of tones costs 
+        ~25 * nSmp [ns] per tone per signal.
+
+        Args:
+            nSmp (int):   the number of samples synthesized at once
+                          (size of the IFFT)
+            bGrid (int):  'tones lie on the grid of the IFFT' flag
+
+        Returns:
+            strEngine (string):  the chosen engine ('ifft' or 'direct')
+        """
+        if self.strEngine == 'direct':
+            return 'direct'
+
+        if not bGrid:
+            if self.strEngine == 'ifft':
+                strErr = ('Frequency leackage! Signal spectrum resolution can not be ')
+                strErr = strErr + ('represented with the current signal parameters!')
+                raise ValueError(strErr)
+            return 'direct'
+
+        if self.strEngine == 'ifft':
+            return 'ifft'
+
+        nTonesSig = self.vFrqs.size + self.nTones   # The number of tones in a signal
+        if 25 * nTonesSig < self._sumPrimeFactors(nSmp):
+            return 'direct'
+        return 'ifft'
+
+
+    # Sum of prime factors of an integer
+    def _sumPrimeFactors(self, iN):
+        """
+        This function computes the sum of prime factors of an integer
+        (with repetitions).
+        """
+        iSum = 0
+        iF = 2
+        while iF * iF <= iN:
+            while iN % iF == 0:
+                iSum = iSum + iF
+                iN = iN // iF
+            iF = iF + 1
+        if iN > 1:
+            iSum = iSum + iN
+        return iSum
+
+
+    # The number of signals in a pack
+    def _packSize(self, nSigsPack, iMemPack):
+        """
+        This function computes the number of signals in a pack, if it is not
+        given (from the memory budget for a pack).
+        """
+        if nSigsPack <= 0:
+            nSigsPack = int(iMemPack / self._memSig())
+        return max(1, min(nSigsPack, self.nSigs))
+
+
+    # Memory needed by one signal
+    def _memSig(self):
+        """
+        This function estimates the memory [bytes] needed to generate one signal:
+        the noisy and the non noisy signal with a temporary copy, the noise
+        (float64) and the tables with parameters of tones.
+        """
+        nTonesSig = self.vFrqs.size + self.nTones   # The number of tones in a signal
+        iMemSmp = 3 * np.dtype(self.strDType).itemsize + 8
+        iMemTone = 8 * 4 + 16 + 8      # frequencies, amplitudes, phases, complex amplitudes, freq. indices
+        return self.nSmp * iMemSmp + nTonesSig * iMemTone
+
+
     def _checkConf(self):
         """
         This function checks the configuration of the generator.    
         """
+        #----------------------------------------------------------------------
+        # Stream of random numbers
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)
+
         #----------------------------------------------------------------------
         # If the minimum frequency was not given, it is equal to the frequency resolution
         if np.isnan(self.fMin):
@@ -347,13 +811,12 @@ class randMult(rxcs._RxCSobject):
 
         #----------------------------------------------------------------------
         # Check if there is a frequency leackage
+        # (the IFFT engine can not be used if there is a frequency leackage)
         self.nSmp = int(round(self.tS*self.fR))  # Calculate the number of samples in the signals
         fFFTR = self.fR/self.nSmp    # Calculate the FFT frequency resolution
     
-        if abs(round(self.fRes/fFFTR) - self.fRes/fFFTR) > 0:
-            strErr = ('Frequency leackage! Signal spectrum resolution can not be ')
-            strErr = strErr + ('represented with the current signal parameters!')
-            raise ValueError(strErr)
+        bGrid = int(abs(round(self.fRes/fFFTR) - self.fRes/fFFTR) == 0)
+        self.strEngineSel = self._chooseEngine(self.nSmp, bGrid)
     
         #----------------------------------------------------------------------
         # Check the vector with given frequencies
@@ -424,8 +887,7 @@ class randMult(rxcs._RxCSobject):
         vFreqIsFree = np.ones(int(fMax/fRes)).astype(bool)
         
         # Mark all the frequencies below min frequency as unavailable 
-        for inxF in np.arange(int(fMin/fRes)-1):
-            vFreqIsFree[inxF] = 0
+        vFreqIsFree[:max(int(fMin/fRes)-1, 0)] = 0
     
         # Mark the frequencies taken by vFreq vector as unavailable
         vFreqIsFree[vFrqsInx_ - 1] = 0
@@ -448,21 +910,22 @@ class randMult(rxcs._RxCSobject):
     
         #----------------------------------------------------------------------
         # Draw the frequencies
-        for inxSig in np.arange(nSigs):
-    
-            # Permute all the indices of frequencies in the spectrum
-            vPermutedFreqsInx = ((np.random.permutation(vAvailFreqsInx)).T)
-    
-            # From the permuted indices of frequencices take as many
-            # as it is missing
-            vTakenFreqsInx = vPermutedFreqsInx[np.arange(iMissF)]
-    
-            # Put the taken indices of frequencies to the matrix with frequency
-            # indices for all the signals
-            mFrqsInx[inxSig, np.isnan(mFrqsInx[inxSig, :])] = vTakenFreqsInx
-    
-        return mFrqsInx
+        if iMissF > 0:
+            
+            # Indices of the missing frequencies in the vector with frequencies
+            vInxMiss = np.isnan(vFrqsInx)
+
+            # Draw the frequencies for packs of signals at once
+            # (the size of a pack is limited, so that the matrix with random
+            #  keys has at most ~4M elements)
+            nAvail = vAvailFreqsInx.size
+            nSigsPack = max(1, int(2**22 / nAvail))
+            for inxSig in np.arange(0, nSigs, nSigsPack):
+                nSigsCurr = min(nSigsPack, nSigs - inxSig)
+                mTakenInx = rxcs.auxiliary.randStream.drawNoReplace(self.randState, nSigsCurr, nAvail, iMissF)
+                mFrqsInx[inxSig:(inxSig + nSigsCurr), vInxMiss] = vAvailFreqsInx[mTakenInx]
 
+        return mFrqsInx
 
     # =================================================================
     # Draw amplitudes of the signals
@@ -501,7 +964,7 @@ class randMult(rxcs._RxCSobject):
     
         # Draw the missing amplitudes for all the signals
         vDrawAmps = \
-            iMinAmp + iGraAmp*(np.random.randint(0, nAmpVal, (nSigs*iMissA)))
+            iMinAmp + iGraAmp*(self.randState.randint(0, nAmpVal, (nSigs*iMissA)))
     
         # Construct a matrix with amplitudes of tones for all the needed signals
         mAmps = np.tile(vAmps, (nSigs, 1))
@@ -550,7 +1013,7 @@ class randMult(rxcs._RxCSobject):
     
         # Draw the missing phases for all the signals
         vDrawPhs = \
-            iMinPhs + iGraPhs*(np.random.randint(0, nPhsVal, (nSigs*iMissP)))
+            iMinPhs + iGraPhs*(self.randState.randint(0, nPhsVal, (nSigs*iMissP)))
     
         # Construct a matrix with phases of tones for all the needed signals
         mPhs = np.tile(vPhs, (nSigs, 1))
@@ -565,9 +1028,14 @@ class randMult(rxcs._RxCSobject):
     # =================================================================
     # Generate the signals by IFFT
     # =================================================================
-    def _genSigs(self, mFrqsInx, mAmps, mPhs, nSigs, tS, fR, fRes):
+    def _genSigs(self, mFrqsInx, mAmps, mPhs, nSigs, tS, fR, fRes, strDType='float64'):
         """
         This function generate the multitone signals using the IFFT algorithm.
+
+        The signals are real, so only the positive half of the spectrum is
+        put into the IFFT matrix and the real IFFT is used.
+        The signals are generated in packs of rows, so the complex IFFT matrix
+        is never allocated for all the signals at once.
     
         Args:
             mFrqsInx (matrix):  matrix with freqs of tones for all the signals
@@ -579,6 +1047,7 @@ class randMult(rxcs._RxCSobject):
             fR (float):         signal representation sampling frequency
             fRes (float):       signal spectrum resolution
                                 (distance between the tones in the spectrum)
+            strDType (string):  type of samples of the signals
     
         Returns:
             mSig (matrix):   matrix with signals (one row - one signal)
@@ -601,9 +1070,8 @@ class randMult(rxcs._RxCSobject):
         # Change phases into radians
         mPhsRad = mPhs*np.pi/180
     
-        # Generate a one complex matrix for all the signals and its conjugated copy
+        # Generate a one complex matrix for all the signals
         mAmPh = mAmpsAdj*np.cos(mPhsRad) + 1j*mAmpsAdj*np.sin(mPhsRad)
-        mAmPh_conj = np.conjugate(mAmPh)
     
         #----------------------------------------------------------------------
         # Put the complex matrix with amplitudes and phases of tones into
@@ -617,30 +1085,111 @@ class randMult(rxcs._RxCSobject):
         # to indices of frequencies in the IFFT transform
         mIFFTFrqsInx = np.around(mFrqs/fFFTR).astype(int)
     
-        # Allocate the vector for the ifft coefficients for all the signals
-        # (one signal in one row)
-        mIFFT = np.zeros((nSigs, nSmp)) + 1j*np.zeros((nSigs, nSmp))
+        # Allocate the matrix for the signals
+        mSig = np.empty((nSigs, nSmp), dtype=strDType)
+
+        # The number of signals in one pack
+        # (the IFFT matrix for a pack has at most 2^22 elements)
+        nHalf = int(nSmp/2) + 1    # The number of coefficients in the positive half of the spectrum
+        nSigsPack = max(1, int(2**22/nHalf))
+
+        for inxStart in range(0, nSigs, nSigsPack):
+            inxStop = min(inxStart + nSigsPack, nSigs)
+
+            # Allocate the matrix for the ifft coefficients for the pack of signals
+            # (one signal in one row, only the positive half of the spectrum)
+            mIFFT = np.zeros((inxStop - inxStart, nHalf), dtype=complex)
+
+            # Put the complex vector with tones values into the IFFT matrix
+            # (all the signals in the pack at once)
+            vRows = np.arange(inxStop - inxStart)[:, np.newaxis]
+            mIFFT[vRows, mIFFTFrqsInx[inxStart:inxStop]] = mAmPh[inxStart:inxStop]
+
+            #------------------------------------------------------------------
+            # Generate the signals (perform the real IFFT)
+            mSig[inxStart:inxStop] = np.fft.irfft(mIFFT, n=nSmp, axis=1)
     
-        # Put the complex vector with tones values into the IFFT matrix
-        for inxSig in np.arange(nSigs):
+        return (mSig, mAmPh, mFrqs, fFFTR)
     
-            # IFFT indices of tones for the current signal
-            vInx = mIFFTFrqsInx[inxSig, :]
     
-            # Put the tones for the current signal
-            mIFFT[inxSig, vInx] = mAmPh[inxSig, :]
+    # =================================================================
+    # Generate the signals by direct evaluation of tones
+    # =================================================================
+    def _genSigsDirect(self, mFrqsInx, mAmps, mPhs, nSigs, tS, fR, fRes, strDType='float64'):
+        """
+        This function generate the multitone signals by direct evaluation
+        of tones (cosines of all the time points). Arguments and returned
+        values are the same as in the '_genSigs' function.
+        The frequencies of tones do not have to lie on the FFT grid of the
+        signals.
+        """
     
-            # IFFT indices of conjugate tones for the current signal
-            vInxConj = (nSmp - mIFFTFrqsInx[inxSig, :]).astype(int)
+        # Calculate the number of samples in the signals
+        nSmp = int(round(tS*fR))
     
-            # Put the conjugate tones for the current signal
-            mIFFT[inxSig, vInxConj] = mAmPh_conj[inxSig, :]
+        # Calculate the FFT frequency resolution
+        fFFTR = fR/nSmp
+
+        # Complex matrix with amplitudes and phases of tones
+        # (adjusted to the number of points, as for the IFFT)
+        mAmpsAdj = mAmps * nSmp/2
+        mPhsRad = mPhs*np.pi/180
+        mAmPh = mAmpsAdj*np.cos(mPhsRad) + 1j*mAmpsAdj*np.sin(mPhsRad)
+
+        # Recalculate the matrix with indices of frequencies in the spectrum
+        # to real frequencies
+        mFrqs = mFrqsInx*fRes
+
+        # Generate the signals
+        mSig = self._synthDirect(mFrqs, mAmps, mPhs, 0, nSmp, fR, strDType)
+
+        return (mSig, mAmPh, mFrqs, fFFTR)
+
+
+    # Direct evaluation of tones
+    def _synthDirect(self, mFrqs, mAmps, mPhs, inxSmp, nSmp, fR, strDType='float64'):
+        """
+        This function evaluates the multitone signals directly in the given
+        time points. Tones are evaluated one by one (outer product of
+        frequencies and time), for packs of signals.
     
-        #----------------------------------------------------------------------
-        # Generate the signals (perform the IFFT)
-        mSig = np.fft.ifftn(mIFFT, axes=[1]).real
+        Args:
+            mFrqs (matrix):     matrix with freqs of tones for all the signals
+            mAmps (matrix):     matrix with amplitudes of tones for all the signals
+            mPhs (matrix):      matrix with phases of tones for all the signals
+            inxSmp (int):       index of the first sample
+            nSmp (int):         the number of samples
+            fR (float):         signal representation sampling frequency
+            strDType (string):  type of samples of the signals
     
-        return (mSig, mAmPh, mFrqs, fFFTR)
+        Returns:
+            mSig (matrix):   matrix with signals (one row - one signal)
+        """
+        (nSigs, nTonesSig) = mFrqs.shape
+
+        # Phases of tones in the first sample
+        # (the number of periods of tones is computed modulo 1)
+        mPhs0 = mPhs*np.pi/180 + 2*np.pi*np.mod(mFrqs * (inxSmp / fR), 1.0)
+        vN = np.arange(nSmp)
+
+        # Allocate the matrix for the signals
+        mSig = np.empty((nSigs, nSmp), dtype=strDType)
+
+        # The number of signals in one pack (a pack has at most 2^22 samples)
+        nSigsPack = max(1, int(2**22/nSmp))
+
+        for inxStart in range(0, nSigs, nSigsPack):
+            inxStop = min(inxStart + nSigsPack, nSigs)
+            mSigPack = np.zeros((inxStop - inxStart, nSmp))
+            for inxTone in range(nTonesSig):
+                vW = 2*np.pi*mFrqs[inxStart:inxStop, inxTone:inxTone+1]/fR     # Angular frequencies
+                mArg = vW * vN + mPhs0[inxStart:inxStop, inxTone:inxTone+1]
+                np.cos(mArg, out=mArg)
+                mArg *= mAmps[inxStart:inxStop, inxTone:inxTone+1]
+                mSigPack += mArg
+            mSig[inxStart:inxStop] = mSigPack
+
+        return mSig
     
     
     # =================================================================
@@ -666,34 +1215,13 @@ class randMult(rxcs._RxCSobject):
             mAmPh (matrix):  complex matrix with adjusted amplitudes/phases
         """
     
-        # Get the number of signals and the size of signals (the number of samples)
-        (nSigs, nSmp) = mSig.shape
-    
-        # Measure the power of the signals
-        vP = (np.sum(mSig * mSig, axis=1) / nSmp).reshape(nSigs, 1)
-    
-        # Adjust the signal power, if needed
+        # Adjust the signal power in place (the signals were just generated)
+        (mSig, vP, vPCoef) = adjPower(mSig, iP, bInPlace=1)
+
+        # Adjust the reported amplitudes of tones
         if not np.isnan(iP) or np.isinf(iP):
-    
-            # Compute power adjustments coefficients for the noise signals
-            vPCoef = np.sqrt(iP / vP)
-    
-            # Adjust the signal power
-            mPCoef = np.tile(vPCoef, (1, nSmp))
-            mSig = mSig * mPCoef
-    
-            # Adjust the reported amplitudes of tones
-            (_, nAmps) = mAmps.shape
-            mPCoef = np.tile(vPCoef, (1, nAmps))
-            mAmps = mAmps * mPCoef
-            mAmPh = mAmPh * mPCoef
-    
-            # Measure the power of the adjusted signals
-            vP = np.sum(mSig*mSig, axis=1) / nSmp
-    
-        else:
-            # Power adjustment coefficients are equal to 1 (no adjustment)
-            vPCoef = np.ones((nSigs, 1))
+            mAmps = mAmps * vPCoef
+            mAmPh = mAmPh * vPCoef
     
         return (mSig, vP, vPCoef, mAmps, mAmPh)
     
@@ -720,9 +1248,14 @@ class randMult(rxcs._RxCSobject):
             vP (vector):     vector with powers of noisy signals
         """
     
-        # Backup the non noisy signals
-        mSigNN = mSig.copy()      # Matrix with signals
+        # The non noisy signals are kept
+        mSigNN = mSig             # Matrix with signals
         vPNN = vP.copy()          # Power of non noisy signals
+
+        # Without the noise the noisy signals are a copy of the non noisy signals
+        # (otherwise the noisy signals are a new matrix)
+        if np.isnan(iSNR) or np.isinf(iSNR):
+            mSig = mSig.copy()
     
         # Add the noise, if needed
         if not (np.isnan(iSNR) or np.isinf(iSNR)):
@@ -732,26 +1265,20 @@ class randMult(rxcs._RxCSobject):
             (nSigs, nSmp) = mSig.shape
     
             # Generate the noise
-            mNoise = np.random.randn(nSigs, nSmp)
-    
-            # Measure the current powers of the noise signals
-            vNoisePReal = (np.sum(mNoise*mNoise, axis=1) / nSmp).reshape(nSigs, 1)
+            mNoise = self.randState.randn(nSigs, nSmp)
     
             # Compute the requested noise power for every signal
-            vNoiseP = (vP / (10**(iSNR/10))).reshape(nSigs, 1)
-    
-            # Compute power adjustments coefficients for the noise signals
-            vPNoiseCoef = np.sqrt(vNoiseP / vNoisePReal)
+            vNoiseP = vP / (10**(iSNR/10))
     
-            # Adjust the noise power
-            mPNoiseCoef = np.tile(vPNoiseCoef, (1, nSmp))
-            mNoise = mPNoiseCoef * mNoise
+            # Adjust the noise power (in place)
+            (mNoise, _, _) = adjPower(mNoise, vNoiseP, bInPlace=1)
     
             # Add the noise to the signals
-            mSig = mSig + mNoise
+            mNoise += mSig
+            mSig = mNoise.astype(mSig.dtype, copy=False)
     
             # Measure the power of the signals
-            vP = np.sum(mSig * mSig, axis=1) / nSmp
+            vP = sigPower(mSig)
     
         return (mSigNN, vPNN, mSig, vP)
   
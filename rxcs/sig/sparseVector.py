@@ -28,7 +28,20 @@ given by a user. |br|
 
     Optional parameters:
 
-     - d. **bMute** (*int*):  mute the console output from the generator [default = 0]
+     - d. **strFormat** (*string*):  format of the generated vectors [default = 'dense']:
+
+                                     'dense' - Numpy array 2D, one vector p. row
+
+                                     'csr' / 'coo' - Scipy sparse matrix (CSR / COO), one vector p. row
+
+                                     'inx' - tuple (mInx, mVal) with indices and values of
+                                             non-zero elements, one vector p. row
+
+     - e. **iSeed** (*int or tuple*):  seed of the stream of random numbers of the generator
+                                       [default = NaN: the global Numpy random state]
+                                       (look at rxcs.auxiliary.randStream)
+
+     - f. **bMute** (*int*):  mute the console output from the generator [default = 0]
 
 
 *Output*:
@@ -38,6 +51,14 @@ given by a user. |br|
 
     - a. **mVects** (*Numpy array 2D*):   Numpy array with the generated vectors.
                                           One vector p. row.
+                                          (a Scipy sparse matrix or a tuple (mInx, mVal),
+                                           depending on the 'strFormat' parameter)
+
+    - b. **mInx** (*Numpy array 2D*):     indices of non-zero elements of the vectors (sorted).
+                                          One vector p. row.
+
+    - c. **mVal** (*Numpy array 2D*):     values of non-zero elements of the vectors.
+                                          One vector p. row.
 
 *Author*:
     Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
@@ -46,6 +67,9 @@ given by a user. |br|
     1.0    | 22-JAN-2014 : * Version 1.0 released. |br|
     2.0    | 15-JUL-2015 : * Version 2.0 released. |br|
     2.0r1  | 18-AUG-2015 : * Adjusted to RxCSobject v1.0 |br|
+    2.1    | 19-OCT-2026 : * Seed of the stream of random numbers (iSeed) |br|
+    2.2    | 19-OCT-2026 : * All the vectors are drawn at once |br|
+                             * Sparse formats of the generated vectors (strFormat) |br|
 
 *License*:
     BSD 2-Clause
@@ -55,6 +79,7 @@ given by a user. |br|
 
 from __future__ import division
 import numpy as np
+import scipy.sparse as scsparse
 import rxcs
 
 class sparseVector(rxcs._RxCSobject):
@@ -90,6 +115,15 @@ class sparseVector(rxcs._RxCSobject):
         self.paramH('iNVect', 0)           # The number of vectors to be generated must be higher than zero
         self.paramL('iNVect', np.inf)      # ...and lower than infinity
 
+        # Format of the generated vectors
+        self.paramAddOpt('strFormat', 'Format of the vectors', default='dense')
+        self.paramType('strFormat', str)
+        self.paramAllowed('strFormat', ['dense', 'csr', 'coo', 'inx'])
+
+        # Seed of the stream of random numbers
+        self.paramAddOpt('iSeed', 'Seed of the stream of random numbers', default=np.nan)
+        self.paramType('iSeed', (int, float, tuple))
+
         # Mute the output flag
         self.paramAddOpt('bMute', 'Mute the output', noprint=1, default=0)
         self.paramType('bMute', int)          # Must be of int type
@@ -118,35 +152,64 @@ class sparseVector(rxcs._RxCSobject):
         settings to the module.
         """
         
+        # Stream of random numbers
+        self.randState = rxcs.auxiliary.randStream.stream(self.iSeed)
+
         # Compute the number of non-zero elements in the vector X
-        iNs = np.ceil(self.iS * self.iVectSiz)
+        iNs = int(np.ceil(self.iS * self.iVectSiz))
+
+        # Draw indices and values of non-zero elements of all the vectors
+        (self.mInx, self.mVal) = self._generate(self.iNVect, self.iVectSiz, iNs)
 
-        # Loop over all vectors
-        self.mVects = np.zeros((self.iNVect, self.iVectSiz,))  # Allocate matrix for all the vectors
-        for inxVect in np.arange(self.iNVect):
-            vVect = self._generate(self.iVectSiz, iNs)   # Generate a sparse vector
-            self.mVects[inxVect, :] = vVect              # Store the vector
+        # Store the vectors in the requested format
+        self.mVects = self._format(self.mInx, self.mVal, self.iVectSiz, self.strFormat)
         return
 
-    def _generate(self, iN, iNs):
+    def _generate(self, iNVect, iN, iNs):
         """
-        This function generates one sparse vector (internal function). 
-    
+        This function generates indices and values of non-zero elements
+        of sparse vectors (internal function). All the vectors are drawn at once.
+
         Args:
-            iN  (int):  size of the vector
-            iNs (int):  the number of non-zero elements
-    
+            iNVect (int):  the number of vectors
+            iN  (int):     size of the vectors
+            iNs (int):     the number of non-zero elements in a vector
+
+        Returns:
+            mInx (Numpy array 2D):   indices of non-zero elements (sorted), one vector p. row
+            mVal (Numpy array 2D):   values of non-zero elements, one vector p. row
+        """
+        mInx = rxcs.auxiliary.randStream.drawNoReplace(self.randState, iNVect, iN, iNs)
+        mInx.sort(axis=1)
+        mVal = self.randState.rand(iNVect, iNs)    # Draw the non-zero elements of the vectors
+        return (mInx, mVal)
+
+    def _format(self, mInx, mVal, iN, strFormat):
+        """
+        This function stores sparse vectors in the requested format
+        (internal function).
+
+        Args:
+            mInx (Numpy array 2D):   indices of non-zero elements, one vector p. row
+            mVal (Numpy array 2D):   values of non-zero elements, one vector p. row
+            iN  (int):               size of the vectors
+            strFormat (string):      format of the vectors ('dense', 'csr', 'coo', 'inx')
+
         Returns:
-            vX (numpy vectors):    generated sparse vector
+            mVects:    the vectors in the requested format
         """
+        (iNVect, iNs) = mInx.shape
+        if strFormat == 'inx':
+            return (mInx, mVal)
 
-        vX = np.zeros((iN))                 # Allocate X vector
+        if strFormat == 'dense':
+            mVects = np.zeros((iNVect, iN))
+            mVects[np.arange(iNVect)[:, np.newaxis], mInx] = mVal    # Put the non-zero elements into the vectors
+            return mVects
 
-        vInx = np.random.permutation(iN)    # Draw indices on non-zero elements
-        vInx = vInx[0:iNs]                  # ^
-    
-        vXel = np.random.rand(iNs,1)        # Draw the non-zero elements of the vector x
-        for inxEl in np.arange(iNs):        # Put the non-zero elements into the vector x
-            vX[vInx[inxEl]] = vXel[inxEl]   # ^
+        if strFormat == 'csr':
+            vInxPtr = np.arange(iNVect + 1) * iNs
+            return scsparse.csr_matrix((mVal.ravel(), mInx.ravel(), vInxPtr), shape=(iNVect, iN))
 
-        return vX
+        vRows = np.repeat(np.arange(iNVect), iNs)
+        return scsparse.coo_matrix((mVal.ravel(), (vRows, mInx.ravel())), shape=(iNVect, iN))
@@ -0,0 +1 @@
+../../test/signals/sparseVector_test.py
\ No newline at end of file
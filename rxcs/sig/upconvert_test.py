@@ -0,0 +1 @@
+../../test/signals/upconvert_test.py
\ No newline at end of file
@@ -0,0 +1,448 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the fused front-end (a nonlinear amplifier,
+a saturation block and a uniform quantizer). |br|
+
+It tests the front-end with a number of test cases. In every case random
+signals are pushed through the front-end and through the chain of separate
+modules: the nonlinear amplifier (rxcs.sig.LNA), the saturation block
+(rxcs.acq.satur) and a uniform quantizer. Results of the chain are treated
+as the expected results. The amplifier and the saturation block are checked
+against the direct computations (a sum of powers of the input signals,
+comparisons with the amplitude limits). |br|
+
+The following tests are performed:
+
+- if the output of the amplifier is equal to the sum of powers of the input signals?
+
+- if the output and the saturation markers of the saturation block are correct?
+
+- if the observed signals of the front-end are equal to the output of the chain?
+
+- if the saturation markers and the numbers of saturated samples are equal?
+
+- if the signals are processed in place (if requested), and the input signals
+  are not changed otherwise?
+
+- if the quantized signals contain only the allowed quantization levels?
+
+- if integer signals are processed out of place, and refused to be processed
+  in place?
+
+- if the polynomial of the amplifier (rxcs.sig.LNA.horner) is evaluated
+  correctly into an output matrix which is separate from the input signals,
+  is the input matrix, or shares memory with the input signals?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python frontEnd_test.py`
+
+when in *rxcs/test/acquisitions* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+    1.1  | 19-OCT-2026 : * Tests of integer signals and of the output matrix of horner added. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+from rxcs.sig.LNA import horner
+
+
+# =====================================================================
+# Main function of the test
+# =====================================================================
+def _frontEnd_test():
+    """
+    This is main function of the test.
+
+    It runs the test case functions.
+    An info that a test was passed is printed to the console if a case
+    function returns.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+
+    # Print out the header of the front-end test
+    print('')
+    rxcs.console.progress('Function under test',
+                          'Fused front-end (amplifier, saturation, quantization)')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed signals
+    iTolerance = 1e-9
+
+    _TestCase1(iTolerance)
+    rxcs.console.info('case 1 OK!')
+
+    _TestCase2(iTolerance)
+    rxcs.console.info('case 2 OK!')
+
+    _TestCase3(iTolerance)
+    rxcs.console.info('case 3 OK!')
+
+    _TestCase4()
+    rxcs.console.info('case 4 OK!')
+
+    _TestCase5(iTolerance)
+    rxcs.console.info('case 5 OK!')
+
+    _TestCase6(iTolerance)
+    rxcs.console.info('case 6 OK!')
+
+
+# =====================================================================
+# Test case 1
+# =====================================================================
+def _TestCase1(iTolerance):
+    """
+    This is test case function #1. |br|
+
+    Amplifier and saturation, the signals are not processed in place.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    mSig = 2 * np.random.randn(20, 5000)
+    vCoef = np.array([1.0, 0.3, -0.1])
+    _checkFrontEnd(mSig, vCoef, -1.5, 2.0, np.nan, 0, iTolerance)
+
+
+# =====================================================================
+# Test case 2
+# =====================================================================
+def _TestCase2(iTolerance):
+    """
+    This is test case function #2. |br|
+
+    Amplifier and saturation, the signals are processed in place, signals
+    are longer than a block of the front-end (2^16 samples).
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    mSig = np.random.randn(3, 100000)
+    vCoef = np.array([2.0, 0.1, -0.3, 0.01])
+    _checkFrontEnd(mSig, vCoef, -1.0, 1.5, np.nan, 1, iTolerance)
+
+
+# =====================================================================
+# Test case 3
+# =====================================================================
+def _TestCase3(iTolerance):
+    """
+    This is test case function #3. |br|
+
+    Amplifier, saturation and 4-bit quantization, the signals are processed
+    in place and not in place.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    mSig = np.random.randn(50, 2000)
+    vCoef = np.array([1.0, 0.0, -0.2])
+    _checkFrontEnd(mSig, vCoef, -0.8, 0.8, 4, 0, iTolerance)
+    _checkFrontEnd(mSig, vCoef, -0.8, 0.8, 4, 1, iTolerance)
+
+
+# =====================================================================
+# Test case 4
+# =====================================================================
+def _TestCase4():
+    """
+    This is test case function #4. |br|
+
+    Quantization without both amplitude limits must be refused.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+    frontEnd = rxcs.acq.frontEnd()
+    frontEnd.mSig = np.random.randn(2, 100)
+    frontEnd.iMaxAmp = 1.0
+    frontEnd.nBits = 3
+    frontEnd.bMute = 1
+    try:
+        frontEnd.run()
+    except ValueError:
+        rxcs.console.note('quantization without limits is refused:    ok!')
+    else:
+        raise Exception('quantization without limits is refused: error!!!')
+
+
+# =====================================================================
+# Test case 5
+# =====================================================================
+def _TestCase5(iTolerance):
+    """
+    This is test case function #5. |br|
+
+    Integer signals: they are processed out of place, processing in place
+    (with the amplifier only, and with the quantization) must be refused.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    mSig = np.random.randint(-3, 4, (10, 300))
+    vCoef = np.array([0.5, 0.0, -0.1])
+    _checkFrontEnd(mSig, vCoef, -2.0, 2.0, 3, 0, iTolerance)
+
+    for nBits in [np.nan, 3]:
+        mSigIn = mSig.copy()
+        frontEnd = rxcs.acq.frontEnd()
+        frontEnd.mSig = mSigIn
+        frontEnd.vCoef = vCoef
+        frontEnd.iMinAmp = -2.0
+        frontEnd.iMaxAmp = 2.0
+        if not np.isnan(nBits):
+            frontEnd.nBits = nBits
+        frontEnd.bInPlace = 1
+        frontEnd.bMute = 1
+        strName = 'integers in place refused (%s):' % ('quantization' if nBits == 3 else 'amplifier')
+        try:
+            frontEnd.run()
+        except ValueError:
+            if not np.array_equal(mSigIn, mSig):
+                raise Exception('%s error!!!' % strName)
+            rxcs.console.note('%-42s ok!' % strName)
+        else:
+            raise Exception('%s error!!!' % strName)
+
+
+# =====================================================================
+# Test case 6
+# =====================================================================
+def _TestCase6(iTolerance):
+    """
+    This is test case function #6. |br|
+
+    The polynomial of the amplifier (rxcs.sig.LNA.horner) evaluated into an
+    output matrix: a separate matrix (the polynomial is evaluated directly
+    in it), the input matrix, a matrix which shares memory with the input
+    matrix.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    mSig = np.random.randn(4, 1000)
+    vCoef = np.array([1.5, -0.2, 0.05])
+    mSigLNA = vCoef[0] * mSig + vCoef[1] * mSig**2 + vCoef[2] * mSig**3
+
+    # No output matrix
+    _checkEqual(horner(mSig, vCoef), mSigLNA, iTolerance, 'horner (no output matrix):')
+
+    # A separate output matrix
+    mSigIn = mSig.copy()
+    mOut = np.empty(mSig.shape)
+    if horner(mSigIn, vCoef, mOut) is not mOut or not np.array_equal(mSigIn, mSig):
+        raise Exception('horner (a separate output matrix): error!!!')
+    _checkEqual(mOut, mSigLNA, iTolerance, 'horner (a separate output matrix):')
+
+    # The input matrix
+    mSigIn = mSig.copy()
+    if horner(mSigIn, vCoef, mSigIn) is not mSigIn:
+        raise Exception('horner (the input matrix): error!!!')
+    _checkEqual(mSigIn, mSigLNA, iTolerance, 'horner (the input matrix):')
+
+    # A matrix which shares memory with the input matrix
+    mSigIn = mSig.copy()
+    horner(mSigIn[:, :], vCoef, mSigIn[:, :])
+    _checkEqual(mSigIn, mSigLNA, iTolerance, 'horner (a view of the input matrix):')
+
+
+# =====================================================================
+# Push the signals through the front-end and through the chain of
+# separate modules, compare the results
+# =====================================================================
+def _checkFrontEnd(mSig, vCoef, iMinAmp, iMaxAmp, nBits, bInPlace, iTolerance):
+    """
+    This is the engine of the test.
+
+    Args:
+        mSig (Numpy array 2D):     input signals
+        vCoef (Numpy array 1D):    coefficients of the amplifier
+        iMinAmp (float):           the minimum allowed amplitude
+        iMaxAmp (float):           the maximum allowed amplitude
+        nBits (int):               the number of bits of the quantizer (NaN - no quantization)
+        bInPlace (int):            'process the signals in place' flag
+        iTolerance (float):        maximum tolerance of a difference between an
+                                   expected value and a real value
+    Returns:
+        nothing
+
+    """
+    # -----------------------------------------------------------------
+    # The chain: amplifier -> saturation -> quantizer
+    LNA = rxcs.sig.LNA()
+    LNA.mSig = mSig
+    LNA.vCoef = vCoef
+    LNA.bMute = 1
+    LNA.run()
+
+    # Check the amplifier (sum of powers of the input signals)
+    mSigLNA = np.zeros(mSig.shape)
+    for (inxCoef, iCoef) in enumerate(vCoef):
+        mSigLNA += iCoef * mSig**(inxCoef + 1)
+    _checkEqual(LNA.mSig, mSigLNA, iTolerance, 'output of the amplifier:')
+
+    satur = rxcs.acq.satur()
+    satur.mSig = LNA.mSig
+    satur.iMinAmp = iMinAmp
+    satur.iMaxAmp = iMaxAmp
+    satur.bMute = 1
+    satur.run()
+
+    # Check the saturation block (comparisons with the amplitude limits)
+    mSaturMark = (mSigLNA > iMaxAmp).astype(int) - (mSigLNA < iMinAmp).astype(int)
+    _checkEqual(satur.mObSig, np.minimum(np.maximum(mSigLNA, iMinAmp), iMaxAmp), iTolerance,
+                'output of the saturation block:')
+    _checkEqual(satur.mSaturMark, mSaturMark, 0, 'markers of the saturation block:')
+
+    # Uniform mid-rise quantizer
+    mSigRef = satur.mObSig
+    if not np.isnan(nBits):
+        iStep = (iMaxAmp - iMinAmp) / 2**nBits
+        mCode = np.minimum(np.maximum(np.floor((mSigRef - iMinAmp) / iStep), 0), 2**nBits - 1)
+        mSigRef = iMinAmp + (mCode + 0.5) * iStep
+
+    # -----------------------------------------------------------------
+    # The front-end
+    mSigIn = mSig.copy()
+    frontEnd = rxcs.acq.frontEnd()
+    frontEnd.mSig = mSigIn
+    frontEnd.vCoef = vCoef
+    frontEnd.iMinAmp = iMinAmp
+    frontEnd.iMaxAmp = iMaxAmp
+    if not np.isnan(nBits):
+        frontEnd.nBits = nBits
+    frontEnd.bInPlace = bInPlace
+    frontEnd.bMute = 1
+    frontEnd.run()
+
+    # -----------------------------------------------------------------
+    # Check the results of the front-end
+    _checkEqual(frontEnd.mObSig, mSigRef, iTolerance, 'observed signals:')
+    _checkEqual(frontEnd.mSaturMark, satur.mSaturMark, 0, 'saturation markers:')
+    if frontEnd.mSaturMark.dtype != np.int8:
+        raise Exception('type of saturation markers: error!!!')
+
+    if not ((frontEnd.nSatMin == satur.nSatMin) and (frontEnd.nSatMax == satur.nSatMax) and
+            (frontEnd.nSat == satur.nSat) and _isequal(frontEnd.nSatPerc, satur.nSatPerc, iTolerance)):
+        raise Exception('the numbers of saturated samples: error!!!')
+    rxcs.console.note('the numbers of saturated samples:          ok!')
+
+    # Check if the signals were processed in place (or the input was not changed)
+    if bInPlace:
+        bOk = frontEnd.mObSig is mSigIn
+    else:
+        bOk = (frontEnd.mObSig is not mSigIn) and np.array_equal(mSigIn, mSig)
+    if not bOk:
+        raise Exception('processing in place: error!!!')
+    rxcs.console.note('processing in place:                       ok!')
+
+    # Check the quantization levels
+    if not np.isnan(nBits):
+        vLevels = iMinAmp + (np.arange(2**nBits) + 0.5) * frontEnd.iQStep
+        vDist = np.min(np.abs(frontEnd.mObSig.ravel()[:, np.newaxis] - vLevels), axis=1)
+        if not (np.max(vDist) <= iTolerance):
+            raise Exception('quantization levels: error!!!')
+        rxcs.console.note('quantization levels:                       ok!')
+    return
+
+
+# =====================================================================
+# Check if two matrices are equal (up to the given margin)
+# =====================================================================
+def _checkEqual(mX, mY, iMargin, strName):
+    """
+    This function checks if two matrices are equal, up to the given margin.
+    The result is printed to the console.
+
+    Args:
+        mX: the first matrix |br|
+        mY: the second matrix |br|
+        iMargin: the allowed margin |br|
+        strName: name of the check |br|
+
+    Returns:
+        Nothing
+    """
+    if (mX.shape == mY.shape) and (np.max(np.abs(mX - mY)) <= iMargin):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two values.
+# The function allows for a very small error margin
+# =====================================================================
+def _isequal(iX, iY, iMargin):
+    """
+    This function checks if a difference between two values is in the
+    given allowed margin.
+
+    Args:
+        iX: the first value |br|
+        iY: the second value |br|
+        iMargin: the allowed margin |br|
+
+    Returns:
+        1: if the difference between the given values does not exceed the
+           given margin |br|
+        0: if the difference between the given values does exceed the
+           given margin |br|
+    """
+
+    if (abs(iX - iY) <= np.abs(iMargin)):
+        return 1
+    else:
+        return 0
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _frontEnd_test()
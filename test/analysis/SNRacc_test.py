@@ -0,0 +1,336 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the SNR accumulator of the reconstructed
+signals. |br|
+
+It tests the SNR accumulator with the number of test cases, and analyzes
+the results.
+
+In every case random reference signals are generated, and the signals under
+test are the reference signals with an additional random noise (the power
+of noise is different for every signal). The signals are fed to the
+accumulator in packs of different sizes. The SNR computed by the one-shot
+SNR evaluation (rxcs.ana.SNR) of all the signals is treated as the expected
+SNR. |br|
+
+The following tests are performed on the results of accumulation:
+
+- if the number of accumulated signals is correct?
+
+- if the average SNR and the standard deviation of SNR are correct?
+
+- if the lowest and the highest SNR are correct?
+
+- if the success ratio of the reconstruction is correct?
+
+- if the histogram of SNR is correct?
+
+- if the statistics of merged accumulators are correct?
+
+- if accumulators with different settings are refused to be merged?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python SNRacc_test.py`
+
+when in *rxcs/test/analysis* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+# =====================================================================
+# Main function of the test
+# =====================================================================
+def _SNRacc_test():
+    """
+    This is main function of the test.
+
+    It runs the test case functions.
+    An info that a test was passed is printed to the console if a case
+    function returns.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+
+    # Print out the header of the SNR accumulator test
+    print('')
+    rxcs.console.progress('Function under test',
+                          'SNR accumulator of the reconstructed signals')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed
+    iTolerance = 1e-9
+
+    _TestCase1(iTolerance)
+    rxcs.console.info('case 1 OK!')
+
+    _TestCase2(iTolerance)
+    rxcs.console.info('case 2 OK!')
+
+    _TestCase3()
+    rxcs.console.info('case 3 OK!')
+
+
+# =====================================================================
+# Test case 1
+# =====================================================================
+def _TestCase1(iTolerance):
+    """
+    This is test case function #1. |br|
+
+    Signals are fed to one accumulator in packs of different sizes,
+    packs are processed in chunks smaller than a pack.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    (mSig, mSigRef) = _genSignals(300, 200)
+
+    acc = _accumulator(7)
+    for (inxStart, inxStop) in [(0, 40), (40, 41), (41, 150), (150, 300)]:
+        acc.mSig = mSig[inxStart:inxStop, :]
+        acc.mSigRef = mSigRef[inxStart:inxStop, :]
+        acc.run()
+
+    _checkStatistics(acc, mSig, mSigRef, iTolerance, 'packs of signals')
+
+
+# =====================================================================
+# Test case 2
+# =====================================================================
+def _TestCase2(iTolerance):
+    """
+    This is test case function #2. |br|
+
+    Signals are fed to two accumulators, the accumulators are merged
+    (also into an empty accumulator).
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    (mSig, mSigRef) = _genSignals(250, 100)
+
+    acc1 = _accumulator(128)
+    for (inxStart, inxStop) in [(0, 30), (30, 100)]:
+        acc1.mSig = mSig[inxStart:inxStop, :]
+        acc1.mSigRef = mSigRef[inxStart:inxStop, :]
+        acc1.run()
+
+    acc2 = _accumulator(16)
+    acc2.mSig = mSig[100:, :]
+    acc2.mSigRef = mSigRef[100:, :]
+    acc2.run()
+
+    # Merge into an empty accumulator
+    acc = _accumulator(128)
+    acc.merge(acc1)
+    acc.merge(acc2)
+    _checkStatistics(acc, mSig, mSigRef, iTolerance, 'merged into an empty accumulator')
+
+    # Merge into an accumulator with signals
+    acc1.merge(acc2)
+    _checkStatistics(acc1, mSig, mSigRef, iTolerance, 'merged accumulators')
+
+
+# =====================================================================
+# Test case 3
+# =====================================================================
+def _TestCase3():
+    """
+    This is test case function #3. |br|
+
+    Accumulators with different success thresholds or different edges
+    of bins of the histogram can not be merged.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+    (mSig, mSigRef) = _genSignals(20, 100)
+
+    # Settings of accumulators: (success threshold, edges of bins of the histogram)
+    lSettings = [(20, np.arange(0, 70, 5)),
+                 (30, np.arange(0, 70, 5)),
+                 (np.nan, np.arange(0, 70, 5)),
+                 (20, np.arange(0, 70, 10)),
+                 (20, np.nan)]
+    lAcc = []
+    for (iSNRSuccess, vSNREdges) in lSettings:
+        acc = rxcs.ana.SNRacc()
+        acc.iSNRSuccess = iSNRSuccess
+        acc.vSNREdges = vSNREdges
+        acc.mSig = mSig
+        acc.mSigRef = mSigRef
+        acc.bMute = 1
+        acc.run()
+        lAcc.append(acc)
+
+    lNames = ['different success thresholds', 'no success threshold',
+              'different histogram edges', 'no histogram']
+    for (acc, strName) in zip(lAcc[1:], lNames):
+        _checkRefused(lAcc[0], acc, strName + ' (refused):')
+        _checkRefused(acc, lAcc[0], strName + ' (refused, reversed):')
+
+
+# =====================================================================
+# Generate the reference signals and the signals under test
+# =====================================================================
+def _genSignals(nSigs, iSizSig):
+    """
+    This function generates random reference signals and signals under test
+    (reference signals with an additional noise, the power of noise is
+    different for every signal).
+
+    Args:
+        nSigs (int):      the number of signals
+        iSizSig (int):    the number of samples in a signal
+
+    Returns:
+        mSig (Numpy array 2D):     signals under test
+        mSigRef (Numpy array 2D):  reference signals
+    """
+    mSigRef = np.random.randn(nSigs, iSizSig)
+    vNoiseAmp = 10**(-3 * np.random.rand(nSigs, 1))
+    mSig = mSigRef + vNoiseAmp * np.random.randn(nSigs, iSizSig)
+    return (mSig, mSigRef)
+
+
+# =====================================================================
+# SNR accumulator used in the tests
+# =====================================================================
+def _accumulator(iNSigsChunk):
+    acc = rxcs.ana.SNRacc()
+    acc.iSNRSuccess = 30                   # Success threshold is 30 dB
+    acc.vSNREdges = np.arange(0, 75, 5)    # Edges of bins of the histogram
+    acc.iNSigsChunk = iNSigsChunk          # The max number of signals in a chunk
+    acc.bMute = 1
+    return acc
+
+
+# =====================================================================
+# Compare the accumulated statistics with the one-shot SNR evaluation
+# =====================================================================
+def _checkStatistics(acc, mSig, mSigRef, iTolerance, strName):
+    """
+    This is the engine of the test.
+
+    Args:
+        acc (SNRacc):               the SNR accumulator
+        mSig (Numpy array 2D):      all the signals under test
+        mSigRef (Numpy array 2D):   all the reference signals
+        iTolerance (float): maximum tolerance of a difference between an
+                            expected value and a real value
+        strName (string):   name of the check
+    Returns:
+        nothing
+
+    """
+    # -----------------------------------------------------------------
+    # Run the one-shot SNR evaluation on all the signals
+    analysisSNR = rxcs.ana.SNR()
+    analysisSNR.mSig = mSig
+    analysisSNR.mSigRef = mSigRef
+    analysisSNR.iSNRSuccess = acc.iSNRSuccess
+    analysisSNR.bMute = 1
+    analysisSNR.run()
+    vSNR = analysisSNR.vSNR
+
+    # -----------------------------------------------------------------
+    # Check the accumulated statistics
+    bOk = (acc.nSigs == vSNR.size)
+    bOk = bOk and _isequal(acc.iSNR, analysisSNR.iSNR, iTolerance)
+    bOk = bOk and _isequal(acc.iSNRStd, np.std(vSNR), iTolerance)
+    bOk = bOk and _isequal(acc.iSNRMin, vSNR.min(), iTolerance)
+    bOk = bOk and _isequal(acc.iSNRMax, vSNR.max(), iTolerance)
+    bOk = bOk and _isequal(acc.iSR, analysisSNR.iSR, iTolerance)
+    if not bOk:
+        raise Exception('%s (statistics): error!!!' % strName)
+    rxcs.console.note('%-52s ok!' % (strName + ' (statistics):'))
+
+    (vSNRHist, _) = np.histogram(vSNR, acc.vSNREdges)
+    if not np.array_equal(acc.vSNRHist, vSNRHist):
+        raise Exception('%s (histogram): error!!!' % strName)
+    rxcs.console.note('%-52s ok!' % (strName + ' (histogram):'))
+    return
+
+
+# =====================================================================
+# Check if merging of two accumulators is refused
+# =====================================================================
+def _checkRefused(acc, accOther, strName):
+    nSigs = acc.nSigs
+    try:
+        acc.merge(accOther)
+    except ValueError:
+        if acc.nSigs != nSigs:
+            raise Exception('%s error!!!' % strName)
+        rxcs.console.note('%-52s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two values.
+# The function allows for a very small error margin
+# =====================================================================
+def _isequal(iX, iY, iMargin):
+    """
+    This function checks if a difference between two values is in the
+    given allowed margin.
+
+    Args:
+        iX: the first value |br|
+        iY: the second value |br|
+        iMargin: the allowed margin |br|
+
+    Returns:
+        1: if the difference between the given values does not exceed the
+           given margin |br|
+        0: if the difference between the given values does exceed the
+           given margin |br|
+    """
+
+    if (abs(iX - iY) <= np.abs(iMargin)):
+        return 1
+    else:
+        return 0
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _SNRacc_test()
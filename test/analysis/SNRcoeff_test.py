@@ -0,0 +1,306 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the coefficient domain SNR evaluation of the
+reconstructed signal. |br|
+
+It tests the coefficient domain SNR evaluator with the number of test cases,
+and analyzes the results.
+
+In every case random sparse coefficients of reference signals are generated,
+and the coefficients of signals under test are the reference coefficients with
+an additional random noise. The signals are synthesized with a dictionary
+and the SNR computed by the time domain SNR evaluation (rxcs.ana.SNR)
+is treated as the expected SNR. |br|
+
+The following tests are performed on the results of evaluation:
+
+- if the SNR computed for every signal is correct?
+
+- if the average SNR is correct?
+
+- if the success ratio of the reconstruction is correct?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python SNRcoeff_test.py`
+
+when in *rxcs/test/analysis* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+# =====================================================================
+# Main function of the test
+# =====================================================================
+def _SNRcoeff_test():
+    """
+    This is main function of the test.
+
+    It runs the test case functions.
+    An info that a test was passed is printed to the console if a case
+    function returns.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+
+    # Print out the header of the signal generator test
+    print('')
+    rxcs.console.progress('Function under test',
+                          'Coefficient domain SNR evaluation of the reconstructed signal')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed is 0.1%
+    iTolerance = 0.1 * 1e-2
+
+    _TestCase1(iTolerance)
+    rxcs.console.info('case 1 OK!')
+
+    _TestCase2(iTolerance)
+    rxcs.console.info('case 2 OK!')
+
+    _TestCase3(iTolerance)
+    rxcs.console.info('case 3 OK!')
+
+
+# =====================================================================
+# Test case 1
+# =====================================================================
+def _TestCase1(iTolerance):
+    """
+    This is test case function #1. |br|
+
+    IDFT dictionary (orthogonal), complex coefficients, real part of the
+    synthesized signals.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    # Generate the dictionary
+    IDFT = rxcs.cs.dict.IDFT()
+    IDFT.tS = 1e-3      # Time of the dictionary is 1 ms
+    IDFT.fR = 40e3      # Representation sampling frequency is 40 kHz
+    IDFT.fDelta = 1e3   # The frequency separation between tones
+    IDFT.nTones = 15    # The number of tones in the dictionary
+    IDFT.bMute = 1
+    IDFT.run()
+
+    # Reference coefficients (real signals) and noisy coefficients
+    mCoeffRef = _drawCoeff(50, IDFT.mDict.shape[0], 1, 4)
+    mCoeffRef = mCoeffRef + mCoeffRef[:, IDFT.vInxConj].conj()
+    mCoeff = mCoeffRef + 0.1 * _drawCoeff(50, IDFT.mDict.shape[0], 1, IDFT.mDict.shape[0])
+
+    _checkSNR(mCoeff, mCoeffRef, IDFT.mDict, IDFT.gram(), IDFT.vInxConj, iTolerance)
+
+
+# =====================================================================
+# Test case 2
+# =====================================================================
+def _TestCase2(iTolerance):
+    """
+    This is test case function #2. |br|
+
+    IDFT dictionary with symmetrical frequency distribution, tones are not
+    on the FFT grid (the full Gram matrix is used).
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    # Generate the dictionary
+    IDFT = rxcs.cs.dict.IDFT()
+    IDFT.tS = 1e-3       # Time of the dictionary is 1 ms
+    IDFT.fR = 40e3       # Representation sampling frequency is 40 kHz
+    IDFT.fDelta = 1.5e3  # The frequency separation between tones (not on the FFT grid)
+    IDFT.nTones = 10     # The number of tones in the dictionary
+    IDFT.bFreqSym = 1    # Symmetrical frequency distribution
+    IDFT.bMute = 1
+    IDFT.run()
+
+    # Reference coefficients (real signals) and noisy coefficients
+    mCoeffRef = _drawCoeff(50, IDFT.mDict.shape[0], 1, 3)
+    mCoeffRef = mCoeffRef + mCoeffRef[:, IDFT.vInxConj].conj()
+    mCoeff = mCoeffRef + 0.2 * _drawCoeff(50, IDFT.mDict.shape[0], 1, 5)
+
+    _checkSNR(mCoeff, mCoeffRef, IDFT.mDict, IDFT.gram(), IDFT.vInxConj, iTolerance)
+
+
+# =====================================================================
+# Test case 3
+# =====================================================================
+def _TestCase3(iTolerance):
+    """
+    This is test case function #3. |br|
+
+    IDHT dictionary (orthogonal), real coefficients.
+
+    Args:
+        iTolerance: maximum tolerance of a difference between an expected value
+        and a real value
+
+    Returns:
+        Nothing
+    """
+    # Generate the dictionary
+    IDHT = rxcs.cs.dict.IDHT()
+    IDHT.tS = 2e-3      # Time of the dictionary is 2 ms
+    IDHT.fR = 50e3      # Representation sampling frequency is 50 kHz
+    IDHT.fDelta = 1e3   # The frequency separation between tones
+    IDHT.nTones = 20    # The number of tones in the dictionary
+    IDHT.bMute = 1
+    IDHT.run()
+
+    # Reference coefficients and noisy coefficients
+    mCoeffRef = _drawCoeff(50, IDHT.mDict.shape[0], 0, 5)
+    mCoeff = mCoeffRef + 0.05 * _drawCoeff(50, IDHT.mDict.shape[0], 0, IDHT.mDict.shape[0])
+
+    _checkSNR(mCoeff, mCoeffRef, IDHT.mDict, IDHT.gram(), np.nan, iTolerance)
+
+
+# =====================================================================
+# Draw random sparse coefficients
+# =====================================================================
+def _drawCoeff(nSigs, nCoeff, bComplex, iS):
+    """
+    This function draws random sparse coefficients of signals.
+
+    Args:
+        nSigs (int):      the number of signals
+        nCoeff (int):     the number of coefficients of a signal
+        bComplex (int):   'complex coefficients' flag
+        iS (int):         the number of non-zero coefficients of a signal
+
+    Returns:
+        mCoeff (Numpy array 2D):  coefficients of signals, one signal in a row
+    """
+    mCoeff = np.zeros((nSigs, nCoeff), dtype=complex if bComplex else float)
+    for inxSig in np.arange(nSigs):
+        vInx = np.random.permutation(nCoeff)[:iS]
+        mCoeff[inxSig, vInx] = np.random.randn(iS)
+        if bComplex:
+            mCoeff[inxSig, vInx] += 1j * np.random.randn(iS)
+    return mCoeff
+
+
+# =====================================================================
+# Compute the SNR in the coefficient domain and in the time domain and
+# compare them
+# =====================================================================
+def _checkSNR(mCoeff, mCoeffRef, mDict, mGram, vInxConj, iTolerance):
+    """
+    This is the engine of the test.
+
+    Args:
+        mCoeff (Numpy array 2D):      coefficients of signals under test
+        mCoeffRef (Numpy array 2D):   coefficients of reference signals
+        mDict (Numpy array 2D):       dictionary, one atom in a row
+        mGram (Numpy array 1D/2D):    the Gram matrix of the dictionary (or its diagonal)
+        vInxConj (Numpy array 1D):    indices of conjugate atoms (or NaN)
+        iTolerance (float): maximum tolerance of a difference between an
+                            expected value and a real value
+    Returns:
+        nothing
+
+    """
+    # Succcess ratio if SNR > 20 [db]
+    iSNRSuccess = 20
+
+    # -----------------------------------------------------------------
+    # Run the time domain SNR evaluation on the synthesized signals
+    analysisSNR = rxcs.ana.SNR()
+    analysisSNR.mSig = np.dot(mCoeff, mDict).real
+    analysisSNR.mSigRef = np.dot(mCoeffRef, mDict).real
+    analysisSNR.iSNRSuccess = iSNRSuccess
+    analysisSNR.bMute = 1
+    analysisSNR.run()
+
+    # -----------------------------------------------------------------
+    # Run the coefficient domain SNR evaluation
+    analysisSNRc = rxcs.ana.SNRcoeff()
+    analysisSNRc.mCoeff = mCoeff
+    analysisSNRc.mCoeffRef = mCoeffRef
+    analysisSNRc.mGram = mGram
+    analysisSNRc.vInxConj = vInxConj
+    analysisSNRc.iSNRSuccess = iSNRSuccess
+    analysisSNRc.bMute = 1
+    analysisSNRc.run()
+
+    # -----------------------------------------------------------------
+    # Check the SNR values for every signal
+    (nSigs, _) = mCoeff.shape
+    for inxSig in np.arange(nSigs):
+        if not _isequal(analysisSNR.vSNR[inxSig], analysisSNRc.vSNR[inxSig], iTolerance):
+            raise Exception('SNR computed in the coefficient domain: error!!!')
+
+    # Check the average SNR
+    if not _isequal(analysisSNR.iSNR, analysisSNRc.iSNR, iTolerance):
+        raise Exception('average SNR computed in the coefficient domain: error!!!')
+
+    # Check the success ratio
+    if not _isequal(analysisSNR.iSR, analysisSNRc.iSR, iTolerance):
+        raise Exception('SNR success ratio computed in the coefficient domain: error!!!')
+
+    # -----------------------------------------------------------------
+    return
+
+
+# =====================================================================
+# This function compares two values.
+# The function allows for a very small error margin
+# =====================================================================
+def _isequal(iX, iY, iMargin):
+    """
+    This function checks if a difference between two values is in the
+    given allowed margin.
+
+    Args:
+        iX: the first value |br|
+        iY: the second value |br|
+        iMargin: the allowed margin |br|
+
+    Returns:
+        1: if the difference between the given values does not exceed the
+           given margin |br|
+        0: if the difference between the given values does exceed the
+           given margin |br|
+    """
+
+    if (abs(iX - iY) <= np.abs(iMargin)):
+        return 1
+    else:
+        return 0
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _SNRcoeff_test()
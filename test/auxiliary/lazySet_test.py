@@ -0,0 +1,234 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the lazy set of signals. |br|
+
+It tests the lazy set with a number of test cases. In every case signals
+are generated pack after pack by the 'packs' method of the random multitone
+signal generator (or pack after pack by a sampler), with the seeds of packs
+spawned from the seed of the set. These signals are treated as the expected
+signals. |br|
+
+The following tests are performed:
+
+- if the signals given by the lazy set are equal to the signals generated
+  by the 'packs' method (all the outputs, all the signals)?
+
+- if signals with the given indices (an integer, a negative integer, a slice,
+  a list of indices in any order) are correct?
+
+- if packs removed from the cache are regenerated exactly the same?
+
+- if a lazy set which takes the signals from another lazy set (a sampler
+  which samples generated signals) is correct?
+
+- if wrong usage (no seed, an index out of range) is refused?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python lazySet_test.py`
+
+when in *rxcs/test/auxiliary* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+def _lazySet_test():
+
+    # Print out the header of the lazy set test
+    print('')
+    rxcs.console.progress('Function under test', 'Lazy set of signals')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+    _testCase1()                       # Test case 1
+    _testCase2()                       # Test case 2
+    _testCase3()                       # Test case 3
+    _testCase4()                       # Test case 4
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1():
+    """
+    Lazy set of noisy signals of the random multitone signal generator
+    vs the 'packs' method (the last pack is not full).
+    """
+    tStart = rxcs.console.module_progress('test (case 1): ')
+    gen = _generator(103)
+    lsSig = gen.lazy(nSigsPack=10)
+    dPacks = _packs(_generator(103), 10)
+    rxcs.console.progress_doneNL(tStart)
+
+    # All the outputs of all the signals
+    for strName in ['mSig', 'mSigNN', 'vP', 'vPNN', 'mFrqs', 'mAmps', 'mPhs']:
+        _checkEqual(lsSig.toarray(strName), dPacks[strName], 'all the signals (%s):' % strName)
+
+    # Signals with the given indices
+    mSig = dPacks['mSig']
+    _checkEqual(lsSig[57], mSig[57], 'a signal:')
+    _checkEqual(lsSig[-1], mSig[-1], 'the last signal:')
+    _checkEqual(lsSig[5:48:3], mSig[5:48:3], 'a slice of signals:')
+    vInx = [99, 3, 57, 3, 0, 102]
+    _checkEqual(lsSig[vInx], mSig[vInx], 'a list of signals:')
+    _checkEqual(lsSig.rows(vInx, 'mSigNN'), dPacks['mSigNN'][vInx], 'a list of signals (mSigNN):')
+    if len(lsSig) != 103:
+        raise Exception('the number of signals: error!!!')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2():
+    """
+    Packs which are removed from the cache are regenerated exactly the same
+    (the cache keeps one pack).
+    """
+    tStart = rxcs.console.module_progress('test (case 2): ')
+    gen = _generator(40)
+    lsSig = gen.lazy(nSigsPack=8, nCache=1)
+    mSig = _packs(_generator(40), 8)['mSig']
+    rxcs.console.progress_doneNL(tStart)
+
+    for inxSig in [33, 2, 17, 2, 33, 39, 0]:
+        _checkEqual(lsSig[inxSig], mSig[inxSig], 'signal #%d (cache with one pack):' % inxSig)
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3():
+    """
+    Lazy set of observed signals of the ANGIE sampler which samples
+    a lazy set of signals of the generator vs the sampler run pack after pack.
+    """
+    tStart = rxcs.console.module_progress('test (case 3): ')
+    iSeed = 7
+    gen = _generator(30)
+    lsSig = gen.lazy(nSigsPack=7)
+
+    samp = _sampler(gen)
+    lsObs = rxcs.auxiliary.lazySet(samp, iSeed, lOutputs=['mObSig', 'mPatts'],
+                                   strNSigs='', dInputs={'mSig': lsSig})
+
+    # Expected observed signals: the sampler is run pack after pack
+    lObSig = []
+    lPatts = []
+    for (inxPack, dGen) in enumerate(_generator(30).packs(7)):
+        samp = _sampler(gen)
+        samp.mSig = dGen['mSig'].copy()
+        samp.iSeed = rxcs.auxiliary.randStream.spawn(iSeed, inxPack)
+        samp.run()
+        lObSig.append(samp.mObSig)
+        lPatts.append(samp.mPatts)
+    rxcs.console.progress_doneNL(tStart)
+
+    _checkEqual(lsObs.toarray('mObSig'), np.vstack(lObSig), 'observed signals:')
+    _checkEqual(lsObs.toarray('mPatts'), np.vstack(lPatts), 'sampling patterns:')
+    _checkEqual(lsObs[[29, 4, 11]], np.vstack(lObSig)[[29, 4, 11]], 'a list of observed signals:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4():
+    """
+    Wrong usage of the lazy set is refused.
+    """
+    gen = _generator(20)
+    lsSig = gen.lazy(nSigsPack=5)
+    _checkRefused(lambda: lsSig[20], IndexError, 'an index out of range is refused:')
+    _checkRefused(lambda: lsSig.pack(4), IndexError, 'a pack out of range is refused:')
+
+    gen.iSeed = np.nan
+    _checkRefused(lambda: gen.lazy(nSigsPack=5), ValueError, 'a set without a seed is refused:')
+
+
+# =====================================================================
+# Random multitone signal generator used in the tests
+# =====================================================================
+def _generator(nSigs):
+    gen = rxcs.sig.randMult()
+    gen.tS = 1e-3       # Time of the signal is 1 ms
+    gen.fR = 100e3      # The signal representation sampling frequency is 100 kHz
+    gen.fMax = 20e3     # The highest possible frequency in the signal is 20 kHz
+    gen.fRes = 1e3      # The signal spectrum resolution is 1 kHz
+    gen.nTones = 4      # The number of random tones
+    gen.iSNR = 20       # Signal noise
+    gen.nSigs = nSigs   # The number of signals
+    gen.iSeed = 3       # Seed of the stream of random numbers
+    gen.bMute = 1
+    return gen
+
+
+# =====================================================================
+# ANGIE sampler used in the tests
+# =====================================================================
+def _sampler(gen):
+    samp = rxcs.acq.nonuniANGIE()
+    samp.tS = gen.tS     # Time of the signals
+    samp.fR = gen.fR     # The signal representation sampling frequency
+    samp.Tg = 1e-5       # The sampling grid period
+    samp.fSamp = 20e3    # The average sampling frequency
+    samp.bMute = 1
+    return samp
+
+
+# =====================================================================
+# Outputs of the generator generated pack after pack
+# =====================================================================
+def _packs(gen, nSigsPack):
+    dOut = {}
+    for dGen in gen.packs(nSigsPack):
+        for strName in ['mSig', 'mSigNN', 'vP', 'vPNN', 'mFrqs', 'mAmps', 'mPhs']:
+            dOut.setdefault(strName, []).append(np.array(dGen[strName]).copy())
+    for strName in dOut:
+        dOut[strName] = np.concatenate(dOut[strName])
+    return dOut
+
+
+# =====================================================================
+# Check if two matrices are equal
+# =====================================================================
+def _checkEqual(mX, mY, strName):
+    if (np.shape(mX) == np.shape(mY)) and np.array_equal(mX, mY):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# Check if a wrong usage is refused
+# =====================================================================
+def _checkRefused(funcWrong, excExpected, strName):
+    try:
+        funcWrong()
+    except excExpected:
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _lazySet_test()
@@ -0,0 +1,177 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the drawing of indices without replacement
+(drawNoReplace) from the module with streams of random numbers. |br|
+
+It tests the drawing with a number of test cases, one for every method
+of drawing (rejection sampling, oversampling with replacement, random keys).
+In every case many rows of indices are drawn. |br|
+
+The following tests are performed:
+
+- if the size of the drawn matrix is correct and the indices are in range?
+
+- if the indices in every row are distinct?
+
+- if every index is drawn equally often (up to 6 standard deviations)?
+
+- if every index is drawn equally often at the first position of a row
+  (the order of indices is random)?
+
+- if the same seed gives the same indices?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python randStream_test.py`
+
+when in *rxcs/test/auxiliary* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+def _randStream_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test',
+                          'Drawing of indices without replacement (randStream.drawNoReplace)')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+    _testCase1()                       # Test case 1
+    _testCase2()                       # Test case 2
+    _testCase3()                       # Test case 3
+    _testCase4()                       # Test case 4
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1():
+    """
+    Rejection sampling (nTake^2 < nAvail).
+    """
+    _testEngine(1, 20000, 50, 5)
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2():
+    """
+    Oversampling with replacement (nTake <= nAvail/4).
+    """
+    _testEngine(2, 20000, 50, 10)
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3():
+    """
+    Random keys (nTake > nAvail/4), also all the indices are taken
+    (random permutations).
+    """
+    _testEngine(3, 20000, 50, 30)
+    _testEngine(3, 20000, 50, 50)
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4():
+    """
+    No indices are taken.
+    """
+    mInx = rxcs.auxiliary.randStream.drawNoReplace(np.random.RandomState(1), 7, 50, 0)
+    if mInx.shape != (7, 0):
+        raise Exception('no indices are taken: error!!!')
+    rxcs.console.note('no indices are taken:                      ok!')
+
+
+# =====================================================================
+# Engine of the test
+# =====================================================================
+def _testEngine(inxCase, nRows, nAvail, nTake):
+    """
+    This is the engine of the test.
+
+    Args:
+        inxCase (int):   index of the test case
+        nRows (int):     the number of rows
+        nAvail (int):    the number of available indices
+        nTake (int):     the number of indices to be taken for every row
+
+    Returns:
+        nothing
+    """
+    strCase = '(%d from %d)' % (nTake, nAvail)
+    tStart = rxcs.console.module_progress('test (case %d) drawing of %s indices' % (inxCase, strCase))
+    randState = rxcs.auxiliary.randStream.stream(11)
+    mInx = rxcs.auxiliary.randStream.drawNoReplace(randState, nRows, nAvail, nTake)
+    rxcs.console.progress_doneNL(tStart)
+
+    # Size and range
+    if not ((mInx.shape == (nRows, nTake)) and (mInx.min() >= 0) and (mInx.max() < nAvail)):
+        raise Exception('size and range of indices %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('size and range of indices %s:' % strCase))
+
+    # Distinct indices in every row
+    mInxSorted = np.sort(mInx, axis=1)
+    if np.any(mInxSorted[:, 1:] == mInxSorted[:, :-1]):
+        raise Exception('distinct indices %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('distinct indices %s:' % strCase))
+
+    # Every index is drawn equally often
+    _checkUniform(np.bincount(mInx.ravel(), minlength=nAvail), nRows * nTake / nAvail,
+                  'uniform indices %s:' % strCase)
+
+    # Every index is drawn equally often at the first position
+    _checkUniform(np.bincount(mInx[:, 0], minlength=nAvail), nRows / nAvail,
+                  'uniform first indices %s:' % strCase)
+
+    # The same seed gives the same indices
+    randState = rxcs.auxiliary.randStream.stream(11)
+    if not np.array_equal(mInx, rxcs.auxiliary.randStream.drawNoReplace(randState, nRows, nAvail, nTake)):
+        raise Exception('reproducible indices %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('reproducible indices %s:' % strCase))
+    return
+
+
+# =====================================================================
+# Check if counts of indices are uniform
+# =====================================================================
+def _checkUniform(vCounts, iExpected, strName):
+    """
+    This function checks if all the counts are within 6 standard deviations
+    of the expected count (the standard deviation of a count is estimated
+    as the square root of the expected count).
+    """
+    if np.max(np.abs(vCounts - iExpected)) < 6 * np.sqrt(iExpected):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _randStream_test()
@@ -0,0 +1,296 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the IDFT dictionary generator. |br|
+
+It tests the generator with a number of test cases. In every case a dictionary
+is generated. The dictionary matrices computed in the original way (the
+dictionary is 0.5 * exp(j*2*pi*f*t) computed for all the tones at once, the
+real-valued dictionary is built from the real and imaginary parts of the
+dictionary) are treated as the expected dictionary matrices. Rows of
+sub-dictionaries are compared with rows found by a scan of the frequency
+vector. |br|
+
+The following tests are performed:
+
+- if the dictionary matrices (mDict, mDictR) generated on the first access are
+  equal to the expected dictionary matrices (for both orders of access, for
+  symmetrical and non-symmetrical distribution of frequencies)?
+
+- if the dictionary matrices are not generated before they are accessed, and
+  a new run of the generator removes the matrices generated by the previous run?
+
+- if a dictionary shifted in time (shift, shiftR, shiftTheta) is equal to the
+  dictionary generated with the shifted starting time point (tStart)?
+
+- if band-restricted sub-dictionaries (freqBands, freqBandsR) are views on
+  the rows of the dictionary which are found by a scan of the frequency vector
+  (for one band and for a number of bands)?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python IDFT_test.py`
+
+when in *rxcs/test/dictionaries* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+def _IDFT_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'IDFT dictionary generator')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed dictionaries
+    iTolerance = 1e-9
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3(iTolerance)             # Test case 3
+    _testCase4()                       # Test case 4
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    Dictionary matrices generated on the first access vs the expected
+    dictionary matrices.
+    """
+    rxcs.console.module_progress('test (case 1) dictionary matrices')
+    print('')
+    for bFreqSym in [0, 1]:
+        for tStart in [0, 0.5e-3]:
+            strName = 'bFreqSym %d, tStart %.1e' % (bFreqSym, tStart)
+
+            # mDict accessed first
+            IDFT = _generator(bFreqSym=bFreqSym, tStart=tStart)
+            (mDict, mDictR) = _baseline(IDFT)
+            _checkEqual(IDFT.mDict, mDict, iTolerance, strName + ', mDict:')
+            _checkEqual(IDFT.mDictR, mDictR, iTolerance, strName + ', mDictR:')
+
+            # mDictR accessed first
+            IDFT = _generator(bFreqSym=bFreqSym, tStart=tStart)
+            _checkEqual(IDFT.mDictR, mDictR, iTolerance, strName + ', mDictR first:')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    Lazy generation of the dictionary matrices, a new run of the generator.
+    """
+    rxcs.console.module_progress('test (case 2) lazy generation')
+    print('')
+    IDFT = _generator()
+    dOut = IDFT.__dict__.copy()
+    bOk = ('mDict' not in dOut) and ('mDictR' not in dOut)
+    IDFT.mDict
+    bOk = bOk and ('mDict' in IDFT.__dict__) and ('mDictR' not in IDFT.__dict__)
+    if not bOk:
+        raise Exception('matrices are generated on access: error!!!')
+    rxcs.console.note('%-42s ok!' % 'matrices are generated on access:')
+
+    # A new run with different parameters drops the matrices of the previous run
+    for bCache in [0, 1]:
+        IDFT = _generator(bCache=bCache)
+        (IDFT.mDict, IDFT.mDictR)
+        IDFT.nTones = 7
+        IDFT.tStart = 0.25e-3
+        IDFT.run()
+        bOk = ('mDict' not in IDFT.__dict__) and ('mDictR' not in IDFT.__dict__)
+        (mDict, mDictR) = _baseline(IDFT)
+        bOk = bOk and _isclose(IDFT.mDict, mDict, iTolerance) and _isclose(IDFT.mDictR, mDictR, iTolerance)
+        strName = 'a new run, bCache = %d:' % bCache
+        if not bOk:
+            raise Exception('%s error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % strName)
+    rxcs.cs.dict.dictCache.clear()
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(iTolerance):
+    """
+    Dictionary shifted in time vs dictionary generated with the shifted
+    starting time point.
+    """
+    rxcs.console.module_progress('test (case 3) time shift')
+    print('')
+    for bFreqSym in [0, 1]:
+        for (tStart, tShift) in [(0, 0.25e-3), (0.5e-3, 0.125e-3), (0.5e-3, -0.5e-3)]:
+            strName = 'bFreqSym = %d, shift %.3e' % (bFreqSym, tShift)
+            IDFT = _generator(bFreqSym=bFreqSym, tStart=tStart)
+            IDFTS = _generator(bFreqSym=bFreqSym, tStart=tStart + tShift)
+            bOk = _isclose(IDFT.shift(tShift), IDFTS.mDict, iTolerance)
+            bOk = bOk and _isclose(IDFT.shiftR(tShift), IDFTS.mDictR, iTolerance)
+
+            # Theta matrices (complex and real)
+            mPhi = np.random.randn(15, IDFT.nSamp)
+            bOk = bOk and _isclose(IDFT.shiftTheta(np.dot(mPhi, IDFT.mDict.T), tShift),
+                                   np.dot(mPhi, IDFTS.mDict.T), iTolerance)
+            bOk = bOk and _isclose(IDFT.shiftTheta(np.dot(mPhi, IDFT.mDictR.T), tShift),
+                                   np.dot(mPhi, IDFTS.mDictR.T), iTolerance)
+            if not bOk:
+                raise Exception('%s: error!!!' % strName)
+            rxcs.console.note('%-42s ok!' % (strName + ':'))
+
+    try:
+        IDFT.shiftTheta(np.ones((15, 5)), 1e-3)
+    except ValueError:
+        rxcs.console.note('%-42s ok!' % 'wrong Theta matrix is refused:')
+    else:
+        raise Exception('wrong Theta matrix is refused: error!!!')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4():
+    """
+    Band-restricted sub-dictionaries vs rows found by a scan of the
+    frequency vector.
+    """
+    rxcs.console.module_progress('test (case 4) band-restricted sub-dictionaries')
+    print('')
+    lBandsAll = [((2e3, 5e3), 'one band'),
+                 ((2.5e3, 5.5e3), 'band edges off the grid'),
+                 ([(2e3, 4e3), (7e3, 9e3)], 'two bands'),
+                 ([(1e3, 1e3), (5e3, 6e3), (11e3, 20e3)], 'three bands'),
+                 ([(2.2e3, 2.8e3), (5e3, 6e3)], 'bands with no tones')]
+    for bFreqSym in [0, 1]:
+        IDFT = _generator(bFreqSym=bFreqSym)
+        for (lBands, strName) in lBandsAll:
+            strName = 'bFreqSym = %d, %s' % (bFreqSym, strName)
+            (vPos, vNeg) = _scanBands(IDFT.vF, lBands)
+            nRows = IDFT.vF.size
+
+            subDict = IDFT.freqBands(lBands)
+            bOk = _isView(subDict, IDFT.mDict, np.hstack((vPos, vNeg)))
+            bOk = bOk and _isView(IDFT.freqBands(lBands, bPosOnly=1), IDFT.mDict, vPos)
+            vRowsR = np.hstack((vPos, vNeg, vPos + nRows, vNeg + nRows))
+            bOk = bOk and _isView(IDFT.freqBandsR(lBands), IDFT.mDictR, vRowsR)
+
+            # Products with the sub-dictionary
+            vX = np.random.randn(IDFT.nSamp)
+            bOk = bOk and _isclose(subDict.dot(vX), np.dot(IDFT.mDict[subDict.vInx], vX), 1e-12)
+            if not bOk:
+                raise Exception('%s: error!!!' % strName)
+            rxcs.console.note('%-42s ok!' % (strName + ':'))
+
+        # Indices of columns in a frequency range (the original scan)
+        (vPos, vNeg) = _scanBands(IDFT.vF, [(3e3, 8e3)])
+        bOk = np.array_equal(IDFT.freqRange(3e3, 8e3), np.hstack((vNeg, vPos)))
+        (vPosR, vNegR) = _scanBands(IDFT.vFr, [(3e3, 8e3)])
+        bOk = bOk and np.array_equal(IDFT.freqRangeR(3e3, 8e3), np.hstack((vNegR, vPosR)))
+        strName = 'bFreqSym = %d, freqRange:' % bFreqSym
+        if not bOk:
+            raise Exception('%s error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % strName)
+
+
+# =====================================================================
+# IDFT dictionary generator used in the tests
+# =====================================================================
+def _generator(bFreqSym=0, tStart=0, bCache=0):
+    IDFT = rxcs.cs.dict.IDFT()
+    IDFT.tS = 1e-3           # Time of the dictionary is 1 ms
+    IDFT.fR = 40e3           # Representation sampling frequency is 40 kHz
+    IDFT.fDelta = 1e3        # The frequency separation between tones
+    IDFT.nTones = 12         # The number of tones in the dictionary
+    IDFT.tStart = tStart     # The time shift of the starting time point
+    IDFT.bFreqSym = bFreqSym
+    IDFT.bCache = bCache
+    IDFT.bMute = 1
+    IDFT.run()
+    return IDFT
+
+
+# =====================================================================
+# Expected dictionary matrices
+# =====================================================================
+def _baseline(IDFT):
+    """
+    This function computes the dictionary matrices in the original way:
+    the dictionary is 0.5 * exp(j*2*pi*f*t) for all the tones at once, rows of
+    the real-valued dictionary are [Re(D+); -Re(D-); Im(D)].
+    """
+    mDict = 0.5 * np.exp(1j * 2 * np.pi * np.outer(IDFT.vF, IDFT.vT))
+    (nRows, _) = mDict.shape
+    nHalf = int(nRows / 2)
+    mDictR = np.vstack((mDict.real[:nHalf, :], -mDict.real[nHalf:, :], mDict.imag))
+    return (mDict, mDictR)
+
+
+# =====================================================================
+# Rows of tones within frequency bands (a scan of the frequency vector)
+# =====================================================================
+def _scanBands(vF, lBands):
+    """
+    This function finds rows of positive and negative tones within frequency
+    bands by a scan of the frequency vector (band after band).
+    """
+    if isinstance(lBands, tuple):
+        lBands = [lBands]
+    vInx = np.arange(vF.size)
+    vPos = np.hstack([vInx[(vF >= iFMin) & (vF <= iFMax)] for (iFMin, iFMax) in lBands])
+    vNeg = np.hstack([vInx[(vF <= -iFMin) & (vF >= -iFMax)] for (iFMin, iFMax) in lBands])
+    return (vPos.astype(int), vNeg.astype(int))
+
+
+# =====================================================================
+# Check if a sub-dictionary is a view on the given rows of a dictionary
+# =====================================================================
+def _isView(subDict, mDict, vRows):
+    bOk = np.array_equal(subDict.vInx, vRows) and (subDict.shape == (vRows.size, mDict.shape[1]))
+    bOk = bOk and np.array_equal(subDict.toarray(), mDict[vRows, :])
+    bOk = bOk and all([np.may_share_memory(mBlock, mDict) for mBlock in subDict.lBlocks])
+    return bOk
+
+
+# =====================================================================
+# Check if a matrix is equal to the expected matrix
+# =====================================================================
+def _checkEqual(mX, mExp, iTolerance, strName):
+    if _isclose(mX, mExp, iTolerance):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two matrices.
+# The function allows for a very small error margin
+# =====================================================================
+def _isclose(mX, mY, iTolerance):
+    return (np.shape(mX) == np.shape(mY)) and (np.max(np.abs(mX - mY)) <= iTolerance)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _IDFT_test()
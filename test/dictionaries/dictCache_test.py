@@ -0,0 +1,246 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the cache of dictionary matrices. |br|
+
+It tests the cache with a number of test cases. In every case dictionary
+matrices are taken from the cache (directly, or by the IDFT and IDHT
+dictionary generators with the cache switched on). The matrices generated
+by the generators with the cache switched off are treated as the expected
+matrices. |br|
+
+The following tests are performed:
+
+- if a matrix which is in the in-process layer of the cache is not generated
+  again (the same read-only matrix is given)?
+
+- if a matrix larger than the byte limit of the in-process layer is not kept
+  in the in-process layer?
+
+- if matrices stored in the on-disk layer of the cache are equal to the
+  matrices generated by the generators, and are read-only memory-mapped
+  arrays?
+
+- if matrices with a different version of the generator are not reused?
+
+- if the cache is cleared (the in-process layer and the on-disk layer)?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python dictCache_test.py`
+
+when in *rxcs/test/dictionaries* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import os
+import glob
+import shutil
+import tempfile
+import numpy as np
+import rxcs
+from rxcs.cs.dict import dictCache
+
+
+def _dictCache_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Cache of dictionary matrices')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+    strDir = tempfile.mkdtemp()
+    try:
+        _testCase1()                   # Test case 1
+        _testCase2()                   # Test case 2
+        _testCase3(strDir)             # Test case 3
+        _testCase4(strDir)             # Test case 4
+    finally:
+        dictCache.setSize(16, 2**30)   # Restore the default size of the cache
+        dictCache.clear()
+        shutil.rmtree(strDir)
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1():
+    """
+    The in-process layer: a matrix is generated only once, the same read-only
+    matrix is given. Dictionary generators with the same parameters share
+    the same matrices.
+    """
+    rxcs.console.module_progress('test (case 1) in-process layer')
+    print('')
+    dictCache.clear()
+    lGen = []
+    funcGen = _counted(lGen, lambda: np.random.randn(10, 20))
+    mMat = dictCache.get('test', 'mMat', (1, 2.5), funcGen)
+    mMat2 = dictCache.get('test', 'mMat', (1, 2.5), funcGen)
+    if not ((len(lGen) == 1) and (mMat2 is mMat) and not mMat.flags.writeable):
+        raise Exception('a matrix is generated only once: error!!!')
+    rxcs.console.note('%-42s ok!' % 'a matrix is generated only once:')
+
+    dictCache.get('test', 'mMat', (1, 2.5000001), funcGen)
+    dictCache.get('test', 'mMat2', (1, 2.5), funcGen)
+    if len(lGen) != 3:
+        raise Exception('different matrices are generated: error!!!')
+    rxcs.console.note('%-42s ok!' % 'different matrices are generated:')
+
+    # Dictionary generators with the same parameters
+    for strKind in ['IDFT', 'IDHT']:
+        gen1 = _generator(strKind, 1, '')
+        gen2 = _generator(strKind, 1, '')
+        _checkEqual(gen2.mDict is gen1.mDict, _generator(strKind, 0, '').mDict, gen1.mDict,
+                    '%s, the same matrix:' % strKind)
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2():
+    """
+    The in-process layer limited in bytes: a matrix larger than the limit
+    is not kept.
+    """
+    rxcs.console.module_progress('test (case 2) byte limit of in-process layer')
+    print('')
+    dictCache.clear()
+    dictCache.setSize(16, 1000 * 8)
+    lGen = []
+    funcSmall = _counted(lGen, lambda: np.zeros((10, 100)))
+    funcLarge = _counted(lGen, lambda: np.zeros((10, 101)))
+    for _ in range(2):
+        dictCache.get('test', 'mSmall', (1,), funcSmall)
+        dictCache.get('test', 'mLarge', (1,), funcLarge)
+    dictCache.setSize(16, 2**30)
+    if len(lGen) != 3:
+        raise Exception('a too large matrix is not kept: error!!!')
+    rxcs.console.note('%-42s ok!' % 'a too large matrix is not kept:')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(strDir):
+    """
+    The on-disk layer: matrices stored in the directory are equal to the
+    matrices generated by the generators (also after the in-process layer
+    is cleared), they are read-only memory-mapped arrays. No temporary files
+    are left in the directory. Matrices with a different version of the
+    generator are not reused.
+    """
+    rxcs.console.module_progress('test (case 3) on-disk layer')
+    print('')
+    dictCache.clear(strDir)
+    for strKind in ['IDFT', 'IDHT']:
+        mDictRef = _generator(strKind, 0, '').mDict
+        _generator(strKind, 1, strDir).mDict
+        dictCache.clear()                          # Only the in-process layer is cleared
+        mDict = _generator(strKind, 1, strDir).mDict
+        bMapped = isinstance(mDict, np.memmap) and not mDict.flags.writeable
+        _checkEqual(bMapped, mDictRef, mDict, '%s, a round trip through the disk:' % strKind)
+    if not ((len(_files(strDir, '*.npy')) == 2) and (len(_files(strDir, '*.tmp')) == 0)):
+        raise Exception('files in the directory: error!!!')
+    rxcs.console.note('%-42s ok!' % 'files in the directory:')
+
+    # A matrix stored by an older version of a generator
+    lGen = []
+    funcGen = _counted(lGen, lambda: np.ones((3, 3)))
+    dictCache.get('test', 'mMat', (1,), funcGen, strDir, '1.0')
+    dictCache.clear()
+    dictCache.get('test', 'mMat', (1,), funcGen, strDir, '1.0')
+    dictCache.get('test', 'mMat', (1,), funcGen, strDir, '1.1')
+    if len(lGen) != 2:
+        raise Exception('an older version is not reused: error!!!')
+    rxcs.console.note('%-42s ok!' % 'an older version is not reused:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4(strDir):
+    """
+    Clearing of the cache: the in-process layer and the on-disk layer.
+    """
+    rxcs.console.module_progress('test (case 4) clearing of the cache')
+    print('')
+    lGen = []
+    funcGen = _counted(lGen, lambda: np.ones((3, 3)))
+    dictCache.get('test', 'mMat', (2,), funcGen)
+    dictCache.get('test', 'mMat', (2,), funcGen, strDir)
+    dictCache.clear(strDir)
+    if len(_files(strDir, '*')) != 0:
+        raise Exception('the on-disk layer is cleared: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the on-disk layer is cleared:')
+
+    dictCache.get('test', 'mMat', (2,), funcGen)
+    dictCache.get('test', 'mMat', (2,), funcGen, strDir)
+    if len(lGen) != 4:
+        raise Exception('the in-process layer is cleared: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the in-process layer is cleared:')
+
+
+# =====================================================================
+# Dictionary generator used in the tests
+# =====================================================================
+def _generator(strKind, bCache, strDir):
+    gen = rxcs.cs.dict.IDFT() if strKind == 'IDFT' else rxcs.cs.dict.IDHT()
+    gen.tS = 1e-3         # Time of the dictionary is 1 ms
+    gen.fR = 40e3         # Representation sampling frequency is 40 kHz
+    gen.fDelta = 1e3      # The frequency separation between tones
+    gen.nTones = 12       # The number of tones in the dictionary
+    gen.bFreqSym = 1      # Symmetrical frequency distribution
+    gen.bCache = bCache
+    gen.strCacheDir = strDir
+    gen.bMute = 1
+    gen.run()
+    return gen
+
+
+# =====================================================================
+# Function which generates a matrix and counts the generations
+# =====================================================================
+def _counted(lGen, funcGen):
+    def funcGenCounted():
+        lGen.append(1)
+        return funcGen()
+    return funcGenCounted
+
+
+# =====================================================================
+# Files in the directory
+# =====================================================================
+def _files(strDir, strPattern):
+    return glob.glob(os.path.join(strDir, strPattern))
+
+
+# =====================================================================
+# Check if a matrix is equal to the expected matrix
+# =====================================================================
+def _checkEqual(bOk, mExp, mMat, strName):
+    if bOk and (mExp.shape == mMat.shape) and np.array_equal(mExp, mMat):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _dictCache_test()
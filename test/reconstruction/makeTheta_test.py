@@ -0,0 +1,346 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the Theta matrices generator. |br|
+
+It tests the generator with a number of test cases. In every case random
+observation matrices and random dictionaries (one atom in a column) are
+generated, and Theta matrices are generated by the generator. Products of
+the observation matrices and the dictionaries (np.dot(mPhi, mDict)) are
+treated as the expected Theta matrices. |br|
+
+The following tests are performed:
+
+- if the number of the generated Theta matrices is correct
+  (f.e. one Theta matrix p. dictionary, if one observation matrix is given)?
+
+- if the generated Theta matrices are correct (for a shared observation matrix,
+  a shared dictionary and distinct pairs, also if observation matrices
+  are processed in many batches)?
+
+- if Theta matrices of identical pairs (the same objects) are shared?
+
+- if Theta matrices from nonuniform observation matrices are correct?
+
+- if Theta matrices of sampling patterns (vPattInx) are taken from the cache
+  of Theta matrices (only if the observation matrix is the same), and are
+  computed again after they are evicted from the cache, or after the cache
+  is cleared?
+
+- if different observation matrices with the same index of a sampling pattern
+  are refused?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python makeTheta_test.py`
+
+when in *rxcs/test/reconstruction* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+    1.1  | 19-OCT-2026 : * Tests of the cache of Theta matrices of sampling patterns added. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+def _makeTheta_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Theta matrices generator')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed Theta matrices
+    iTolerance = 1e-9
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3(iTolerance)             # Test case 3
+    _testCase4(iTolerance)             # Test case 4
+    _testCase5(iTolerance)             # Test case 5
+    _testCase6(iTolerance)             # Test case 6
+    _testCase7()                       # Test case 7
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    A shared observation matrix: one observation matrix and a list of
+    dictionaries gives one Theta matrix p. dictionary.
+    """
+    rxcs.console.module_progress('test (case 1) shared observation matrix')
+    print('')
+    mPhi = np.random.randn(20, 100)
+    lDict = [np.random.randn(100, 40) for _ in range(5)]
+    lTheta = _run([mPhi], lDict)
+    _checkTheta(lTheta, [mPhi] * 5, lDict, iTolerance, 'one Theta p. dictionary:')
+
+    lTheta = _run([mPhi], lDict[:1])
+    _checkTheta(lTheta, [mPhi], lDict[:1], iTolerance, 'one observation matrix, one dictionary:')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    A shared dictionary: observation matrices are stacked and multiplied
+    with the dictionary in batches (one batch, many batches, batches of one
+    observation matrix).
+    """
+    rxcs.console.module_progress('test (case 2) shared dictionary')
+    print('')
+    lPhi = [np.random.randn(15 + inxPhi, 80) for inxPhi in range(10)]
+    mDict = np.random.randn(80, 30)
+    for iNBatch in [64, 3, 1]:
+        lTheta = _run(lPhi, [mDict], iNBatch=iNBatch)
+        _checkTheta(lTheta, lPhi, [mDict] * 10, iTolerance, 'shared dictionary (iNBatch = %d):' % iNBatch)
+
+    # Complex dictionary
+    mDict = mDict + 1j * np.random.randn(80, 30)
+    lTheta = _run(lPhi, [mDict], iNBatch=4)
+    _checkTheta(lTheta, lPhi, [mDict] * 10, iTolerance, 'shared complex dictionary:')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(iTolerance):
+    """
+    Distinct pairs and identical pairs: the Theta matrix of identical
+    pairs (the same objects) is computed once and shared by reference.
+    """
+    rxcs.console.module_progress('test (case 3) distinct and identical pairs')
+    print('')
+    lPhi = [np.random.randn(10, 50) for _ in range(4)]
+    lDict = [np.random.randn(50, 25) for _ in range(4)]
+    lTheta = _run(lPhi, lDict, iNBatch=2)
+    _checkTheta(lTheta, lPhi, lDict, iTolerance, 'distinct pairs:')
+
+    # Pairs: (0, 0), (1, 1), (0, 0), (0, 1), (1, 1), (0, 0)
+    vInxPhi = [0, 1, 0, 0, 1, 0]
+    vInxDict = [0, 1, 0, 1, 1, 0]
+    lPhiP = [lPhi[inx] for inx in vInxPhi]
+    lDictP = [lDict[inx] for inx in vInxDict]
+    lTheta = _run(lPhiP, lDictP, iNBatch=2)
+    _checkTheta(lTheta, lPhiP, lDictP, iTolerance, 'identical pairs:')
+    bOk = (lTheta[2] is lTheta[0]) and (lTheta[5] is lTheta[0]) and (lTheta[4] is lTheta[1])
+    bOk = bOk and (lTheta[3] is not lTheta[0]) and (lTheta[3] is not lTheta[1])
+    if not bOk:
+        raise Exception('Theta of identical pairs is shared: error!!!')
+    rxcs.console.note('%-42s ok!' % 'Theta of identical pairs is shared:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4(iTolerance):
+    """
+    Nonuniform observation matrices (selections of samples): a shared
+    observation matrix, a shared dictionary, distinct pairs, batches smaller
+    than the number of pairs.
+    """
+    rxcs.console.module_progress('test (case 4) nonuniform observation matrices')
+    print('')
+    lPhi = [_selection(100, 20) for _ in range(6)]
+    lDict = [np.random.randn(100, 40) for _ in range(6)]
+    lTheta = _run(lPhi[:1], lDict, bNonuniform=1)
+    _checkTheta(lTheta, lPhi[:1] * 6, lDict, iTolerance, 'nonuniform, shared observation matrix:')
+
+    lTheta = _run(lPhi, lDict[:1], bNonuniform=1, iNBatch=4)
+    _checkTheta(lTheta, lPhi, lDict[:1] * 6, iTolerance, 'nonuniform, shared dictionary:')
+
+    lTheta = _run(lPhi, lDict, bNonuniform=1, iNBatch=4)
+    _checkTheta(lTheta, lPhi, lDict, iTolerance, 'nonuniform, distinct pairs:')
+
+
+# =====================================================================
+# Test case # 5
+# =====================================================================
+def _testCase5(iTolerance):
+    """
+    Cache of Theta matrices of sampling patterns: Theta matrices are computed
+    once p. pattern, and are taken from the cache in the next run (also if
+    the observation matrices are equal copies). A pattern with a changed
+    observation matrix is computed again.
+    """
+    rxcs.console.module_progress('test (case 5) cache of Theta matrices')
+    print('')
+    theta = rxcs.cs.makeTheta()
+    lBank = [np.random.randn(12, 60) for _ in range(4)]     # Bank of sampling patterns
+    mDict = np.random.randn(60, 30)
+    vPattInx = np.array([2, 0, 2, 3, 0, 2])
+    lPhi = [lBank[inx] for inx in vPattInx]
+    lTheta = _run(lPhi, [mDict], theta=theta, vPattInx=vPattInx)
+    _checkTheta(lTheta, lPhi, [mDict] * 6, iTolerance, 'Theta of sampling patterns:')
+    if not ((lTheta[2] is lTheta[0]) and (lTheta[5] is lTheta[0]) and (lTheta[4] is lTheta[1]) and
+            (len(theta.cacheTheta) == 3)):
+        raise Exception('Theta computed once p. pattern: error!!!')
+    rxcs.console.note('%-42s ok!' % 'Theta computed once p. pattern:')
+
+    # The next run: Theta matrices are taken from the cache (equal copies of observation matrices)
+    vPattInx2 = np.array([3, 0, 2])
+    lPhi2 = [lBank[inx].copy() for inx in vPattInx2]
+    lTheta2 = _run(lPhi2, [mDict], theta=theta, vPattInx=vPattInx2)
+    _checkTheta(lTheta2, lPhi2, [mDict] * 3, iTolerance, 'Theta from the cache:')
+    if not ((lTheta2[0] is lTheta[3]) and (lTheta2[1] is lTheta[1]) and (lTheta2[2] is lTheta[0])):
+        raise Exception('cache hit: error!!!')
+    rxcs.console.note('%-42s ok!' % 'cache hit:')
+
+    # The bank of sampling patterns is changed: pattern #0 is computed again
+    lPhi3 = [np.random.randn(12, 60), lBank[2]]
+    lTheta3 = _run(lPhi3, [mDict], theta=theta, vPattInx=np.array([0, 2]))
+    _checkTheta(lTheta3, lPhi3, [mDict] * 2, iTolerance, 'changed pattern, Theta:')
+    if not ((lTheta3[0] is not lTheta[1]) and (lTheta3[1] is lTheta[0])):
+        raise Exception('changed pattern is computed again: error!!!')
+    rxcs.console.note('%-42s ok!' % 'changed pattern is computed again:')
+
+    # Another dictionary: Theta matrices are computed again
+    mDict2 = np.random.randn(60, 30)
+    lTheta4 = _run([lBank[2]], [mDict2], theta=theta, vPattInx=np.array([2]))
+    _checkTheta(lTheta4, [lBank[2]], [mDict2], iTolerance, 'another dictionary, Theta:')
+    if lTheta4[0] is lTheta[0]:
+        raise Exception('another dictionary is computed again: error!!!')
+
+
+# =====================================================================
+# Test case # 6
+# =====================================================================
+def _testCase6(iTolerance):
+    """
+    Cache of Theta matrices smaller than the number of sampling patterns:
+    evicted Theta matrices are computed again. Cleared cache: all the Theta
+    matrices are computed again.
+    """
+    rxcs.console.module_progress('test (case 6) eviction and clearing of the cache')
+    print('')
+    theta = rxcs.cs.makeTheta()
+    lBank = [np.random.randn(8, 40) for _ in range(4)]
+    mDict = np.random.randn(40, 20)
+    vPattInx = np.arange(4)
+    lTheta = _run(lBank, [mDict], theta=theta, vPattInx=vPattInx, iNCache=2)
+    if len(theta.cacheTheta) != 2:
+        raise Exception('the size of the cache: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the size of the cache:')
+
+    # Patterns #2 and #3 are in the cache, patterns #0 and #1 were evicted
+    lTheta2 = _run(lBank, [mDict], theta=theta, vPattInx=vPattInx, iNCache=2)
+    _checkTheta(lTheta2, lBank, [mDict] * 4, iTolerance, 'eviction, Theta:')
+    bOk = (lTheta2[2] is lTheta[2]) and (lTheta2[3] is lTheta[3])
+    bOk = bOk and (lTheta2[0] is not lTheta[0]) and (lTheta2[1] is not lTheta[1])
+    if not bOk:
+        raise Exception('evicted patterns are computed again: error!!!')
+    rxcs.console.note('%-42s ok!' % 'evicted patterns are computed again:')
+
+    # Cleared cache
+    theta.clearCache()
+    if len(theta.cacheTheta) != 0:
+        raise Exception('the cache is cleared: error!!!')
+    lTheta3 = _run(lBank[2:], [mDict], theta=theta, vPattInx=vPattInx[2:], iNCache=2)
+    _checkTheta(lTheta3, lBank[2:], [mDict] * 2, iTolerance, 'cleared cache, Theta:')
+    if (lTheta3[0] is lTheta2[2]) or (lTheta3[1] is lTheta2[3]):
+        raise Exception('the cache is cleared: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the cache is cleared:')
+
+
+# =====================================================================
+# Test case # 7
+# =====================================================================
+def _testCase7():
+    """
+    Different observation matrices with the same index of a sampling pattern
+    in one run are refused. The number of indices of sampling patterns must
+    be equal to the number of Theta matrices.
+    """
+    rxcs.console.module_progress('test (case 7) wrong indices of sampling patterns')
+    print('')
+    lPhi = [np.random.randn(8, 40) for _ in range(3)]
+    mDict = np.random.randn(40, 20)
+    _checkRefused(lambda: _run(lPhi, [mDict], vPattInx=np.array([0, 1, 0])),
+                  'the same index, different patterns:')
+    _checkRefused(lambda: _run(lPhi, [mDict], vPattInx=np.array([0, 1])),
+                  'wrong number of indices:')
+
+
+# =====================================================================
+# Run the Theta matrices generator
+# =====================================================================
+def _run(lPhi, lDict, theta=None, **dParam):
+    """
+    This function runs the Theta matrices generator with the given
+    observation matrices, dictionaries and optional parameters
+    (a new generator is used, if a generator is not given).
+    """
+    if theta is None:
+        theta = rxcs.cs.makeTheta()
+    theta.lPhi = lPhi
+    theta.lDict = lDict
+    for (strName, value) in dParam.items():
+        theta.__dict__[strName] = value
+    theta.bMute = 1
+    theta.run()
+    return theta.lTheta
+
+
+# =====================================================================
+# Random nonuniform observation matrix (a selection of samples)
+# =====================================================================
+def _selection(nSamp, nObSamp):
+    vInx = np.sort(np.random.permutation(nSamp)[:nObSamp])
+    mPhi = np.zeros((nObSamp, nSamp))
+    mPhi[np.arange(nObSamp), vInx] = 1
+    return mPhi
+
+
+# =====================================================================
+# Check the Theta matrices
+# =====================================================================
+def _checkTheta(lTheta, lPhi, lDict, iTolerance, strName):
+    """
+    This function checks if the Theta matrices are equal to the products
+    of the observation matrices and the dictionaries.
+    """
+    bOk = (len(lTheta) == len(lPhi))
+    for (mTheta, mPhi, mDict) in zip(lTheta, lPhi, lDict):
+        mThetaRef = np.dot(mPhi, mDict)
+        bOk = bOk and (mTheta.shape == mThetaRef.shape) and (np.max(np.abs(mTheta - mThetaRef)) <= iTolerance)
+    if not bOk:
+        raise Exception('%s error!!!' % strName)
+    rxcs.console.note('%-42s ok!' % strName)
+    return
+
+
+# =====================================================================
+# Check if a wrong usage is refused
+# =====================================================================
+def _checkRefused(funcWrong, strName):
+    try:
+        funcWrong()
+    except ValueError:
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _makeTheta_test()
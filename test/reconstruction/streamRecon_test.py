@@ -0,0 +1,344 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the sliding-window streaming reconstruction. |br|
+
+It tests the streaming reconstruction with a number of test cases. In every
+case a long multitone signal (tones on the grid of the dictionary) is
+generated and nonuniformly sampled, then the signal is reconstructed window
+by window. |br|
+
+The following tests are performed:
+
+- if the signal captured over many windows is reconstructed with SNR above
+  the threshold (with and without overlap of windows)?
+
+- if the reconstructed signal is composed correctly from the reconstructed
+  windows (blocks, cross-fade of the overlapping parts of windows)?
+
+- if coefficients found in a window are used as a warm start of the
+  reconstruction of the next window?
+
+- if the signal given by 'run' is equal to the concatenated blocks given
+  by the 'blocks' generator?
+
+- if a window without observed samples is synthesized from the coefficients
+  of the previous window (or is zero, if there is no previous window)?
+
+- if unsorted indices of observed samples are refused?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python streamRecon_test.py`
+
+when in *rxcs/test/reconstruction* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+# Settings of the tests
+_TIME = 2e-3       # Time of the signal is 2 ms
+_FSMP = 1e6        # Signal representation sampling frequency 1 MHz
+_TWIN = 400e-6     # Time of a reconstruction window is 400 us
+_DELTA = 5e3       # Tone separation is 5 kHz
+_NTONES = 20       # The number of tones in the dictionary (up to 100 kHz)
+_FSAMP = 100e3     # The average sampling frequency is 100 kHz
+
+# SNR threshold of the reconstruction [dB]
+_SNR = 25
+
+
+def _streamRecon_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Sliding-window streaming reconstruction')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+    _testCase1()                       # Test case 1
+    _testCase2()                       # Test case 2
+    _testCase3()                       # Test case 3
+    _testCase4()                       # Test case 4
+    _testCase5()                       # Test case 5
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1():
+    """
+    A multitone signal captured over many overlapping windows: SNR of the
+    reconstruction, composition of the signal from the windows (cross-fade),
+    warm start.
+    """
+    tStart = rxcs.console.module_progress('test (case 1) overlapping windows')
+    (vSig, vObSig, vPattRep) = _genSignal(3)
+    recon = _recon(vObSig, vPattRep, _TWIN / 4)
+    (lWins, lInit, lCoeff) = _record(recon)
+    recon.run()
+    rxcs.console.progress_doneNL(tStart)
+
+    _checkSNR(recon.vSig, vSig, 'overlapping windows, SNR:')
+    if not ((recon.nWin == 7) and (len(lWins) == 7) and (recon.vSig.size == vSig.size)):
+        raise Exception('the number of windows: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the number of windows:')
+
+    # Compose the signal from the windows (linear cross-fade of the overlaps)
+    _checkEqual(recon.vSig, _compose(lWins, recon.nSmpH, recon.nSmpO, vSig.size), 'cross-fade of windows:')
+
+    # Coefficients of a window are the warm start of the next window
+    bOk = (not isinstance(lInit[0], list))
+    for inxWin in range(1, len(lInit)):
+        bOk = bOk and isinstance(lInit[inxWin], list) and np.array_equal(lInit[inxWin][0], lCoeff[inxWin - 1])
+    if not bOk:
+        raise Exception('warm start: error!!!')
+    rxcs.console.note('%-42s ok!' % 'warm start:')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2():
+    """
+    The signal given by 'run' and the blocks given by 'blocks'.
+    """
+    tStart = rxcs.console.module_progress('test (case 2) run vs blocks')
+    (vSig, vObSig, vPattRep) = _genSignal(2)
+    recon = _recon(vObSig, vPattRep, _TWIN / 4)
+    recon.run()
+    recon2 = _recon(vObSig, vPattRep, _TWIN / 4)
+    lBlocks = [vBlock.copy() for vBlock in recon2.blocks()]
+    rxcs.console.progress_doneNL(tStart)
+
+    vSizes = np.array([vBlock.size for vBlock in lBlocks])
+    bOk = np.all(vSizes[:-1] == recon2.nSmpH) and (vSizes.sum() == vSig.size)
+    if not bOk:
+        raise Exception('sizes of blocks: error!!!')
+    rxcs.console.note('%-42s ok!' % 'sizes of blocks:')
+    _checkEqual(recon.vSig, np.hstack(lBlocks), 'run is equal to blocks:')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3():
+    """
+    Windows without overlap (tOverlap = 0).
+    """
+    tStart = rxcs.console.module_progress('test (case 3) no overlap')
+    (vSig, vObSig, vPattRep) = _genSignal(3)
+    recon = _recon(vObSig, vPattRep, 0)
+    (lWins, _, _) = _record(recon)
+    recon.run()
+    rxcs.console.progress_doneNL(tStart)
+
+    _checkSNR(recon.vSig, vSig, 'no overlap, SNR:')
+    if not ((recon.nWin == 5) and (recon.nSmpH == recon.nSmpW)):
+        raise Exception('no overlap, the number of windows: error!!!')
+    _checkEqual(recon.vSig, np.hstack(lWins)[:vSig.size], 'no overlap, windows:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4():
+    """
+    Windows without observed samples: the first window (zero signal),
+    and a window in the middle of the signal (the coefficients of the
+    previous window are used).
+    """
+    tStart = rxcs.console.module_progress('test (case 4) windows without samples')
+    (vSig, vObSig, vPattRep) = _genSignal(4)
+    nSmpW = int(round(_TWIN * _FSMP))
+
+    # No observed samples in window #3 (windows do not overlap)
+    vKeep = (vPattRep < 2 * nSmpW) | (vPattRep >= 3 * nSmpW)
+    recon = _recon(vObSig[vKeep], vPattRep[vKeep], 0)
+    (lWins, _, lCoeff) = _record(recon)
+    recon.run()
+
+    # No observed samples in the first window
+    vKeep = (vPattRep >= nSmpW)
+    recon2 = _recon(vObSig[vKeep], vPattRep[vKeep], 0)
+    recon2.run()
+    rxcs.console.progress_doneNL(tStart)
+
+    # The gap is filled with the signal synthesized from the coefficients of window #2
+    vGap = slice(2 * nSmpW, 3 * nSmpW)
+    _checkSNR(recon.vSig[vGap], vSig[vGap], 'window without samples, SNR:')
+    if not ((len(lCoeff) == 4) and (lWins[2].size == nSmpW)):
+        raise Exception('window without samples is skipped: error!!!')
+    rxcs.console.note('%-42s ok!' % 'window without samples is skipped:')
+
+    # The first window without samples is zero
+    if not np.all(recon2.vSig[:nSmpW] == 0):
+        raise Exception('first window without samples: error!!!')
+    rxcs.console.note('%-42s ok!' % 'first window without samples:')
+    _checkSNR(recon2.vSig[nSmpW:], vSig[nSmpW:], 'first window without samples, SNR:')
+
+
+# =====================================================================
+# Test case # 5
+# =====================================================================
+def _testCase5():
+    """
+    Unsorted (or repeated) indices of observed samples are refused.
+    """
+    rxcs.console.module_progress('test (case 5) unsorted indices')
+    print('')
+    (_, vObSig, vPattRep) = _genSignal(5)
+    vPattUnsorted = vPattRep.copy()
+    vPattUnsorted[[3, 4]] = vPattUnsorted[[4, 3]]
+    vPattRepeated = vPattRep.copy()
+    vPattRepeated[4] = vPattRepeated[3]
+    for (vPatt, strName) in [(vPattUnsorted, 'unsorted indices are refused:'),
+                             (vPattRepeated, 'repeated indices are refused:')]:
+        recon = _recon(vObSig, vPatt, _TWIN / 4)
+        try:
+            recon.run()
+        except ValueError:
+            rxcs.console.note('%-42s ok!' % strName)
+        else:
+            raise Exception('%s error!!!' % strName)
+
+
+# =====================================================================
+# Generate and sample the signal
+# =====================================================================
+def _genSignal(iSeed):
+    """
+    This function generates a multitone signal (tones on the grid of the
+    dictionary) and samples it at random points of the representation
+    sampling grid.
+
+    Args:
+        iSeed (int):   seed of the random numbers
+
+    Returns:
+        vSig (Numpy array 1D):      the signal
+        vObSig (Numpy array 1D):    observed samples
+        vPattRep (Numpy array 1D):  indices of observed samples
+    """
+    randState = np.random.RandomState(iSeed)
+    nSmp = int(round(_TIME * _FSMP))
+    vT = np.arange(nSmp) / _FSMP
+    vF = _DELTA * (1 + randState.permutation(_NTONES)[:3])
+    vSig = np.zeros(nSmp)
+    for fTone in vF:
+        vSig += randState.rand() * np.cos(2 * np.pi * fTone * vT + 2 * np.pi * randState.rand())
+    nObSmp = int(round(_TIME * _FSAMP))
+    vPattRep = np.sort(randState.permutation(nSmp)[:nObSmp])
+    return (vSig, vSig[vPattRep], vPattRep)
+
+
+# =====================================================================
+# Streaming reconstruction used in the tests
+# =====================================================================
+def _recon(vObSig, vPattRep, tOverlap):
+    recon = rxcs.cs.streamRecon()
+    recon.vObSig = vObSig          # The observed signal
+    recon.vPattRep = vPattRep      # Indices of the observed samples
+    recon.fR = _FSMP               # The signal representation sampling frequency
+    recon.tW = _TWIN               # Time of a window
+    recon.tOverlap = tOverlap      # Time of overlap of windows
+    recon.fDelta = _DELTA          # The frequency separation between tones
+    recon.nTones = _NTONES         # The number of tones in the dictionary
+    recon.tS = _TIME               # Time of the signal
+    recon.bMute = 1
+    return recon
+
+
+# =====================================================================
+# Record the reconstructed windows and the warm starts
+# =====================================================================
+def _record(recon):
+    """
+    This function wraps the reconstruction of a single window and the L1
+    solver of the streaming reconstruction, so that the reconstructed windows
+    (before the cross-fade), the warm starts and the found coefficients
+    are recorded.
+    """
+    lWins = []
+    lInit = []
+    lCoeff = []
+    funcRecon1win = recon._recon1win
+    funcL1run = recon.L1solv.run
+
+    def _recon1win(inxStart):
+        vSigW = funcRecon1win(inxStart)
+        lWins.append(vSigW.copy())
+        return vSigW
+
+    def _L1run():
+        lInit.append(recon.L1solv.lCoeffInit)
+        dOut = funcL1run()
+        lCoeff.append(recon.L1solv.lCoeff[0].copy())
+        return dOut
+
+    recon._recon1win = _recon1win
+    recon.L1solv.run = _L1run
+    return (lWins, lInit, lCoeff)
+
+
+# =====================================================================
+# Compose the signal from the windows
+# =====================================================================
+def _compose(lWins, nSmpH, nSmpO, nSmp):
+    """
+    This function composes the signal from the reconstructed windows,
+    the overlapping parts of windows are linearly cross-faded.
+    """
+    vSig = np.zeros((len(lWins) - 1) * nSmpH + lWins[0].size)
+    vFadeIn = (np.arange(nSmpO) + 0.5) / nSmpO
+    for (inxWin, vSigW) in enumerate(lWins):
+        inxStart = inxWin * nSmpH
+        vSigW = vSigW.copy()
+        if inxWin > 0:
+            vSigW[:nSmpO] = vSig[inxStart:inxStart + nSmpO] * (1 - vFadeIn) + vSigW[:nSmpO] * vFadeIn
+        vSig[inxStart:inxStart + vSigW.size] = vSigW
+    return vSig[:nSmp]
+
+
+# =====================================================================
+# Check the SNR of the reconstruction
+# =====================================================================
+def _checkSNR(vSigRecon, vSig, strName):
+    iSNR = 10 * np.log10(np.sum(vSig**2) / np.sum((vSigRecon - vSig)**2))
+    if not (iSNR > _SNR):
+        raise Exception('%s error (SNR = %.1f dB)!!!' % (strName, iSNR))
+    rxcs.console.note('%-42s ok! (%.1f dB)' % (strName, iSNR))
+    return
+
+
+# =====================================================================
+# Check if two signals are equal
+# =====================================================================
+def _checkEqual(vX, vY, strName):
+    if (vX.shape == vY.shape) and (np.max(np.abs(vX - vY)) <= 1e-12):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _streamRecon_test()
@@ -0,0 +1,253 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the composed Theta operator. |br|
+
+It tests the operator with a number of test cases. In every case an
+observation matrix (a dense observation matrix, or a selection of samples
+in case of nonuniform sampling) is composed with a dictionary (a Numpy array,
+a band-restricted sub-dictionary given by 'freqBands' or an FFT-backed
+dictionary operator given by 'fftOperator' of the IDFT dictionary generator).
+The dense Theta matrix computed as a product of the observation matrix and
+the dictionary matrix is treated as the expected Theta matrix. |br|
+
+The following tests are performed:
+
+- if the shape of the operator is correct?
+
+- if the materialized operator (toarray) is equal to the Theta matrix?
+
+- if products with the operator (matvec) and with its conjugate transpose
+  (rmatvec) are equal to products with the Theta matrix (for vectors
+  and matrices)?
+
+- if an operator with a subset of columns (cols) is correct?
+
+- if the Theta matrix generator gives correct operators (bOperator)?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python thetaOp_test.py`
+
+when in *rxcs/test/reconstruction* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+def _thetaOp_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Composed Theta operator')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed products
+    iTolerance = 1e-9
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3(iTolerance)             # Test case 3
+    _testCase4(iTolerance)             # Test case 4
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    A dictionary given as a Numpy array: a dense observation matrix and
+    a selection of samples.
+    """
+    rxcs.console.module_progress('test (case 1) dictionary matrix')
+    print('')
+    IDFT = _generator(0)
+    mDict = IDFT.mDict.T
+    _checkOperator(np.random.randn(15, 40), mDict, mDict, 0, iTolerance, 'matrix')
+    _checkOperator(_selection(40, 15), mDict, mDict, 1, iTolerance, 'matrix, nonuniform')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    A band-restricted sub-dictionary (two frequency bands).
+    """
+    rxcs.console.module_progress('test (case 2) sub-dictionary')
+    print('')
+    IDFT = _generator(0)
+    subDict = IDFT.freqBands([(2e3, 4e3), (8e3, 10e3)]).T
+    mDict = subDict.toarray()
+    _checkOperator(np.random.randn(15, 40), subDict, mDict, 0, iTolerance, 'sub-dict.')
+    _checkOperator(_selection(40, 15), subDict, mDict, 1, iTolerance, 'sub-dict., nonuniform')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(iTolerance):
+    """
+    An FFT-backed dictionary operator (the dictionary starts at tStart > 0).
+    """
+    rxcs.console.module_progress('test (case 3) FFT-backed dictionary')
+    print('')
+    IDFT = _generator(0.25e-3)
+    fftDict = IDFT.fftOperator().T
+    mDict = IDFT.mDict.T
+    _checkEqual(fftDict.toarray(), mDict, iTolerance, 'FFT-backed dictionary:')
+    _checkOperator(np.random.randn(15, 40), fftDict, mDict, 0, iTolerance, 'FFT')
+    _checkOperator(_selection(40, 15), fftDict, mDict, 1, iTolerance, 'FFT, nonuniform')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4(iTolerance):
+    """
+    Operators given by the Theta matrix generator (bOperator).
+    """
+    rxcs.console.module_progress('test (case 4) operators of makeTheta')
+    print('')
+    IDFT = _generator(0)
+    lDict = [IDFT.mDict.T, IDFT.freqBands((2e3, 6e3)).T, IDFT.fftOperator().T]
+    lPhi = [_selection(40, 12) for _ in range(3)]
+    theta = rxcs.cs.makeTheta()
+    theta.lPhi = lPhi
+    theta.lDict = lDict
+    theta.bNonuniform = 1
+    theta.bOperator = 1
+    theta.bMute = 1
+    theta.run()
+    bOk = all([isinstance(opTheta, rxcs.cs.thetaOp) for opTheta in theta.lTheta])
+    for (opTheta, mPhi, mDict) in zip(theta.lTheta, lPhi, lDict):
+        mDict = mDict if isinstance(mDict, np.ndarray) else mDict.toarray()
+        bOk = bOk and _isclose(opTheta.toarray(), np.dot(mPhi, mDict), iTolerance)
+    if not bOk:
+        raise Exception('operators of makeTheta: error!!!')
+    rxcs.console.note('%-42s ok!' % 'operators of makeTheta:')
+
+
+# =====================================================================
+# Check the operator
+# =====================================================================
+def _checkOperator(mPhi, dictOp, mDict, bNonuniform, iTolerance, strName):
+    """
+    This function checks a Theta operator composed of an observation matrix
+    and a dictionary against the dense Theta matrix.
+
+    Args:
+        mPhi (Numpy array 2D):    the observation matrix
+        dictOp:                   the dictionary given to the operator
+        mDict (Numpy array 2D):   the dictionary matrix
+        bNonuniform (int):        the observation matrix is a selection of samples
+        iTolerance (float):       maximum tolerance of a difference between an
+                                  expected value and a real value
+        strName (string):         name of the case
+
+    Returns:
+        nothing
+    """
+    mTheta = np.dot(mPhi, mDict)
+    opTheta = rxcs.cs.thetaOp(mPhi, dictOp, bNonuniform)
+    _checkProducts(opTheta, mTheta, iTolerance, strName)
+
+    # Operators with subsets of columns (also a subset of a subset)
+    nCols = mTheta.shape[1]
+    vInx = np.random.permutation(nCols)[:int(nCols / 2)]
+    opThetaC = opTheta.cols(vInx)
+    _checkProducts(opThetaC, mTheta[:, vInx], iTolerance, strName + ', cols')
+    _checkProducts(opThetaC.cols([0, 2]), mTheta[:, vInx[[0, 2]]], iTolerance, strName + ', cols of cols')
+    return
+
+
+# =====================================================================
+# Check the products with the operator
+# =====================================================================
+def _checkProducts(opTheta, mTheta, iTolerance, strName):
+    """
+    This function checks the shape of the operator, the materialized operator
+    and the products with the operator and with its conjugate transpose.
+    """
+    (nRows, nCols) = mTheta.shape
+    vX = np.random.randn(nCols) + 1j * np.random.randn(nCols)
+    mX = np.random.randn(nCols, 3) + 1j * np.random.randn(nCols, 3)
+    vY = np.random.randn(nRows) + 1j * np.random.randn(nRows)
+    mY = np.random.randn(nRows, 3) + 1j * np.random.randn(nRows, 3)
+
+    bOk = (opTheta.shape == mTheta.shape) and _isclose(opTheta.toarray(), mTheta, iTolerance)
+    bOk = bOk and _isclose(opTheta.matvec(vX), np.dot(mTheta, vX), iTolerance)
+    bOk = bOk and _isclose(opTheta.matvec(mX), np.dot(mTheta, mX), iTolerance)
+    bOk = bOk and _isclose(opTheta.rmatvec(vY), np.dot(mTheta.conj().T, vY), iTolerance)
+    bOk = bOk and _isclose(opTheta.rmatvec(mY), np.dot(mTheta.conj().T, mY), iTolerance)
+    if not bOk:
+        raise Exception('%s: error!!!' % strName)
+    rxcs.console.note('%-42s ok!' % (strName + ':'))
+    return
+
+
+# =====================================================================
+# IDFT dictionary generator used in the tests
+# =====================================================================
+def _generator(tStart):
+    IDFT = rxcs.cs.dict.IDFT()
+    IDFT.tS = 1e-3         # Time of the dictionary is 1 ms
+    IDFT.fR = 40e3         # Representation sampling frequency is 40 kHz
+    IDFT.fDelta = 1e3      # The frequency separation between tones
+    IDFT.nTones = 12       # The number of tones in the dictionary
+    IDFT.tStart = tStart   # The time shift of the starting time point
+    IDFT.bMute = 1
+    IDFT.run()
+    return IDFT
+
+
+# =====================================================================
+# Random nonuniform observation matrix (a selection of samples)
+# =====================================================================
+def _selection(nSamp, nObSamp):
+    vInx = np.sort(np.random.permutation(nSamp)[:nObSamp])
+    mPhi = np.zeros((nObSamp, nSamp))
+    mPhi[np.arange(nObSamp), vInx] = 1
+    return mPhi
+
+
+# =====================================================================
+# Check if two matrices are equal (up to the given margin)
+# =====================================================================
+def _checkEqual(mX, mY, iTolerance, strName):
+    if _isclose(mX, mY, iTolerance):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two matrices.
+# The function allows for a very small error margin
+# =====================================================================
+def _isclose(mX, mY, iTolerance):
+    return (np.shape(mX) == np.shape(mY)) and (np.max(np.abs(mX - mY)) <= iTolerance)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _thetaOp_test()
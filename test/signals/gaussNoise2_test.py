@@ -0,0 +1,177 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the frequency domain synthesis engine
+(strEngine = 'fft') of the random gaussian noise generator (type 2). |br|
+
+It tests the engine with a number of test cases. In every case signals are
+generated and their spectra are computed with the real FFT. |br|
+
+The following tests are performed:
+
+- if the spectra of the signals are zero outside the band [fMin, fMax],
+  and non-zero within the band (for an even and an odd number of samples,
+  with and without the minimum frequency, for a band with the DC and
+  the Nyquist frequency)?
+
+- if the power of the signals is exactly equal to the requested power?
+
+- if the signals are reproducible with the same seed of the stream of
+  random numbers, and differ for different seeds?
+
+- if a band without FFT bins is refused?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python gaussNoise2_test.py`
+
+when in *rxcs/test/signals* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+
+
+def _gaussNoise2_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Random gaussian noise generator (type 2), FFT engine')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed values (relative)
+    iTolerance = 1e-12
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3()                       # Test case 3
+    _testCase4()                       # Test case 4
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    Spectra of the signals within and outside the band.
+    """
+    rxcs.console.module_progress('test (case 1) band of the signals')
+    print('')
+    for (tS, dBand, strName) in [(1e-3, {'fMin': 10e3, 'fMax': 30e3}, 'band, even'),
+                                 (1.01e-3, {'fMin': 10.5e3, 'fMax': 29.5e3}, 'band, odd'),
+                                 (1e-3, {'fMax': 30e3}, 'low-pass, even'),
+                                 (1.01e-3, {'fMax': 30e3}, 'low-pass, odd'),
+                                 (1e-3, {'fMin': 30e3, 'fMax': 50e3}, 'band up to Nyquist'),
+                                 (1e-3, {}, 'whole spectrum')]:
+        gen = _generator(tS, dBand, 1)
+        mSpec = np.fft.rfft(gen.mSig, axis=1)
+        vF = np.arange(mSpec.shape[1]) * gen.fR / gen.nSmp
+        vBand = (vF >= dBand.get('fMin', 0)) & (vF <= dBand.get('fMax', gen.fR / 2))
+        iMax = np.max(np.abs(mSpec))
+        bOk = np.all(np.abs(mSpec[:, ~vBand]) <= iTolerance * iMax * gen.nSmp)
+        bOk = bOk and np.all(np.abs(mSpec[:, vBand]) > 0) and (gen.mSig.shape == (gen.nSigs, gen.nSmp))
+        if not bOk:
+            raise Exception('%s: error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % ('%s:' % strName))
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    Power of the signals.
+    """
+    rxcs.console.module_progress('test (case 2) power of the signals')
+    print('')
+    for (tS, dBand, iP) in [(1e-3, {'fMin': 10e3, 'fMax': 30e3}, 1),
+                            (1.01e-3, {'fMax': 30e3}, 2.5),
+                            (1e-3, {}, 0.01),
+                            (1e-3, {'fMin': 20e3, 'fMax': 21e3}, 4)]:
+        gen = _generator(tS, dBand, 1)
+        gen.iP = iP
+        gen.run()
+        vP = np.mean(gen.mSig**2, axis=1)
+        bOk = np.all(np.abs(vP / iP - 1) <= iTolerance * gen.nSmp) and np.all(gen.vP == iP)
+        strName = 'power %.2f, %d samples:' % (iP, gen.nSmp)
+        if not bOk:
+            raise Exception('%s error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % strName)
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3():
+    """
+    Reproducibility of the signals (seed of the stream of random numbers).
+    """
+    rxcs.console.module_progress('test (case 3) seed of random numbers')
+    print('')
+    dBand = {'fMin': 10e3, 'fMax': 30e3}
+    mSig = _generator(1e-3, dBand, 7).mSig
+    mSig2 = _generator(1e-3, dBand, 7).mSig
+    mSig3 = _generator(1e-3, dBand, 8).mSig
+    mSig4 = _generator(1e-3, dBand, (7, 1)).mSig
+    if not np.array_equal(mSig, mSig2):
+        raise Exception('the same seed, the same signals: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the same seed, the same signals:')
+    if np.any(mSig == mSig3) or np.any(mSig == mSig4):
+        raise Exception('different seeds, different signals: error!!!')
+    rxcs.console.note('%-42s ok!' % 'different seeds, different signals:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4():
+    """
+    A band without FFT bins is refused.
+    """
+    rxcs.console.module_progress('test (case 4) band without FFT bins')
+    print('')
+    try:
+        _generator(1e-3, {'fMin': 10.2e3, 'fMax': 10.7e3}, 1)
+    except ValueError:
+        rxcs.console.note('%-42s ok!' % 'band without FFT bins is refused:')
+    else:
+        raise Exception('band without FFT bins is refused: error!!!')
+
+
+# =====================================================================
+# Gaussian noise generator used in the tests
+# =====================================================================
+def _generator(tS, dBand, iSeed):
+    gen = rxcs.sig.gaussNoise2()
+    gen.tS = tS             # Time of the signals
+    gen.fR = 100e3          # Representation sampling frequency is 100 kHz
+    gen.nSigs = 5           # The number of signals
+    gen.iSeed = iSeed       # Seed of the stream of random numbers
+    gen.strEngine = 'fft'   # Frequency domain synthesis
+    for (strParam, value) in dBand.items():
+        setattr(gen, strParam, value)
+    gen.bMute = 1
+    gen.run()
+    return gen
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _gaussNoise2_test()
@@ -0,0 +1,215 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the random gaussian noise generator. |br|
+
+It tests the generator with a number of test cases. In every case signals
+are generated in time blocks (the 'blocks' method). The white noise drawn from
+the same stream of random numbers, filtered at once over the whole signals
+(one 'scipy.signal.sosfilt') and adjusted with the expected power of the
+filtered noise is treated as the expected signals. |br|
+
+The following tests are performed:
+
+- if the signals generated in blocks are equal to the signals filtered at
+  once (the state of the filter is carried from block to block), for
+  low-pass, high-pass, band-pass filters and no filter, for any size of
+  a block?
+
+- if the expected power of the filtered noise ('_noiseGain') is equal to the
+  power of the impulse response of the filter, and the signals generated
+  in blocks have the requested power?
+
+- if the designs of filters are taken from the cache (the same read-only
+  second-order sections for equal parameters of the filter), and the
+  designs are equal to the designs of 'scipy.signal.iirfilter'?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python gaussNoise_test.py`
+
+when in *rxcs/test/signals* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import scipy.signal as scsig
+import rxcs
+
+
+def _gaussNoise_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Random gaussian noise generator')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed signals
+    iTolerance = 1e-12
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2()                       # Test case 2
+    _testCase3()                       # Test case 3
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    Signals generated in blocks vs signals filtered at once.
+    """
+    rxcs.console.module_progress('test (case 1) blocks vs one filter')
+    print('')
+    for (dFilt, strName) in [({'fMax': 20e3}, 'low-pass'),
+                             ({'fMin': 20e3}, 'high-pass'),
+                             ({'fMin': 10e3, 'fMax': 30e3, 'strFilt': 'ellip'}, 'band-pass'),
+                             ({}, 'no filter')]:
+        for nSmpBlock in [1000, 777, 5000, 0]:
+            gen = _generator(dFilt)
+            lBlocks = []
+            for dBlock in gen.blocks(nSmpBlock):
+                lBlocks.append(dBlock['mSig'].copy())
+
+            # The same white noise filtered at once
+            randState = rxcs.auxiliary.randStream.stream(gen.iSeed)
+            nSmpB = nSmpBlock if nSmpBlock > 0 else gen.nSmp
+            mSig = np.hstack([randState.randn(gen.nSigs, vBlock.shape[1]) for vBlock in lBlocks])
+            if gen.mSOS is not None:
+                mZi = np.zeros((gen.mSOS.shape[0], gen.nSigs, 2))
+                (mSig, mZi) = scsig.sosfilt(gen.mSOS, mSig, axis=1, zi=mZi)
+            mSig = mSig * np.sqrt(gen.iP / gen._noiseGain(gen.mSOS))
+
+            bOk = (len(lBlocks) == int(np.ceil(gen.nSmp / nSmpB)))
+            bOk = bOk and _isclose(np.hstack(lBlocks), mSig, iTolerance)
+            if gen.mSOS is not None:
+                bOk = bOk and _isclose(gen.mZi, mZi, iTolerance)
+            strNote = '%s, blocks of %d samples:' % (strName, nSmpB)
+            if not bOk:
+                raise Exception('%s error!!!' % strNote)
+            rxcs.console.note('%-42s ok!' % strNote)
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2():
+    """
+    The expected power of the filtered noise and the power of the signals
+    generated in blocks.
+    """
+    rxcs.console.module_progress('test (case 2) power of signals')
+    print('')
+    for (dFilt, strName) in [({'fMax': 20e3}, 'low-pass'),
+                             ({'fMin': 20e3, 'strFilt': 'cheby1'}, 'high-pass'),
+                             ({'fMin': 10e3, 'fMax': 30e3, 'strFilt': 'ellip'}, 'band-pass')]:
+        gen = _generator(dFilt)
+        mSOS = gen._designFilter()
+
+        # Power of the impulse response of the filter
+        vImp = np.zeros(2**16)
+        vImp[0] = 1
+        iGainExp = np.sum(scsig.sosfilt(mSOS, vImp)**2)
+        if not (abs(gen._noiseGain(mSOS) / iGainExp - 1) < 1e-3):
+            raise Exception('%s, expected power: error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % ('%s, expected power:' % strName))
+
+        # Power of the signals generated in blocks
+        gen.tS = 1
+        gen.nSigs = 10
+        gen.iP = 3
+        iEnergy = 0
+        for dBlock in gen.blocks():
+            iEnergy = iEnergy + np.sum(dBlock['mSig']**2)
+        iP = iEnergy / (gen.nSigs * gen.nSmp)
+        if not ((abs(iP / gen.iP - 1) < 0.02) and np.all(gen.vP == gen.iP)):
+            raise Exception('%s, power of signals: error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % ('%s, power of signals:' % strName))
+
+    gen = _generator({})
+    if gen._noiseGain(None) != 1:
+        raise Exception('no filter, expected power: error!!!')
+    rxcs.console.note('%-42s ok!' % 'no filter, expected power:')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3():
+    """
+    The cache of designs of filters.
+    """
+    rxcs.console.module_progress('test (case 3) cache of filters')
+    print('')
+    dFilt = {'fMin': 10e3, 'fMax': 30e3, 'strFilt': 'cheby2', 'nFiltOrd': 8, 'iRs': 50}
+    mSOS = _generator(dFilt)._designFilter()
+    mSOS2 = _generator(dFilt)._designFilter()
+    mSOSExp = scsig.iirfilter(8, [0.2, 0.6], btype='bandpass', ftype='cheby2', rs=50, rp=0.1, output='sos')
+    bOk = (mSOS2 is mSOS) and not mSOS.flags.writeable and np.array_equal(mSOS, mSOSExp)
+    if not bOk:
+        raise Exception('the same read-only filter: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the same read-only filter:')
+
+    # The filter given by 'run'
+    gen = _generator(dFilt)
+    gen.run()
+    if not (gen.mSOS is mSOS):
+        raise Exception('the same filter in run: error!!!')
+    rxcs.console.note('%-42s ok!' % 'the same filter in run:')
+
+    # Different parameters of the filter
+    bOk = True
+    for (strParam, value) in [('nFiltOrd', 9), ('iRs', 51), ('fMax', 31e3), ('strFilt', 'ellip')]:
+        dFiltD = dict(dFilt)
+        dFiltD[strParam] = value
+        bOk = bOk and (_generator(dFiltD)._designFilter() is not mSOS)
+    bOk = bOk and (_generator({'fMax': 30e3})._designFilter() is not _generator({'fMin': 30e3})._designFilter())
+    if not bOk:
+        raise Exception('different filters: error!!!')
+    rxcs.console.note('%-42s ok!' % 'different filters:')
+
+
+# =====================================================================
+# Gaussian noise generator used in the tests
+# =====================================================================
+def _generator(dFilt):
+    gen = rxcs.sig.gaussNoise()
+    gen.tS = 0.1            # Time of the signals is 100 ms
+    gen.fR = 100e3          # Representation sampling frequency is 100 kHz
+    gen.nSigs = 3           # The number of signals
+    gen.iP = 2              # Power of the signals
+    gen.iSeed = 1           # Seed of the stream of random numbers
+    for (strParam, value) in dFilt.items():
+        setattr(gen, strParam, value)
+    gen.bMute = 1
+    gen.parametersCheck()
+    return gen
+
+
+# =====================================================================
+# This function compares two matrices.
+# The function allows for a very small error margin
+# =====================================================================
+def _isclose(mX, mY, iTolerance):
+    return (np.shape(mX) == np.shape(mY)) and (np.max(np.abs(mX - mY)) <= iTolerance)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _gaussNoise_test()
@@ -0,0 +1,273 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the signal oversampler. |br|
+
+It tests the oversampler with a number of test cases. In every case random
+signals are oversampled. The signals oversampled by the reference functions
+('np.interp' for the linear interpolation, 'scipy.signal.resample_poly' for
+the polyphase method and 'scipy.signal.resample' for the FFT method) are
+treated as the expected signals. |br|
+
+The following tests are performed:
+
+- if the linear interpolation of all the signals at once is equal to the
+  linear interpolation of every signal with 'np.interp' (also for long
+  signals, which are interpolated in blocks)?
+
+- if the polyphase method is equal to 'scipy.signal.resample_poly', and a
+  ratio of frequencies which is not rational is refused?
+
+- if the FFT method is equal to 'scipy.signal.resample' (for an even and an
+  odd number of input samples)?
+
+- if the oversampled signals are written into the given buffer, and a buffer
+  of a wrong size is refused?
+
+- if the oversampled signals are of the requested type (float32)?
+
+- if the basic signals of the gaussian noise generators (type 2 and type 3)
+  are oversampled with the FFT method?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python oversampler_test.py`
+
+when in *rxcs/test/signals* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import scipy.signal as scsig
+import rxcs
+
+
+def _oversampler_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Oversampler')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed signals
+    iTolerance = 3e-11
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3(iTolerance)             # Test case 3
+    _testCase4(iTolerance)             # Test case 4
+    _testCase5(1e-9)                   # Test case 5
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    Linear interpolation vs 'np.interp'.
+    """
+    rxcs.console.module_progress('test (case 1) linear interpolation')
+    print('')
+    for (nSigs, nSmp, iFLow, iFHigh, strName) in [(5, 100, 1e3, 7.3e3, 'linear:'),
+                                                  (3, 100, 1e3, 1e6, 'linear, long signals:'),
+                                                  (1, 2, 1e3, 5e3, 'linear, two samples:')]:
+        mSig = np.random.randn(nSigs, nSmp)
+        over = _run(mSig, iFLow, iFHigh, 'linear')
+        mExp = np.vstack([np.interp(over.vTHigh, over.vTLow, vSig) for vSig in mSig])
+        _checkEqual(over.mSigOversamp, mExp, iTolerance, strName)
+
+    # A 1D signal
+    vSig = np.random.randn(100)
+    over = _run(vSig, 1e3, 4.5e3, 'linear')
+    _checkEqual(over.mSigOversamp, np.atleast_2d(np.interp(over.vTHigh, over.vTLow, vSig)),
+                iTolerance, 'linear, 1D signal:')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    Polyphase method vs 'scipy.signal.resample_poly'. A ratio of frequencies
+    which is not rational is refused.
+    """
+    rxcs.console.module_progress('test (case 2) polyphase method')
+    print('')
+    for (iFLow, iFHigh, iUp, iDown) in [(1e3, 4e3, 4, 1), (2e3, 5e3, 5, 2), (3e3, 7.1e3, 71, 30)]:
+        mSig = np.random.randn(4, 150)
+        over = _run(mSig, iFLow, iFHigh, 'poly')
+        mExp = scsig.resample_poly(mSig, iUp, iDown, axis=1)[:, :over.iNSampH]
+        _checkEqual(over.mSigOversamp, mExp, iTolerance, 'poly, ratio %d/%d:' % (iUp, iDown))
+    if not _isclose(over.vTOversamp, over.vTLow[0] + np.arange(over.iNSampH) / 7.1e3, iTolerance):
+        raise Exception('poly, time vector: error!!!')
+    rxcs.console.note('%-42s ok!' % 'poly, time vector:')
+
+    try:
+        _run(np.random.randn(2, 100), 1e3, np.pi * 1e3, 'poly')
+    except ValueError:
+        rxcs.console.note('%-42s ok!' % 'poly, not rational ratio is refused:')
+    else:
+        raise Exception('poly, not rational ratio is refused: error!!!')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(iTolerance):
+    """
+    FFT method vs 'scipy.signal.resample' (an even and an odd number of
+    input samples).
+    """
+    rxcs.console.module_progress('test (case 3) FFT method')
+    print('')
+    for (nSmp, iFLow, iFHigh) in [(100, 1e3, 4e3), (101, 1e3, 4e3), (100, 1e3, 3.33e3), (99, 1e3, 2.5e3)]:
+        mSig = np.random.randn(4, nSmp)
+        over = _run(mSig, iFLow, iFHigh, 'fft')
+        mExp = scsig.resample(mSig, over.iNSampH, axis=1)
+        _checkEqual(over.mSigOversamp, mExp, iTolerance, 'fft, %d samples -> %d samples:' % (nSmp, over.iNSampH))
+    if not _isclose(over.vTOversamp, over.vTLow[0] + np.arange(over.iNSampH) / 2.5e3, iTolerance):
+        raise Exception('fft, time vector: error!!!')
+    rxcs.console.note('%-42s ok!' % 'fft, time vector:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4(iTolerance):
+    """
+    The buffer for the output signals and the type of samples of the output
+    signals.
+    """
+    rxcs.console.module_progress('test (case 4) buffer and type of samples')
+    print('')
+    mSig = np.random.randn(3, 100)
+    for strMethod in ['linear', 'poly', 'fft']:
+        mExp = _run(mSig, 1e3, 4e3, strMethod).mSigOversamp
+        mBuf = np.empty((3, 400))
+        over = _run(mSig, 1e3, 4e3, strMethod, mBuf=mBuf)
+        if not ((over.mSigOversamp is mBuf) and _isclose(mBuf, mExp, iTolerance)):
+            raise Exception('%s, buffer: error!!!' % strMethod)
+        rxcs.console.note('%-42s ok!' % ('%s, buffer:' % strMethod))
+
+        over = _run(mSig, 1e3, 4e3, strMethod, strDType='float32')
+        bOk = (over.mSigOversamp.dtype == np.float32)
+        bOk = bOk and _isclose(over.mSigOversamp, mExp, 1e-5 * np.max(np.abs(mExp)))
+        if not bOk:
+            raise Exception('%s, float32: error!!!' % strMethod)
+        rxcs.console.note('%-42s ok!' % ('%s, float32:' % strMethod))
+
+    for mBuf in [np.empty((3, 399)), np.empty((2, 400)), np.empty(1200)]:
+        try:
+            _run(mSig, 1e3, 4e3, 'linear', mBuf=mBuf)
+        except ValueError:
+            pass
+        else:
+            raise Exception('buffer of a wrong size is refused: error!!!')
+    rxcs.console.note('%-42s ok!' % 'buffer of a wrong size is refused:')
+
+
+# =====================================================================
+# Test case # 5
+# =====================================================================
+def _testCase5(iTolerance):
+    """
+    The basic signals of the gaussian noise generators (type 2 and type 3) are
+    oversampled with the FFT method.
+    """
+    rxcs.console.module_progress('test (case 5) gaussian noise generators')
+    print('')
+
+    # Gaussian noise (type 2)
+    gen = rxcs.sig.gaussNoise2()
+    gen.tS = 1e-3
+    gen.fR = 1e6
+    gen.fMin = 10e3
+    gen.fMax = 50e3
+    gen.iP = 2
+    gen.nSigs = 4
+    gen.iSeed = 1
+    gen.bMute = 1
+    gen.run()
+    mExp = scsig.resample(gen.gaussNoise.mSig, gen.nSmp, axis=1)
+    mExp = mExp * np.sqrt(gen.iP / np.mean(mExp**2, axis=1))[:, np.newaxis]
+    _checkEqual(gen.mSig, mExp, iTolerance, 'gaussNoise2, fft oversampling:')
+
+    # Gaussian noise (type 3)
+    gen = rxcs.sig.gaussNoise3()
+    gen.tS = 1e-3
+    gen.fR = 1e6
+    gen.fMin = 100e3
+    gen.fMax = 200e3
+    gen.fWidth = 20e3
+    gen.fGrad = 10e3
+    gen.iP = 2
+    gen.nSigs = 4
+    gen.iSeed = 1
+    gen.bMute = 1
+    gen.run()
+    upconvert = rxcs.sig.radio.upconvert()
+    upconvert.mSig = scsig.resample(gen.gaussNoise.mSig, gen.nSmp, axis=1)
+    upconvert.fR = gen.fR
+    upconvert.tS = gen.tS
+    upconvert.fC = gen.vFC
+    upconvert.bMute = 1
+    upconvert.run()
+    mExp = upconvert.mSig
+    mExp = mExp * np.sqrt(gen.iP / np.mean(mExp**2, axis=1))[:, np.newaxis]
+    _checkEqual(gen.mSig, mExp, iTolerance, 'gaussNoise3, fft oversampling:')
+
+
+# =====================================================================
+# Run the oversampler
+# =====================================================================
+def _run(mSig, iFLow, iFHigh, strMethod, **dParam):
+    over = rxcs.sig.oversampler()
+    over.mSig = mSig
+    over.iFLow = iFLow
+    over.iFHigh = iFHigh
+    over.strMethod = strMethod
+    for (strParam, value) in dParam.items():
+        setattr(over, strParam, value)
+    over.bMute = 1
+    over.run()
+    return over
+
+
+# =====================================================================
+# Check if the signals are equal to the expected signals
+# =====================================================================
+def _checkEqual(mSig, mExp, iTolerance, strName):
+    if _isclose(mSig, mExp, iTolerance):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two matrices.
+# The function allows for a very small error margin
+# =====================================================================
+def _isclose(mX, mY, iTolerance):
+    return (np.shape(mX) == np.shape(mY)) and (np.max(np.abs(mX - mY)) <= iTolerance)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _oversampler_test()
@@ -0,0 +1,250 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the power regulator and its power regulation
+kernel (functions sigPower and adjPower). |br|
+
+It tests the kernel and the regulator with a number of test cases. In every
+case random signals are generated, the expected powers of signals are
+computed directly as means of squared samples. |br|
+
+The following tests are performed:
+
+- if the powers of signals measured by sigPower are correct
+  (for any size of packs of signals)?
+
+- if the signals adjusted by adjPower have the requested powers
+  (a scalar or a vector with powers), and the reported powers and
+  adjustment coefficients are correct?
+
+- if the signals are adjusted in place (if requested), and the input signals
+  are not changed otherwise?
+
+- if the signals are not adjusted if the requested power is NaN?
+
+- if the power regulator gives the regulated signals, and a copy of the input
+  signals if the power is not regulated?
+
+- if integer signals are regulated into a new float matrix, also if the
+  regulation in place is requested?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python powerRegulator_test.py`
+
+when in *rxcs/test/signals* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+    1.1  | 19-OCT-2026 : * Test of integer signals added. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+from rxcs.sig.powerRegulator import adjPower, sigPower
+
+
+def _powerRegulator_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Power regulator (sigPower, adjPower)')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed powers is 1e-6 (relative)
+    iTolerance = 1e-6
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3(iTolerance)             # Test case 3
+    _testCase4(iTolerance)             # Test case 4
+    _testCase5(iTolerance)             # Test case 5
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    Measurement of powers of signals (float64 and float32), for packs
+    of signals of different sizes.
+    """
+    rxcs.console.module_progress('test (case 1) measurement of powers')
+    print('')
+    mSig = 3 * np.random.randn(37, 1000)
+    vPRef = np.mean(mSig**2, axis=1)
+    for nSigsPack in [0, 1, 5, 37, 100]:
+        _checkClose(sigPower(mSig, nSigsPack), vPRef, iTolerance, 'powers (packs of %d signals):' % nSigsPack)
+    _checkClose(sigPower(mSig.astype(np.float32)), vPRef, iTolerance, 'powers (float32 signals):')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    Adjustment of powers of signals to a scalar power and to a vector
+    with powers, not in place and in place.
+    """
+    rxcs.console.module_progress('test (case 2) adjustment of powers')
+    print('')
+    mSig = 3 * np.random.randn(25, 800)
+    vIP = np.random.rand(25) + 0.5
+    for (iP, strP) in [(2.0, 'scalar'), (vIP, 'vector')]:
+        for nSigsPack in [0, 4]:
+            _checkAdjPower(mSig, iP, 0, nSigsPack, iTolerance, '%s power, packs of %d signals' % (strP, nSigsPack))
+            _checkAdjPower(mSig, iP, 1, nSigsPack, iTolerance, '%s power, in place' % strP)
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(iTolerance):
+    """
+    Requested power equal to NaN: the signals are not adjusted.
+    """
+    rxcs.console.module_progress('test (case 3) power not adjusted')
+    print('')
+    mSig = np.random.randn(10, 500)
+    (mSigOut, vP, vPCoef) = adjPower(mSig, np.nan)
+    bOk = np.array_equal(mSigOut, mSig) and np.all(vPCoef == 1)
+    if not (bOk and _isclose(vP, np.mean(mSig**2, axis=1), iTolerance)):
+        raise Exception('power not adjusted: error!!!')
+    rxcs.console.note('%-42s ok!' % 'power not adjusted:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4(iTolerance):
+    """
+    The power regulator module: regulated signals, a copy of the input signals
+    if the power is not regulated, the input signals if the regulation is
+    in place.
+    """
+    rxcs.console.module_progress('test (case 4) power regulator')
+    print('')
+    mSig = np.random.randn(8, 300)
+    mSigIn = mSig.copy()
+
+    regulator = rxcs.sig.powerRegulator()
+    regulator.mSig = mSigIn
+    regulator.iP = 0.5
+    regulator.bMute = 1
+    regulator.run()
+    _checkClose(np.mean(regulator.mSigOut**2, axis=1), 0.5 * np.ones(8), iTolerance, 'regulated signals:')
+    _checkClose(regulator.vP, 0.5 * np.ones(8), iTolerance, 'reported powers:')
+
+    regulator = rxcs.sig.powerRegulator()
+    regulator.mSig = mSigIn
+    regulator.bMute = 1
+    regulator.run()
+    bOk = (regulator.mSigOut is not mSigIn) and np.array_equal(regulator.mSigOut, mSig)
+    bOk = bOk and np.array_equal(mSigIn, mSig)
+    if not bOk:
+        raise Exception('not regulated signals (a copy): error!!!')
+    rxcs.console.note('%-42s ok!' % 'not regulated signals (a copy):')
+
+    regulator.bInPlace = 1
+    regulator.iP = 2.0
+    regulator.run()
+    if not ((regulator.mSigOut is mSigIn) and _isclose(np.mean(mSigIn**2, axis=1), 2.0 * np.ones(8), iTolerance)):
+        raise Exception('signals regulated in place: error!!!')
+    rxcs.console.note('%-42s ok!' % 'signals regulated in place:')
+
+
+# =====================================================================
+# Test case # 5
+# =====================================================================
+def _testCase5(iTolerance):
+    """
+    Integer signals, the regulation in place is requested: the signals are
+    regulated into a new float matrix, the input signals are not changed.
+    """
+    rxcs.console.module_progress('test (case 5) integer signals')
+    print('')
+    mSig = np.arange(1, 11).reshape(2, 5)
+    _checkAdjPower(mSig, 2.0, 0, 0, iTolerance, 'integer signals')
+
+    mSigIn = mSig.copy()
+    (mSigOut, vP, _) = adjPower(mSigIn, 2.0, bInPlace=1)
+    bOk = (mSigOut is not mSigIn) and (mSigOut.dtype.kind == 'f') and np.array_equal(mSigIn, mSig)
+    if not (bOk and _isclose(vP, 2.0 * np.ones(2), iTolerance)):
+        raise Exception('integer signals, in place: error!!!')
+    rxcs.console.note('%-42s ok!' % 'integer signals, in place:')
+
+    regulator = rxcs.sig.powerRegulator()
+    regulator.mSig = mSigIn
+    regulator.iP = 2.0
+    regulator.bInPlace = 1
+    regulator.bMute = 1
+    regulator.run()
+    bOk = _isclose(np.mean(regulator.mSigOut**2, axis=1), 2.0 * np.ones(2), iTolerance)
+    if not (bOk and _isclose(regulator.vP, 2.0 * np.ones(2), iTolerance) and np.array_equal(mSigIn, mSig)):
+        raise Exception('integer signals, power regulator: error!!!')
+    rxcs.console.note('%-42s ok!' % 'integer signals, power regulator:')
+
+
+# =====================================================================
+# Check adjustment of powers of signals
+# =====================================================================
+def _checkAdjPower(mSig, iP, bInPlace, nSigsPack, iTolerance, strName):
+    """
+    This function adjusts powers of signals and checks the adjusted signals,
+    the reported powers and adjustment coefficients.
+    """
+    mSigIn = mSig.copy()
+    (mSigOut, vP, vPCoef) = adjPower(mSigIn, iP, bInPlace, nSigsPack)
+
+    vIP = iP * np.ones(mSig.shape[0])
+    vPCoefRef = np.sqrt(vIP / np.mean(mSig**2, axis=1))
+    bOk = _isclose(np.mean(mSigOut**2, axis=1), vIP, iTolerance)
+    bOk = bOk and _isclose(vP, vIP, iTolerance)
+    bOk = bOk and _isclose(vPCoef[:, 0], vPCoefRef, iTolerance)
+    bOk = bOk and _isclose(mSigOut, mSig * vPCoefRef[:, np.newaxis], iTolerance)
+    if bInPlace:
+        bOk = bOk and (mSigOut is mSigIn)
+    else:
+        bOk = bOk and (mSigOut is not mSigIn) and np.array_equal(mSigIn, mSig)
+    if not bOk:
+        raise Exception('%s: error!!!' % strName)
+    rxcs.console.note('%-42s ok!' % (strName + ':'))
+    return
+
+
+# =====================================================================
+# Check if two vectors are close
+# =====================================================================
+def _checkClose(vX, vY, iTolerance, strName):
+    if _isclose(vX, vY, iTolerance):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two arrays.
+# The function allows for a very small relative error margin
+# =====================================================================
+def _isclose(mX, mY, iTolerance):
+    return (np.shape(mX) == np.shape(mY)) and np.allclose(mX, mY, rtol=iTolerance, atol=0)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _powerRegulator_test()
@@ -49,6 +49,18 @@ The following tests are performed on the generated signals:
 
     - if the requested noise in signals agree with real noise (if applicable)?
 
+- engines of synthesis:
+
+    - if signals synthesized by the IFFT engine and by the direct engine agree?
+
+    - if the direct engine is chosen for tones which are not on the FFT grid
+      of the signals (and the IFFT engine refuses such tones)?
+
+- time blocks of signals:
+
+    - if signals generated in time blocks ('blocks') agree with signals
+      generated at once ('run')?
+
 
 FFT analysis is used to get the real frequency, amplitude and phases of the
 generated signals.
@@ -70,6 +82,7 @@ when in *rxcs/test/signals* directory. The results are then printed to the conso
     1.0  | 20-MAY-2014 : * Version 1.0 released. |br|
     1.1  | 15-JUL-2015 : * Adjusted to new name of random multitone gen. |br|  
     2.0  | 21-JUL-2015 : * Version 2.0 released (adjusted to v2.0 of the generator) |br|
+    2.1  | 19-OCT-2026 : * Tests of engines of synthesis and of time blocks of signals |br|
 
 
 *License*:
@@ -125,6 +138,15 @@ def _randMult_test():
     _TestCase5(iTolerance)
     rxcs.console.info('case 5 OK!')
 
+    _TestCase6()
+    rxcs.console.info('case 6 OK!')
+
+    _TestCase7()
+    rxcs.console.info('case 7 OK!')
+
+    _TestCase8()
+    rxcs.console.info('case 8 OK!')
+
 
 # =====================================================================
 # Test case 1
@@ -457,6 +479,215 @@ def _TestCase5(iTolerance):
     return
 
 
+# =====================================================================
+# Test case 6
+# =====================================================================
+def _TestCase6():
+    """
+    This is test case function #6. |br|
+
+    The function generates the same signals (the same seed) with the IFFT
+    engine and with the direct engine, and checks if the signals agree.
+    It checks also if the 'auto' engine chooses the IFFT engine for signals
+    with tones on the FFT grid.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+
+    # Generate the signals with both the engines
+    tStart = rxcs.console.module_progress('test (case 6) signals generation')
+    genIFFT = _genEngine('ifft', 1e-3)
+    genIFFT.run()
+    genDirect = _genEngine('direct', 1e-3)
+    genDirect.run()
+    genAuto = _genEngine('auto', 1e-3)
+    genAuto.run()
+    rxcs.console.progress_doneNL(tStart)
+
+    # -----------------------------------------------------------------
+    # Check the signals
+    _checkEngine(genIFFT, 'ifft')
+    _checkEngine(genDirect, 'direct')
+    _checkEngine(genAuto, 'ifft')
+    _checkAgree(genDirect.mSig, genIFFT.mSig, 'IFFT vs direct engine:')
+    _checkAgree(genAuto.mSig, genIFFT.mSig, 'auto vs IFFT engine:')
+    return
+
+
+# =====================================================================
+# Test case 7
+# =====================================================================
+def _TestCase7():
+    """
+    This is test case function #7. |br|
+
+    The function generates signals with tones which are not on the FFT grid
+    of the signals (the signal spectrum resolution is 1 kHz, the FFT
+    resolution is 666.67 Hz). The 'auto' engine must choose the direct
+    engine, the IFFT engine must refuse such signals. The signals are
+    checked against tones evaluated from the reported frequencies,
+    amplitudes and phases.
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+
+    # Generate the signals
+    tStart = rxcs.console.module_progress('test (case 7) signals generation')
+    gen = _genEngine('auto', 1.5e-3)
+    gen.run()
+    rxcs.console.progress_doneNL(tStart)
+
+    # -----------------------------------------------------------------
+    # Check the engine and the signals
+    _checkEngine(gen, 'direct')
+
+    vT = np.arange(gen.nSmp) / gen.fR
+    mSigRef = np.zeros((gen.nSigs, gen.nSmp))
+    for inxTone in range(gen.mFrqs.shape[1]):
+        mPhase = 2 * np.pi * np.outer(gen.mFrqs[:, inxTone], vT) + gen.mPhs[:, [inxTone]] * np.pi / 180
+        mSigRef += gen.mAmps[:, [inxTone]] * np.cos(mPhase)
+    _checkAgree(gen.mSig, mSigRef, 'off-grid tones vs reported tones:')
+
+    # The IFFT engine must refuse the signals
+    gen = _genEngine('ifft', 1.5e-3)
+    try:
+        gen.run()
+    except ValueError:
+        rxcs.console.note('IFFT engine refuses off-grid tones:       ok!')
+    else:
+        raise Exception('IFFT engine refuses off-grid tones: error!!!')
+    return
+
+
+# =====================================================================
+# Test case 8
+# =====================================================================
+def _TestCase8():
+    """
+    This is test case function #8. |br|
+
+    The function generates the same signals (the same seed) at once ('run')
+    and in time blocks ('blocks'), and checks if the signals agree.
+    Blocks are checked for tones on the FFT grid of the blocks (the IFFT
+    engine, with and without regulation of power) and for tones which are
+    not on the grid (the direct engine).
+
+    Args:
+        None
+
+    Returns:
+        Nothing
+    """
+    lCases = [(5e-3, np.nan, 1000, 'ifft'),       # (time of signals, power,
+              (5e-3, 2.0, 1000, 'ifft'),          #  the number of samples in a block,
+              (4.5e-3, np.nan, 0, 'direct'),      #  the expected engine)
+              (5e-3, np.nan, 300, 'direct')]
+
+    # Generate the signals at once and in time blocks
+    tStart = rxcs.console.module_progress('test (case 8) signals generation')
+    lResults = []
+    for (tS, iP, nSmpBlock, strEngineSel) in lCases:
+        gen = _genEngine('auto', tS)
+        gen.iP = iP
+        gen.run()
+
+        genBlocks = _genEngine('auto', tS)
+        genBlocks.iP = iP
+        lBlocks = [dGen['mSig'].copy() for dGen in genBlocks.blocks(nSmpBlock)]
+        lResults.append((gen, genBlocks, np.hstack(lBlocks), strEngineSel))
+    rxcs.console.progress_doneNL(tStart)
+
+    # -----------------------------------------------------------------
+    # Check the signals
+    for (gen, genBlocks, mSigBlocks, strEngineSel) in lResults:
+        _checkEngine(genBlocks, strEngineSel)
+        _checkAgree(mSigBlocks, gen.mSig, 'time blocks vs signals at once:')
+    return
+
+
+# =====================================================================
+# Generator used in tests of engines of synthesis
+# =====================================================================
+def _genEngine(strEngine, tS):
+    """
+    This function configures the Random Multitone Signal Generator used
+    in tests of engines of synthesis (tests #6 - #8). All the generators
+    use the same seed, so they draw the same tones.
+
+    Args:
+        strEngine: engine of synthesis |br|
+        tS: time of signals |br|
+
+    Returns:
+        gen: configured random multitone signal generator object
+    """
+    gen = rxcs.sig.randMult()
+
+    gen.tS = tS       # Time of the signal
+    gen.fR = 1e6      # The signal representation sampling frequency is 1 MHz
+    gen.fMax = 40e3   # The highest possible frequency in the signal is 40 kHz
+    gen.fRes = 1e3    # The signal spectrum resolution is 1 kHz
+    gen.nTones = 5    # The number of random tones
+    gen.nSigs = 50    # The number of signals to be generated
+
+    gen.strEngine = strEngine   # Engine of synthesis
+    gen.iSeed = 11              # Seed of the stream of random numbers
+    gen.bMute = 1               # Mute the output from the generator
+    return gen
+
+
+# =====================================================================
+# This function checks the engine chosen by the generator
+# =====================================================================
+def _checkEngine(gen, strEngine):
+    """
+    This function checks if the generator used the expected engine of
+    synthesis.
+
+    Args:
+        gen: random multitone signal generator object |br|
+        strEngine: the expected engine |br|
+
+    Returns:
+        Nothing
+    """
+    if gen.strEngineSel != strEngine:
+        strErr = 'engine of synthesis: %s expected, %s used: error!!!' % (strEngine, gen.strEngineSel)
+        raise Exception(strErr)
+    return
+
+
+# =====================================================================
+# This function checks if two matrices with signals agree
+# =====================================================================
+def _checkAgree(mSigA, mSigB, strName):
+    """
+    This function checks if two matrices with signals agree (up to
+    numerical errors).
+
+    Args:
+        mSigA: the first matrix with signals |br|
+        mSigB: the second matrix with signals |br|
+        strName: name of the check |br|
+
+    Returns:
+        Nothing
+    """
+    if (mSigA.shape == mSigB.shape) and (np.max(np.abs(mSigA - mSigB)) < 1e-9):
+        rxcs.console.note('%-41s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
 # =====================================================================
 # ENGINE OF THE TEST: Check the generated signals
 # =====================================================================
@@ -0,0 +1,160 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the sparse vectors generator. |br|
+
+It tests the generator with a number of test cases. In every case the same
+vectors (the same seed) are generated in all the formats ('dense', 'csr',
+'coo' and 'inx'). |br|
+
+The following tests are performed:
+
+- if the number and the size of the vectors are correct?
+
+- if every vector has the requested number of non-zero elements?
+
+- if the indices of non-zero elements are sorted, distinct and in range?
+
+- if the values of non-zero elements are in the range [0, 1)?
+
+- if the vectors in all the formats are equal to each other?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python sparseVector_test.py`
+
+when in *rxcs/test/signals* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import scipy.sparse as scsparse
+import rxcs
+
+
+def _sparseVector_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Sparse vectors generator')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+    _testCase1()                       # Test case 1
+    _testCase2()                       # Test case 2
+    _testCase3()                       # Test case 3
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1():
+    """
+    Very sparse vectors (rejection sampling of indices).
+    """
+    _testEngine(1, 1000, 0.005, 500)
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2():
+    """
+    Sparse vectors (oversampling of indices).
+    """
+    _testEngine(2, 200, 0.1, 500)
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3():
+    """
+    Dense vectors (random keys), all the elements are non-zero.
+    """
+    _testEngine(3, 64, 0.5, 500)
+    _testEngine(3, 64, 1.0, 20)
+
+
+# =====================================================================
+# Engine of the test
+# =====================================================================
+def _testEngine(inxCase, iVectSiz, iS, iNVect):
+    """
+    This is the engine of the test.
+
+    Args:
+        inxCase (int):     index of the test case
+        iVectSiz (int):    size of a vector
+        iS (float):        sparsity of a vector
+        iNVect (int):      the number of vectors
+
+    Returns:
+        nothing
+    """
+    iNs = int(np.ceil(iS * iVectSiz))    # The number of non-zero elements in a vector
+    strCase = '(%d of %d)' % (iNs, iVectSiz)
+
+    # Generate the same vectors in all the formats
+    tStart = rxcs.console.module_progress('test (case %d) generation of %s vectors' % (inxCase, strCase))
+    dVects = {}
+    for strFormat in ['dense', 'csr', 'coo', 'inx']:
+        gen = rxcs.sig.sparseVector()
+        gen.iVectSiz = iVectSiz
+        gen.iS = iS
+        gen.iNVect = iNVect
+        gen.strFormat = strFormat
+        gen.iSeed = 5
+        gen.bMute = 1
+        gen.run()
+        dVects[strFormat] = gen.mVects
+    rxcs.console.progress_doneNL(tStart)
+
+    # The dense vectors
+    mVects = dVects['dense']
+    if mVects.shape != (iNVect, iVectSiz):
+        raise Exception('number and size of vectors %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('number and size of vectors %s:' % strCase))
+
+    if not np.all(np.sum(mVects != 0, axis=1) == iNs):
+        raise Exception('non-zero elements %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('non-zero elements %s:' % strCase))
+
+    # Indices and values of non-zero elements
+    (mInx, mVal) = dVects['inx']
+    bOk = (mInx.shape == (iNVect, iNs)) and (mVal.shape == (iNVect, iNs))
+    bOk = bOk and np.all(np.diff(mInx, axis=1) > 0) and (mInx.min() >= 0) and (mInx.max() < iVectSiz)
+    bOk = bOk and (mVal.min() >= 0) and (mVal.max() < 1)
+    if not bOk:
+        raise Exception('indices and values %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('indices and values %s:' % strCase))
+
+    # All the formats are equal
+    mVectsInx = np.zeros((iNVect, iVectSiz))
+    mVectsInx[np.arange(iNVect)[:, np.newaxis], mInx] = mVal
+    bOk = np.array_equal(mVectsInx, mVects)
+    bOk = bOk and scsparse.isspmatrix_csr(dVects['csr']) and np.array_equal(dVects['csr'].toarray(), mVects)
+    bOk = bOk and scsparse.isspmatrix_coo(dVects['coo']) and np.array_equal(dVects['coo'].toarray(), mVects)
+    if not bOk:
+        raise Exception('all the formats %s: error!!!' % strCase)
+    rxcs.console.note('%-42s ok!' % ('all the formats %s:' % strCase))
+    return
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _sparseVector_test()
@@ -0,0 +1,279 @@
+"""
+.. role:: bash(code)
+    :language: bash
+
+This is the test module for the single branch upconverter. |br|
+
+It tests the upconverter with a number of test cases. In every case random
+signals are upconverted. The signals mixed with carriers computed separately
+for every signal with 'np.cos' are treated as the expected signals. |br|
+
+The following tests are performed:
+
+- if the signals upconverted with a single carrier frequency are equal to
+  the signals upconverted with the carrier given by the random multitone
+  signal generator (the original upconverter), and the carrier is taken
+  from the cache of carriers?
+
+- if the signals upconverted with a vector of carrier frequencies are correct,
+  when there are only a few different carrier frequencies (cached carriers,
+  runs of signals with the same carrier frequency), and when there are more
+  different carrier frequencies than the cache can keep (broadcasted matrix
+  of cosines)?
+
+- if a vector with one carrier frequency gives the same signals as the
+  single carrier frequency?
+
+- if the signals are upconverted into the given buffer, and in place
+  (the buffer is the matrix with input signals)?
+
+- if a vector of carrier frequencies with a wrong size is refused?
+
+
+To start the test run this module directly as a script:
+
+    :bash:`$ python upconvert_test.py`
+
+when in *rxcs/test/signals* directory.
+The results are then printed to the console.
+|br|
+
+*Author*:
+    Jacek Pierzchlewski, Aalborg University, Denmark. <jap@es.aau.dk>
+
+*Version*:
+    1.0  | 19-OCT-2026 : * Initial version. |br|
+
+*License*:
+    BSD 2-Clause
+"""
+from __future__ import division
+import numpy as np
+import rxcs
+from rxcs.sig.radio.upconvert import _cacheCarriers
+
+
+# Settings of the tests
+_TIME = 1e-3       # Time of the signals is 1 ms
+_FSMP = 1e6        # Signal representation sampling frequency 1 MHz
+
+
+def _upconvert_test():
+
+    # Print out the header of the test
+    print('')
+    rxcs.console.progress('Function under test', 'Upconverter')
+
+    # -----------------------------------------------------------------
+    # Tests start here:
+
+    # Tolerance of expected vs computed signals
+    iTolerance = 1e-9
+
+    _testCase1(iTolerance)             # Test case 1
+    _testCase2(iTolerance)             # Test case 2
+    _testCase3(iTolerance)             # Test case 3
+    _testCase4(iTolerance)             # Test case 4
+    _testCase5()                       # Test case 5
+
+
+# =====================================================================
+# Test case # 1
+# =====================================================================
+def _testCase1(iTolerance):
+    """
+    A single carrier frequency: the original upconverter (carrier given by
+    the random multitone signal generator), the cache of carriers.
+    """
+    rxcs.console.module_progress('test (case 1) single carrier frequency')
+    print('')
+    _cacheCarriers.clear()
+    mSig = np.random.randn(5, 1000)
+    up = _run(mSig, 100e3)
+    _checkEqual(up.mSig, mSig * _carriersCos(100e3 * np.ones(5)), iTolerance, 'scalar fC vs cosines:')
+    _checkEqual(up.mSig, mSig * _carrierRandMult(100e3, 5), iTolerance, 'scalar fC vs original upconverter:')
+
+    up2 = _run(mSig, 100e3)
+    bOk = (up2.vCarrier is up.vCarrier) and not up.vCarrier.flags.writeable and (len(_cacheCarriers) == 1)
+    bOk = bOk and np.array_equal(up2.mSig, up.mSig) and (up.mSig is not mSig)
+    if not bOk:
+        raise Exception('scalar fC, cached carrier: error!!!')
+    rxcs.console.note('%-42s ok!' % 'scalar fC, cached carrier:')
+
+
+# =====================================================================
+# Test case # 2
+# =====================================================================
+def _testCase2(iTolerance):
+    """
+    A vector of carrier frequencies with a few different carrier frequencies
+    (cached carriers, runs of signals with the same carrier frequency).
+    """
+    rxcs.console.module_progress('test (case 2) vector fC, cached carriers')
+    print('')
+    _cacheCarriers.clear()
+    vFC = np.array([100e3, 100e3, 50e3, 50e3, 50e3, 100e3, 200e3, 50e3])
+    mSig = np.random.randn(vFC.size, 1000)
+    up = _run(mSig, vFC)
+    _checkEqual(up.mSig, mSig * _carriersCos(vFC), iTolerance, 'vector fC, cached carriers:')
+    bOk = (len(_cacheCarriers) == 3) and _isclose(up.vCarrier, _carriersCos(vFC[:1])[0], iTolerance)
+    if not bOk:
+        raise Exception('vector fC, carriers in the cache: error!!!')
+    rxcs.console.note('%-42s ok!' % 'vector fC, carriers in the cache:')
+
+    # The second run with the cached carriers
+    up2 = _run(mSig, vFC)
+    if not (np.array_equal(up2.mSig, up.mSig) and (up2.vCarrier is up.vCarrier)):
+        raise Exception('vector fC, second run: error!!!')
+    rxcs.console.note('%-42s ok!' % 'vector fC, second run:')
+
+    # A vector with one carrier frequency vs the single carrier frequency
+    _checkEqual(_run(mSig, 100e3 * np.ones(vFC.size)).mSig, _run(mSig, 100e3).mSig, 0,
+                'vector fC vs scalar fC:')
+
+
+# =====================================================================
+# Test case # 3
+# =====================================================================
+def _testCase3(iTolerance):
+    """
+    A vector of carrier frequencies with more different carrier frequencies
+    than the cache can keep (broadcasted matrix of cosines).
+    """
+    rxcs.console.module_progress('test (case 3) vector fC, broadcast carriers')
+    print('')
+    _cacheCarriers.clear()
+    nSigs = _cacheCarriers.nMax + 6
+    vFC = 1e3 * np.random.permutation(np.arange(1, nSigs + 1))
+    mSig = np.random.randn(nSigs, 1000)
+    up = _run(mSig, vFC)
+    _checkEqual(up.mSig, mSig * _carriersCos(vFC), iTolerance, 'vector fC, broadcast carriers:')
+    if not ((len(_cacheCarriers) == 0) and _isclose(up.vCarrier, _carriersCos(vFC[:1])[0], iTolerance)):
+        raise Exception('vector fC, carriers not cached: error!!!')
+    rxcs.console.note('%-42s ok!' % 'vector fC, carriers not cached:')
+
+    # More signals than in a pack of signals
+    vFC = 1e3 * np.random.randint(1, 400, 5000)
+    mSig = np.random.randn(vFC.size, 1000)
+    _checkEqual(_run(mSig, vFC).mSig, mSig * _carriersCos(vFC), iTolerance, 'vector fC, packs of signals:')
+
+
+# =====================================================================
+# Test case # 4
+# =====================================================================
+def _testCase4(iTolerance):
+    """
+    Upconversion into the buffer and in place.
+    """
+    rxcs.console.module_progress('test (case 4) buffer, in place')
+    print('')
+    vFCCached = np.array([100e3, 100e3, 50e3, 200e3])
+    vFCBroadcast = 1e3 * np.arange(1, _cacheCarriers.nMax + 2)
+    for (fC, strName) in [(100e3, 'scalar fC'),
+                          (vFCCached, 'cached carriers'),
+                          (vFCBroadcast, 'broadcast carriers')]:
+        nSigs = np.size(fC)
+        vFC = fC * np.ones(nSigs)
+        mSig = np.random.randn(nSigs, 1000)
+        mExp = mSig * _carriersCos(vFC)
+
+        mBuf = np.empty(mSig.shape)
+        mSigIn = mSig.copy()
+        up = _run(mSig, fC, mBuf=mBuf)
+        bOk = (up.mSig is mBuf) and _isclose(mBuf, mExp, iTolerance) and np.array_equal(mSig, mSigIn)
+        if not bOk:
+            raise Exception('%s, buffer: error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % ('%s, buffer:' % strName))
+
+        up = _run(mSig, fC, mBuf=mSig)
+        if not ((up.mSig is mSig) and _isclose(mSig, mExp, iTolerance)):
+            raise Exception('%s, in place: error!!!' % strName)
+        rxcs.console.note('%-42s ok!' % ('%s, in place:' % strName))
+
+
+# =====================================================================
+# Test case # 5
+# =====================================================================
+def _testCase5():
+    """
+    A vector of carrier frequencies with a wrong size is refused.
+    """
+    rxcs.console.module_progress('test (case 5) wrong size of fC')
+    print('')
+    for vFC in [np.array([100e3, 50e3]), 100e3 * np.ones(6)]:
+        try:
+            _run(np.random.randn(5, 1000), vFC)
+        except ValueError:
+            pass
+        else:
+            raise Exception('wrong size of fC is refused: error!!!')
+    rxcs.console.note('%-42s ok!' % 'wrong size of fC is refused:')
+
+
+# =====================================================================
+# Run the upconverter
+# =====================================================================
+def _run(mSig, fC, **dParam):
+    up = rxcs.sig.radio.upconvert()
+    up.mSig = mSig
+    up.fR = _FSMP
+    up.tS = _TIME
+    up.fC = fC
+    for (strParam, value) in dParam.items():
+        setattr(up, strParam, value)
+    up.bMute = 1
+    up.run()
+    return up
+
+
+# =====================================================================
+# Carriers of signals (computed separately for every signal)
+# =====================================================================
+def _carriersCos(vFC):
+    vT = np.arange(int(round(_TIME * _FSMP))) / _FSMP
+    return np.vstack([np.cos(2 * np.pi * fC * vT) for fC in vFC])
+
+
+# =====================================================================
+# Carrier given by the random multitone signal generator
+# (the carrier of the original upconverter)
+# =====================================================================
+def _carrierRandMult(fC, nSigs):
+    genC = rxcs.sig.randMult()
+    genC.tS = _TIME
+    genC.fR = _FSMP
+    genC.fRes = fC
+    genC.fMax = fC
+    genC.vFrqs = np.array([fC])
+    genC.vAmps = np.array([1])
+    genC.vPhs = np.array([0])
+    genC.nSigs = nSigs
+    genC.bMute = 1
+    genC.run()
+    return genC.mSig
+
+
+# =====================================================================
+# Check if the signals are equal to the expected signals
+# =====================================================================
+def _checkEqual(mSig, mExp, iTolerance, strName):
+    if _isclose(mSig, mExp, iTolerance):
+        rxcs.console.note('%-42s ok!' % strName)
+    else:
+        raise Exception('%s error!!!' % strName)
+    return
+
+
+# =====================================================================
+# This function compares two matrices.
+# The function allows for a very small error margin
+# =====================================================================
+def _isclose(mX, mY, iTolerance):
+    return (np.shape(mX) == np.shape(mY)) and (np.max(np.abs(mX - mY)) <= iTolerance)
+
+
+# =====================================================================
+# Trigger when start as a script
+# =====================================================================
+if __name__ == '__main__':
+    _upconvert_test()